@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Citation Export Benchmark
+
+Exports a large synthetic bibliography three ways and reports wall time and
+peak traced memory (tracemalloc) for each:
+
+- joined:  papers materialized as a list, ``export_citations`` builds one string
+- chunked: papers generated lazily, ``iter_citation_chunks`` (HTTP body path)
+- file:    papers generated lazily, ``write_citations`` into a file sink
+
+The streaming paths should stay flat as --count grows; the joined path grows
+linearly with the size of the bibliography.
+
+Usage:
+    python benchmarks/citation_export_benchmark.py [--count 100000] [--format bibtex]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Tuple
+from unittest.mock import Mock
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.application.scholarly_use_cases import ScholarlyResearchUseCase  # noqa: E402
+
+
+def synthetic_papers(count: int) -> Iterator[Dict[str, Any]]:
+    """Yield realistic-looking paper dicts without holding them all at once."""
+    for i in range(count):
+        yield {
+            "title": f"Scalable Methods for Synthetic Benchmark Problem {i}",
+            "authors": [f"Author {i} One", f"Author {i} Two", f"Author {i} Three"],
+            "year": 2000 + i % 25,
+            "venue": "Journal of Synthetic Benchmarks",
+            "doi": f"10.5555/bench.{i}",
+            "abstract": "We study a synthetic problem at scale. " * 8,
+            "source_url": f"https://example.org/papers/{i}",
+        }
+
+
+def measure(run: Callable[[], int]) -> Tuple[float, int, int]:
+    """Return (seconds, peak traced bytes, bytes produced) for ``run``."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    produced = run()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, produced
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--format", default="bibtex")
+    args = parser.parse_args()
+
+    use_case = ScholarlyResearchUseCase(Mock(), Mock(), Mock())
+
+    def joined() -> int:
+        papers = list(synthetic_papers(args.count))
+        return len(use_case.export_citations(papers, args.format))
+
+    def chunked() -> int:
+        produced = 0
+        for chunk in use_case.iter_citation_chunks(
+            synthetic_papers(args.count), args.format
+        ):
+            produced += len(chunk.encode("utf-8"))
+        return produced
+
+    def to_file() -> int:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, f"citations.{args.format}")
+            with open(path, "w", encoding="utf-8") as sink:
+                use_case.write_citations(
+                    synthetic_papers(args.count), sink, args.format
+                )
+            return os.path.getsize(path)
+
+    print(f"📚 Exporting {args.count:,} papers as {args.format}")
+    print(f"{'mode':<10}{'seconds':>10}{'peak MiB':>12}{'output MiB':>13}")
+    for name, run in (("joined", joined), ("chunked", chunked), ("file", to_file)):
+        elapsed, peak, produced = measure(run)
+        print(
+            f"{name:<10}{elapsed:>10.2f}{peak / 2**20:>12.1f}{produced / 2**20:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Citation Export Cache Benchmark
+
+Exports a synthetic collection through ``ScholarlyResearchUseCase.export_citations``
+and reports wall time for the cache scenarios users actually hit:
+
+- cold:      first export of the collection
+- repeat:    the same collection exported again (whole-export cache hit)
+- add one:   the collection with one paper appended (per-paper fragments reused)
+- uncached:  the streaming path, which always renders every entry
+
+Usage:
+    python benchmarks/citation_export_cache_benchmark.py [--count 5000] [--format bibtex]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.citation_export_benchmark import synthetic_papers  # noqa: E402
+from src.application.scholarly_use_cases import ScholarlyResearchUseCase  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=5_000)
+    parser.add_argument("--format", default="bibtex")
+    args = parser.parse_args()
+
+    use_case = ScholarlyResearchUseCase(Mock(), Mock(), Mock())
+    papers = list(synthetic_papers(args.count + 1))
+    collection, grown = papers[:-1], papers
+
+    scenarios = (
+        ("cold", lambda: use_case.export_citations(collection, args.format)),
+        ("repeat", lambda: use_case.export_citations(collection, args.format)),
+        ("add one", lambda: use_case.export_citations(grown, args.format)),
+        ("uncached", lambda: "".join(use_case.iter_citations(grown, args.format))),
+    )
+
+    print(f"📚 Exporting {args.count:,} papers as {args.format}")
+    print(f"{'scenario':<10}{'ms':>10}{'rendered':>10}")
+    for name, run in scenarios:
+        rendered_before = use_case.export_cache.fragments_rendered
+        started = time.perf_counter()
+        run()
+        elapsed = (time.perf_counter() - started) * 1000
+        rendered = use_case.export_cache.fragments_rendered - rendered_before
+        print(f"{name:<10}{elapsed:>10.1f}{rendered:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+HTTP Load Benchmark
+
+Starts the ASGI server (src/presentation/http_server.py) with uvicorn on a
+local port, backed by stub scholarly upstreams that answer after a fixed
+latency instead of calling arXiv or Semantic Scholar, then drives it with
+concurrent keep-alive HTTP/1.1 clients and reports requests per second and
+latency percentiles for:
+
+- health:        GET /health (server and routing overhead only)
+- search (miss): POST /api/scholarly/search with a new query every request
+- search (hit):  the same query repeated, served from the shared disk cache
+
+Requires fastapi and uvicorn (see requirements.txt).
+
+Usage:
+    python benchmarks/http_load_benchmark.py [--workers 2] [--concurrency 32]
+        [--requests 2000] [--upstream-latency-ms 50]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.citation_export_benchmark import synthetic_papers  # noqa: E402
+
+LATENCY_ENV = "BENCHMARK_UPSTREAM_LATENCY"
+
+
+class StubScholarlySearcher:
+    """Stands in for UnifiedScholarlySearcher: fixed latency, synthetic papers."""
+
+    def __init__(self, latency_seconds: float):
+        self.latency_seconds = latency_seconds
+
+    def search(self, query: str, max_results: int = 10, **kwargs: Any) -> List[Dict]:
+        time.sleep(self.latency_seconds)
+        return list(synthetic_papers(max_results))
+
+
+def stub_app():
+    """uvicorn factory: the real app over stub upstreams (runs in each worker)."""
+    from src.application.container import ApplicationContainer
+    from src.presentation.http_server import create_http_app, response_cache_from_env
+    from src.presentation.web_interface import WebInterfaceHandler
+
+    searcher = StubScholarlySearcher(float(os.environ[LATENCY_ENV]))
+    container = ApplicationContainer(scholarly_searcher=searcher)
+    handler = WebInterfaceHandler(container=container)
+    return create_http_app(handler, response_cache_from_env())
+
+
+def serve(port: int, workers: int) -> None:
+    import uvicorn
+
+    uvicorn.run(
+        "benchmarks.http_load_benchmark:stub_app",
+        factory=True,
+        host="127.0.0.1",
+        port=port,
+        workers=workers,
+        log_level="warning",
+    )
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_until_up(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+
+async def request(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    method: str,
+    path: str,
+    body: bytes = b"",
+) -> Tuple[int, bytes]:
+    """One request on a keep-alive connection; returns (status, body)."""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+    status_line = await reader.readline()
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return int(status_line.split()[1]), await reader.readexactly(length)
+
+
+async def load(
+    port: int,
+    concurrency: int,
+    total: int,
+    make_request: Callable[[int], Tuple[str, str, bytes]],
+) -> Tuple[float, List[float], int]:
+    """Run ``total`` requests over ``concurrency`` connections."""
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def client() -> None:
+        nonlocal errors
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for index in counter:
+            started = time.perf_counter()
+            status, _ = await request(reader, writer, *make_request(index))
+            latencies.append(time.perf_counter() - started)
+            errors += status != 200
+        writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return time.perf_counter() - started, latencies, errors
+
+
+def search(query: str) -> Tuple[str, str, bytes]:
+    body = json.dumps({"query": query, "max_results": 10}).encode()
+    return "POST", "/api/scholarly/search", body
+
+
+async def run_scenarios(args: argparse.Namespace, port: int) -> None:
+    await wait_until_up(port)
+    scenarios = (
+        ("health", lambda i: ("GET", "/health", b"")),
+        ("search (miss)", lambda i: search(f"load test query {i}")),
+        ("search (hit)", lambda i: search("load test query 0")),
+    )
+    print(f"{'scenario':<15}{'rps':>10}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}")
+    for name, make_request in scenarios:
+        elapsed, latencies, errors = await load(
+            port, args.concurrency, args.requests, make_request
+        )
+        cuts = statistics.quantiles(latencies, n=100)
+        print(
+            f"{name:<15}{len(latencies) / elapsed:>10.0f}"
+            f"{cuts[49] * 1000:>9.1f}{cuts[89] * 1000:>9.1f}{cuts[98] * 1000:>9.1f}"
+            + (f"  ({errors} errors)" if errors else "")
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--upstream-latency-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    port = free_port()
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["RESEARCH_CACHE_PATH"] = os.path.join(directory, "cache.sqlite3")
+        os.environ[LATENCY_ENV] = str(args.upstream_latency_ms / 1000)
+        server = multiprocessing.Process(target=serve, args=(port, args.workers))
+        server.start()
+        try:
+            print(
+                f"🌐 {args.workers} worker(s), {args.concurrency} connections, "
+                f"{args.requests:,} requests per scenario, "
+                f"{args.upstream_latency_ms:.0f} ms stub upstreams"
+            )
+            asyncio.run(run_scenarios(args, port))
+        finally:
+            server.terminate()
+            server.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Import Time Benchmark
+
+Imports each entry point in a fresh interpreter under ``python -X importtime``
+and reports its cumulative import time against a budget, plus the slowest
+modules it pulled in. Entry points:
+
+- src:                        the package (``import src``)
+- src.__main__:               ``python -m src`` up to argument parsing
+- src.presentation.cli:       ``python -m src.presentation.cli`` up to parsing
+- src.presentation.mcp_server: the MCP server with its service graph
+
+None of them may load the HTTP client stack (requests, feedparser) or the
+web server stack (fastapi, uvicorn); those are imported when first used.
+tests/unit/test_startup_imports.py enforces the same budgets.
+
+Usage:
+    python benchmarks/import_time_benchmark.py [--repeat 5] [--top 8]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Cumulative import time allowed per entry point (milliseconds). Several
+# times what a laptop measures, so only a real regression - such as an
+# eager import of a heavy dependency - fails them.
+BUDGETS_MS = {
+    "src": 50,
+    "src.__main__": 150,
+    "src.presentation.cli": 200,
+    "src.presentation.mcp_server": 500,
+}
+
+# Imported only when a request is sent or a server is started
+DEFERRED_MODULES = ("requests", "feedparser", "defusedxml", "fastapi", "uvicorn")
+
+
+def import_profile(module: str) -> Tuple[float, Dict[str, float]]:
+    """
+    Import ``module`` in a fresh interpreter.
+
+    Returns:
+        The module's cumulative import time in milliseconds, and the
+        cumulative time of every module loaded by the interpreter
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    cumulative: Dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        try:
+            cumulative[name.strip()] = int(cumulative_us) / 1000
+        except ValueError:
+            continue  # the header line
+    return cumulative.get(module, 0.0), cumulative
+
+
+def slowest_modules(
+    cumulative: Dict[str, float], baseline: Dict[str, float], top: int
+) -> List[str]:
+    """
+    The ``top`` slowest modules not already loaded by a bare interpreter
+    (``baseline``, e.g. site-packages .pth hooks), as "name (ms)".
+    """
+    ranked = sorted(cumulative.items(), key=lambda item: item[1], reverse=True)
+    return [f"{name} ({ms:.1f})" for name, ms in ranked if name not in baseline][:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"⏱️  Cumulative import time, median of {args.repeat} fresh interpreters")
+    print(f"{'entry point':<30}{'ms':>8}{'budget':>8}  deferred stack loaded")
+    _, baseline = import_profile("sys")
+    over_budget = False
+    for module, budget in BUDGETS_MS.items():
+        runs = [import_profile(module) for _ in range(args.repeat)]
+        median = statistics.median(total for total, _ in runs)
+        loaded = [name for name in DEFERRED_MODULES if name in runs[-1][1]]
+        over_budget |= median > budget
+        flag = "✅" if median <= budget else "❌"
+        print(
+            f"{module:<30}{median:>8.1f}{budget:>8}  "
+            f"{', '.join(loaded) or 'none'} {flag}"
+        )
+        slowest = slowest_modules(runs[-1][1], baseline, args.top)
+        print(f"    slowest: {', '.join(slowest)}")
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
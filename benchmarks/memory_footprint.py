@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Memory Footprint Benchmark for Research Records
+
+Measures the per-object memory cost of ResearchSource and
+ResearchCollection (both slotted dataclasses) against an otherwise
+identical dict-backed dataclass, using tracemalloc to count every byte
+allocated while building a large batch of records.
+
+Usage:
+    python benchmarks/memory_footprint.py [--count 20000]
+"""
+
+import argparse
+import dataclasses
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.domain.entities import (  # noqa: E402
+    ResearchCollection,
+    ResearchSource,
+    SourceType,
+)
+
+
+def dict_backed_twin(cls: type) -> type:
+    """Build a non-slotted dataclass with the same fields and validation."""
+    twin_fields = [
+        (
+            f.name,
+            f.type,
+            dataclasses.field(
+                default=f.default,
+                default_factory=f.default_factory,
+                init=f.init,
+                repr=f.repr,
+                compare=f.compare,
+            ),
+        )
+        for f in dataclasses.fields(cls)
+    ]
+    namespace = {}
+    if hasattr(cls, "__post_init__"):
+        namespace["__post_init__"] = cls.__post_init__
+    return dataclasses.make_dataclass(
+        f"DictBacked{cls.__name__}", twin_fields, namespace=namespace
+    )
+
+
+def measure(factory: Callable[[int], Any], count: int) -> float:
+    """Return the average number of bytes allocated per object."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects: List[Any] = [factory(i) for i in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def source_kwargs(i: int) -> Dict[str, Any]:
+    return {
+        "url": f"https://example.org/paper/{i}",
+        "title": f"Synthetic paper {i}",
+        "source_type": SourceType.ARXIV,
+        "relevance_score": 0.5,
+    }
+
+
+def collection_kwargs(i: int) -> Dict[str, Any]:
+    return {"name": f"Synthetic collection {i}", "paper_count": i}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args()
+
+    cases = [
+        ("ResearchSource", ResearchSource, source_kwargs),
+        ("ResearchCollection", ResearchCollection, collection_kwargs),
+    ]
+
+    print(f"📏 Bytes allocated per object ({args.count:,} objects each)")
+    print(f"{'record':<20}{'dict-backed':>14}{'slotted':>12}{'saved':>10}")
+    for name, cls, kwargs in cases:
+        twin = dict_backed_twin(cls)
+        baseline = measure(lambda i: twin(**kwargs(i)), args.count)
+        slotted = measure(lambda i: cls(**kwargs(i)), args.count)
+        saving = 100 * (baseline - slotted) / baseline
+        print(f"{name:<20}{baseline:>14.0f}{slotted:>12.0f}{saving:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Response Size Benchmark
+
+Measures the bytes on the wire for an enhanced research response in each
+response mode, before and after compression:
+
+- default:   every source with its truncated content and its full text
+- compact:   the text once (truncated), no empty metadata
+- full_text: compact, with the untruncated text once
+
+Each mode is shown plain, gzipped and (if the brotli package is installed)
+brotli-compressed, at the settings CompressionMiddleware uses.
+
+Usage:
+    python benchmarks/response_size_benchmark.py [--sources 100]
+        [--abstract-words 250]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.serialization_benchmark import enhanced_response  # noqa: E402
+from src.presentation import compression, serialization  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sources", type=int, default=100)
+    parser.add_argument("--abstract-words", type=int, default=250)
+    args = parser.parse_args()
+
+    modes = {
+        "default": {},
+        "compact": {"compact": True},
+        "full_text": {"compact": True, "full_text": True},
+    }
+    middleware = compression.CompressionMiddleware(app=None)
+    encodings = compression.available_encodings()
+
+    print(f"📏 Enhanced research response: {args.sources} sources")
+    print(
+        f"{'mode':<12}{'plain KiB':>11}"
+        + "".join(f"{e + ' KiB':>11}" for e in encodings)
+    )
+    baseline = None
+    for name, options in modes.items():
+        body = serialization.dumps(
+            enhanced_response(args.sources, args.abstract_words, **options)
+        )
+        baseline = baseline or len(body)
+        sizes = [len(body)]
+        for encoding in encodings:
+            stream = middleware.stream_for(encoding)
+            sizes.append(len(stream.compress(body, flush=False) + stream.finish()))
+        print(
+            f"{name:<12}"
+            + "".join(f"{size / 1024:>11.1f}" for size in sizes)
+            + f"  (smallest {baseline / min(sizes):.0f}x below default)"
+        )
+
+
+if __name__ == "__main__":
+    main()
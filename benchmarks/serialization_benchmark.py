@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Serialization Throughput Benchmark
+
+Encodes an enhanced research response (the largest the web API sends: every
+source with its content, full text and scholarly metadata) repeatedly and
+reports responses per second and MB/s for:
+
+- json (before):  json.dumps with default=str, as the HTTP server used to
+- dumps (json):   serialization.dumps on the standard library backend
+- dumps (orjson): serialization.dumps with orjson (skipped if not installed)
+- hot cache hit:  the already-encoded body served from MemoryResponseCache
+
+Usage:
+    python benchmarks/serialization_benchmark.py [--sources 100]
+        [--abstract-words 250] [--iterations 200]
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict
+from unittest.mock import Mock
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.citation_export_benchmark import synthetic_papers  # noqa: E402
+from src.application.container import ApplicationContainer  # noqa: E402
+from src.application.scholarly_use_cases import _paper_to_source  # noqa: E402
+from src.domain.entities import (  # noqa: E402
+    QueryId,
+    ResearchQuery,
+    ResearchQueryType,
+    ResearchResult,
+    ResearchStatus,
+)
+from src.infrastructure.response_cache import MemoryResponseCache  # noqa: E402
+from src.presentation import serialization  # noqa: E402
+from src.presentation.web_interface import WebInterfaceHandler  # noqa: E402
+
+
+def enhanced_response(
+    sources: int, abstract_words: int, **text_options: bool
+) -> Dict[str, Any]:
+    """
+    A successful enhanced research response with ``sources`` sources.
+
+    ``text_options`` (compact, full_text) select the response mode.
+    """
+    query = ResearchQuery(
+        id=QueryId(),
+        text="graph neural networks for molecules",
+        query_type=ResearchQueryType.ACADEMIC,
+        created_at=datetime.now(),
+        max_sources=sources,
+    )
+    result = ResearchResult(query=query, status=ResearchStatus.IN_PROGRESS)
+    for paper in synthetic_papers(sources):
+        paper["abstract"] = " ".join(["molecular"] * abstract_words)
+        paper["source_type"] = "arxiv"
+        result.add_source(_paper_to_source(paper))
+    result.mark_completed()
+
+    handler = WebInterfaceHandler(
+        container=ApplicationContainer(scholarly_searcher=Mock(), pipeline=Mock())
+    )
+    data = handler._format_enhanced_result(
+        result, str(query.id.value), True, **text_options
+    )
+    return {"success": True, "data": data}
+
+
+def stdlib_before(document: Any) -> bytes:
+    return json.dumps(
+        document, default=str, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def throughput(encode: Callable[[], bytes], iterations: int) -> float:
+    """Seconds per call (best of three rounds)."""
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            encode()
+        best = min(best, (time.perf_counter() - started) / iterations)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sources", type=int, default=100)
+    parser.add_argument("--abstract-words", type=int, default=250)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    document = enhanced_response(args.sources, args.abstract_words)
+    body = stdlib_before(document)
+    hot = MemoryResponseCache()
+    hot.set("key", body)
+    fast = serialization.orjson
+
+    def stdlib_dumps() -> bytes:
+        serialization.orjson = None
+        try:
+            return serialization.dumps(document)
+        finally:
+            serialization.orjson = fast
+
+    scenarios = [
+        ("json (before)", lambda: stdlib_before(document)),
+        ("dumps (json)", stdlib_dumps),
+    ]
+    if fast is not None:
+        scenarios.append(("dumps (orjson)", lambda: serialization.dumps(document)))
+    scenarios.append(("hot cache hit", lambda: hot.get("key")))
+
+    print(
+        f"📦 Enhanced research response: {args.sources} sources, "
+        f"{len(body) / 1024:.0f} KiB encoded"
+    )
+    print(f"{'encoder':<16}{'µs/response':>13}{'responses/s':>13}{'MB/s':>9}")
+    baseline = None
+    for name, encode in scenarios:
+        seconds = throughput(encode, args.iterations)
+        baseline = baseline or seconds
+        print(
+            f"{name:<16}{seconds * 1e6:>13.1f}{1 / seconds:>13.0f}"
+            f"{len(body) / seconds / 1e6:>9.0f}"
+            f"  ({baseline / seconds:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Application Startup and Memory Benchmark
+
+Builds the MCP server, CLI and web interface in a fresh interpreter two ways
+and reports construction time, memory allocated, peak RSS and how many
+scholarly searchers and HTTP sessions exist afterwards:
+
+- separate:  every adapter wires its own service graph (the old behaviour,
+             where the web interface built its own repositories and searchers)
+- shared:    AIDeepResearchMCP, where all adapters share one ApplicationContainer
+
+Each mode runs in its own subprocess so imports and caches from one mode
+cannot flatter the other.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--repeat 5]
+"""
+
+import argparse
+import gc
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+MODES = ("separate", "shared")
+
+
+def build(mode: str) -> Dict[str, float]:
+    """Import the app, build the adapters for ``mode`` and measure the cost."""
+    import logging
+
+    logging.disable(logging.INFO)
+    started = time.perf_counter()
+    import requests  # noqa: F401
+
+    from src import AIDeepResearchMCP
+    from src.infrastructure.scholarly_sources import UnifiedScholarlySearcher
+    from src.presentation.cli import ResearchCLI
+    from src.presentation.mcp_server import McpServerHandler
+    from src.presentation.web_interface import WebInterfaceHandler
+
+    imported = time.perf_counter()
+    tracemalloc.start()
+    if mode == "separate":
+        adapters = [McpServerHandler(), ResearchCLI(), WebInterfaceHandler()]
+    else:
+        app = AIDeepResearchMCP()
+        adapters = [app.mcp_server, app.cli, app.web_interface]
+    built = time.perf_counter()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    objects = gc.get_objects()
+    return {
+        "import_ms": (imported - started) * 1000,
+        "build_ms": (built - imported) * 1000,
+        "allocated_kib": allocated / 1024,
+        "max_rss_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "searchers": sum(isinstance(o, UnifiedScholarlySearcher) for o in objects),
+        "sessions": sum(isinstance(o, requests.Session) for o in objects),
+        "adapters": len(adapters),
+    }
+
+
+def run_child(mode: str) -> Dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, __file__, "--child", mode],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(build(args.child)))
+        return
+
+    print(f"🚀 Building MCP + CLI + web adapters ({args.repeat} runs per mode)")
+    print(
+        f"{'mode':<10}{'import ms':>11}{'build ms':>10}{'alloc KiB':>11}"
+        f"{'RSS MiB':>9}{'searchers':>11}{'sessions':>10}"
+    )
+    for mode in MODES:
+        runs = [run_child(mode) for _ in range(args.repeat)]
+        last = runs[-1]
+        print(
+            f"{mode:<10}"
+            f"{statistics.median(r['import_ms'] for r in runs):>11.1f}"
+            f"{statistics.median(r['build_ms'] for r in runs):>10.1f}"
+            f"{statistics.median(r['allocated_kib'] for r in runs):>11.1f}"
+            f"{statistics.median(r['max_rss_mib'] for r in runs):>9.1f}"
+            f"{last['searchers']:>11}{last['sessions']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,34 +2,55 @@
 """
 Health Check Script for AI Deep Research MCP Production Deployment
 
-Monitors system health, performance, and functionality to ensure
-the platform is operating correctly in production.
+By default, probes a running server's liveness endpoint (or its readiness
+endpoint with ``--ready``) and exits 0 if it answered 200, 1 otherwise.
+The probe uses only the standard library and imports nothing from the
+project, so it is cheap enough for a container HEALTHCHECK:
+
+    python deployment/health-check.py [--url http://127.0.0.1:8000] [--ready]
+
+``--full`` instead runs the complete system check - module imports, each
+layer, citation export, performance, the file system and git - and saves
+the results to docs/health-check-results.json. It takes seconds; run it
+after a deployment, not as a probe.
 """
 
-import sys
-import time
+import argparse
 import json
-import requests
 import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
 from datetime import datetime
-from typing import Dict, List, Any
+from importlib import import_module
 from pathlib import Path
+from typing import Any, Dict, List
+
+DEFAULT_URL = "http://127.0.0.1:8000"
 
 # Add the project root to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-try:
-    from src.presentation.web_interface import WebInterfaceHandler
-    from src.domain.entities import ResearchQuery, QueryId, ResearchQueryType
-    from src.application.scholarly_use_cases import ScholarlyResearchUseCase
-    from src.infrastructure.repositories import (
-        InMemoryResearchQueryRepository,
-        InMemoryResearchResultRepository,
-    )
-except ImportError as e:
-    print(f"❌ Import error: {e}")
-    print("Please ensure you're running from the project root directory")
-    sys.exit(1)
+
+def probe(url: str, timeout: float) -> int:
+    """
+    GET a health endpoint and print its report.
+
+    Returns:
+        The process exit code: 0 for a 200 response, 1 otherwise
+    """
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            print(response.read().decode("utf-8"))
+            return 0 if response.status == 200 else 1
+    except urllib.error.HTTPError as e:
+        # Readiness answers 503, with its report, while not ready
+        print(e.read().decode("utf-8", "replace"))
+        return 1
+    except (urllib.error.URLError, OSError) as e:
+        print(f"Health probe failed: {e}")
+        return 1
 
 
 class HealthChecker:
@@ -110,8 +131,8 @@ class HealthChecker:
         """Check that all critical modules can be imported."""
         try:
             # Test critical imports
-            from src.domain.entities import ResearchQuery, ResearchSource
             from src.application.use_cases import CreateResearchQueryUseCase
+            from src.domain.entities import ResearchQuery, ResearchSource
             from src.infrastructure.scholarly_sources import UnifiedScholarlySearcher
             from src.presentation.mcp_server import McpServerHandler
 
@@ -122,6 +143,8 @@ class HealthChecker:
     def check_domain_layer(self) -> Dict[str, str]:
         """Check domain layer functionality."""
         try:
+            from src.domain.entities import QueryId, ResearchQuery, ResearchQueryType
+
             # Test entity creation
             query = ResearchQuery(
                 id=QueryId(),
@@ -146,6 +169,12 @@ class HealthChecker:
     def check_application_layer(self) -> Dict[str, str]:
         """Check application layer use cases."""
         try:
+            from src.application.scholarly_use_cases import ScholarlyResearchUseCase
+            from src.infrastructure.repositories import (
+                InMemoryResearchQueryRepository,
+                InMemoryResearchResultRepository,
+            )
+
             # Test use case initialization
             repo = InMemoryResearchQueryRepository()
             use_case = ScholarlyResearchUseCase(
@@ -182,6 +211,12 @@ class HealthChecker:
     def check_infrastructure_layer(self) -> Dict[str, str]:
         """Check infrastructure components."""
         try:
+            from src.domain.entities import QueryId, ResearchQuery, ResearchQueryType
+            from src.infrastructure.repositories import (
+                InMemoryResearchQueryRepository,
+                InMemoryResearchResultRepository,
+            )
+
             # Test repository functionality
             query_repo = InMemoryResearchQueryRepository()
             result_repo = InMemoryResearchResultRepository()
@@ -212,6 +247,8 @@ class HealthChecker:
     def check_web_interface(self) -> Dict[str, str]:
         """Check web interface functionality."""
         try:
+            from src.presentation.web_interface import WebInterfaceHandler
+
             handler = WebInterfaceHandler()
 
             # Test API documentation generation
@@ -234,6 +271,12 @@ class HealthChecker:
     def check_citation_export(self) -> Dict[str, str]:
         """Test citation export functionality in detail."""
         try:
+            from src.application.scholarly_use_cases import ScholarlyResearchUseCase
+            from src.infrastructure.repositories import (
+                InMemoryResearchQueryRepository,
+                InMemoryResearchResultRepository,
+            )
+
             use_case = ScholarlyResearchUseCase(
                 InMemoryResearchQueryRepository(), InMemoryResearchResultRepository()
             )
@@ -283,6 +326,8 @@ class HealthChecker:
     def check_performance(self) -> Dict[str, str]:
         """Check basic performance metrics."""
         try:
+            from src.domain.entities import QueryId, ResearchQuery, ResearchQueryType
+
             # Test query creation performance
             start_time = time.time()
 
@@ -396,8 +441,15 @@ class HealthChecker:
             return {"status": "WARN", "message": f"Git status check failed: {e}"}
 
 
-def main():
-    """Run health checks and output results."""
+def run_full_check() -> None:
+    """Run every system check, save the results and exit with their status."""
+    try:
+        # Imports every layer; each check imports what it exercises itself
+        import_module("src.presentation.web_interface")
+    except ImportError as e:
+        print(f"❌ Import error: {e}")
+        print("Please ensure you're running from the project root directory")
+        sys.exit(1)
     checker = HealthChecker()
     results = checker.run_all_checks()
 
@@ -436,5 +488,29 @@ def main():
         sys.exit(1)
 
 
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Probe a running server, or run the full system check"
+    )
+    parser.add_argument("--url", default=DEFAULT_URL, help="Server base URL")
+    parser.add_argument(
+        "--ready",
+        action="store_true",
+        help="Probe readiness (/health/ready) instead of liveness (/health/live)",
+    )
+    parser.add_argument("--timeout", type=float, default=2.0)
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Run the full system check instead of probing a server",
+    )
+    args = parser.parse_args()
+
+    if args.full:
+        run_full_check()
+    endpoint = "/health/ready" if args.ready else "/health/live"
+    sys.exit(probe(args.url.rstrip("/") + endpoint, args.timeout))
+
+
 if __name__ == "__main__":
     main()
@@ -18,38 +18,48 @@ Key Features:
 - Professional software architecture
 """
 
-from .__main__ import AIDeepResearchMCP, create_app
-from .application.use_cases import (
-    CreateResearchQueryUseCase,
-    ExecuteResearchUseCase,
-    ResearchOrchestrationService,
-)
-
-# Core imports - individual modules can be imported as needed
-from .domain.entities import QueryId, ResearchQuery, ResearchResult, ResearchSource
-from .presentation.cli import ResearchCLI
-from .presentation.mcp_server import create_mcp_server
-from .presentation.web_interface import create_web_interface
+from importlib import import_module
+from typing import Any, List
 
 __version__ = "1.0.0"
 __author__ = "AI Deep Research MCP Team"
 __email__ = "contact@airesearch.dev"
 
-__all__ = [
+# Public names and the module each one lives in. They are imported on first
+# access (PEP 562), so ``import src`` - and every ``python -m src...``
+# entry point - only loads the layers it actually uses.
+_LAZY_EXPORTS = {
     # Main application
-    "create_app",
-    "AIDeepResearchMCP",
+    "create_app": ".__main__",
+    "AIDeepResearchMCP": ".__main__",
     # Presentation interfaces
-    "create_mcp_server",
-    "ResearchCLI",
-    "create_web_interface",
+    "create_mcp_server": ".presentation.mcp_server",
+    "ResearchCLI": ".presentation.cli",
+    "create_web_interface": ".presentation.web_interface",
     # Domain entities (for advanced usage)
-    "ResearchQuery",
-    "ResearchResult",
-    "ResearchSource",
-    "QueryId",
+    "ResearchQuery": ".domain.entities",
+    "ResearchResult": ".domain.entities",
+    "ResearchSource": ".domain.entities",
+    "QueryId": ".domain.entities",
     # Use cases (for custom integrations)
-    "CreateResearchQueryUseCase",
-    "ExecuteResearchUseCase",
-    "ResearchOrchestrationService",
-]
+    "ApplicationContainer": ".application.container",
+    "get_application_container": ".application.container",
+    "CreateResearchQueryUseCase": ".application.use_cases",
+    "ExecuteResearchUseCase": ".application.use_cases",
+    "ResearchOrchestrationService": ".application.use_cases",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # later lookups skip this hook
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
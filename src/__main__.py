@@ -5,21 +5,24 @@ This module serves as the primary entry point for the AI Deep Research MCP syste
 It provides educational examples of how to structure professional Python applications.
 """
 
+import argparse
 import asyncio
 import logging
+import os
 import sys
+from functools import cached_property
 from pathlib import Path
-
-# Import infrastructure for shared repositories
-from .infrastructure.repositories import (
-    InMemoryResearchQueryRepository,
-    InMemoryResearchResultRepository,
-)
-from .presentation.cli import ResearchCLI
-
-# Import presentation layer components
-from .presentation.mcp_server import create_mcp_server
-from .presentation.web_interface import create_web_interface
+from typing import TYPE_CHECKING, List, Optional
+
+# Educational note: the service graph and the presentation layers are
+# imported where they are first used, not here. ``--help`` then answers
+# without loading them, and each transport loads only the interface it
+# serves - a faster start for short commands and container cold starts.
+if TYPE_CHECKING:
+    from .application.container import ApplicationContainer
+    from .presentation.cli import ResearchCLI
+    from .presentation.mcp_server import McpServerHandler
+    from .presentation.web_interface import WebInterfaceHandler
 
 # Add src to path for imports - Educational note: This ensures our modules can be found
 sys.path.insert(0, str(Path(__file__).parent))
@@ -39,25 +42,47 @@ class AIDeepResearchMCP:
     and provides a unified entry point for the application.
     """
 
-    def __init__(self):
-        """Initialize the main application with shared repositories."""
-        # Shared infrastructure
-        self.query_repository = InMemoryResearchQueryRepository()
-        self.result_repository = InMemoryResearchResultRepository()
+    def __init__(self, container: Optional["ApplicationContainer"] = None):
+        """
+        Initialize the main application with one shared service graph.
 
-        # Initialize interfaces with shared repositories
-        self.mcp_server = create_mcp_server(
-            query_repository=self.query_repository,
-            result_repository=self.result_repository,
-        )
-        self.cli = ResearchCLI(
-            query_repository=self.query_repository,
-            result_repository=self.result_repository,
-        )
-        self.web_interface = create_web_interface()
+        Args:
+            container: Services shared by every interface (the process-wide
+                container by default), so repositories, searchers, HTTP
+                sessions and caches exist once
+        """
+        if container is None:
+            from .application.container import get_application_container
+
+            container = get_application_container()
+        self.container = container
+
+        # Shared infrastructure
+        self.query_repository = self.container.query_repository
+        self.result_repository = self.container.result_repository
 
         logger.info("AI Deep Research MCP initialized successfully")
 
+    # Interfaces are built with the shared container on first use
+
+    @cached_property
+    def mcp_server(self) -> "McpServerHandler":
+        from .presentation.mcp_server import create_mcp_server
+
+        return create_mcp_server(container=self.container)
+
+    @cached_property
+    def cli(self) -> "ResearchCLI":
+        from .presentation.cli import ResearchCLI
+
+        return ResearchCLI(container=self.container)
+
+    @cached_property
+    def web_interface(self) -> "WebInterfaceHandler":
+        from .presentation.web_interface import create_web_interface
+
+        return create_web_interface(container=self.container)
+
     def get_mcp_server(self):
         """Get the MCP server handler."""
         return self.mcp_server
@@ -74,71 +99,123 @@ class AIDeepResearchMCP:
         """
         Perform a health check on the system.
 
+        Reads the container's readiness report; nothing is created or
+        stored, so it is safe to call as often as needed.
+
         Returns:
             True if system is healthy, False otherwise
         """
         try:
-            # Test basic functionality
-            query_id = await self.cli.create_query("Health check test query")
-            logger.info(f"Health check passed - created query {query_id}")
-            return True
+            report = self.container.health.readiness()
         except Exception as e:
             logger.error(f"Health check failed: {e}")
             return False
+        if report["status"] != "ready":
+            logger.error(f"Health check failed: {report['checks']['event_loop']}")
+            return False
+        logger.info("Health check passed")
+        return True
 
 
-def create_app() -> AIDeepResearchMCP:
+def create_app(container: Optional["ApplicationContainer"] = None) -> AIDeepResearchMCP:
     """
     Application factory function.
 
     Creates and configures the main application instance.
     This is the recommended way to create the application.
 
+    Args:
+        container: Optional service graph (the process-wide one by default)
+
     Returns:
         Configured AIDeepResearchMCP instance
     """
-    return AIDeepResearchMCP()
-
-
-async def main():
+    return AIDeepResearchMCP(container)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse server options (environment variables provide the defaults)."""
+    parser = argparse.ArgumentParser(description="AI Deep Research MCP server")
+    parser.add_argument("--host", default=os.environ.get("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 8000)))
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("WEB_CONCURRENCY", 1)),
+        help="HTTP worker processes (they share the on-disk response cache)",
+    )
+    parser.add_argument(
+        "--transport",
+        choices=("http", "stdio"),
+        default=os.environ.get("MCP_TRANSPORT", "http"),
+        help="'stdio' serves MCP JSON-RPC on stdin/stdout for a local MCP "
+        "client; 'http' serves the web API (and MCP over WebSocket at /mcp)",
+    )
+    parser.add_argument(
+        "--cache-path",
+        default=None,
+        help="Shared response cache file ('' disables caching)",
+    )
+    parser.add_argument(
+        "--collections-path",
+        default=None,
+        help="Research collection database shared by the HTTP workers "
+        "('' keeps collections in memory)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
     """
-    Main async entry point for the application.
+    Main entry point for the application.
 
-    Starts the MCP server and keeps it running for container deployment.
+    Checks the application is healthy, then serves the HTTP API (the port
+    nginx proxies to) until the process is asked to stop, or with
+    ``--transport stdio`` serves MCP on stdin/stdout until the client
+    closes stdin.
     """
+    args = parse_args(argv)
     app = create_app()
 
     # Perform health check
-    is_healthy = await app.health_check()
+    is_healthy = asyncio.run(app.health_check())
     if not is_healthy:
         logger.error("Application health check failed")
         sys.exit(1)
 
+    if args.transport == "stdio":
+        from .presentation.mcp_transport import serve_stdio
+
+        # stdout carries the protocol, so everything else logs to stderr
+        asyncio.run(serve_stdio(app.get_mcp_server()))
+        return
+
     logger.info("🚀 Starting AI Deep Research MCP Server...")
     logger.info("🎓 Educational MCP Server for middle school students")
     logger.info("Available interfaces:")
-    logger.info("- MCP Server: Started and listening")
+    logger.info(f"- HTTP API: http://{args.host}:{args.port}/api/docs")
+    logger.info(f"- MCP (WebSocket): ws://{args.host}:{args.port}/mcp")
     logger.info("- CLI: Available via ResearchCLI()")
     logger.info("- Web Interface: Available via create_web_interface()")
 
-    # Start MCP server and keep it running
     try:
-        # Create and start the MCP server
-        logger.info("✅ MCP Server is now running and ready for connections")
-        logger.info("🎯 Container will continue running to serve MCP requests")
-
-        # Keep the server running by waiting indefinitely
-        # This prevents the container from exiting
-        while True:
-            await asyncio.sleep(60)  # Sleep for 1 minute intervals
-            logger.debug("🔄 MCP Server heartbeat - still running")
-
-    except KeyboardInterrupt:
-        logger.info("🛑 Shutting down MCP Server...")
+        # Imported here so the CLI and tests do not need the web server stack
+        from .presentation.http_server import run_server
+
+        # uvicorn handles SIGTERM/SIGINT: it stops accepting connections
+        # and lets in-flight requests finish before shutting down
+        run_server(
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            cache_path=args.cache_path,
+            collections_path=args.collections_path,
+        )
+        logger.info("🛑 AI Deep Research MCP Server stopped")
     except Exception as e:
         logger.error(f"❌ MCP Server error: {e}")
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
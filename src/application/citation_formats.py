@@ -0,0 +1,439 @@
+"""
+Citation Format Registry
+
+Every export style (BibTeX, RIS, EndNote, APA, MLA, IEEE, Chicago) is
+declared once as a template - a sequence of literal text, optional fields,
+repeated fields and computed pieces. Registering a template compiles it into
+a flat tuple of render steps, so rendering a paper is a single pass over
+precomputed steps with no per-call branching on the style name.
+
+Educational Note:
+A template is like a fill-in-the-blanks form. Instead of re-reading the
+instructions ("if there is a year, write 'PY  - ' then the year...") for
+every paper, we prepare the form once and then just drop each paper's
+values into the blanks.
+"""
+
+import hashlib
+import marshal
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+Paper = Dict[str, Any]
+RenderStep = Callable[[Paper, int, List[str]], None]
+
+
+# Template segments
+
+
+@dataclass(frozen=True)
+class Text:
+    """Literal text emitted for every paper."""
+
+    value: str
+
+
+@dataclass(frozen=True)
+class Field:
+    """``pattern`` filled with a field's value, emitted only when it is truthy."""
+
+    name: str
+    pattern: str = "{}"
+
+
+@dataclass(frozen=True)
+class Always:
+    """``pattern`` filled with a field's value (or ``default``), always emitted."""
+
+    name: str
+    pattern: str = "{}"
+    default: Any = ""
+
+
+@dataclass(frozen=True)
+class Each:
+    """``pattern`` emitted once per item of a list field."""
+
+    name: str
+    pattern: str = "{}"
+
+
+@dataclass(frozen=True)
+class Computed:
+    """Text computed from the whole paper and its 1-based position."""
+
+    render: Callable[[Paper, int], str]
+
+
+Segment = Any  # Text | Field | Always | Each | Computed
+
+
+def _compile_segment(segment: Segment) -> RenderStep:
+    if isinstance(segment, Text):
+        value = segment.value
+        return lambda paper, number, out: out.append(value)
+
+    if isinstance(segment, Field):
+        name, fill = segment.name, segment.pattern.format
+
+        def field_step(paper: Paper, number: int, out: List[str]) -> None:
+            value = paper.get(name)
+            if value:
+                out.append(fill(value))
+
+        return field_step
+
+    if isinstance(segment, Always):
+        name, fill, default = segment.name, segment.pattern.format, segment.default
+        return lambda paper, number, out: out.append(fill(paper.get(name, default)))
+
+    if isinstance(segment, Each):
+        name, fill = segment.name, segment.pattern.format
+        return lambda paper, number, out: out.extend(
+            fill(item) for item in paper.get(name) or ()
+        )
+
+    if isinstance(segment, Computed):
+        render = segment.render
+        return lambda paper, number, out: out.append(render(paper, number))
+
+    raise TypeError(f"Unknown template segment: {segment!r}")
+
+
+def _merge_literals(template: Iterable[Segment]) -> List[Segment]:
+    merged: List[Segment] = []
+    for segment in template:
+        if isinstance(segment, Text) and merged and isinstance(merged[-1], Text):
+            merged[-1] = Text(merged[-1].value + segment.value)
+        else:
+            merged.append(segment)
+    return merged
+
+
+@dataclass(frozen=True)
+class CitationFormat:
+    """A compiled citation style."""
+
+    name: str
+    content_type: str
+    separator: str
+    steps: Tuple[RenderStep, ...]
+    positional: bool = False  # entries depend on their position (e.g. IEEE [n])
+
+    def render(self, paper: Paper, number: int = 1) -> str:
+        """Render one paper (``number`` is its 1-based bibliography position)."""
+        out: List[str] = []
+        for step in self.steps:
+            step(paper, number, out)
+        return "".join(out)
+
+    def render_many(self, papers: Iterable[Paper]) -> Iterator[str]:
+        """Yield one entry per paper, with the style's separator between entries."""
+        steps = self.steps
+        separator = ""
+        for number, paper in enumerate(papers, 1):
+            out: List[str] = [separator]
+            for step in steps:
+                step(paper, number, out)
+            separator = self.separator
+            yield "".join(out)
+
+
+class CitationFormatRegistry:
+    """Named citation styles, compiled once at registration."""
+
+    def __init__(self) -> None:
+        self._formats: Dict[str, CitationFormat] = {}
+
+    def register(
+        self,
+        name: str,
+        template: Iterable[Segment],
+        content_type: str = "text/plain",
+        separator: str = "",
+        positional: bool = False,
+    ) -> CitationFormat:
+        """
+        Compile ``template`` and register it under ``name``.
+
+        Args:
+            separator: Text placed between entries (for styles whose entries
+                do not end with their own terminator)
+            positional: True if an entry's text depends on its position in
+                the bibliography, so cached entries are keyed by position too
+        """
+        compiled = CitationFormat(
+            name=name.lower(),
+            content_type=content_type,
+            separator=separator,
+            steps=tuple(_compile_segment(s) for s in _merge_literals(template)),
+            positional=positional,
+        )
+        self._formats[compiled.name] = compiled
+        return compiled
+
+    def get(self, name: str) -> Optional[CitationFormat]:
+        """Find a style by name (case-insensitive)."""
+        return self._formats.get(name.lower())
+
+    def names(self) -> List[str]:
+        """List registered style names in registration order."""
+        return list(self._formats)
+
+    def content_type(self, name: str) -> str:
+        """Download content type for a style (text/plain if unknown)."""
+        citation_format = self.get(name)
+        return citation_format.content_type if citation_format else "text/plain"
+
+
+def _paper_digest(paper: Paper) -> bytes:
+    try:
+        # marshal is a fast C serializer for the plain JSON-like values papers
+        # hold; version 2 predates back-references, so equal papers always
+        # serialize to equal bytes
+        content = marshal.dumps(paper, 2)
+    except ValueError:
+        content = repr(sorted(paper.items())).encode("utf-8")
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+class CitationExportCache:
+    """
+    Memoizes whole bibliographies and the individual entries they are built from.
+
+    A bibliography is keyed by a content fingerprint of its papers (in order)
+    plus the style name, so re-exporting an unchanged collection is a single
+    lookup. Entries are cached per paper content, so exporting a collection
+    with one new or edited paper renders only that paper. Both levels are
+    bounded LRUs.
+
+    Keys use the style name: call ``clear`` after re-registering a style.
+    """
+
+    def __init__(self, max_exports: int = 32, max_fragments: int = 100_000):
+        self.max_exports = max_exports
+        self.max_fragments = max_fragments
+        self._exports: "OrderedDict[bytes, str]" = OrderedDict()
+        self._fragments: "OrderedDict[Tuple[str, int, bytes], str]" = OrderedDict()
+        self.export_hits = 0
+        self.fragments_rendered = 0
+
+    def export(self, papers: Iterable[Paper], citation_format: CitationFormat) -> str:
+        """Return the full bibliography for ``papers`` in ``citation_format``."""
+        digests = [(paper, _paper_digest(paper)) for paper in papers]
+        fingerprint = self.fingerprint(
+            (digest for _, digest in digests), citation_format
+        )
+
+        cached = self._exports.get(fingerprint)
+        if cached is not None:
+            self._exports.move_to_end(fingerprint)
+            self.export_hits += 1
+            return cached
+
+        text = citation_format.separator.join(
+            self._fragment(citation_format, paper, digest, number)
+            for number, (paper, digest) in enumerate(digests, 1)
+        )
+        self._remember(self._exports, fingerprint, text, self.max_exports)
+        return text
+
+    @staticmethod
+    def fingerprint(digests: Iterable[bytes], citation_format: CitationFormat) -> bytes:
+        """Combine per-paper digests and the style name into one key."""
+        combined = hashlib.blake2b(citation_format.name.encode("utf-8"))
+        for digest in digests:
+            combined.update(digest)
+        return combined.digest()
+
+    def clear(self) -> None:
+        """Drop every cached bibliography and entry."""
+        self._exports.clear()
+        self._fragments.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Entry counts and hit counters (no rendering, no locking)."""
+        return {
+            "exports": len(self._exports),
+            "fragments": len(self._fragments),
+            "export_hits": self.export_hits,
+            "fragments_rendered": self.fragments_rendered,
+        }
+
+    def _fragment(
+        self, citation_format: CitationFormat, paper: Paper, digest: bytes, number: int
+    ) -> str:
+        key = (
+            citation_format.name,
+            number if citation_format.positional else 0,
+            digest,
+        )
+        cached = self._fragments.get(key)
+        if cached is not None:
+            self._fragments.move_to_end(key)
+            return cached
+
+        entry = citation_format.render(paper, number)
+        self.fragments_rendered += 1
+        self._remember(self._fragments, key, entry, self.max_fragments)
+        return entry
+
+    @staticmethod
+    def _remember(cache: OrderedDict, key: Any, value: str, limit: int) -> None:
+        if limit <= 0:
+            return
+        cache[key] = value
+        if len(cache) > limit:
+            cache.popitem(last=False)
+
+
+# Shared helpers for the built-in styles
+
+
+def _author_list(paper: Paper) -> List[str]:
+    return paper.get("authors") or ["Unknown Author"]
+
+
+def _join_authors(authors: List[str], final: str = ", & ") -> str:
+    if len(authors) == 1:
+        return authors[0]
+    if len(authors) == 2:
+        return f"{authors[0]}{final.replace(', ', ' ', 1)}{authors[1]}"
+    return f"{', '.join(authors[:-1])}{final}{authors[-1]}"
+
+
+def _link(paper: Paper, url_prefix: str = "") -> str:
+    if paper.get("doi"):
+        return f"https://doi.org/{paper['doi']}"
+    if paper.get("source_url"):
+        return f"{url_prefix}{paper['source_url']}"
+    return ""
+
+
+def _bibtex_key(paper: Paper, number: int) -> str:
+    first_author = (
+        paper["authors"][0].split()[-1] if paper.get("authors") else "Unknown"
+    )
+    year = paper.get("year", datetime.now().year)
+    title_words = paper.get("title", "").split()[:2]
+    key = f"{first_author}{year}{''.join(title_words)}"
+    return "".join(c for c in key if c.isalnum())
+
+
+def _apa(paper: Paper, number: int) -> str:
+    citation = (
+        f"{_join_authors(_author_list(paper))} ({paper.get('year', 'n.d.')}). "
+        f"{paper.get('title', 'Unknown title')}. "
+        f"{paper.get('venue', 'Unknown venue')}."
+    )
+    link = _link(paper, url_prefix="Retrieved from ")
+    return f"{citation} {link}" if link else citation
+
+
+def _mla(paper: Paper, number: int) -> str:
+    authors = _author_list(paper)
+    if len(authors) == 1:
+        author_str = authors[0]
+    elif len(authors) == 2:
+        author_str = f"{authors[0]}, and {authors[1]}"
+    else:
+        author_str = f"{authors[0]}, et al"
+    parts = [f'{author_str}. "{paper.get("title", "Untitled")}."']
+    details = [str(v) for v in (paper.get("venue"), paper.get("year")) if v]
+    link = _link(paper)
+    if link:
+        details.append(link)
+    if details:
+        parts.append(f"{', '.join(details)}.")
+    return " ".join(parts)
+
+
+def _ieee(paper: Paper, number: int) -> str:
+    authors = _join_authors(_author_list(paper), final=", and ")
+    details = [str(v) for v in (paper.get("venue"), paper.get("year")) if v]
+    if paper.get("doi"):
+        details.append(f"doi: {paper['doi']}")
+    citation = f'[{number}] {authors}, "{paper.get("title", "Untitled")},"'
+    if details:
+        return f"{citation} {', '.join(details)}."
+    return citation
+
+
+def _chicago(paper: Paper, number: int) -> str:
+    authors = _join_authors(_author_list(paper), final=", and ")
+    year = f"{paper['year']}." if paper.get("year") else "n.d."
+    parts = [f'{authors}. {year} "{paper.get("title", "Untitled")}."']
+    if paper.get("venue"):
+        parts.append(f"{paper['venue']}.")
+    link = _link(paper)
+    if link:
+        parts.append(f"{link}.")
+    return " ".join(parts)
+
+
+def create_default_citation_formats() -> CitationFormatRegistry:
+    """Build a registry with every built-in export style."""
+    registry = CitationFormatRegistry()
+    registry.register(
+        "bibtex",
+        [
+            Text("@article{"),
+            Computed(_bibtex_key),
+            Text(",\n"),
+            Always("title", "  title = {{{}}},\n", default="Unknown Title"),
+            Computed(
+                lambda paper, number: (
+                    f"  author = {{{' and '.join(paper['authors'])}}},\n"
+                    if paper.get("authors")
+                    else ""
+                )
+            ),
+            Field("year", "  year = {{{}}},\n"),
+            Field("venue", "  journal = {{{}}},\n"),
+            Field("doi", "  doi = {{{}}},\n"),
+            Field("source_url", "  url = {{{}}},\n"),
+            Always("abstract", "  abstract = {{{}}}\n"),
+            Text("}\n\n"),
+        ],
+        content_type="application/x-bibtex",
+    )
+    registry.register(
+        "ris",
+        [
+            Text("TY  - JOUR\n"),
+            Always("title", "TI  - {}\n", default="Unknown Title"),
+            Each("authors", "AU  - {}\n"),
+            Field("year", "PY  - {}\n"),
+            Field("venue", "JO  - {}\n"),
+            Field("doi", "DO  - {}\n"),
+            Field("source_url", "UR  - {}\n"),
+            Field("abstract", "AB  - {}\n"),
+            Text("ER  - \n\n"),
+        ],
+        content_type="application/x-research-info-systems",
+    )
+    registry.register(
+        "endnote",
+        [
+            Text("%0 Journal Article\n"),
+            Always("title", "%T {}\n", default="Unknown Title"),
+            Each("authors", "%A {}\n"),
+            Field("year", "%D {}\n"),
+            Field("venue", "%J {}\n"),
+            Field("doi", "%R {}\n"),
+            Field("source_url", "%U {}\n"),
+            Field("abstract", "%X {}\n"),
+            Text("\n"),
+        ],
+        content_type="application/x-endnote-refer",
+    )
+    registry.register("apa", [Computed(_apa)], separator="\n\n")
+    registry.register("mla", [Computed(_mla)], separator="\n\n")
+    registry.register("ieee", [Computed(_ieee)], separator="\n\n", positional=True)
+    registry.register("chicago", [Computed(_chicago)], separator="\n\n")
+    return registry
+
+
+default_citation_formats = create_default_citation_formats()
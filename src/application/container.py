@@ -0,0 +1,135 @@
+"""
+Application Container
+
+Builds the application's service graph - repositories, the scholarly
+searcher (and its HTTP sessions), the research pipeline, every use case,
+the citation caches and the health probes - in one place. The MCP server,
+CLI and web interface take a container instead of wiring their own copies,
+so adapters that share a container share connection pools, caches and
+stored research.
+
+get_application_container() returns the process-wide container used by the
+adapter factories; construct ApplicationContainer directly for an isolated
+graph (tests, or custom repositories).
+
+Educational Note:
+Think of the container as a school's supply room. Instead of every
+classroom buying its own projector and printer, the supply room sets them
+up once and each class borrows the same ones.
+"""
+
+from threading import Lock
+from typing import Optional
+
+from ..domain.entities import (
+    ResearchCollectionRepository,
+    ResearchQueryRepository,
+    ResearchResultRepository,
+)
+from ..infrastructure.repositories import (
+    InMemoryResearchQueryRepository,
+    InMemoryResearchResultRepository,
+)
+from ..infrastructure.scholarly_sources import UnifiedScholarlySearcher
+from .health import HealthService
+from .research_collections import ResearchCollectionService
+from .research_jobs import ResearchJobQueue
+from .research_pipeline import ResearchPipeline, create_default_research_pipeline
+from .scholarly_use_cases import (
+    EnhancedResearchOrchestrationService,
+    ScholarlyResearchUseCase,
+)
+from .use_cases import (
+    CreateResearchQueryUseCase,
+    ExecuteResearchUseCase,
+    GetResearchResultsUseCase,
+    ResearchOrchestrationService,
+)
+
+
+class ApplicationContainer:
+    """The shared service graph injected into every presentation adapter."""
+
+    def __init__(
+        self,
+        query_repository: Optional[ResearchQueryRepository] = None,
+        result_repository: Optional[ResearchResultRepository] = None,
+        collection_repository: Optional[ResearchCollectionRepository] = None,
+        scholarly_searcher: Optional[UnifiedScholarlySearcher] = None,
+        pipeline: Optional[ResearchPipeline] = None,
+    ):
+        """
+        Args:
+            query_repository: Query storage (in-memory by default)
+            result_repository: Result storage (in-memory by default)
+            collection_repository: Collection storage (in-memory by default)
+            scholarly_searcher: Searcher shared by the pipeline and the
+                scholarly use case
+            pipeline: Research pipeline (arXiv and Semantic Scholar branches
+                over ``scholarly_searcher`` by default)
+        """
+        # Infrastructure
+        self.query_repository = (
+            query_repository
+            if query_repository is not None
+            else InMemoryResearchQueryRepository()
+        )
+        self.result_repository = (
+            result_repository
+            if result_repository is not None
+            else InMemoryResearchResultRepository()
+        )
+        self.scholarly_searcher = scholarly_searcher or UnifiedScholarlySearcher()
+        self.pipeline = pipeline or create_default_research_pipeline(
+            self.scholarly_searcher
+        )
+
+        # Core research use cases
+        self.create_query_use_case = CreateResearchQueryUseCase(
+            query_repository=self.query_repository
+        )
+        self.execute_research_use_case = ExecuteResearchUseCase(
+            query_repository=self.query_repository,
+            result_repository=self.result_repository,
+            pipeline=self.pipeline,
+        )
+        self.get_results_use_case = GetResearchResultsUseCase(
+            query_repository=self.query_repository,
+            result_repository=self.result_repository,
+        )
+        self.orchestration_service = ResearchOrchestrationService(
+            create_query_use_case=self.create_query_use_case,
+            execute_research_use_case=self.execute_research_use_case,
+        )
+
+        # Scholarly research, citation caches and collections
+        self.scholarly_use_case = ScholarlyResearchUseCase(
+            self.query_repository,
+            self.result_repository,
+            scholarly_searcher=self.scholarly_searcher,
+        )
+        self.enhanced_orchestration = EnhancedResearchOrchestrationService(
+            self.query_repository, self.result_repository, self.scholarly_use_case
+        )
+        self.collection_service = ResearchCollectionService(
+            collection_repository, self.scholarly_use_case
+        )
+
+        # Background execution for long research runs
+        self.job_queue = ResearchJobQueue()
+
+        # Liveness and readiness reports (read-only)
+        self.health = HealthService(self)
+
+
+_container: Optional[ApplicationContainer] = None
+_container_lock = Lock()
+
+
+def get_application_container() -> ApplicationContainer:
+    """Return the process-wide container, building it on first use."""
+    global _container
+    with _container_lock:
+        if _container is None:
+            _container = ApplicationContainer()
+        return _container
@@ -0,0 +1,183 @@
+"""
+Health Probes
+
+Liveness and readiness reports for container orchestrators, load balancers
+and ``deployment/health-check.py``. Both only read counters the services
+already keep: they never write to a repository, call an external API or
+await anything, so a probe answers in well under a millisecond and can run
+as often as an orchestrator likes.
+
+- ``liveness`` says the process is up: status and uptime, nothing else.
+- ``readiness`` adds what the process holds and how its dependencies are
+  doing: repository sizes, cache sizes and hit counters, the job queue,
+  each external API's recent outcomes and the event loop's lag. It is not
+  ready while the event loop lags by more than ``max_loop_lag_seconds``.
+
+An unreachable external API does not make the process unready - searches
+still answer from the other source and the caches - it shows up as that
+upstream's ``state``.
+
+Educational Note:
+A liveness probe is a nurse checking you have a pulse; a readiness probe
+asks whether you are fit to see visitors. Neither should involve surgery -
+a check that does real work (like creating a research query every time)
+slowly becomes the thing it was meant to detect.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_LOOP_LAG_SECONDS = 1.0
+
+
+class EventLoopLagMonitor:
+    """
+    Measures how late the event loop wakes a sleeping task.
+
+    A background task sleeps for ``interval`` seconds at a time; anything
+    beyond ``interval`` before it runs again is time the loop spent on
+    blocking work. Probes read the last and worst samples, so measuring lag
+    never makes a probe wait.
+    """
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+        self.samples = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start sampling on the running event loop (idempotent)."""
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(
+                self._sample(), name="event-loop-lag-monitor"
+            )
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lag_seconds = max(0.0, loop.time() - started - self.interval)
+            self.max_lag_seconds = max(self.max_lag_seconds, self.lag_seconds)
+            self.samples += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "lag_ms": round(self.lag_seconds * 1000, 3),
+            "max_lag_ms": round(self.max_lag_seconds * 1000, 3),
+            "samples": self.samples,
+        }
+
+
+def _size(repository: Any) -> Optional[int]:
+    """
+    How many items ``repository`` holds, or None if it cannot say cheaply.
+
+    Only in-memory repositories define ``count``; a database-backed one
+    would have to query, which a probe must not do.
+    """
+    return _report(repository, "count")
+
+
+def _report(owner: Any, method: str) -> Optional[Any]:
+    """``owner.method()`` if its class defines it (test doubles do not)."""
+    if owner is None or not callable(getattr(type(owner), method, None)):
+        return None
+    return getattr(owner, method)()
+
+
+class HealthService:
+    """Builds liveness and readiness reports from an application container."""
+
+    def __init__(
+        self,
+        container: Any,
+        loop_monitor: Optional[EventLoopLagMonitor] = None,
+        max_loop_lag_seconds: float = DEFAULT_MAX_LOOP_LAG_SECONDS,
+    ):
+        """
+        Args:
+            container: The ApplicationContainer whose services are reported
+            loop_monitor: Event loop lag sampler (started by the server)
+            max_loop_lag_seconds: Lag above which the process is not ready
+        """
+        self.container = container
+        self.loop_monitor = loop_monitor or EventLoopLagMonitor()
+        self.max_loop_lag_seconds = max_loop_lag_seconds
+        self.started_at = time.time()
+        self._started = time.monotonic()
+
+    def uptime_seconds(self) -> float:
+        return round(time.monotonic() - self._started, 3)
+
+    def liveness(self) -> Dict[str, Any]:
+        """The process is up and serving."""
+        return {"status": "alive", "uptime_seconds": self.uptime_seconds()}
+
+    def readiness(
+        self, caches: Optional[Dict[str, Callable[[], Dict[str, Any]]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Whether the process can take traffic, and what it is holding.
+
+        Args:
+            caches: Extra cache reporters by name (the HTTP server's
+                response caches live outside the container)
+
+        Returns:
+            ``status`` is "ready" or "not_ready"; ``checks`` holds the details
+        """
+        container = self.container
+        collection_service = getattr(container, "collection_service", None)
+        cache_stats: Dict[str, Any] = {
+            "citations": _report(container.scholarly_use_case, "cache_stats")
+        }
+        for name, stats in (caches or {}).items():
+            cache_stats[name] = stats()
+
+        loop = self.loop_monitor.to_dict()
+        lagging = self.loop_monitor.lag_seconds > self.max_loop_lag_seconds
+        return {
+            "status": "not_ready" if lagging else "ready",
+            "uptime_seconds": self.uptime_seconds(),
+            "checks": {
+                "repositories": {
+                    "queries": _size(container.query_repository),
+                    "results": _size(container.result_repository),
+                    "collections": _size(
+                        getattr(collection_service, "repository", None)
+                    ),
+                },
+                "caches": cache_stats,
+                "upstreams": _report(container.scholarly_searcher, "upstream_status")
+                or {},
+                "jobs": _report(container.job_queue, "stats"),
+                "pipeline": _report(container.pipeline, "stats"),
+                "event_loop": {
+                    **loop,
+                    "max_allowed_lag_ms": self.max_loop_lag_seconds * 1000,
+                },
+            },
+        }
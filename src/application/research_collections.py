@@ -0,0 +1,147 @@
+"""
+Research Collections
+
+Researchers keep project libraries of thousands of papers. This service
+manages named collections on top of a ResearchCollectionRepository:
+papers are deduplicated by DOI or normalized title, can be added and
+removed in bulk, are listed page by page, and export straight into any
+citation format through the scholarly use case's cached exporter.
+
+Educational Note:
+A collection is like a shelf in your own study. The repository keeps two
+card catalogues - one per shelf listing its papers, and one per paper
+listing the shelves it sits on - so "is this paper already on my shelf?"
+is answered by a single look-up instead of reading every spine.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..domain.entities import (
+    CollectionNotFoundError,
+    InvalidQueryException,
+    ResearchCollection,
+    ResearchCollectionRepository,
+    paper_identity,
+)
+from ..infrastructure.async_repositories import AsyncCollectionRepositoryAdapter
+from ..infrastructure.collection_repositories import (
+    InMemoryResearchCollectionRepository,
+)
+from .scholarly_use_cases import ScholarlyResearchUseCase
+
+MAX_PAGE_SIZE = 500
+
+
+class ResearchCollectionService:
+    """Application service for creating, filling, browsing and exporting collections."""
+
+    def __init__(
+        self,
+        repository: Optional[ResearchCollectionRepository] = None,
+        scholarly_use_case: Optional[ScholarlyResearchUseCase] = None,
+    ):
+        self.repository = (
+            repository
+            if repository is not None
+            else InMemoryResearchCollectionRepository()
+        )
+        self._repository = AsyncCollectionRepositoryAdapter(self.repository)
+        self.scholarly_use_case = scholarly_use_case
+
+    async def create(self, name: str, description: str = "") -> ResearchCollection:
+        """Create an empty collection."""
+        if not isinstance(name, str) or not isinstance(description, str):
+            raise InvalidQueryException("Collection name and description must be text")
+        try:
+            collection = ResearchCollection(name=name, description=description)
+        except ValueError as e:
+            raise InvalidQueryException(str(e)) from e
+        await self._repository.save(collection)
+        return collection
+
+    async def get(self, collection_id: str) -> ResearchCollection:
+        """Fetch a collection, raising CollectionNotFoundError if missing."""
+        collection = await self._repository.find_by_id(collection_id)
+        if collection is None:
+            raise CollectionNotFoundError(f"Collection not found: {collection_id}")
+        return collection
+
+    async def list_collections(
+        self, limit: int = 50, offset: int = 0
+    ) -> List[ResearchCollection]:
+        """List collections page by page."""
+        limit, offset = _page(limit, offset)
+        return await self._repository.list_collections(limit=limit, offset=offset)
+
+    async def delete(self, collection_id: str) -> None:
+        """Delete a collection and its memberships."""
+        if not await self._repository.delete(collection_id):
+            raise CollectionNotFoundError(f"Collection not found: {collection_id}")
+
+    async def add_papers(
+        self, collection_id: str, papers: Iterable[Dict[str, Any]]
+    ) -> int:
+        """Add papers in one batch; duplicates are skipped. Returns the number added."""
+        return await self._repository.add_papers(
+            collection_id, [_paper(paper) for paper in papers]
+        )
+
+    async def remove_papers(
+        self, collection_id: str, papers: Iterable[Union[str, Dict[str, Any]]]
+    ) -> int:
+        """Remove papers given as paper dicts or dedupe keys. Returns the number removed."""
+        keys = [
+            paper if isinstance(paper, str) else paper_identity(_paper(paper))
+            for paper in papers
+        ]
+        return await self._repository.remove_papers(
+            collection_id, [key for key in keys if key]
+        )
+
+    async def contains(self, collection_id: str, paper: Dict[str, Any]) -> bool:
+        """Check whether a paper (or a duplicate of it) is in the collection."""
+        key = paper_identity(_paper(paper))
+        return key is not None and await self._repository.contains(collection_id, key)
+
+    async def list_papers(
+        self, collection_id: str, limit: int = 50, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """List a page of papers in insertion order."""
+        limit, offset = _page(limit, offset)
+        return await self._repository.list_papers(
+            collection_id, limit=limit, offset=offset
+        )
+
+    async def collections_for(self, paper: Dict[str, Any]) -> List[str]:
+        """IDs of every collection that already holds this paper."""
+        key = paper_identity(_paper(paper))
+        return await self._repository.collections_for(key) if key else []
+
+    def iter_papers(self, collection_id: str) -> Iterator[Dict[str, Any]]:
+        """Iterate every paper for streaming exports (validates the ID eagerly)."""
+        return self.repository.iter_papers(collection_id)
+
+    def export(self, collection_id: str, format_type: str = "bibtex") -> str:
+        """Export the whole collection as a bibliography in ``format_type``."""
+        if self.scholarly_use_case is None:
+            raise InvalidQueryException("Citation export is not configured")
+        return self.scholarly_use_case.export_citations(
+            self.iter_papers(collection_id), format_type
+        )
+
+
+def _paper(paper: Any) -> Dict[str, Any]:
+    if not isinstance(paper, dict):
+        raise InvalidQueryException("Papers must be JSON objects")
+    return paper
+
+
+def _page(limit: Any, offset: Any) -> Tuple[int, int]:
+    for name, value in (("limit", limit), ("offset", offset)):
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise InvalidQueryException(f"{name} must be an integer")
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise InvalidQueryException(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    if offset < 0:
+        raise InvalidQueryException("offset cannot be negative")
+    return limit, offset
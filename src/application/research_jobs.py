@@ -0,0 +1,401 @@
+"""
+Background Research Jobs
+
+Research runs can take many seconds, so presentation adapters should not
+hold a caller's connection open while they execute. This module provides a
+small job subsystem: ``submit`` returns a job ID immediately, and a bounded
+pool of asyncio workers processes jobs by priority while keeping requesters
+fair to each other.
+
+Educational Note:
+Think of a busy library help desk that hands out ticket numbers. You get a
+ticket straight away and can check back later (polling) or ask to be called
+when your answer is ready (subscribing). Urgent tickets are served first,
+and no single visitor can grab every helper by taking fifty tickets.
+"""
+
+import asyncio
+import itertools
+import logging
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from ..core.cancellation import CancellationToken, OperationCancelled
+from ..domain.entities import DomainException, ResearchStatus
+
+logger = logging.getLogger(__name__)
+
+JobWork = Callable[[], Awaitable[Any]]
+JobListener = Callable[["ResearchJob"], None]
+# (priority, requester round, submission sequence, job ID)
+QueueEntry = Tuple["JobPriority", int, int, str]
+
+
+class JobPriority(IntEnum):
+    """Scheduling priority for research jobs (lower values run first)."""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class JobQueueFullError(DomainException):
+    """Raised when the job queue cannot accept more pending jobs."""
+
+    pass
+
+
+@dataclass
+class ResearchJob:
+    """A unit of research work tracked through the ResearchStatus lifecycle."""
+
+    job_id: str
+    requester_id: str
+    priority: JobPriority
+    description: str = ""
+    status: ResearchStatus = ResearchStatus.PENDING
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    result: Any = None
+    error_message: Optional[str] = None
+    cancel_token: CancellationToken = field(
+        default_factory=CancellationToken, repr=False, compare=False
+    )
+    _work: Optional[JobWork] = field(default=None, repr=False, compare=False)
+    _done: asyncio.Event = field(
+        default_factory=asyncio.Event, repr=False, compare=False
+    )
+
+    def is_finished(self) -> bool:
+        """Check if the job has reached a terminal status."""
+        return self.status in (
+            ResearchStatus.COMPLETED,
+            ResearchStatus.FAILED,
+            ResearchStatus.CANCELLED,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the job for status responses (result excluded)."""
+        return {
+            "job_id": self.job_id,
+            "requester_id": self.requester_id,
+            "priority": self.priority.name.lower(),
+            "description": self.description,
+            "status": self.status.value,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": (
+                self.completed_at.isoformat() if self.completed_at else None
+            ),
+            "error_message": self.error_message,
+        }
+
+
+class ResearchJobQueue:
+    """
+    Bounded asyncio worker pool for research jobs.
+
+    Scheduling order is ``(priority, requester round, submission order)``.
+    Each requester's jobs are numbered in rounds starting no earlier than
+    the round currently being served, so a requester who submits a large
+    batch is interleaved with others instead of starving them.
+
+    Workers start lazily on the first ``submit`` from a running event loop.
+    Each job carries a CancellationToken that its work should pass down to
+    the use cases; ``cancel`` drops pending jobs and signals running ones.
+    ``max_pending`` counts jobs still waiting to run: cancelled ones do not
+    take up room, and their queue entries are purged once they add up.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_pending: int = 1000,
+        max_retained: int = 1000,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_retained = max_retained
+
+        self._jobs: "OrderedDict[str, ResearchJob]" = OrderedDict()
+        # Finished job IDs, oldest first, so eviction never scans every job
+        self._finished: Deque[str] = deque()
+        # Jobs waiting to run, and queue entries of jobs cancelled meanwhile
+        self._pending = 0
+        self._stale = 0
+        self._listeners: List[JobListener] = []
+        self._sequence = itertools.count()
+        # Rounds of requesters with unfinished jobs, and how many they have
+        self._requester_rounds: Dict[str, int] = {}
+        self._requester_active: Dict[str, int] = {}
+        self._current_round = 0
+
+        self._queue: Optional[asyncio.PriorityQueue[QueueEntry]] = None
+        self._workers: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # Submission and lookup
+
+    def submit(
+        self,
+        work: JobWork,
+        requester_id: str = "anonymous",
+        priority: JobPriority = JobPriority.NORMAL,
+        description: str = "",
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> str:
+        """
+        Queue a coroutine factory and return its job ID immediately.
+
+        Args:
+            cancel_token: Token the work observes (for example one created
+                with a timeout); a fresh token is used if omitted
+
+        Raises:
+            JobQueueFullError: If ``max_pending`` jobs are already waiting
+        """
+        queue = self._ensure_started()
+
+        job = ResearchJob(
+            job_id=str(uuid.uuid4()),
+            requester_id=requester_id,
+            priority=priority,
+            description=description,
+            cancel_token=cancel_token or CancellationToken(),
+            _work=work,
+        )
+        if self._pending >= self.max_pending:
+            raise JobQueueFullError(
+                f"Job queue is full ({self.max_pending} pending jobs)"
+            )
+        round_number = max(
+            self._current_round, self._requester_rounds.get(requester_id, 0) + 1
+        )
+
+        queue.put_nowait((priority, round_number, next(self._sequence), job.job_id))
+        self._pending += 1
+
+        self._requester_rounds[requester_id] = round_number
+        self._requester_active[requester_id] = (
+            self._requester_active.get(requester_id, 0) + 1
+        )
+        self._jobs[job.job_id] = job
+        self._evict_finished()
+        self._notify(job)
+        return job.job_id
+
+    def get(self, job_id: str) -> Optional[ResearchJob]:
+        """Find a job by ID (finished jobs are retained up to max_retained)."""
+        return self._jobs.get(job_id)
+
+    async def wait(
+        self, job_id: str, timeout: Optional[float] = None
+    ) -> Optional[ResearchJob]:
+        """Wait until a job finishes and return it (None if unknown)."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        await asyncio.wait_for(job._done.wait(), timeout)
+        return job
+
+    def cancel(self, job_id: str, reason: str = "cancelled by requester") -> bool:
+        """
+        Cancel a job.
+
+        Pending jobs are marked CANCELLED without running. Running jobs have
+        their token cancelled and finish as CANCELLED once their work notices.
+
+        Returns:
+            False if the job is unknown or already finished
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.is_finished():
+            return False
+
+        job.cancel_token.cancel(reason)
+        if job.status == ResearchStatus.PENDING:
+            job.status = ResearchStatus.CANCELLED
+            job.error_message = reason
+            self._finish(job)
+            self._pending -= 1
+            self._stale += 1
+            if self._stale > self.max_pending:
+                self._purge_stale()
+        return True
+
+    def subscribe(self, listener: JobListener) -> Callable[[], None]:
+        """
+        Push job status changes to ``listener``.
+
+        Returns:
+            A function that removes the listener again
+        """
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def stats(self) -> Dict[str, Any]:
+        """Report queue depth and job counts by status."""
+        counts: Dict[str, int] = {}
+        for job in self._jobs.values():
+            counts[job.status.value] = counts.get(job.status.value, 0) + 1
+        return {
+            "workers": len(self._workers),
+            "max_workers": self.max_workers,
+            "queued": self._pending,
+            "jobs": counts,
+        }
+
+    # Worker lifecycle
+
+    def _ensure_started(self) -> "asyncio.PriorityQueue[QueueEntry]":
+        loop = asyncio.get_running_loop()
+        if self._queue is not None and self._loop is loop and self._workers:
+            return self._queue
+        if self._queue is None or self._loop is not loop:
+            # A queue is bound to the loop that created it.
+            self._abandon_loop()
+            # Unbounded: submit enforces max_pending on live jobs instead
+            self._queue = asyncio.PriorityQueue()
+            self._pending = self._stale = 0
+            self._loop = loop
+        queue = self._queue
+        self._workers = [
+            loop.create_task(
+                self._worker(queue, index), name=f"research-job-worker-{index}"
+            )
+            for index in range(self.max_workers)
+        ]
+        return queue
+
+    def _abandon_loop(self) -> None:
+        """
+        Stop the previous event loop's workers and fail its unfinished jobs.
+
+        Their queue and tasks belong to that loop, so nothing on the new loop
+        could ever run or finish them.
+        """
+        for worker in self._workers:
+            if not worker.done():
+                try:
+                    worker.cancel()
+                except RuntimeError:
+                    pass  # Its loop is already closed
+        self._workers = []
+        for job in list(self._jobs.values()):
+            if job.is_finished():
+                continue
+            job.cancel_token.cancel("event loop changed")
+            job.status = ResearchStatus.FAILED
+            job.error_message = "Event loop changed before the job finished"
+            self._finish(job)
+
+    async def shutdown(self) -> None:
+        """Stop all workers; queued jobs that never started stay PENDING."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _worker(
+        self, queue: "asyncio.PriorityQueue[QueueEntry]", index: int
+    ) -> None:
+        while True:
+            _, round_number, _, job_id = await queue.get()
+            try:
+                job = self._jobs.get(job_id)
+                if job is None or job.is_finished():
+                    self._stale -= 1  # Cancelled before it started
+                    continue
+                self._pending -= 1
+                self._current_round = max(self._current_round, round_number)
+                await self._run(job)
+            finally:
+                queue.task_done()
+
+    async def _run(self, job: ResearchJob) -> None:
+        job.status = ResearchStatus.IN_PROGRESS
+        job.started_at = datetime.now()
+        self._notify(job)
+
+        work = job._work
+        try:
+            if work is None:
+                raise RuntimeError("Job has no work to run")
+            job.result = await work()
+            if job.cancel_token.is_cancelled:
+                job.status = ResearchStatus.CANCELLED
+                job.error_message = job.cancel_token.reason
+            else:
+                job.status = ResearchStatus.COMPLETED
+        except OperationCancelled as e:
+            job.error_message = e.reason
+            job.status = ResearchStatus.CANCELLED
+        except asyncio.CancelledError:
+            # The worker was stopped (shutdown) while running this job
+            if not job.is_finished():
+                job.error_message = "Research job queue shut down"
+                job.status = ResearchStatus.CANCELLED
+            raise
+        except Exception as e:
+            logger.error(f"Research job {job.job_id} failed: {e}")
+            job.error_message = str(e)
+            job.status = ResearchStatus.FAILED
+        finally:
+            self._finish(job)
+
+    def _finish(self, job: ResearchJob) -> None:
+        if job.completed_at is not None:
+            return  # Already failed when its event loop was abandoned
+        job.completed_at = datetime.now()
+        job._work = None
+        self._finished.append(job.job_id)
+        try:
+            job._done.set()
+        except RuntimeError:
+            pass  # Its waiters belong to a closed event loop
+        self._release_requester(job.requester_id)
+        self._notify(job)
+
+    def _release_requester(self, requester_id: str) -> None:
+        """Forget a requester's round once it has no unfinished jobs."""
+        active = self._requester_active.get(requester_id, 0) - 1
+        if active > 0:
+            self._requester_active[requester_id] = active
+        else:
+            self._requester_active.pop(requester_id, None)
+            self._requester_rounds.pop(requester_id, None)
+
+    # Helpers
+
+    def _notify(self, job: ResearchJob) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(job)
+            except Exception as e:
+                logger.warning(f"Job listener failed for {job.job_id}: {e}")
+
+    def _evict_finished(self) -> None:
+        while len(self._jobs) > self.max_retained and self._finished:
+            self._jobs.pop(self._finished.popleft(), None)
+
+    def _purge_stale(self) -> None:
+        """Drop the queue entries of jobs cancelled before they started."""
+        queue = self._queue
+        if queue is None:
+            return
+        entries = []
+        while not queue.empty():
+            entries.append(queue.get_nowait())
+            queue.task_done()
+        for entry in entries:
+            job = self._jobs.get(entry[3])
+            if job is not None and not job.is_finished():
+                queue.put_nowait(entry)
+        self._stale = 0
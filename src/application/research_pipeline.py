@@ -0,0 +1,505 @@
+"""
+Research Pipeline
+
+ExecuteResearchUseCase runs every query through five pluggable stages:
+
+    analyze -> search -> fetch -> parse -> score
+
+``analyze`` turns the query into a SearchPlan (search terms and the source
+types to consult). Each planned SourceType then runs as its own concurrent
+branch: its search stage finds candidates, and every candidate is fetched,
+parsed into a ResearchSource and scored. Each stage has its own concurrency
+limit (an asyncio.Semaphore shared by all branches) and records timing
+statistics, so a slow upstream or an expensive scorer is easy to spot and to
+throttle independently. An optional progress callback hears about each step
+as it finishes (PipelineProgress), so callers can report long runs live.
+
+Stages are small objects with a single async method, so a new source type or
+a better scorer is added by passing a different object - nothing else in the
+pipeline changes. The existing UnifiedScholarlySearcher provides the academic
+search branches (one per scholarly source).
+
+Educational Note:
+Think of a school science fair. One judge reads each project title and
+decides which tables to visit (analyze). Teams of helpers go to different
+tables at the same time (search per source type), pick up the posters
+(fetch), read them (parse) and give each a score (score). Each kind of
+helper has a fixed team size, so no single job can take every helper.
+"""
+
+import asyncio
+import logging
+import math
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol, TypeVar
+
+from ..core.cancellation import CancellationToken, OperationCancelled, ensure_token
+from ..domain.entities import (
+    ResearchQuery,
+    ResearchResult,
+    ResearchSource,
+    ResearchStatus,
+    SourceType,
+)
+from ..infrastructure.scholarly_sources import PaperProcessor, UnifiedScholarlySearcher
+from .scholarly_use_cases import _paper_to_source
+
+logger = logging.getLogger(__name__)
+
+Candidate = Dict[str, Any]
+T = TypeVar("T")
+
+STAGES = ("analyze", "search", "fetch", "parse", "score")
+DEFAULT_CONCURRENCY = {"analyze": 4, "search": 4, "fetch": 8, "parse": 32, "score": 32}
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from how in into is it of on or that the "
+    "this to was what when where which who why will with".split()
+)
+
+
+@dataclass
+class SearchPlan:
+    """What to search for and where, produced by the analyze stage."""
+
+    query: ResearchQuery
+    terms: List[str]
+    source_types: List[SourceType]
+    results_per_source: int
+
+
+@dataclass
+class PipelineProgress:
+    """One finished step of a run, reported while the run continues."""
+
+    stage: str
+    completed: int
+    total: int
+    message: str
+    source_type: Optional[SourceType] = None
+    sources_found: int = 0
+
+
+ProgressCallback = Callable[[PipelineProgress], None]
+
+
+class _ProgressReporter:
+    """Counts steps and hands each one to the (optional) callback."""
+
+    def __init__(self, callback: Optional[ProgressCallback]):
+        self.callback = callback
+        self.completed = 0
+        self.total = 1
+
+    def step(
+        self,
+        stage: str,
+        message: str,
+        source_type: Optional[SourceType] = None,
+        sources_found: int = 0,
+    ) -> None:
+        self.completed += 1
+        if self.callback is None:
+            return
+        try:
+            self.callback(
+                PipelineProgress(
+                    stage=stage,
+                    completed=self.completed,
+                    total=self.total,
+                    message=message,
+                    source_type=source_type,
+                    sources_found=sources_found,
+                )
+            )
+        except Exception as e:
+            # A broken listener must not fail the research itself
+            logger.warning(f"Progress callback failed: {e}")
+
+
+# Stage interfaces
+
+
+class QueryAnalysisStage(Protocol):
+    """Turns a query into a SearchPlan."""
+
+    async def analyze(self, query: ResearchQuery) -> SearchPlan:
+        """Build the plan for ``query``."""
+        ...
+
+
+class SourceSearchStage(Protocol):
+    """Finds candidate documents (plain dicts) for one source type."""
+
+    async def search(
+        self, plan: SearchPlan, cancel_token: CancellationToken
+    ) -> List[Candidate]:
+        """Return candidates for the plan."""
+        ...
+
+
+class FetchStage(Protocol):
+    """Retrieves extra content for a candidate (e.g. full text)."""
+
+    async def fetch(
+        self, candidate: Candidate, cancel_token: CancellationToken
+    ) -> Candidate:
+        """Return the candidate, enriched if possible."""
+        ...
+
+
+class ParseStage(Protocol):
+    """Turns a candidate into a ResearchSource (None to drop it)."""
+
+    async def parse(self, candidate: Candidate) -> Optional[ResearchSource]:
+        """Build a source from the candidate."""
+        ...
+
+
+class ScoreStage(Protocol):
+    """Assigns a relevance score in [0, 1] to a parsed source."""
+
+    async def score(self, source: ResearchSource, plan: SearchPlan) -> float:
+        """Return the source's relevance to the plan."""
+        ...
+
+
+# Built-in stages
+
+
+class KeywordQueryAnalyzer:
+    """Extracts search terms and picks source types from the query's flags."""
+
+    academic_source_types = (SourceType.ARXIV, SourceType.SEMANTIC_SCHOLAR)
+
+    async def analyze(self, query: ResearchQuery) -> SearchPlan:
+        terms = [
+            word
+            for word in re.findall(r"[a-z0-9]+", query.text.lower())
+            if len(word) > 2 and word not in _STOPWORDS
+        ]
+        source_types: List[SourceType] = []
+        if query.include_academic_sources:
+            source_types.extend(self.academic_source_types)
+        if query.include_web_search:
+            source_types.append(SourceType.WEB)
+        return SearchPlan(
+            query=query,
+            terms=list(dict.fromkeys(terms)),
+            source_types=source_types,
+            results_per_source=query.max_sources,
+        )
+
+
+class ScholarlySourceSearch:
+    """Searches one scholarly source through UnifiedScholarlySearcher."""
+
+    def __init__(self, searcher: UnifiedScholarlySearcher, source: str):
+        self.searcher = searcher
+        self.source = source
+
+    async def search(
+        self, plan: SearchPlan, cancel_token: CancellationToken
+    ) -> List[Candidate]:
+        # The searchers use blocking HTTP clients, so they run off the loop
+        return await asyncio.to_thread(
+            self.searcher.search,
+            query=plan.query.text,
+            max_results=plan.results_per_source,
+            sources=[self.source],
+            results_per_source=plan.results_per_source,
+            cancel_token=cancel_token,
+        )
+
+
+class AbstractOnlyFetch:
+    """Uses the abstract as the source's content; makes no extra requests."""
+
+    async def fetch(
+        self, candidate: Candidate, cancel_token: CancellationToken
+    ) -> Candidate:
+        return candidate
+
+
+class PdfTextFetch:
+    """Downloads each candidate's PDF and uses its extracted text as content."""
+
+    def __init__(self, processor: Optional[PaperProcessor] = None):
+        self.processor = processor or PaperProcessor()
+
+    async def fetch(
+        self, candidate: Candidate, cancel_token: CancellationToken
+    ) -> Candidate:
+        pdf_url = candidate.get("pdf_url")
+        if not pdf_url:
+            return candidate
+        pdf = await asyncio.to_thread(
+            self.processor.download_pdf, pdf_url, cancel_token=cancel_token
+        )
+        if not pdf:
+            return candidate
+        text = await asyncio.to_thread(self.processor.extract_text_from_pdf, pdf)
+        return {**candidate, "content": text} if text else candidate
+
+
+class PaperParser:
+    """Converts searcher paper dicts into ResearchSource entities."""
+
+    async def parse(self, candidate: Candidate) -> Optional[ResearchSource]:
+        if not candidate.get("title"):
+            return None
+        source = _paper_to_source(candidate)
+        if candidate.get("content"):
+            source.content = candidate["content"]
+        return source
+
+
+class TermOverlapScorer:
+    """
+    Scores by the share of query terms found in the title and abstract,
+    nudged up for well-cited work.
+    """
+
+    def __init__(self, citation_weight: float = 0.2):
+        self.citation_weight = citation_weight
+
+    async def score(self, source: ResearchSource, plan: SearchPlan) -> float:
+        text = f"{source.title} {source.abstract}".lower()
+        overlap = (
+            sum(term in text for term in plan.terms) / len(plan.terms)
+            if plan.terms
+            else 0.5
+        )
+        # log10(1 + citations) / 4 reaches 1.0 at ~10k citations
+        citations = min(1.0, math.log10(1 + source.citation_count) / 4)
+        score = (1 - self.citation_weight) * overlap + self.citation_weight * citations
+        return round(min(1.0, max(0.0, score)), 4)
+
+
+# Pipeline
+
+
+@dataclass
+class StageStats:
+    """Call counts and wall-clock timings for one stage."""
+
+    calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, seconds: float, failed: bool) -> None:
+        self.calls += 1
+        self.errors += failed
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_seconds": round(self.total_seconds, 6),
+            "max_seconds": round(self.max_seconds, 6),
+            "mean_seconds": (
+                round(self.total_seconds / self.calls, 6) if self.calls else 0.0
+            ),
+        }
+
+
+@dataclass
+class _Stage:
+    """A stage's concurrency limit and statistics."""
+
+    name: str
+    limit: int
+    stats: StageStats = field(default_factory=StageStats)
+
+    def __post_init__(self) -> None:
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # Semaphores bind to one event loop; the CLI starts a new loop per
+        # command, so the semaphore is recreated when the loop changes.
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore, self._loop = asyncio.Semaphore(self.limit), loop
+        return self._semaphore
+
+    async def run(self, call: Callable[..., Awaitable[T]], *args: Any) -> T:
+        async with self.semaphore:
+            started = time.perf_counter()
+            failed = True
+            try:
+                value = await call(*args)
+                failed = False
+                return value
+            finally:
+                self.stats.record(time.perf_counter() - started, failed)
+
+
+class ResearchPipeline:
+    """Runs a query through the analyze/search/fetch/parse/score stages."""
+
+    def __init__(
+        self,
+        searchers: Dict[SourceType, SourceSearchStage],
+        analyzer: Optional[QueryAnalysisStage] = None,
+        fetcher: Optional[FetchStage] = None,
+        parser: Optional[ParseStage] = None,
+        scorer: Optional[ScoreStage] = None,
+        concurrency: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Args:
+            searchers: Search stage per source type; planned source types
+                without a searcher are skipped
+            concurrency: Per-stage limits overriding DEFAULT_CONCURRENCY
+        """
+        self.searchers = dict(searchers)
+        self.analyzer = analyzer or KeywordQueryAnalyzer()
+        self.fetcher = fetcher or AbstractOnlyFetch()
+        self.parser = parser or PaperParser()
+        self.scorer = scorer or TermOverlapScorer()
+        limits = {**DEFAULT_CONCURRENCY, **(concurrency or {})}
+        self._stages = {name: _Stage(name, limits[name]) for name in STAGES}
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Timing statistics for every stage since the pipeline was created."""
+        return {name: stage.stats.to_dict() for name, stage in self._stages.items()}
+
+    async def run(
+        self,
+        query: ResearchQuery,
+        cancel_token: Optional[CancellationToken] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> ResearchResult:
+        """
+        Research ``query`` and return a COMPLETED (or CANCELLED) result.
+
+        A failing source branch is logged and contributes no sources; it never
+        fails the whole run. Sources are deduplicated by URL and the best
+        ``query.max_sources`` by relevance are kept.
+
+        Args:
+            progress: Called on the event loop as each step finishes: the
+                analysis, each source's search, each source's scoring and
+                the final ranking (``total`` is known after the analysis)
+        """
+        token = ensure_token(cancel_token)
+        started = time.perf_counter()
+        result = ResearchResult(query=query, status=ResearchStatus.IN_PROGRESS)
+        reporter = _ProgressReporter(progress)
+
+        plan = await self._stages["analyze"].run(self.analyzer.analyze, query)
+        branches = [st for st in plan.source_types if st in self.searchers]
+        result.search_strategies_used = [source_type.value for source_type in branches]
+        reporter.total = 2 + 2 * len(branches)
+        reporter.step(
+            "analyze",
+            f"Searching {len(branches)} source(s) for: {', '.join(plan.terms)}",
+        )
+
+        found = await asyncio.gather(
+            *(
+                self._run_branch(source_type, plan, token, reporter)
+                for source_type in branches
+            )
+        )
+
+        ranked = sorted(
+            (source for sources in found for source in sources),
+            key=lambda source: source.relevance_score,
+            reverse=True,
+        )
+        for source in ranked:
+            if len(result.sources) >= query.max_sources:
+                break
+            result.add_source(source)
+
+        result.total_processing_time = time.perf_counter() - started
+        if token.is_cancelled:
+            result.mark_cancelled(token.reason or "cancelled")
+        else:
+            result.mark_completed()
+        reporter.step("rank", f"Kept the {len(result.sources)} most relevant sources")
+        return result
+
+    async def _run_branch(
+        self,
+        source_type: SourceType,
+        plan: SearchPlan,
+        token: CancellationToken,
+        reporter: _ProgressReporter,
+    ) -> List[ResearchSource]:
+        name = source_type.value
+        candidates: List[Candidate] = []
+        if not token.is_cancelled:
+            try:
+                candidates = await self._stages["search"].run(
+                    self.searchers[source_type].search, plan, token
+                )
+            except OperationCancelled:
+                pass
+            except Exception as e:
+                logger.warning(f"{name} search failed: {e}")
+        reporter.step(
+            "search",
+            f"{name}: {len(candidates)} candidate(s) found",
+            source_type,
+            len(candidates),
+        )
+
+        processed = await asyncio.gather(
+            *(self._process(candidate, plan, token) for candidate in candidates)
+        )
+        sources = [source for source in processed if source is not None]
+        reporter.step(
+            "score",
+            f"{name}: {len(sources)} source(s) fetched, parsed and scored",
+            source_type,
+            len(sources),
+        )
+        return sources
+
+    async def _process(
+        self, candidate: Candidate, plan: SearchPlan, token: CancellationToken
+    ) -> Optional[ResearchSource]:
+        # Once cancelled, skip the network-bound fetch but keep what we have
+        if not token.is_cancelled:
+            try:
+                candidate = await self._stages["fetch"].run(
+                    self.fetcher.fetch, candidate, token
+                )
+            except Exception as e:
+                logger.warning(f"Fetch failed for {candidate.get('title')!r}: {e}")
+
+        try:
+            source = await self._stages["parse"].run(self.parser.parse, candidate)
+            if source is None:
+                return None
+            source.relevance_score = await self._stages["score"].run(
+                self.scorer.score, source, plan
+            )
+            return source
+        except Exception as e:
+            logger.warning(f"Dropping unparseable candidate: {e}")
+            return None
+
+
+def create_default_research_pipeline(
+    searcher: Optional[UnifiedScholarlySearcher] = None,
+) -> ResearchPipeline:
+    """Pipeline with arXiv and Semantic Scholar branches (no web search backend yet)."""
+    searcher = searcher or UnifiedScholarlySearcher()
+    return ResearchPipeline(
+        searchers={
+            SourceType.ARXIV: ScholarlySourceSearch(searcher, "arxiv"),
+            SourceType.SEMANTIC_SCHOLAR: ScholarlySourceSearch(
+                searcher, "semantic_scholar"
+            ),
+        }
+    )
@@ -27,25 +27,144 @@ Enhanced application layer use cases that integrate with scholarly sources
 infrastructure to provide real academic research capabilities.
 """
 
+import asyncio
 import logging
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+)
 
+from ..core.cancellation import CancellationToken, OperationCancelled, ensure_token
 from ..domain.entities import (
     DomainException,
     InvalidQueryException,
     QueryId,
     QueryNotFoundError,
+    ResearchQuery,
     ResearchQueryRepository,
     ResearchResult,
     ResearchResultRepository,
     ResearchSource,
     ResearchStatus,
     SourceType,
+    paper_identity,
+)
+from ..infrastructure.async_repositories import (
+    as_async_query_repository,
+    as_async_result_repository,
 )
 from ..infrastructure.scholarly_sources import UnifiedScholarlySearcher
+from .citation_formats import (
+    CitationExportCache,
+    CitationFormat,
+    CitationFormatRegistry,
+    default_citation_formats,
+)
+
+# Raw searcher ``source_type`` values mapped onto the domain enum (built once)
+_SOURCE_TYPE_MAP: Dict[str, SourceType] = {
+    "arxiv": SourceType.ARXIV,
+    "semantic_scholar": SourceType.SEMANTIC_SCHOLAR,
+    "google_scholar": SourceType.GOOGLE_SCHOLAR,
+}
+
+
+def _paper_to_source(paper: Dict[str, Any]) -> ResearchSource:
+    """
+    Convert a raw searcher paper dict straight into a ResearchSource.
+
+    No display formatting happens here - truncated abstracts and citations
+    are produced lazily by whichever presentation layer needs them.
+    """
+    return ResearchSource(
+        title=paper.get("title") or "",
+        url=paper.get("source_url") or paper.get("url") or "",
+        source_type=_SOURCE_TYPE_MAP.get(
+            (paper.get("source_type") or "").lower(),
+            SourceType.CUSTOM,  # Default for academic sources
+        ),
+        authors=paper.get("authors") or [],
+        abstract=paper.get("abstract") or "",
+        content=paper.get("abstract") or "",
+        relevance_score=paper.get("relevance_score", 0.5),
+        citation_count=paper.get("citation_count") or 0,
+        metadata={
+            "year": paper.get("year"),
+            "venue": paper.get("venue"),
+            "pdf_url": paper.get("pdf_url"),
+            "doi": paper.get("doi"),
+        },
+    )
+
+
+def _chunk_entries(entries: Iterable[str], chunk_size: int) -> Iterator[str]:
+    buffer: List[str] = []
+    buffered = 0
+    for entry in entries:
+        buffer.append(entry)
+        buffered += len(entry)
+        if buffered >= chunk_size:
+            yield "".join(buffer)
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def _truncate(text: str, limit: int = 500) -> str:
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+# Builders for each API response field; a response only pays for the
+# fields its request asks for.
+_RESPONSE_FIELD_BUILDERS: Dict[
+    str, Callable[["ScholarlyResearchUseCase", Dict[str, Any]], Any]
+] = {
+    "title": lambda use_case, paper: paper.get("title", ""),
+    "authors": lambda use_case, paper: paper.get("authors", []),
+    "abstract": lambda use_case, paper: _truncate(paper.get("abstract") or ""),
+    "full_abstract": lambda use_case, paper: paper.get("abstract") or "",
+    "year": lambda use_case, paper: paper.get("year"),
+    "citation_count": lambda use_case, paper: paper.get("citation_count", 0),
+    "pdf_url": lambda use_case, paper: paper.get("pdf_url"),
+    "source_url": lambda use_case, paper: (
+        paper.get("source_url") or paper.get("url", "")
+    ),
+    "source_type": lambda use_case, paper: (
+        paper.get("source_type") or paper.get("source", "")
+    ),
+    "relevance_score": lambda use_case, paper: paper.get("relevance_score", 0.5),
+    "venue": lambda use_case, paper: paper.get("venue"),
+    "doi": lambda use_case, paper: paper.get("doi"),
+    "formatted_citation": lambda use_case, paper: use_case._format_citation(paper),
+    "display_class": lambda use_case, paper: use_case._get_relevance_class(
+        paper.get("relevance_score", 0.5)
+    ),
+}
+
+RESPONSE_FIELDS = tuple(_RESPONSE_FIELD_BUILDERS)
+_ABSTRACT_FIELDS = ("abstract", "full_abstract")
+
+# With ``full_text`` the ``abstract`` field carries the whole abstract
+_FULL_TEXT_FIELD_BUILDERS = {
+    **_RESPONSE_FIELD_BUILDERS,
+    "abstract": _RESPONSE_FIELD_BUILDERS["full_abstract"],
+}
+
+DEFAULT_SCHOLARLY_SOURCES = ("arxiv", "semantic_scholar")
+
 
 # Enhanced DTOs for Scholarly Research
 
@@ -55,12 +174,15 @@ class ScholarlySearchRequest:
     """Request for scholarly research with specific academic parameters."""
 
     query_text: str
-    sources: List[str] = field(default_factory=lambda: ["arxiv", "semantic_scholar"])
+    sources: List[str] = field(default_factory=lambda: list(DEFAULT_SCHOLARLY_SOURCES))
     max_results: int = 10
     include_abstracts: bool = True
     min_year: Optional[int] = None
     max_year: Optional[int] = None
     fields_of_study: List[str] = field(default_factory=list)
+    fields: Optional[List[str]] = None  # Response fields to return (None = all)
+    compact: bool = False  # Drop full_abstract (a duplicate) and empty fields
+    full_text: bool = False  # Untruncated text in ``abstract``
 
 
 @dataclass
@@ -72,6 +194,27 @@ class ScholarlySearchResponse:
     total_found: int
     sources_used: List[str]
     search_time_ms: int
+    # Requested sources whose upstream failed; their papers are missing
+    failed_sources: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ResearchProgressEvent:
+    """
+    One step of a streamed research run.
+
+    ``kind`` is "started", "source" (one scholarly source finished; its new
+    sources are in ``sources``) or "completed" (``result`` is final and saved).
+    """
+
+    kind: str
+    query_id: str
+    source: Optional[str] = None
+    sources: List[ResearchSource] = field(default_factory=list)
+    completed: int = 0
+    total: int = 0
+    error: Optional[str] = None
+    result: Optional[ResearchResult] = None
 
 
 @dataclass
@@ -107,20 +250,34 @@ class ScholarlyResearchUseCase:
         query_repository: ResearchQueryRepository,
         result_repository: ResearchResultRepository,
         scholarly_searcher: Optional[UnifiedScholarlySearcher] = None,
+        citation_cache_size: int = 4096,
+        citation_formats: Optional[CitationFormatRegistry] = None,
+        export_cache: Optional[CitationExportCache] = None,
     ):
         self.query_repository = query_repository
         self.result_repository = result_repository
         self.scholarly_searcher = scholarly_searcher or UnifiedScholarlySearcher()
+        self.citation_formats = citation_formats or default_citation_formats
+        self.export_cache = export_cache or CitationExportCache()
+        self.citation_cache_size = citation_cache_size
+        self._citation_cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
         self.logger = logging.getLogger(__name__)
 
     async def execute_scholarly_search(
-        self, request: ScholarlySearchRequest
+        self,
+        request: ScholarlySearchRequest,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> ScholarlySearchResponse:
         """
         Execute a scholarly research search across academic databases.
 
+        The blocking searcher runs in a worker thread so the event loop stays
+        free to deliver cancellations while upstream requests are in flight.
+
         Args:
             request: Scholarly search parameters
+            cancel_token: Optional token; a cancelled search returns the
+                papers gathered before cancellation
 
         Returns:
             ScholarlySearchResponse with formatted results
@@ -128,26 +285,17 @@ class ScholarlyResearchUseCase:
         start_time = datetime.now()
 
         try:
-            # Validate request
-            if not request.query_text.strip():
-                raise InvalidQueryException("Query text cannot be empty")
-
-            if request.max_results < 1 or request.max_results > 100:
-                raise InvalidQueryException("Max results must be between 1 and 100")
-
-            # Execute search using the actual UnifiedScholarlySearcher API
-            self.logger.info(f"Executing scholarly search: '{request.query_text}'")
-
-            papers_data = self.scholarly_searcher.search(
-                query=request.query_text,
-                max_results=request.max_results,
-                sources=request.sources,
-                results_per_source=max(request.max_results // len(request.sources), 1),
+            fields = self._response_fields(request)
+            failed_sources: List[str] = []
+            papers_data = await self.search_papers(
+                request, cancel_token, failed_sources
             )
 
-            # Process and format results
+            # Process and format only the requested fields
             formatted_papers = [
-                self._format_paper_for_response(paper_data)
+                self._format_paper_for_response(
+                    paper_data, fields, request.full_text, request.compact
+                )
                 for paper_data in papers_data
             ]
 
@@ -162,6 +310,7 @@ class ScholarlyResearchUseCase:
                 total_found=len(papers_data),
                 sources_used=request.sources,
                 search_time_ms=search_time,
+                failed_sources=failed_sources,
             )
 
             self.logger.info(
@@ -171,12 +320,81 @@ class ScholarlyResearchUseCase:
 
             return response
 
+        except OperationCancelled:
+            raise
         except Exception as e:
             self.logger.error(f"Scholarly search failed: {str(e)}")
             raise DomainException(f"Scholarly search failed: {str(e)}")
 
+    async def search_papers(
+        self,
+        request: ScholarlySearchRequest,
+        cancel_token: Optional[CancellationToken] = None,
+        failed_sources: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate the request and return the searcher's raw paper dicts.
+
+        This is the unformatted path used by the orchestration service;
+        ``execute_scholarly_search`` adds display formatting on top of it.
+        ``failed_sources`` receives the name of every source whose upstream
+        failed.
+
+        Raises:
+            InvalidQueryException: If the request parameters are invalid
+        """
+        if not request.query_text.strip():
+            raise InvalidQueryException("Query text cannot be empty")
+
+        if request.max_results < 1 or request.max_results > 100:
+            raise InvalidQueryException("Max results must be between 1 and 100")
+
+        # Execute search using the actual UnifiedScholarlySearcher API
+        self.logger.info(f"Executing scholarly search: '{request.query_text}'")
+
+        return await asyncio.to_thread(
+            self.scholarly_searcher.search,
+            query=request.query_text,
+            max_results=request.max_results,
+            sources=request.sources,
+            results_per_source=max(request.max_results // len(request.sources), 1),
+            cancel_token=cancel_token,
+            failed_sources=failed_sources,
+        )
+
+    def format_source_citation(self, source: ResearchSource) -> str:
+        """Format a ResearchSource built by the orchestration service as a citation."""
+        return self._format_citation(
+            {
+                "title": source.title,
+                "authors": source.authors,
+                "source_url": source.url,
+                "year": source.metadata.get("year"),
+                "venue": source.metadata.get("venue"),
+                "doi": source.metadata.get("doi"),
+            }
+        )
+
+    def _response_fields(self, request: ScholarlySearchRequest) -> List[str]:
+        """Resolve the response fields for a request, validating names."""
+        if request.fields is None:
+            if not request.include_abstracts:
+                return [
+                    name for name in RESPONSE_FIELDS if name not in _ABSTRACT_FIELDS
+                ]
+            if request.compact:
+                return [name for name in RESPONSE_FIELDS if name != "full_abstract"]
+            return list(RESPONSE_FIELDS)
+
+        unknown = [name for name in request.fields if name not in RESPONSE_FIELDS]
+        if unknown:
+            raise InvalidQueryException(
+                f"Unknown response fields: {', '.join(unknown)}"
+            )
+        return list(request.fields)
+
     def export_citations(
-        self, papers: List[Dict[str, Any]], format_type: str = "bibtex"
+        self, papers: Iterable[Dict[str, Any]], format_type: str = "bibtex"
     ) -> str:
         """
         🎓 RESEARCH UTILITY: Export citations in various academic formats
@@ -186,183 +404,134 @@ class ScholarlyResearchUseCase:
 
         Args:
             papers: List of paper dictionaries from search results
-            format_type: 'bibtex', 'ris', 'endnote', or 'apa'
+            format_type: Any style in ``self.citation_formats`` - 'bibtex',
+                'ris', 'endnote', 'apa', 'mla', 'ieee' or 'chicago' by default
 
         Returns:
             Formatted citation string ready for import into reference managers
-        """
-        if format_type.lower() == "bibtex":
-            return self._export_bibtex(papers)
-        elif format_type.lower() == "ris":
-            return self._export_ris(papers)
-        elif format_type.lower() == "endnote":
-            return self._export_endnote(papers)
-        elif format_type.lower() == "apa":
-            return self._export_apa(papers)
-        else:
-            raise InvalidQueryException(f"Unsupported citation format: {format_type}")
-
-    def _export_bibtex(self, papers: List[Dict[str, Any]]) -> str:
-        """Export papers in BibTeX format - most widely used academic format."""
-        bibtex_entries = []
-
-        for i, paper in enumerate(papers):
-            # Generate unique citation key
-            first_author = (
-                paper.get("authors", ["Unknown"])[0].split()[-1]
-                if paper.get("authors")
-                else "Unknown"
-            )
-            year = paper.get("year", datetime.now().year)
-            title_words = paper.get("title", "").split()[:2]
-            key = f"{first_author}{year}{''.join(title_words)}"
-
-            # Clean key of special characters
-            key = "".join(c for c in key if c.isalnum())
-
-            entry = f"@article{{{key},\n"
-            entry += f"  title = {{{paper.get('title', 'Unknown Title')}}},\n"
-
-            if paper.get("authors"):
-                authors_str = " and ".join(paper["authors"])
-                entry += f"  author = {{{authors_str}}},\n"
-
-            if paper.get("year"):
-                entry += f"  year = {{{paper['year']}}},\n"
-
-            if paper.get("venue"):
-                entry += f"  journal = {{{paper['venue']}}},\n"
-
-            if paper.get("doi"):
-                entry += f"  doi = {{{paper['doi']}}},\n"
-
-            if paper.get("source_url"):
-                entry += f"  url = {{{paper['source_url']}}},\n"
-
-            entry += f"  abstract = {{{paper.get('abstract', '')}}}\n"
-            entry += "}\n\n"
 
-            bibtex_entries.append(entry)
-
-        return "".join(bibtex_entries)
-
-    def _export_ris(self, papers: List[Dict[str, Any]]) -> str:
-        """Export papers in RIS format - used by EndNote and other reference
-        managers."""
-        ris_entries = []
-
-        for paper in papers:
-            entry = "TY  - JOUR\n"  # Journal article type
-            entry += f"TI  - {paper.get('title', 'Unknown Title')}\n"
-
-            for author in paper.get("authors", []):
-                entry += f"AU  - {author}\n"
-
-            if paper.get("year"):
-                entry += f"PY  - {paper['year']}\n"
-
-            if paper.get("venue"):
-                entry += f"JO  - {paper['venue']}\n"
-
-            if paper.get("doi"):
-                entry += f"DO  - {paper['doi']}\n"
-
-            if paper.get("source_url"):
-                entry += f"UR  - {paper['source_url']}\n"
-
-            if paper.get("abstract"):
-                entry += f"AB  - {paper['abstract']}\n"
-
-            entry += "ER  - \n\n"
-            ris_entries.append(entry)
-
-        return "".join(ris_entries)
-
-    def _export_endnote(self, papers: List[Dict[str, Any]]) -> str:
-        """Export papers in EndNote tagged format."""
-        endnote_entries = []
-
-        for paper in papers:
-            entry = "%0 Journal Article\n"
-            entry += f"%T {paper.get('title', 'Unknown Title')}\n"
-
-            for author in paper.get("authors", []):
-                entry += f"%A {author}\n"
-
-            if paper.get("year"):
-                entry += f"%D {paper['year']}\n"
+        Exports are cached by a fingerprint of the papers plus the format, and
+        each paper's entry is cached separately, so re-exporting a collection
+        (or exporting it with one paper added) only renders what changed.
+        """
+        return self.export_cache.export(papers, self._citation_format(format_type))
 
-            if paper.get("venue"):
-                entry += f"%J {paper['venue']}\n"
+    def iter_citations(
+        self, papers: Iterable[Dict[str, Any]], format_type: str = "bibtex"
+    ) -> Iterator[str]:
+        """
+        Yield citation entries one at a time.
 
-            if paper.get("doi"):
-                entry += f"%R {paper['doi']}\n"
+        ``papers`` may itself be a generator, so a bibliography of any size
+        is rendered with memory bounded by a single entry. The format is
+        validated immediately, before the first entry is requested.
 
-            if paper.get("source_url"):
-                entry += f"%U {paper['source_url']}\n"
+        Raises:
+            InvalidQueryException: If the format is not supported
+        """
+        return self._citation_format(format_type).render_many(papers)
 
-            if paper.get("abstract"):
-                entry += f"%X {paper['abstract']}\n"
+    def _citation_format(self, format_type: str) -> CitationFormat:
+        citation_format = self.citation_formats.get(format_type)
+        if citation_format is None:
+            raise InvalidQueryException(f"Unsupported citation format: {format_type}")
+        return citation_format
 
-            entry += "\n"
-            endnote_entries.append(entry)
+    def iter_citation_chunks(
+        self,
+        papers: Iterable[Dict[str, Any]],
+        format_type: str = "bibtex",
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[str]:
+        """
+        Group citation entries into roughly ``chunk_size``-character chunks.
 
-        return "".join(endnote_entries)
+        Suitable as the body of a chunked HTTP response; the format is
+        validated before the first chunk is produced.
+        """
+        return _chunk_entries(self.iter_citations(papers, format_type), chunk_size)
 
-    def _export_apa(self, papers: List[Dict[str, Any]]) -> str:
-        """Export papers in APA citation format."""
-        apa_citations = []
+    def write_citations(
+        self,
+        papers: Iterable[Dict[str, Any]],
+        sink: TextIO,
+        format_type: str = "bibtex",
+    ) -> int:
+        """
+        Stream citations into a text sink such as an open file.
 
-        for paper in papers:
-            authors = paper.get("authors", ["Unknown Author"])
+        Returns:
+            The number of papers written
+        """
+        count = 0
+        for entry in self.iter_citations(papers, format_type):
+            sink.write(entry)
+            count += 1
+        return count
 
-            # Format authors for APA
-            if len(authors) == 1:
-                author_str = authors[0]
-            elif len(authors) == 2:
-                author_str = f"{authors[0]} & {authors[1]}"
-            else:
-                author_str = f"{', '.join(authors[:-1])}, & {authors[-1]}"
+    def _format_paper_for_response(
+        self,
+        paper_data: Dict[str, Any],
+        fields: Optional[List[str]] = None,
+        full_text: bool = False,
+        compact: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Format a paper dictionary for API response (all fields by default).
 
-            year = paper.get("year", "n.d.")
-            title = paper.get("title", "Unknown title")
-            venue = paper.get("venue", "Unknown venue")
+        ``full_text`` puts the untruncated abstract in ``abstract``;
+        ``compact`` leaves out fields with no value.
+        """
+        builders = _FULL_TEXT_FIELD_BUILDERS if full_text else _RESPONSE_FIELD_BUILDERS
+        paper = {
+            name: builders[name](self, paper_data)
+            for name in (fields or RESPONSE_FIELDS)
+        }
+        if compact:
+            return {name: value for name, value in paper.items() if value is not None}
+        return paper
 
-            citation = f"{author_str} ({year}). {title}. {venue}."
+    def cache_stats(self) -> Dict[str, Any]:
+        """Sizes and hit counters of the citation caches."""
+        return {
+            "citations": len(self._citation_cache),
+            "citation_cache_size": self.citation_cache_size,
+            "exports": self.export_cache.stats(),
+        }
 
-            if paper.get("doi"):
-                citation += f" https://doi.org/{paper['doi']}"
-            elif paper.get("source_url"):
-                citation += f" Retrieved from {paper['source_url']}"
+    def _format_citation(self, paper_data: Dict[str, Any]) -> str:
+        """
+        Format paper as academic citation.
 
-            apa_citations.append(citation)
+        Citations are memoized in a bounded LRU keyed by the paper's identity
+        (see ``paper_identity``) plus the fields the citation is built from,
+        so a paper returned by many searches is formatted once, and a paper
+        whose details change under the same DOI or URL is formatted again.
+        """
+        identity = paper_identity(paper_data)
+        key = None
+        if identity is not None:
+            key = (
+                identity,
+                tuple(paper_data.get("authors") or ()),
+                paper_data.get("year"),
+                paper_data.get("venue"),
+                paper_data.get("title", "Untitled"),
+            )
+            cached = self._citation_cache.get(key)
+            if cached is not None:
+                self._citation_cache.move_to_end(key)
+                return cached
 
-        return "\n\n".join(apa_citations)
+        citation = self._render_citation(paper_data)
 
-    def _format_paper_for_response(self, paper_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Format a paper dictionary for API response."""
-        abstract = paper_data.get("abstract", "")
-        return {
-            "title": paper_data.get("title", ""),
-            "authors": paper_data.get("authors", []),
-            "abstract": abstract[:500] + "..." if len(abstract) > 500 else abstract,
-            "full_abstract": abstract,
-            "year": paper_data.get("year"),
-            "citation_count": paper_data.get("citation_count", 0),
-            "pdf_url": paper_data.get("pdf_url"),
-            "source_url": paper_data.get("url", ""),
-            "source_type": paper_data.get("source", ""),
-            "relevance_score": paper_data.get("relevance_score", 0.5),
-            "venue": paper_data.get("venue"),
-            "doi": paper_data.get("doi"),
-            "formatted_citation": self._format_citation(paper_data),
-            "display_class": self._get_relevance_class(
-                paper_data.get("relevance_score", 0.5)
-            ),
-        }
+        if key is not None and self.citation_cache_size > 0:
+            self._citation_cache[key] = citation
+            if len(self._citation_cache) > self.citation_cache_size:
+                self._citation_cache.popitem(last=False)
+        return citation
 
-    def _format_citation(self, paper_data: Dict[str, Any]) -> str:
-        """Format paper as academic citation."""
+    def _render_citation(self, paper_data: Dict[str, Any]) -> str:
         authors = paper_data.get("authors", [])
         if not authors:
             authors_str = "Unknown Authors"
@@ -406,10 +575,26 @@ class EnhancedResearchOrchestrationService:
         self.scholarly_use_case = scholarly_use_case or ScholarlyResearchUseCase(
             query_repository, result_repository
         )
+        self._async_query_repository = as_async_query_repository(query_repository)
+        self._async_result_repository = as_async_result_repository(result_repository)
         self.logger = logging.getLogger(__name__)
 
+    async def _find_query(self, query_id: str) -> ResearchQuery:
+        """Load a query by its string ID, raising QueryNotFoundError if absent."""
+        try:
+            key = QueryId(uuid.UUID(query_id))
+        except ValueError:
+            raise QueryNotFoundError(f"Query {query_id} not found")
+        query = await self._async_query_repository.find_by_id(key)
+        if not query:
+            raise QueryNotFoundError(f"Query {query_id} not found")
+        return query
+
     async def execute_enhanced_research(
-        self, query_id: str, include_scholarly: bool = True
+        self,
+        query_id: str,
+        include_scholarly: bool = True,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> ResearchResult:
         """
         Execute research with optional scholarly source integration.
@@ -417,15 +602,16 @@ class EnhancedResearchOrchestrationService:
         Args:
             query_id: ID of the research query
             include_scholarly: Whether to include scholarly sources
+            cancel_token: Optional token; on cancellation or timeout the
+                partial result is saved with status CANCELLED
 
         Returns:
             ResearchResult with enhanced data
         """
+        token = ensure_token(cancel_token)
+
         try:
-            # Get the query
-            query = self.query_repository.find_by_id(QueryId(query_id))
-            if not query:
-                raise QueryNotFoundError(f"Query {query_id} not found")
+            query = await self._find_query(query_id)
 
             # Create result structure
             result = ResearchResult(
@@ -434,74 +620,158 @@ class EnhancedResearchOrchestrationService:
                 created_at=datetime.now(),
             )
 
-            # If scholarly sources requested and query includes academic sources
-            if include_scholarly and query.include_academic_sources:
-                self.logger.info(f"Including scholarly sources for query: {query.text}")
+            try:
+                token.raise_if_cancelled()
+                await self._gather_sources(query, result, include_scholarly, token)
+            except OperationCancelled as e:
+                token.cancel(e.reason)
 
-                # Execute scholarly search
-                scholarly_request = ScholarlySearchRequest(
-                    query_text=query.text,
-                    max_results=query.max_sources,
-                    include_abstracts=True,
-                )
+            await self._finish(result, token, query_id)
+            return result
+
+        except Exception as e:
+            self.logger.error(
+                f"Enhanced research failed for query {query_id}: {str(e)}"
+            )
+            raise DomainException(f"Research execution failed: {str(e)}")
+
+    async def stream_enhanced_research(
+        self,
+        query_id: str,
+        include_scholarly: bool = True,
+        cancel_token: Optional[CancellationToken] = None,
+        sources: Iterable[str] = DEFAULT_SCHOLARLY_SOURCES,
+    ) -> AsyncGenerator[ResearchProgressEvent, None]:
+        """
+        Execute enhanced research, yielding progress as each source finishes.
+
+        Scholarly sources are searched concurrently and reported fastest
+        first, so the first results arrive after the quickest source instead
+        of after all of them. The last event is "completed" with the saved
+        result. If the consumer stops early (e.g. the client disconnects) the
+        token is cancelled so the remaining searches wind down, and the
+        partial result is saved as CANCELLED.
+
+        Raises:
+            QueryNotFoundError: If the query does not exist
+        """
+        token = ensure_token(cancel_token)
+        query = await self._find_query(query_id)
 
-                scholarly_response = (
-                    await self.scholarly_use_case.execute_scholarly_search(
-                        scholarly_request
-                    )
+        result = ResearchResult(
+            query=query, status=ResearchStatus.IN_PROGRESS, created_at=datetime.now()
+        )
+        names = (
+            list(sources)
+            if include_scholarly and query.include_academic_sources
+            else []
+        )
+        yield ResearchProgressEvent("started", query_id, total=len(names))
+
+        per_source = max(query.max_sources // len(names), 1) if names else 0
+        searches = [
+            asyncio.ensure_future(self._search_source(query, name, per_source, token))
+            for name in names
+        ]
+        finished = False
+        try:
+            for completed, search in enumerate(asyncio.as_completed(searches), 1):
+                name, papers, error = await search
+                room = query.max_sources - len(result.sources)
+                before = len(result.sources)
+                result.add_sources(list(map(_paper_to_source, papers))[:room])
+                yield ResearchProgressEvent(
+                    "source",
+                    query_id,
+                    source=name,
+                    sources=result.sources[before:],
+                    completed=completed,
+                    total=len(names),
+                    error=error,
                 )
+            finished = True
+        finally:
+            if not finished:
+                # Keep what was gathered, as a cancelled partial result
+                token.cancel("stream closed")
+                for search in searches:
+                    search.cancel()
+                await self._finish(result, token, query_id)
+
+        await self._finish(result, token, query_id)
+        yield ResearchProgressEvent(
+            "completed", query_id, completed=len(names), total=len(names), result=result
+        )
 
-                # Add scholarly results to research result
-                for paper_data in scholarly_response.papers:
-                    # Map source types correctly - use existing SourceType enum values
-                    source_type_map = {
-                        "arxiv": SourceType.ARXIV,
-                        "semantic_scholar": SourceType.SEMANTIC_SCHOLAR,
-                        "google_scholar": SourceType.GOOGLE_SCHOLAR,
-                    }
-
-                    source_type = source_type_map.get(
-                        paper_data.get("source_type", "").lower(),
-                        SourceType.CUSTOM,  # Default for academic sources
-                    )
-
-                    source = ResearchSource(
-                        title=paper_data["title"],
-                        url=paper_data["source_url"],
-                        source_type=source_type,
-                        content=paper_data["full_abstract"],
-                        relevance_score=paper_data["relevance_score"],
-                        metadata={
-                            "authors": paper_data["authors"],
-                            "year": paper_data["year"],
-                            "citation_count": paper_data["citation_count"],
-                            "venue": paper_data["venue"],
-                            "pdf_url": paper_data["pdf_url"],
-                            "doi": paper_data["doi"],
-                            "formatted_citation": paper_data["formatted_citation"],
-                        },
-                    )
-                    result.add_source(source)
-
-            # Mark as completed
+    async def _search_source(
+        self,
+        query: ResearchQuery,
+        name: str,
+        max_results: int,
+        token: CancellationToken,
+    ) -> Tuple[str, List[Dict[str, Any]], Optional[str]]:
+        """Search one scholarly source; failures become an error message."""
+        request = ScholarlySearchRequest(
+            query_text=query.text, sources=[name], max_results=max_results
+        )
+        try:
+            papers = await self.scholarly_use_case.search_papers(
+                request, cancel_token=token
+            )
+            return name, papers, None
+        except OperationCancelled:
+            return name, [], None
+        except Exception as e:
+            self.logger.warning(f"{name} search failed for '{query.text}': {e}")
+            return name, [], str(e)
+
+    async def _finish(
+        self, result: ResearchResult, token: CancellationToken, query_id: str
+    ) -> None:
+        """Mark the result completed (or cancelled) and save it."""
+        if token.is_cancelled:
+            result.mark_cancelled(token.reason or "cancelled")
+            self.logger.info(
+                f"Enhanced research {token.reason} for query {query_id}: "
+                f"keeping {len(result.sources)} partial sources"
+            )
+        else:
             result.status = ResearchStatus.COMPLETED
             result.completed_at = datetime.now()
 
-            # Save result
-            self.result_repository.save(result)
+        # Save result without blocking the event loop
+        await self._async_result_repository.save(result)
 
-            self.logger.info(
-                f"Enhanced research completed for query {query_id}: "
-                f"{len(result.sources)} sources"
-            )
+        self.logger.info(
+            f"Enhanced research finished for query {query_id}: "
+            f"{len(result.sources)} sources"
+        )
 
-            return result
+    async def _gather_sources(
+        self,
+        query: ResearchQuery,
+        result: ResearchResult,
+        include_scholarly: bool,
+        token: CancellationToken,
+    ) -> None:
+        """Collect sources into ``result``; sources added before a cancel stay."""
+        # If scholarly sources requested and query includes academic sources
+        if include_scholarly and query.include_academic_sources:
+            self.logger.info(f"Including scholarly sources for query: {query.text}")
+
+            # Execute scholarly search
+            scholarly_request = ScholarlySearchRequest(
+                query_text=query.text,
+                max_results=query.max_sources,
+                include_abstracts=True,
+            )
 
-        except Exception as e:
-            self.logger.error(
-                f"Enhanced research failed for query {query_id}: {str(e)}"
+            papers = await self.scholarly_use_case.search_papers(
+                scholarly_request, cancel_token=token
             )
-            raise DomainException(f"Research execution failed: {str(e)}")
+
+            # Single pass from raw papers to domain sources (URL-deduplicated)
+            result.add_sources(map(_paper_to_source, papers))
 
 
 # Factory functions
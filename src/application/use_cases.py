@@ -6,13 +6,15 @@ the domain logic to fulfill business workflows. Use cases are stateless
 and depend only on domain interfaces.
 """
 
-import asyncio
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 
+from ..core.cancellation import CancellationToken, ensure_token
 from ..domain.entities import (
+    AsyncResearchQueryRepository,
+    AsyncResearchResultRepository,
     DomainException,
     InvalidQueryException,
     QueryId,
@@ -22,10 +24,12 @@ from ..domain.entities import (
     ResearchQueryType,
     ResearchResult,
     ResearchResultRepository,
-    ResearchSource,
-    ResearchStatus,
-    SourceType,
 )
+from ..infrastructure.async_repositories import (
+    as_async_query_repository,
+    as_async_result_repository,
+)
+from .research_pipeline import ProgressCallback, ResearchPipeline
 
 # Use Case DTOs
 
@@ -60,6 +64,21 @@ class ExecuteResearchResponse:
     results: List[ResearchResult]
 
 
+@dataclass
+class GetResearchResultsRequest:
+    """Request for the stored results of a query."""
+
+    query_id: str
+
+
+@dataclass
+class GetResearchResultsResponse:
+    """The results stored for a query, oldest first."""
+
+    query_id: str
+    results: List[ResearchResult]
+
+
 @dataclass
 class OrchestrationResponse:
     """Response from full research orchestration."""
@@ -74,8 +93,11 @@ class OrchestrationResponse:
 class CreateResearchQueryUseCase:
     """Use case for creating new research queries."""
 
-    def __init__(self, query_repository: ResearchQueryRepository):
-        self._query_repository = query_repository
+    def __init__(
+        self,
+        query_repository: Union[ResearchQueryRepository, AsyncResearchQueryRepository],
+    ):
+        self._query_repository = as_async_query_repository(query_repository)
 
     async def execute(
         self, request: CreateResearchQueryRequest
@@ -109,28 +131,48 @@ class CreateResearchQueryUseCase:
         )
 
         # Save to repository
-        self._query_repository.save(query)
+        await self._query_repository.save(query)
 
         return CreateResearchQueryResponse(query_id=str(query.id.value))
 
 
 class ExecuteResearchUseCase:
-    """Use case for executing research on existing queries."""
+    """
+    Use case for executing research on existing queries.
+
+    The research itself is done by a ResearchPipeline (see
+    research_pipeline.py). The composition root chooses it - the
+    application container builds one that searches arXiv and Semantic
+    Scholar concurrently - so the use case never reaches the network on
+    its own.
+    """
 
     def __init__(
         self,
-        query_repository: ResearchQueryRepository,
-        result_repository: ResearchResultRepository,
+        query_repository: Union[ResearchQueryRepository, AsyncResearchQueryRepository],
+        result_repository: Union[
+            ResearchResultRepository, AsyncResearchResultRepository
+        ],
+        pipeline: ResearchPipeline,
     ):
-        self._query_repository = query_repository
-        self._result_repository = result_repository
+        self._query_repository = as_async_query_repository(query_repository)
+        self._result_repository = as_async_result_repository(result_repository)
+        self._pipeline = pipeline
 
-    async def execute(self, request: ExecuteResearchRequest) -> ExecuteResearchResponse:
+    async def execute(
+        self,
+        request: ExecuteResearchRequest,
+        cancel_token: Optional[CancellationToken] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> ExecuteResearchResponse:
         """
         Execute research for a given query.
 
         Args:
             request: The execute research request
+            cancel_token: Optional token; cancelled runs are saved with
+                status CANCELLED and whatever sources were gathered
+            progress: Optional callback for each finished pipeline step
 
         Returns:
             Response containing research results
@@ -143,75 +185,56 @@ class ExecuteResearchUseCase:
             query_id = QueryId(uuid.UUID(request.query_id))
         else:
             query_id = QueryId(request.query_id)
-        query = self._query_repository.find_by_id(query_id)
+        query = await self._query_repository.find_by_id(query_id)
 
         if query is None:
             raise QueryNotFoundError(f"Query not found: {query_id}")
 
-        # Simulate research execution by creating mock results
-        # In a real implementation, this would call external services
-        results = await self._simulate_research(query)
+        result = await self._pipeline.run(query, ensure_token(cancel_token), progress)
+        # Persistence runs off the event loop
+        await self._result_repository.save(result)
 
-        # Save results
-        for result in results:
-            self._result_repository.save(result)
+        return ExecuteResearchResponse(results=[result])
 
-        return ExecuteResearchResponse(results=results)
 
-    async def _simulate_research(self, query: ResearchQuery) -> List[ResearchResult]:
+class GetResearchResultsUseCase:
+    """
+    Use case for reading the stored results of a query.
+
+    A read only: results are never recomputed, so repeating the request
+    returns the same document until the query is executed again.
+    """
+
+    def __init__(
+        self,
+        query_repository: Union[ResearchQueryRepository, AsyncResearchQueryRepository],
+        result_repository: Union[
+            ResearchResultRepository, AsyncResearchResultRepository
+        ],
+    ):
+        self._query_repository = as_async_query_repository(query_repository)
+        self._result_repository = as_async_result_repository(result_repository)
+
+    async def execute(
+        self, request: GetResearchResultsRequest
+    ) -> GetResearchResultsResponse:
         """
-        Simulate research execution.
+        Look up a query's results.
 
-        In a real implementation, this would:
-        1. Call source search services
-        2. Retrieve and analyze content
-        3. Score relevance
-        4. Return structured results
+        Raises:
+            InvalidQueryException: If the query ID is not a UUID
+            QueryNotFoundError: If the query doesn't exist
         """
-        # Create a research result for this query
-        result = ResearchResult(
-            query=query,
-            status=ResearchStatus.COMPLETED,
-            completed_at=datetime.now(),
-        )
+        try:
+            query_id = QueryId(uuid.UUID(str(request.query_id)))
+        except ValueError:
+            raise InvalidQueryException(f"Invalid query ID: {request.query_id}")
+
+        if await self._query_repository.find_by_id(query_id) is None:
+            raise QueryNotFoundError(f"Query not found: {query_id}")
 
-        # Add mock sources based on query preferences
-        source_types = []
-        if query.include_web_search:
-            source_types.append(SourceType.WEB)
-        if query.include_academic_sources:
-            source_types.append(SourceType.ARXIV)
-
-        if not source_types:
-            source_types = [SourceType.WEB]  # Default fallback
-
-        for i, source_type in enumerate(source_types):
-            if len(result.sources) >= query.max_sources:
-                break
-
-            # Mock result content based on query
-            content = f"Research result {i+1} from {source_type.value} for query: '{query.text}'"
-            if "machine learning" in query.text.lower():
-                content += " - Machine learning is a subset of artificial intelligence."
-            elif "climate" in query.text.lower():
-                content += " - Climate change is a significant global challenge."
-            elif "quantum" in query.text.lower():
-                content += " - Quantum computing leverages quantum mechanics."
-
-            # Create a research source
-            source = ResearchSource(
-                url=f"https://example.com/source_{i}",
-                title=f"Research Source {i+1}",
-                source_type=source_type,
-                content=content,
-                relevance_score=0.8 - (i * 0.1),  # Decreasing relevance
-            )
-            result.add_source(source)
-
-        # Simulate async processing delay
-        await asyncio.sleep(0.1)
-
-        return [result]
+        results = await self._result_repository.find_by_query_id(query_id)
+        return GetResearchResultsResponse(query_id=str(query_id), results=list(results))
 
 
 class ResearchOrchestrationService:
@@ -231,7 +254,12 @@ class ResearchOrchestrationService:
         self._execute_research_use_case = execute_research_use_case
 
     async def create_and_execute_research(
-        self, query_text: str, sources: List[str], max_results: int
+        self,
+        query_text: str,
+        sources: List[str],
+        max_results: int,
+        cancel_token: Optional[CancellationToken] = None,
+        progress: Optional[ProgressCallback] = None,
     ) -> OrchestrationResponse:
         """
         Create a query and execute research in one workflow.
@@ -240,6 +268,8 @@ class ResearchOrchestrationService:
             query_text: The research question
             sources: Sources to search
             max_results: Maximum results to return
+            cancel_token: Optional token forwarded to the research step
+            progress: Optional callback for each finished research step
 
         Returns:
             Combined response with both create and execute results
@@ -253,7 +283,7 @@ class ResearchOrchestrationService:
         # Step 2: Execute research
         execute_request = ExecuteResearchRequest(query_id=create_response.query_id)
         execute_response = await self._execute_research_use_case.execute(
-            execute_request
+            execute_request, cancel_token=cancel_token, progress=progress
         )
 
         return OrchestrationResponse(
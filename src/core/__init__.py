@@ -12,12 +12,21 @@ Components:
 - Base repository interfaces
 - Common exceptions
 - Shared value objects
-- Cross-cutting concerns
+- Cross-cutting concerns (cooperative cancellation)
 """
 
-# Note: Base classes will be imported when they are implemented
-# For now, core module provides namespace structure
+from .cancellation import (
+    CancellationToken,
+    InvalidTimeoutError,
+    OperationCancelled,
+    ensure_token,
+    parse_timeout,
+)
 
 __all__ = [
-    # Base classes and interfaces will be exported here when implemented
+    "CancellationToken",
+    "InvalidTimeoutError",
+    "OperationCancelled",
+    "ensure_token",
+    "parse_timeout",
 ]
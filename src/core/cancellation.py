@@ -0,0 +1,172 @@
+"""
+Cooperative Cancellation
+
+A CancellationToken is handed from the presentation layer down through the
+use cases into the infrastructure searchers. Long-running work checks the
+token at safe points (between upstream requests, between PDF chunks) and
+stops early, keeping whatever it has gathered so far.
+
+Educational Note:
+Cancellation here is *cooperative* - nobody forcibly kills a running task.
+It works like a "please stop" flag on a librarian's desk: they finish the
+shelf they are on, notice the flag, and bring back what they have found.
+
+Tokens are thread-safe because blocking searchers run in worker threads
+while the request that owns the token lives on the event loop.
+"""
+
+import math
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+CancelCallback = Callable[[str], None]
+
+
+class OperationCancelled(Exception):
+    """Raised at a cancellation checkpoint once the token has been cancelled."""
+
+    def __init__(self, reason: str = "cancelled"):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class InvalidTimeoutError(ValueError):
+    """Raised for a ``timeout_seconds`` that is not a positive number."""
+
+
+class CancellationToken:
+    """
+    Thread-safe cancellation flag with an optional deadline.
+
+    Args:
+        timeout: Seconds from now after which the token cancels itself
+            with reason ``"timed out"`` (None means no deadline)
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[CancelCallback] = []
+        self._reason: Optional[str] = None
+        self._deadline = time.monotonic() + timeout if timeout is not None else None
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Check if the token was cancelled or its deadline has passed."""
+        if self._event.is_set():
+            return True
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            self.cancel("timed out")
+            return True
+        return False
+
+    @property
+    def reason(self) -> Optional[str]:
+        """Why the token was cancelled (None while still active)."""
+        return self._reason
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Cancel the token and run registered callbacks (first call wins)."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+
+        for callback in callbacks:
+            try:
+                callback(reason)
+            except Exception:
+                # A failing cleanup hook must not stop the others
+                pass
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Cancellation checkpoint.
+
+        Raises:
+            OperationCancelled: If the token is cancelled or timed out
+        """
+        if self.is_cancelled:
+            raise OperationCancelled(self._reason or "cancelled")
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline (None if there is no deadline)."""
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.monotonic())
+
+    def timeout_for(self, default: float) -> float:
+        """
+        Cap a per-request timeout so upstream calls never outlive the token.
+
+        Raises:
+            OperationCancelled: If the token is already cancelled
+        """
+        self.raise_if_cancelled()
+        remaining = self.remaining()
+        return default if remaining is None else max(0.001, min(default, remaining))
+
+    def sleep(self, seconds: float) -> bool:
+        """
+        Sleep for up to ``seconds``, waking early on cancellation.
+
+        Returns:
+            True if the token was cancelled while (or before) sleeping
+        """
+        remaining = self.remaining()
+        if remaining is not None:
+            seconds = min(seconds, remaining)
+        self._event.wait(max(0.0, seconds))
+        return self.is_cancelled
+
+    def add_callback(self, callback: CancelCallback) -> Callable[[], None]:
+        """
+        Run ``callback(reason)`` when the token is cancelled.
+
+        The callback runs immediately if the token is already cancelled.
+
+        Returns:
+            A function that unregisters the callback
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove_callback(callback)
+        callback(self._reason or "cancelled")
+        return lambda: None
+
+    def _remove_callback(self, callback: CancelCallback) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+
+def ensure_token(token: Optional[CancellationToken]) -> CancellationToken:
+    """Return ``token`` or a fresh token that is never cancelled."""
+    return token if token is not None else CancellationToken()
+
+
+def parse_timeout(value: Any) -> Optional[float]:
+    """
+    Validate a client-supplied ``timeout_seconds``.
+
+    Returns:
+        The timeout in seconds, or None when ``value`` is None
+
+    Raises:
+        InvalidTimeoutError: If ``value`` is not a positive, finite number
+    """
+    if value is None:
+        return None
+    if (
+        isinstance(value, bool)
+        or not isinstance(value, (int, float))
+        or not 0 < value < math.inf  # Also rejects NaN
+    ):
+        raise InvalidTimeoutError(
+            "timeout_seconds must be a positive number of seconds"
+        )
+    return float(value)
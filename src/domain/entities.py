@@ -24,10 +24,11 @@ consistency rules (making sure everything makes sense together).
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Protocol, Set
+from urllib.parse import urlsplit, urlunsplit
 from uuid import UUID, uuid4
 
 
@@ -165,12 +166,37 @@ class ResearchQuery:
         return self.query_type == ResearchQueryType.TREND_ANALYSIS
 
 
+def _slotted(cls: type) -> type:
+    """
+    Rebuild dataclass ``cls`` with ``__slots__`` for its fields.
+
+    Equivalent to ``@dataclass(slots=True)``, which needs Python 3.10; the
+    project still supports 3.9. A field with ``init=False`` must use
+    ``default_factory``: a plain default lives only in the class attribute
+    that a slot replaces.
+    """
+    for f in fields(cls):
+        if not f.init and f.default_factory is MISSING:
+            raise TypeError(f"{cls.__name__}.{f.name} needs a default_factory")
+    names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted
 @dataclass
 class ResearchSource:
     """
     Domain entity representing a source of research information.
 
     Sources can be papers, websites, or other information repositories.
+    Instances are slotted (no per-instance ``__dict__``) because a single
+    research run can hold tens of thousands of them in memory.
     """
 
     id: UUID = field(default_factory=uuid4)
@@ -210,6 +236,79 @@ class ResearchSource:
         return self.title.strip() if self.title.strip() else f"Source from {self.url}"
 
 
+def normalize_source_url(url: str) -> str:
+    """
+    Normalize a URL for duplicate detection.
+
+    Scheme and host are case-insensitive, fragments never identify a different
+    document, and a trailing slash on the path is cosmetic, so
+    ``HTTPS://Example.com/paper/`` and ``https://example.com/paper#abstract``
+    are treated as the same source.
+    """
+    url = url.strip()
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    path = parts.path.rstrip("/")
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), path, parts.query, "")
+    )
+
+
+def paper_identity(paper: Dict[str, Any]) -> Optional[str]:
+    """
+    Stable identity for a paper dict, shared by every part of the system
+    that asks "is this the same paper?" (collection membership, citation
+    caches).
+
+    A DOI identifies a paper exactly. Without one, the title is compared
+    ignoring case, spacing and punctuation, so the same paper found on arXiv
+    and Semantic Scholar is stored once. A normalized URL is the last resort.
+    Returns None when the paper carries none of these.
+    """
+    doi = (paper.get("doi") or "").strip().lower()
+    if doi:
+        return f"doi:{doi}"
+    title = "".join(c for c in (paper.get("title") or "").lower() if c.isalnum())
+    if title:
+        return f"title:{title}"
+    url = normalize_source_url(paper.get("source_url") or paper.get("url") or "")
+    return f"url:{url}" if url else None
+
+
+@_slotted
+@dataclass
+class ResearchCollection:
+    """
+    Domain entity for a named library of papers kept for a project.
+
+    Membership lives in the ResearchCollectionRepository (which indexes it in
+    both directions); the entity carries the collection's own metadata and a
+    paper count the repository keeps current.
+    """
+
+    name: str
+    description: str = ""
+    id: str = field(default_factory=lambda: str(uuid4()))
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+    paper_count: int = 0
+
+    def __post_init__(self) -> None:
+        """Validate business rules."""
+        self.name = self.name.strip()
+        if not self.name:
+            raise ValueError("Collection name cannot be empty")
+
+        if len(self.name) > 200:
+            raise ValueError("Collection name cannot exceed 200 characters")
+
+    def touch(self) -> None:
+        """Record a modification."""
+        self.updated_at = datetime.now()
+
+
+@_slotted
 @dataclass
 class ResearchResult:
     """
@@ -217,6 +316,10 @@ class ResearchResult:
 
     This aggregates all sources found for a query along with
     synthesized insights and metadata about the research process.
+
+    Sources must be added through add_source/add_sources so the URL index
+    and running aggregates stay in step; appending to ``sources`` directly
+    bypasses them.
     """
 
     query: ResearchQuery
@@ -229,6 +332,58 @@ class ResearchResult:
     search_strategies_used: List[str] = field(default_factory=list)
     total_processing_time: float = 0.0
     error_message: Optional[str] = None
+    # Normalized URLs of ``sources``, kept in step by add_source/add_sources
+    # so duplicate checks are O(1) instead of a scan over every source.
+    _url_index: Set[str] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    # Running aggregates maintained on insert so the read-side accessors used
+    # by every presentation layer are O(1) instead of rescanning ``sources``.
+    _relevance_sum: float = field(
+        default_factory=float, init=False, repr=False, compare=False
+    )
+    _sufficient_count: int = field(
+        default_factory=int, init=False, repr=False, compare=False
+    )
+    _type_counts: Dict[SourceType, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _academic_sources: List[ResearchSource] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _web_sources: List[ResearchSource] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Index any sources supplied at construction time."""
+        self._url_index = {
+            key for key in map(self._url_key, self.sources) if key is not None
+        }
+        for source in self.sources:
+            self._track(source)
+
+    def _track(self, source: ResearchSource) -> None:
+        """Fold a newly added source into the running aggregates."""
+        self._relevance_sum += source.relevance_score
+        self._type_counts[source.source_type] = (
+            self._type_counts.get(source.source_type, 0) + 1
+        )
+        if source.is_academic_source():
+            self._academic_sources.append(source)
+        elif source.source_type == SourceType.WEB:
+            self._web_sources.append(source)
+        if source.has_sufficient_content():
+            self._sufficient_count += 1
+
+    @staticmethod
+    def _url_key(source: ResearchSource) -> Optional[str]:
+        """Return the dedupe key for a source, or None if it has no URL."""
+        return normalize_source_url(source.url) if source.url else None
+
+    def has_source_url(self, url: str) -> bool:
+        """Check whether a source with this URL has already been added."""
+        return normalize_source_url(url) in self._url_index
 
     def add_source(self, source: ResearchSource) -> None:
         """Add a source to the research results."""
@@ -236,10 +391,45 @@ class ResearchResult:
             raise ValueError(f"Cannot add more than {self.query.max_sources} sources")
 
         # Prevent duplicate sources
-        if any(existing.url == source.url for existing in self.sources if source.url):
-            return
+        key = self._url_key(source)
+        if key is not None:
+            if key in self._url_index:
+                return
+            self._url_index.add(key)
 
         self.sources.append(source)
+        self._track(source)
+
+    def add_sources(self, sources: Iterable[ResearchSource]) -> int:
+        """
+        Add a batch of sources in a single pass.
+
+        Duplicates (against existing sources and within the batch) are
+        dropped. The batch is validated as a whole: if the remaining new
+        sources would exceed ``max_sources`` nothing is added.
+
+        Returns:
+            Number of sources actually added
+        """
+        accepted: List[ResearchSource] = []
+        batch_keys: Set[str] = set()
+
+        for source in sources:
+            key = self._url_key(source)
+            if key is not None:
+                if key in self._url_index or key in batch_keys:
+                    continue
+                batch_keys.add(key)
+            accepted.append(source)
+
+        if len(self.sources) + len(accepted) > self.query.max_sources:
+            raise ValueError(f"Cannot add more than {self.query.max_sources} sources")
+
+        self.sources.extend(accepted)
+        self._url_index |= batch_keys
+        for source in accepted:
+            self._track(source)
+        return len(accepted)
 
     def mark_completed(
         self, synthesis: str = "", key_findings: List[str] = None
@@ -256,23 +446,34 @@ class ResearchResult:
         self.completed_at = datetime.now()
         self.error_message = error_message
 
+    def mark_cancelled(self, reason: str = "cancelled") -> None:
+        """Mark the research as cancelled, keeping any partial sources."""
+        self.status = ResearchStatus.CANCELLED
+        self.completed_at = datetime.now()
+        self.error_message = reason
+
     def get_academic_sources(self) -> List[ResearchSource]:
-        """Get only academic sources from the results."""
-        return [source for source in self.sources if source.is_academic_source()]
+        """
+        Get only academic sources from the results.
+
+        Returns a copy of the index maintained by add_source, so callers
+        cannot desynchronize it from ``sources``.
+        """
+        return list(self._academic_sources)
 
     def get_web_sources(self) -> List[ResearchSource]:
-        """Get only web sources from the results."""
-        return [
-            source for source in self.sources if source.source_type == SourceType.WEB
-        ]
+        """Get only web sources from the results (a copy of the index)."""
+        return list(self._web_sources)
+
+    def count_sources_by_type(self, source_type: SourceType) -> int:
+        """Get how many sources of the given type have been added."""
+        return self._type_counts.get(source_type, 0)
 
     def get_average_relevance_score(self) -> float:
         """Calculate average relevance score across all sources."""
         if not self.sources:
             return 0.0
-        return sum(source.relevance_score for source in self.sources) / len(
-            self.sources
-        )
+        return self._relevance_sum / len(self.sources)
 
     def is_complete(self) -> bool:
         """Check if research is complete."""
@@ -280,8 +481,7 @@ class ResearchResult:
 
     def has_sufficient_sources(self) -> bool:
         """Check if we have enough quality sources."""
-        quality_sources = [s for s in self.sources if s.has_sufficient_content()]
-        return len(quality_sources) >= min(3, self.query.max_sources // 2)
+        return self._sufficient_count >= min(3, self.query.max_sources // 2)
 
 
 # Domain Services and Repositories (Interfaces)
@@ -310,8 +510,8 @@ class ResearchResultRepository(Protocol):
         """Save research results."""
         ...
 
-    def find_by_query_id(self, query_id: QueryId) -> Optional[ResearchResult]:
-        """Find results by query ID."""
+    def find_by_query_id(self, query_id: QueryId) -> List[ResearchResult]:
+        """Find every result saved for a query, oldest first."""
         ...
 
     def find_completed_results(
@@ -321,6 +521,100 @@ class ResearchResultRepository(Protocol):
         ...
 
 
+class AsyncResearchQueryRepository(Protocol):
+    """
+    Non-blocking repository interface for research queries.
+
+    Use cases await these methods so that a slow storage backend never
+    blocks the event loop while other research work is in flight.
+    """
+
+    async def save(self, query: ResearchQuery) -> None:
+        """Save a research query."""
+        ...
+
+    async def find_by_id(self, query_id: QueryId) -> Optional[ResearchQuery]:
+        """Find a query by its ID."""
+        ...
+
+    async def find_by_requester(self, requester_id: str) -> List[ResearchQuery]:
+        """Find queries by requester."""
+        ...
+
+
+class AsyncResearchResultRepository(Protocol):
+    """Non-blocking repository interface for research results."""
+
+    async def save(self, result: ResearchResult) -> None:
+        """Save research results."""
+        ...
+
+    async def find_by_query_id(self, query_id: QueryId) -> List[ResearchResult]:
+        """Find every result saved for a query, oldest first."""
+        ...
+
+    async def find_completed_results(
+        self, limit: int = 10, offset: int = 0
+    ) -> List[ResearchResult]:
+        """Find completed research results."""
+        ...
+
+
+class ResearchCollectionRepository(Protocol):
+    """
+    Repository interface for research collections and their papers.
+
+    Papers are stored as plain dicts and deduplicated per collection by
+    ``paper_identity``. Implementations index membership in both
+    directions so membership checks and "which collections hold this paper"
+    are constant-time lookups.
+    """
+
+    def save(self, collection: ResearchCollection) -> None:
+        """Create or update a collection's metadata."""
+        ...
+
+    def find_by_id(self, collection_id: str) -> Optional[ResearchCollection]:
+        """Find a collection by its ID."""
+        ...
+
+    def list_collections(
+        self, limit: int = 50, offset: int = 0
+    ) -> List[ResearchCollection]:
+        """List collections, oldest first."""
+        ...
+
+    def delete(self, collection_id: str) -> bool:
+        """Delete a collection and its memberships."""
+        ...
+
+    def add_papers(self, collection_id: str, papers: Iterable[Dict[str, Any]]) -> int:
+        """Add papers, skipping duplicates; returns how many were new."""
+        ...
+
+    def remove_papers(self, collection_id: str, keys: Iterable[str]) -> int:
+        """Remove papers by dedupe key; returns how many were removed."""
+        ...
+
+    def contains(self, collection_id: str, key: str) -> bool:
+        """Check membership by dedupe key."""
+        ...
+
+    def list_papers(
+        self, collection_id: str, limit: int = 50, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """List papers in insertion order."""
+        ...
+
+    def iter_papers(self, collection_id: str) -> Iterator[Dict[str, Any]]:
+        """Iterate every paper in insertion order (for exports)."""
+        ...
+
+    def collections_for(self, key: str) -> List[str]:
+        """IDs of every collection holding the paper with this key."""
+        ...
+
+
 class SourceAnalyzer(Protocol):
     """Service for analyzing source quality and relevance."""
 
@@ -420,3 +714,9 @@ class QueryNotFoundError(DomainException):
     """Raised when a query cannot be found."""
 
     pass
+
+
+class CollectionNotFoundError(DomainException):
+    """Raised when a research collection cannot be found."""
+
+    pass
@@ -6,28 +6,43 @@ and other infrastructure concerns. It adapts external systems to work
 with our domain interfaces.
 """
 
-from .repositories import (
-    InMemoryResearchQueryRepository,
-    InMemoryResearchResultRepository,
-)
-from .scholarly_sources import (
-    ArxivSearcher,
-    GoogleScholarSearcher,
-    PaperProcessor,
-    ScholarlyPaper,
-    SemanticScholarSearcher,
-    UnifiedScholarlySearcher,
-)
-
-__all__ = [
+from importlib import import_module
+from typing import Any, List
+
+# Public names and their modules, imported on first access (PEP 562): the
+# repositories are needed everywhere, the HTTP searchers only when a
+# search runs
+_LAZY_EXPORTS = {
     # Repositories
-    "InMemoryResearchQueryRepository",
-    "InMemoryResearchResultRepository",
+    "InMemoryResearchQueryRepository": ".repositories",
+    "InMemoryResearchResultRepository": ".repositories",
+    "InMemoryResearchCollectionRepository": ".collection_repositories",
+    "SQLiteResearchCollectionRepository": ".collection_repositories",
+    "AsyncCollectionRepositoryAdapter": ".async_repositories",
+    "AsyncQueryRepositoryAdapter": ".async_repositories",
+    "AsyncResultRepositoryAdapter": ".async_repositories",
+    "as_async_query_repository": ".async_repositories",
+    "as_async_result_repository": ".async_repositories",
     # Scholarly Sources
-    "ArxivSearcher",
-    "SemanticScholarSearcher",
-    "GoogleScholarSearcher",
-    "UnifiedScholarlySearcher",
-    "PaperProcessor",
-    "ScholarlyPaper",
-]
+    "ArxivSearcher": ".scholarly_sources",
+    "SemanticScholarSearcher": ".scholarly_sources",
+    "GoogleScholarSearcher": ".scholarly_sources",
+    "UnifiedScholarlySearcher": ".scholarly_sources",
+    "PaperProcessor": ".scholarly_sources",
+    "ScholarlyPaper": ".scholarly_sources",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # later lookups skip this hook
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
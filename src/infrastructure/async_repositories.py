@@ -0,0 +1,202 @@
+"""
+Async Repository Adapters
+
+The domain exposes both synchronous and asynchronous repository protocols.
+Storage backends are usually synchronous (dict lookups, DB drivers, files),
+while our use cases run on the event loop. These adapters run a synchronous
+backend inside a bounded thread pool so that awaiting persistence never
+blocks other coroutines.
+
+Educational Note:
+A thread pool is like a small team of helpers at the library desk - the
+librarian (event loop) hands slow filing work to a helper and keeps serving
+the queue instead of waiting at the filing cabinet.
+"""
+
+import asyncio
+import inspect
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, TypeVar, cast
+
+from ..domain.entities import (
+    AsyncResearchQueryRepository,
+    AsyncResearchResultRepository,
+    QueryId,
+    ResearchCollection,
+    ResearchCollectionRepository,
+    ResearchQuery,
+    ResearchQueryRepository,
+    ResearchResult,
+    ResearchResultRepository,
+)
+
+DEFAULT_REPOSITORY_WORKERS = 4
+
+Backend = TypeVar("Backend")
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = Lock()
+
+
+def get_repository_executor() -> ThreadPoolExecutor:
+    """Return the process-wide bounded executor used for repository I/O."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=DEFAULT_REPOSITORY_WORKERS,
+                thread_name_prefix="repository-io",
+            )
+        return _executor
+
+
+class _ExecutorBackedRepository(Generic[Backend]):
+    """Shared plumbing for running a sync backend in an executor."""
+
+    def __init__(self, backend: Backend, executor: Optional[Executor] = None) -> None:
+        self._backend = backend
+        self._executor = executor
+
+    @property
+    def backend(self) -> Backend:
+        """The wrapped synchronous repository."""
+        return self._backend
+
+    async def _run(self, method: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        executor = self._executor or get_repository_executor()
+        return await loop.run_in_executor(executor, partial(method, *args, **kwargs))
+
+
+class AsyncQueryRepositoryAdapter(_ExecutorBackedRepository[ResearchQueryRepository]):
+    """Expose a synchronous ResearchQueryRepository as an async repository."""
+
+    def __init__(
+        self, backend: ResearchQueryRepository, executor: Optional[Executor] = None
+    ):
+        super().__init__(backend, executor)
+
+    async def save(self, query: ResearchQuery) -> None:
+        """Save a research query."""
+        await self._run(self._backend.save, query)
+
+    async def find_by_id(self, query_id: QueryId) -> Optional[ResearchQuery]:
+        """Find a query by its ID."""
+        return await self._run(self._backend.find_by_id, query_id)
+
+    async def find_by_requester(self, requester_id: str) -> List[ResearchQuery]:
+        """Find queries by requester."""
+        return await self._run(self._backend.find_by_requester, requester_id)
+
+
+class AsyncResultRepositoryAdapter(_ExecutorBackedRepository[ResearchResultRepository]):
+    """Expose a synchronous ResearchResultRepository as an async repository."""
+
+    def __init__(
+        self, backend: ResearchResultRepository, executor: Optional[Executor] = None
+    ):
+        super().__init__(backend, executor)
+
+    async def save(self, result: ResearchResult) -> None:
+        """Save research results."""
+        await self._run(self._backend.save, result)
+
+    async def find_by_query_id(self, query_id: QueryId) -> List[ResearchResult]:
+        """Find every result saved for a query, oldest first."""
+        return await self._run(self._backend.find_by_query_id, query_id)
+
+    async def find_completed_results(
+        self, limit: int = 10, offset: int = 0
+    ) -> List[ResearchResult]:
+        """Find completed research results."""
+        return await self._run(
+            self._backend.find_completed_results, limit=limit, offset=offset
+        )
+
+
+class AsyncCollectionRepositoryAdapter(
+    _ExecutorBackedRepository[ResearchCollectionRepository]
+):
+    """
+    Expose a synchronous ResearchCollectionRepository with async methods.
+
+    ``iter_papers`` is deliberately not wrapped: exports iterate the backend
+    directly (``adapter.backend.iter_papers``) so large libraries stream in
+    batches instead of being materialized by a single executor call.
+    """
+
+    def __init__(
+        self, backend: ResearchCollectionRepository, executor: Optional[Executor] = None
+    ):
+        super().__init__(backend, executor)
+
+    async def save(self, collection: ResearchCollection) -> None:
+        """Create or update a collection's metadata."""
+        await self._run(self._backend.save, collection)
+
+    async def find_by_id(self, collection_id: str) -> Optional[ResearchCollection]:
+        """Find a collection by its ID."""
+        return await self._run(self._backend.find_by_id, collection_id)
+
+    async def list_collections(
+        self, limit: int = 50, offset: int = 0
+    ) -> List[ResearchCollection]:
+        """List collections, oldest first."""
+        return await self._run(
+            self._backend.list_collections, limit=limit, offset=offset
+        )
+
+    async def delete(self, collection_id: str) -> bool:
+        """Delete a collection and its memberships."""
+        return await self._run(self._backend.delete, collection_id)
+
+    async def add_papers(
+        self, collection_id: str, papers: Iterable[Dict[str, Any]]
+    ) -> int:
+        """Add papers, skipping duplicates; returns how many were new."""
+        return await self._run(self._backend.add_papers, collection_id, papers)
+
+    async def remove_papers(self, collection_id: str, keys: Iterable[str]) -> int:
+        """Remove papers by dedupe key; returns how many were removed."""
+        return await self._run(self._backend.remove_papers, collection_id, keys)
+
+    async def contains(self, collection_id: str, key: str) -> bool:
+        """Check membership by dedupe key."""
+        return await self._run(self._backend.contains, collection_id, key)
+
+    async def list_papers(
+        self, collection_id: str, limit: int = 50, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """List papers in insertion order."""
+        return await self._run(
+            self._backend.list_papers, collection_id, limit=limit, offset=offset
+        )
+
+    async def collections_for(self, key: str) -> List[str]:
+        """IDs of every collection holding the paper with this key."""
+        return await self._run(self._backend.collections_for, key)
+
+
+def _is_async_repository(repository: Any) -> bool:
+    return inspect.iscoroutinefunction(getattr(repository, "save", None))
+
+
+def as_async_query_repository(
+    repository: Any, executor: Optional[Executor] = None
+) -> AsyncResearchQueryRepository:
+    """Return an async view of a query repository, wrapping sync backends."""
+    if _is_async_repository(repository):
+        return cast(AsyncResearchQueryRepository, repository)
+    return AsyncQueryRepositoryAdapter(repository, executor)
+
+
+def as_async_result_repository(
+    repository: Any, executor: Optional[Executor] = None
+) -> AsyncResearchResultRepository:
+    """Return an async view of a result repository, wrapping sync backends."""
+    if _is_async_repository(repository):
+        return cast(AsyncResearchResultRepository, repository)
+    return AsyncResultRepositoryAdapter(repository, executor)
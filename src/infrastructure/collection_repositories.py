@@ -0,0 +1,372 @@
+"""
+Research Collection Repositories
+
+Two implementations of ResearchCollectionRepository:
+
+- InMemoryResearchCollectionRepository keeps dict indexes in both directions
+  (collection -> papers in insertion order, paper -> collections), so
+  membership checks and reverse lookups are O(1).
+- SQLiteResearchCollectionRepository persists collections to a database
+  file. A UNIQUE (collection_id, paper_key) constraint doubles as the
+  collection -> papers index and a paper_key index serves reverse lookups.
+
+Papers are plain dicts deduplicated per collection by paper_identity.
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+from itertools import islice
+from threading import Lock
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..domain.entities import (
+    CollectionNotFoundError,
+    ResearchCollection,
+    SourceValidationException,
+    paper_identity,
+)
+
+Paper = Dict[str, Any]
+
+
+def _keyed(papers: Iterable[Paper]) -> List[Tuple[str, Paper]]:
+    """Pair each paper with its dedupe key, rejecting unidentifiable papers."""
+    keyed = []
+    for paper in papers:
+        key = paper_identity(paper)
+        if key is None:
+            raise SourceValidationException(
+                "Papers need a DOI, title or URL to be added to a collection"
+            )
+        keyed.append((key, paper))
+    return keyed
+
+
+class InMemoryResearchCollectionRepository:
+    """In-memory implementation of ResearchCollectionRepository."""
+
+    def __init__(self) -> None:
+        self._collections: Dict[str, ResearchCollection] = {}
+        self._members: Dict[str, Dict[str, Paper]] = {}
+        self._paper_index: Dict[str, Set[str]] = {}
+        self._lock = Lock()
+
+    def save(self, collection: ResearchCollection) -> None:
+        """Create or update a collection's metadata."""
+        with self._lock:
+            self._collections[collection.id] = collection
+            self._members.setdefault(collection.id, {})
+
+    def find_by_id(self, collection_id: str) -> Optional[ResearchCollection]:
+        """Find a collection by its ID."""
+        with self._lock:
+            return self._collections.get(collection_id)
+
+    def list_collections(
+        self, limit: int = 50, offset: int = 0
+    ) -> List[ResearchCollection]:
+        """List collections, oldest first."""
+        with self._lock:
+            return list(islice(self._collections.values(), offset, offset + limit))
+
+    def delete(self, collection_id: str) -> bool:
+        """Delete a collection and its memberships."""
+        with self._lock:
+            if self._collections.pop(collection_id, None) is None:
+                return False
+            for key in self._members.pop(collection_id, {}):
+                self._unindex(key, collection_id)
+            return True
+
+    def count(self) -> int:
+        """Number of stored collections."""
+        with self._lock:
+            return len(self._collections)
+
+    def add_papers(self, collection_id: str, papers: Iterable[Paper]) -> int:
+        """Add papers, skipping duplicates; returns how many were new."""
+        keyed = _keyed(papers)
+        with self._lock:
+            collection, members = self._require(collection_id)
+            added = 0
+            for key, paper in keyed:
+                if key in members:
+                    continue
+                members[key] = paper
+                self._paper_index.setdefault(key, set()).add(collection_id)
+                added += 1
+            if added:
+                collection.paper_count = len(members)
+                collection.touch()
+            return added
+
+    def remove_papers(self, collection_id: str, keys: Iterable[str]) -> int:
+        """Remove papers by dedupe key; returns how many were removed."""
+        with self._lock:
+            collection, members = self._require(collection_id)
+            removed = 0
+            for key in keys:
+                if members.pop(key, None) is not None:
+                    self._unindex(key, collection_id)
+                    removed += 1
+            if removed:
+                collection.paper_count = len(members)
+                collection.touch()
+            return removed
+
+    def contains(self, collection_id: str, key: str) -> bool:
+        """Check membership by dedupe key."""
+        with self._lock:
+            return key in self._members.get(collection_id, ())
+
+    def list_papers(
+        self, collection_id: str, limit: int = 50, offset: int = 0
+    ) -> List[Paper]:
+        """List papers in insertion order."""
+        with self._lock:
+            _, members = self._require(collection_id)
+            return list(islice(members.values(), offset, offset + limit))
+
+    def iter_papers(self, collection_id: str) -> Iterator[Paper]:
+        """Iterate every paper in insertion order (for exports)."""
+        with self._lock:
+            _, members = self._require(collection_id)
+            # Snapshot so concurrent edits cannot break a running export
+            snapshot = list(members.values())
+        return iter(snapshot)
+
+    def collections_for(self, key: str) -> List[str]:
+        """IDs of every collection holding the paper with this key."""
+        with self._lock:
+            return sorted(self._paper_index.get(key, ()))
+
+    def _require(
+        self, collection_id: str
+    ) -> Tuple[ResearchCollection, Dict[str, Paper]]:
+        collection = self._collections.get(collection_id)
+        if collection is None:
+            raise CollectionNotFoundError(f"Collection not found: {collection_id}")
+        return collection, self._members[collection_id]
+
+    def _unindex(self, key: str, collection_id: str) -> None:
+        holders = self._paper_index.get(key)
+        if holders is not None:
+            holders.discard(collection_id)
+            if not holders:
+                del self._paper_index[key]
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS collections (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    paper_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS collection_papers (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    collection_id TEXT NOT NULL REFERENCES collections(id) ON DELETE CASCADE,
+    paper_key TEXT NOT NULL,
+    paper TEXT NOT NULL,
+    UNIQUE (collection_id, paper_key)
+);
+CREATE INDEX IF NOT EXISTS collection_papers_by_key
+    ON collection_papers (paper_key);
+"""
+
+
+class SQLiteResearchCollectionRepository:
+    """
+    SQLite implementation of ResearchCollectionRepository.
+
+    One connection is shared behind a lock (the repository is called from
+    the repository executor's threads). Bulk adds and removes run as a
+    single executemany transaction, and exports page through the papers in
+    batches so a large library is never loaded into memory at once.
+    """
+
+    def __init__(self, path: str = ":memory:", export_batch_size: int = 1000):
+        self.path = path
+        self.export_batch_size = export_batch_size
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = Lock()
+        with self._lock, self._connection:
+            if path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA foreign_keys=ON")
+            self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def save(self, collection: ResearchCollection) -> None:
+        """Create or update a collection's metadata."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO collections"
+                " (id, name, description, created_at, updated_at, paper_count)"
+                " VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(id) DO UPDATE SET name = excluded.name,"
+                " description = excluded.description,"
+                " updated_at = excluded.updated_at",
+                (
+                    collection.id,
+                    collection.name,
+                    collection.description,
+                    collection.created_at.isoformat(),
+                    collection.updated_at.isoformat(),
+                    collection.paper_count,
+                ),
+            )
+
+    def find_by_id(self, collection_id: str) -> Optional[ResearchCollection]:
+        """Find a collection by its ID."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT id, name, description, created_at, updated_at, paper_count"
+                " FROM collections WHERE id = ?",
+                (collection_id,),
+            ).fetchone()
+        return self._to_collection(row) if row else None
+
+    def list_collections(
+        self, limit: int = 50, offset: int = 0
+    ) -> List[ResearchCollection]:
+        """List collections, oldest first."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, name, description, created_at, updated_at, paper_count"
+                " FROM collections ORDER BY rowid LIMIT ? OFFSET ?",
+                (limit, offset),
+            ).fetchall()
+        return [self._to_collection(row) for row in rows]
+
+    def delete(self, collection_id: str) -> bool:
+        """Delete a collection and its memberships."""
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM collections WHERE id = ?", (collection_id,)
+            )
+            return cursor.rowcount > 0
+
+    def add_papers(self, collection_id: str, papers: Iterable[Paper]) -> int:
+        """Add papers, skipping duplicates; returns how many were new."""
+        rows = [
+            (collection_id, key, json.dumps(paper, default=str))
+            for key, paper in _keyed(papers)
+        ]
+        with self._lock, self._connection:
+            self._require(collection_id)
+            before = self._connection.total_changes
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO collection_papers"
+                " (collection_id, paper_key, paper) VALUES (?, ?, ?)",
+                rows,
+            )
+            added = self._connection.total_changes - before
+            if added:
+                self._adjust_count(collection_id, added)
+            return added
+
+    def remove_papers(self, collection_id: str, keys: Iterable[str]) -> int:
+        """Remove papers by dedupe key; returns how many were removed."""
+        rows = [(collection_id, key) for key in keys]
+        with self._lock, self._connection:
+            self._require(collection_id)
+            before = self._connection.total_changes
+            self._connection.executemany(
+                "DELETE FROM collection_papers"
+                " WHERE collection_id = ? AND paper_key = ?",
+                rows,
+            )
+            removed = self._connection.total_changes - before
+            if removed:
+                self._adjust_count(collection_id, -removed)
+            return removed
+
+    def contains(self, collection_id: str, key: str) -> bool:
+        """Check membership by dedupe key."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM collection_papers"
+                " WHERE collection_id = ? AND paper_key = ?",
+                (collection_id, key),
+            ).fetchone()
+        return row is not None
+
+    def list_papers(
+        self, collection_id: str, limit: int = 50, offset: int = 0
+    ) -> List[Paper]:
+        """List papers in insertion order."""
+        with self._lock:
+            self._require(collection_id)
+            rows = self._connection.execute(
+                "SELECT paper FROM collection_papers WHERE collection_id = ?"
+                " ORDER BY position LIMIT ? OFFSET ?",
+                (collection_id, limit, offset),
+            ).fetchall()
+        return [json.loads(paper) for (paper,) in rows]
+
+    def iter_papers(self, collection_id: str) -> Iterator[Paper]:
+        """Iterate every paper in insertion order (for exports)."""
+        with self._lock:
+            self._require(collection_id)
+        return self._iter_batches(collection_id)
+
+    def collections_for(self, key: str) -> List[str]:
+        """IDs of every collection holding the paper with this key."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT collection_id FROM collection_papers WHERE paper_key = ?"
+                " ORDER BY collection_id",
+                (key,),
+            ).fetchall()
+        return [collection_id for (collection_id,) in rows]
+
+    def _iter_batches(self, collection_id: str) -> Iterator[Paper]:
+        # Keyset pagination: each batch resumes after the last position seen,
+        # so the cost per batch does not grow with the offset.
+        last_position = 0
+        while True:
+            with self._lock:
+                rows = self._connection.execute(
+                    "SELECT position, paper FROM collection_papers"
+                    " WHERE collection_id = ? AND position > ?"
+                    " ORDER BY position LIMIT ?",
+                    (collection_id, last_position, self.export_batch_size),
+                ).fetchall()
+            for last_position, paper in rows:
+                yield json.loads(paper)
+            if len(rows) < self.export_batch_size:
+                return
+
+    def _require(self, collection_id: str) -> None:
+        row = self._connection.execute(
+            "SELECT 1 FROM collections WHERE id = ?", (collection_id,)
+        ).fetchone()
+        if row is None:
+            raise CollectionNotFoundError(f"Collection not found: {collection_id}")
+
+    def _adjust_count(self, collection_id: str, delta: int) -> None:
+        self._connection.execute(
+            "UPDATE collections SET paper_count = paper_count + ?, updated_at = ?"
+            " WHERE id = ?",
+            (delta, datetime.now().isoformat(), collection_id),
+        )
+
+    @staticmethod
+    def _to_collection(row: Tuple[Any, ...]) -> ResearchCollection:
+        collection_id, name, description, created_at, updated_at, paper_count = row
+        return ResearchCollection(
+            id=collection_id,
+            name=name,
+            description=description,
+            created_at=datetime.fromisoformat(created_at),
+            updated_at=datetime.fromisoformat(updated_at),
+            paper_count=paper_count,
+        )
@@ -47,6 +47,11 @@ class InMemoryResearchQueryRepository:
         with self._lock:
             self._queries.pop(str(query_id), None)
 
+    def count(self) -> int:
+        """Number of stored queries."""
+        with self._lock:
+            return len(self._queries)
+
 
 class InMemoryResearchResultRepository:
     """In-memory implementation of ResearchResultRepository."""
@@ -98,3 +103,8 @@ class InMemoryResearchResultRepository:
         """Delete results by query ID."""
         with self._lock:
             self._results.pop(str(query_id), None)
+
+    def count(self) -> int:
+        """Number of stored results, across all queries."""
+        with self._lock:
+            return sum(map(len, self._results.values()))
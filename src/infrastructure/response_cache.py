@@ -0,0 +1,173 @@
+"""
+Shared Response Cache
+
+SQLiteResponseCache stores encoded HTTP response bodies on disk so every
+worker process of the HTTP server shares one cache: a scholarly search
+answered by one worker is a hit for all the others. SQLite in WAL mode lets
+readers in many processes proceed while one writer inserts, and a busy
+timeout absorbs the brief write locks.
+
+Entries expire after ``ttl_seconds``; the oldest entries are evicted once
+the cache holds more than ``max_entries``.
+
+MemoryResponseCache is a small per-process tier in front of it: the hottest
+bodies stay in memory as the exact bytes already sent, so a repeated
+request is answered without a database read or re-encoding.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_by_expiry ON responses (expires_at);
+"""
+
+
+class SQLiteResponseCache:
+    """Process-safe, TTL-bounded cache of response bodies keyed by request."""
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 10_000,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        self._lock = Lock()
+        with self._lock, self._connection:
+            if path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+                self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+
+    @staticmethod
+    def key_for(route: str, payload: Any) -> str:
+        """Stable cache key for a route and its JSON request payload."""
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(f"{route}\n{canonical}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body, or None if missing or expired."""
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[bytes, float]]:
+        """Return ``(body, seconds until it expires)``, or None."""
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, expires_at FROM responses"
+                " WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0], row[1] - now
+
+    def set(self, key: str, body: bytes) -> None:
+        """Store a body, evicting expired and then the oldest entries."""
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, body, expires_at)"
+                " VALUES (?, ?, ?)",
+                (key, body, now + self.ttl_seconds),
+            )
+            self._connection.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (now,)
+            )
+            self._connection.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses"
+                " ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit counters kept by this process; counts nothing in the database."""
+        return {"backend": "sqlite", "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class MemoryResponseCache:
+    """In-process LRU of encoded bodies with the same TTL semantics."""
+
+    def __init__(self, ttl_seconds: float = 3600.0, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: str, body: bytes, ttl_seconds: Optional[float] = None) -> None:
+        """Store a body (for at most ``ttl_seconds``), evicting the least
+        recently used entries."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._entries[key] = (body, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count and hit counters."""
+        return {
+            "backend": "memory",
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -28,19 +28,106 @@ academic databases following Domain-Driven Design principles.
 
 import json
 import logging
+import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from urllib.parse import quote_plus
 
-import defusedxml.ElementTree as ET
-import feedparser
-import requests
+from ..core.cancellation import CancellationToken, OperationCancelled, ensure_token
+
+if TYPE_CHECKING:
+    import requests
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class UpstreamStatus:
+    """
+    Outcome counters for one external API, read by the readiness probe.
+
+    Searchers catch their own errors and return no papers, so without
+    these counters an unreachable database would look like an empty one.
+    ``state`` is "healthy" after a success, "degraded" after a failure and
+    "down" after ``down_after`` failures in a row.
+    """
+
+    name: str
+    down_after: int = 3
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    last_error: Optional[str] = None
+    last_failure_at: Optional[float] = None
+    _lock: Lock = field(default_factory=Lock, repr=False, compare=False)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self.consecutive_failures = 0
+
+    def record_failure(self, error: Exception) -> None:
+        with self._lock:
+            self.requests += 1
+            self.failures += 1
+            self.consecutive_failures += 1
+            self.last_error = f"{type(error).__name__}: {error}"
+            self.last_failure_at = time.time()
+
+    @property
+    def state(self) -> str:
+        if self.consecutive_failures >= self.down_after:
+            return "down"
+        return "degraded" if self.consecutive_failures else "healthy"
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "requests": self.requests,
+                "failures": self.failures,
+                "consecutive_failures": self.consecutive_failures,
+                "last_error": self.last_error,
+                "last_failure_at": self.last_failure_at,
+            }
+
+
+class _HTTPClient:
+    """
+    Gives a searcher a ``requests.Session`` created on first use.
+
+    ⚡ STARTUP NOTE: requests (with urllib3, certifi and charset detection)
+    is the slowest import in the application. Building the container or
+    printing ``--help`` should not pay for it, so it is only imported when
+    the first request is about to be sent.
+    """
+
+    _session: Optional["requests.Session"] = None
+    _session_headers: Optional[Dict[str, str]] = None
+
+    @property
+    def session(self) -> "requests.Session":
+        if self._session is None:
+            import requests
+
+            self._session = requests.Session()
+            if self._session_headers:
+                self._session.headers.update(self._session_headers)
+        return self._session
+
+    @session.setter
+    def session(self, session: "requests.Session") -> None:
+        self._session = session
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern low-cardinality strings (venues, source types) shared by many papers."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 @dataclass
 class ScholarlyPaper:
     """
@@ -75,7 +162,7 @@ class ScholarlyPaper:
     source_type: str = "academic"
 
 
-class ArxivSearcher:
+class ArxivSearcher(_HTTPClient):
     """
     🎓 STUDENT EXPLANATION: Search arXiv database for academic papers
 
@@ -100,19 +187,33 @@ class ArxivSearcher:
 
     def __init__(self, base_url: str = "http://export.arxiv.org/api/query"):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.upstream = UpstreamStatus("arxiv")
 
-    def search(self, query: str, max_results: int = 10) -> List[Dict]:
+    def search(
+        self,
+        query: str,
+        max_results: int = 10,
+        cancel_token: Optional[CancellationToken] = None,
+        failed_sources: Optional[List[str]] = None,
+    ) -> List[Dict]:
         """
         Search arXiv for papers matching the query
 
         Args:
             query: Search query string
             max_results: Maximum number of results to return
+            cancel_token: Checked before every request; on cancellation the
+                papers found so far are returned
+            failed_sources: Receives "arxiv" if the request fails
 
         Returns:
             List of paper dictionaries with metadata
         """
+        import feedparser
+
+        token = ensure_token(cancel_token)
+        papers = []
+
         try:
             # Clean and format query for arXiv - try multiple search strategies
             search_queries = [
@@ -122,8 +223,6 @@ class ArxivSearcher:
                 f'all:{query.replace(" ", "+")}',  # Simple plus search
             ]
 
-            papers = []
-
             for search_query in search_queries:
                 if papers:  # If we found results, stop trying other queries
                     break
@@ -140,7 +239,9 @@ class ArxivSearcher:
                 logger.info(
                     f"Searching arXiv for: '{query}' with query: '{search_query}'"
                 )
-                response = self.session.get(self.base_url, params=params, timeout=30)
+                response = self.session.get(
+                    self.base_url, params=params, timeout=token.timeout_for(30)
+                )
                 response.raise_for_status()
 
                 # Parse the arXiv atom feed response
@@ -200,50 +301,69 @@ class ArxivSearcher:
                     break
                 else:
                     logger.warning(f"No results found with query: {search_query}")
-                    time.sleep(1)  # Be polite to the API
+                    token.sleep(1)  # Be polite to the API
 
+            self.upstream.record_success()
             return papers[:max_results]
 
+        except OperationCancelled as e:
+            logger.info(f"arXiv search {e.reason}; returning {len(papers)} papers")
+            return papers[:max_results]
         except Exception as e:
             logger.error(f"Error searching arXiv: {e}")
+            self.upstream.record_failure(e)
+            if failed_sources is not None:
+                failed_sources.append(self.upstream.name)
             return []
 
 
-class SemanticScholarSearcher:
+class SemanticScholarSearcher(_HTTPClient):
     """Search Semantic Scholar API for academic papers"""
 
     def __init__(self, api_key: Optional[str] = None):
         self.base_url = "https://api.semanticscholar.org/graph/v1"
-        self.session = requests.Session()
+        self.upstream = UpstreamStatus("semantic_scholar")
 
         # Add API key if provided
         if api_key:
-            self.session.headers.update({"x-api-key": api_key})
+            self._session_headers = {"x-api-key": api_key}
 
         # Set reasonable rate limits
         self.last_request_time = 0
         self.min_interval = 1.0  # 1 second between requests for free tier
 
-    def _rate_limit(self):
-        """Enforce rate limiting"""
+    def _rate_limit(self, cancel_token: Optional[CancellationToken] = None):
+        """Enforce rate limiting (the wait ends early on cancellation)"""
+        token = ensure_token(cancel_token)
         elapsed = time.time() - self.last_request_time
         if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
+            token.sleep(self.min_interval - elapsed)
+        token.raise_if_cancelled()
         self.last_request_time = time.time()
 
-    def search(self, query: str, max_results: int = 10) -> List[Dict]:
+    def search(
+        self,
+        query: str,
+        max_results: int = 10,
+        cancel_token: Optional[CancellationToken] = None,
+        failed_sources: Optional[List[str]] = None,
+    ) -> List[Dict]:
         """
         Search Semantic Scholar for papers matching the query
 
         Args:
             query: Search query string
             max_results: Maximum number of results to return
+            cancel_token: Aborts the rate-limit wait and caps the request timeout
+            failed_sources: Receives "semantic_scholar" if the request fails
 
         Returns:
             List of paper dictionaries with metadata
         """
+        token = ensure_token(cancel_token)
+
         try:
-            self._rate_limit()
+            self._rate_limit(token)
 
             # Use Semantic Scholar's paper search endpoint
             url = f"{self.base_url}/paper/search"
@@ -254,7 +374,9 @@ class SemanticScholarSearcher:
             }
 
             logger.info(f"Searching Semantic Scholar for: '{query}'")
-            response = self.session.get(url, params=params, timeout=30)
+            response = self.session.get(
+                url, params=params, timeout=token.timeout_for(30)
+            )
             response.raise_for_status()
 
             data = response.json()
@@ -283,7 +405,7 @@ class SemanticScholarSearcher:
                         "pdf_url": pdf_url,
                         "source_url": paper.get("url"),
                         "published": str(paper.get("year", "")),
-                        "venue": paper.get("venue", ""),
+                        "venue": _intern(paper.get("venue", "")),
                         "citation_count": paper.get("citationCount"),
                         "source_type": "semantic_scholar",
                         "year": paper.get("year"),
@@ -294,18 +416,24 @@ class SemanticScholarSearcher:
             logger.info(
                 f"Successfully retrieved {len(papers)} papers from Semantic Scholar"
             )
+            self.upstream.record_success()
             return papers[:max_results]
 
+        except OperationCancelled as e:
+            logger.info(f"Semantic Scholar search {e.reason}")
+            return []
         except Exception as e:
             logger.error(f"Error searching Semantic Scholar: {e}")
+            self.upstream.record_failure(e)
+            if failed_sources is not None:
+                failed_sources.append(self.upstream.name)
             return []
 
 
-class GoogleScholarSearcher:
+class GoogleScholarSearcher(_HTTPClient):
     """Search Google Scholar for academic papers"""
 
     def __init__(self):
-        self.session = requests.Session()
         # Add reasonable delays to be respectful
         self.min_interval = 2.0
         self.last_request_time = 0
@@ -317,7 +445,13 @@ class GoogleScholarSearcher:
             time.sleep(self.min_interval - elapsed)
         self.last_request_time = time.time()
 
-    def search(self, query: str, max_results: int = 10) -> List[Dict]:
+    def search(
+        self,
+        query: str,
+        max_results: int = 10,
+        cancel_token: Optional[CancellationToken] = None,
+        failed_sources: Optional[List[str]] = None,
+    ) -> List[Dict]:
         """
         Search Google Scholar for papers matching the query
 
@@ -327,10 +461,15 @@ class GoogleScholarSearcher:
         Args:
             query: Search query string
             max_results: Maximum number of results to return
+            cancel_token: Returns no results if already cancelled
+            failed_sources: Receives "google_scholar" if the search fails
 
         Returns:
             List of paper dictionaries with metadata
         """
+        if cancel_token is not None and cancel_token.is_cancelled:
+            return []
+
         try:
             # This is a placeholder implementation
             # In a real system, you would either:
@@ -362,6 +501,8 @@ class GoogleScholarSearcher:
 
         except Exception as e:
             logger.error(f"Error searching Google Scholar: {e}")
+            if failed_sources is not None:
+                failed_sources.append("google_scholar")
             return []
 
 
@@ -381,6 +522,8 @@ class UnifiedScholarlySearcher:
         max_results: int = 20,
         sources: Optional[List[str]] = None,
         results_per_source: Optional[int] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        failed_sources: Optional[List[str]] = None,
     ) -> List[Dict]:
         """
         Search across multiple scholarly sources
@@ -390,10 +533,16 @@ class UnifiedScholarlySearcher:
             max_results: Total maximum number of results to return
             sources: List of sources to search ['arxiv', 'semantic_scholar', 'google_scholar']
             results_per_source: Maximum results per source (auto-calculated if None)
+            cancel_token: Stops before the next source once cancelled; papers
+                from sources already searched are still returned
+            failed_sources: Receives the name of every source whose search
+                failed (its papers are simply missing from the results)
 
         Returns:
             List of paper dictionaries with metadata from all sources
         """
+        token = ensure_token(cancel_token)
+
         if sources is None:
             sources = ["arxiv", "semantic_scholar"]  # Skip Google Scholar for now
 
@@ -403,16 +552,31 @@ class UnifiedScholarlySearcher:
         all_papers = []
 
         for source in sources:
+            if token.is_cancelled:
+                logger.info(f"Scholarly search {token.reason} before {source}")
+                break
+
             try:
                 if source == "arxiv":
-                    papers = self.arxiv_searcher.search(query, results_per_source)
+                    papers = self.arxiv_searcher.search(
+                        query,
+                        results_per_source,
+                        cancel_token=token,
+                        failed_sources=failed_sources,
+                    )
                 elif source == "semantic_scholar":
                     papers = self.semantic_scholar_searcher.search(
-                        query, results_per_source
+                        query,
+                        results_per_source,
+                        cancel_token=token,
+                        failed_sources=failed_sources,
                     )
                 elif source == "google_scholar":
                     papers = self.google_scholar_searcher.search(
-                        query, results_per_source
+                        query,
+                        results_per_source,
+                        cancel_token=token,
+                        failed_sources=failed_sources,
                     )
                 else:
                     logger.warning(f"Unknown source: {source}")
@@ -423,6 +587,8 @@ class UnifiedScholarlySearcher:
 
             except Exception as e:
                 logger.error(f"Error searching {source}: {e}")
+                if failed_sources is not None:
+                    failed_sources.append(source)
                 continue
 
         # Remove duplicates based on title similarity
@@ -438,6 +604,13 @@ class UnifiedScholarlySearcher:
         logger.info(f"Unified search returned {len(sorted_papers)} unique papers")
         return sorted_papers[:max_results]
 
+    def upstream_status(self) -> Dict[str, Dict[str, Any]]:
+        """Outcome counters for each external API (no requests are made)."""
+        return {
+            searcher.upstream.name: searcher.upstream.to_dict()
+            for searcher in (self.arxiv_searcher, self.semantic_scholar_searcher)
+        }
+
     def _deduplicate_papers(self, papers: List[Dict]) -> List[Dict]:
         """Remove duplicate papers based on title similarity"""
         unique_papers = []
@@ -455,31 +628,39 @@ class UnifiedScholarlySearcher:
         return unique_papers
 
 
-class PaperProcessor:
+class PaperProcessor(_HTTPClient):
     """Download and process academic papers"""
 
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(
-            {"User-Agent": "AI Deep Research MCP (Educational Use)"}
-        )
+        self._session_headers = {"User-Agent": "AI Deep Research MCP (Educational Use)"}
 
-    def download_pdf(self, pdf_url: str, max_size_mb: int = 50) -> Optional[bytes]:
+    def download_pdf(
+        self,
+        pdf_url: str,
+        max_size_mb: int = 50,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Optional[bytes]:
         """
         Download PDF content from URL
 
         Args:
             pdf_url: URL of the PDF file
             max_size_mb: Maximum file size to download (in MB)
+            cancel_token: Checked between chunks; cancelling closes the
+                connection and abandons the download
 
         Returns:
-            PDF content as bytes, or None if download failed
+            PDF content as bytes, or None if download failed or was cancelled
         """
+        token = ensure_token(cancel_token)
+
         try:
             logger.info(f"Downloading PDF from: {pdf_url}")
 
             # Stream download to check size
-            response = self.session.get(pdf_url, stream=True, timeout=30)
+            response = self.session.get(
+                pdf_url, stream=True, timeout=token.timeout_for(30)
+            )
             response.raise_for_status()
 
             # Check content length
@@ -495,6 +676,11 @@ class PaperProcessor:
             downloaded_mb = 0
 
             for chunk in response.iter_content(chunk_size=8192):
+                if token.is_cancelled:
+                    response.close()
+                    logger.info(f"PDF download {token.reason}: {pdf_url}")
+                    return None
+
                 content += chunk
                 downloaded_mb = len(content) / (1024 * 1024)
 
@@ -0,0 +1,272 @@
+"""
+Batch Research
+
+Runs many research queries through the shared orchestration service, a
+fixed number at a time, writing one JSON line per query as soon as it
+finishes. Used by ``python -m src.presentation.cli batch`` for offline
+sweeps.
+
+Input is one query per line: either plain text or a JSON object with
+``query`` and optionally ``id``, ``sources`` and ``max_results``. Blank
+lines and lines starting with ``#`` are skipped. Lines are read as the
+workers need them, so a long file (or a pipe) is never held in memory.
+
+Each query has a stable ID: the ``id`` it was given, or a digest of its
+query text, sources and max_results. A checkpoint file records the IDs
+whose results have been written; rerunning the same batch with the same
+checkpoint skips them, so an interrupted sweep resumes where it stopped.
+Failed queries are not checkpointed and are retried on the next run.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, TextIO
+
+from ..core.cancellation import CancellationToken
+
+if TYPE_CHECKING:
+    from ..application.use_cases import ResearchOrchestrationService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 4
+
+
+@dataclass
+class BatchQuery:
+    """One query of a batch."""
+
+    query: str
+    sources: List[str] = field(default_factory=list)
+    max_results: int = 10
+    id: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.id:
+            canonical = json.dumps(
+                [self.query, self.sources, self.max_results], ensure_ascii=False
+            )
+            self.id = hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class BatchSummary:
+    """Counts for a finished (or interrupted) batch run."""
+
+    completed: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+
+def parse_batch_line(
+    line: str, sources: Optional[List[str]] = None, max_results: int = 10
+) -> Optional[BatchQuery]:
+    """
+    A query from one input line, or None for blank and comment lines.
+
+    ``sources`` and ``max_results`` apply where the line does not set them.
+    Raises ValueError for a JSON line without a ``query`` or with a field
+    of the wrong type.
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if not line.startswith("{"):
+        return BatchQuery(
+            query=line, sources=list(sources or []), max_results=max_results
+        )
+
+    item = json.loads(line)
+    if not isinstance(item, dict) or not item.get("query"):
+        raise ValueError(f"Batch line has no query: {line[:80]}")
+    query = item["query"]
+    line_sources = item.get("sources", sources or [])
+    line_max_results = item.get("max_results", max_results)
+    query_id = item.get("id", "")
+    if not isinstance(query, str):
+        raise ValueError(f"Batch query must be a string: {line[:80]}")
+    if not isinstance(line_sources, list) or not all(
+        isinstance(source, str) for source in line_sources
+    ):
+        raise ValueError(f"Batch sources must be a list of strings: {line[:80]}")
+    # bool is an int subclass, but "max_results": true is a mistake
+    if (
+        not isinstance(line_max_results, int)
+        or isinstance(line_max_results, bool)
+        or line_max_results < 1
+    ):
+        raise ValueError(f"Batch max_results must be a positive integer: {line[:80]}")
+    if not isinstance(query_id, (str, int)) or isinstance(query_id, bool):
+        raise ValueError(f"Batch id must be a string or integer: {line[:80]}")
+    return BatchQuery(
+        query=query,
+        sources=list(line_sources),
+        max_results=line_max_results,
+        id=str(query_id),
+    )
+
+
+class BatchCheckpoint:
+    """
+    IDs of queries whose results are already written, kept in a text file.
+
+    Each ID is appended and flushed as its result is written, so the file
+    survives the process being killed mid-batch.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.done: Set[str] = set()
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                self.done = {line.strip() for line in f if line.strip()}
+        self._file: Optional[TextIO] = None
+
+    def __contains__(self, query_id: str) -> bool:
+        return query_id in self.done
+
+    def record(self, query_id: str) -> None:
+        """Mark ``query_id`` as done."""
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(query_id + "\n")
+        self._file.flush()
+        self.done.add(query_id)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+async def run_batch(
+    orchestration_service: "ResearchOrchestrationService",
+    source: TextIO,
+    output: TextIO,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    checkpoint: Optional[BatchCheckpoint] = None,
+    sources: Optional[List[str]] = None,
+    max_results: int = 10,
+    timeout: Optional[float] = None,
+) -> BatchSummary:
+    """
+    Research every query read from ``source``, writing JSONL to ``output``.
+
+    Args:
+        orchestration_service: Creates and executes each query
+        source: Input lines (a file or stdin)
+        output: Where result lines go, in completion order
+        concurrency: Queries researched at the same time
+        checkpoint: Skips and records finished query IDs
+        sources: Default sources for queries that do not name any
+        max_results: Default maximum results per query
+        timeout: Per-query time limit in seconds (partial results are kept)
+
+    Returns:
+        How many queries completed, failed or were skipped
+    """
+    # Imported here so the CLI's argument parsing stays light
+    from .serialization import dumps_text, result_summary
+
+    summary = BatchSummary()
+    # Bounded, so reading the input keeps pace with the workers
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+
+    def write(line: Dict[str, Any]) -> None:
+        output.write(dumps_text(line) + "\n")
+        output.flush()
+
+    async def read_queries() -> None:
+        line_number = 0
+        while True:
+            line = await asyncio.to_thread(source.readline)
+            if not line:
+                break
+            line_number += 1
+            try:
+                item = parse_batch_line(line, sources, max_results)
+            except ValueError as e:
+                summary.failed += 1
+                write(
+                    {
+                        "line": line_number,
+                        "success": False,
+                        "error": {"message": str(e), "type": "ValidationError"},
+                    }
+                )
+                continue
+            if item is None:
+                continue
+            if checkpoint is not None and item.id in checkpoint:
+                summary.skipped += 1
+                continue
+            await queue.put(item)
+
+    async def research(item: BatchQuery) -> None:
+        started = time.perf_counter()
+        try:
+            response = await orchestration_service.create_and_execute_research(
+                query_text=item.query,
+                sources=item.sources,
+                max_results=item.max_results,
+                cancel_token=CancellationToken(timeout=timeout),
+            )
+        except Exception as e:
+            summary.failed += 1
+            logger.warning(f"Batch query {item.id} failed: {e}")
+            write(
+                {
+                    "id": item.id,
+                    "query": item.query,
+                    "success": False,
+                    "error": {"message": str(e), "type": type(e).__name__},
+                }
+            )
+            return
+
+        results = response.execute_response.results
+        write(
+            {
+                "id": item.id,
+                "query": item.query,
+                "success": True,
+                "query_id": response.create_response.query_id,
+                "results_count": len(results),
+                "results": list(map(result_summary, results)),
+                "elapsed_ms": round((time.perf_counter() - started) * 1000),
+            }
+        )
+        if checkpoint is not None:
+            checkpoint.record(item.id)
+        summary.completed += 1
+
+    async def worker() -> None:
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    return
+                await research(item)
+            finally:
+                queue.task_done()
+
+    async def produce() -> None:
+        await read_queries()
+        for _ in workers:
+            await queue.put(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+    producer = asyncio.create_task(produce())
+    try:
+        # A worker that dies (e.g. the output cannot be written) raises here,
+        # and the producer is cancelled instead of blocking on a full queue
+        await asyncio.gather(producer, *workers)
+    finally:
+        for task in (producer, *workers):
+            task.cancel()
+    return summary
@@ -3,6 +3,8 @@ Command Line Interface - CLI for AI Deep Research MCP
 
 Provides a command-line interface for interacting with the AI Deep Research system.
 Useful for testing, automation, and direct interaction outside of MCP protocol.
+The ``batch`` command runs a file of queries concurrently and writes JSONL
+(see batch.py).
 """
 
 import argparse
@@ -10,19 +12,19 @@ import asyncio
 import json
 import sys
 from dataclasses import asdict
-from typing import List, Optional
-
-from ..application.use_cases import (
-    CreateResearchQueryRequest,
-    CreateResearchQueryUseCase,
-    ExecuteResearchRequest,
-    ExecuteResearchUseCase,
-    ResearchOrchestrationService,
-)
-from ..infrastructure.repositories import (
-    InMemoryResearchQueryRepository,
-    InMemoryResearchResultRepository,
-)
+from typing import TYPE_CHECKING, List, Optional
+
+from ..core.cancellation import CancellationToken
+from .batch import DEFAULT_CONCURRENCY, BatchCheckpoint, BatchSummary, run_batch
+
+# The service graph is imported when a command runs, not at import time,
+# so ``--help`` and argument errors answer without loading it
+if TYPE_CHECKING:
+    from ..application.container import ApplicationContainer
+    from ..infrastructure.repositories import (
+        InMemoryResearchQueryRepository,
+        InMemoryResearchResultRepository,
+    )
 
 
 class ResearchCLI:
@@ -37,24 +39,33 @@ class ResearchCLI:
         self,
         query_repository: Optional["InMemoryResearchQueryRepository"] = None,
         result_repository: Optional["InMemoryResearchResultRepository"] = None,
+        container: Optional["ApplicationContainer"] = None,
     ):
-        """Initialize CLI with dependency injection."""
+        """
+        Initialize CLI with dependency injection.
+
+        Args:
+            query_repository: Query storage for a new container
+            result_repository: Result storage for a new container
+            container: Shared service graph; when given, the repositories
+                are taken from it
+        """
+        if container is None:
+            from ..application.container import ApplicationContainer
+
+            container = ApplicationContainer(
+                query_repository=query_repository, result_repository=result_repository
+            )
+        self.container = container
+
         # Infrastructure dependencies
-        self.query_repository = query_repository or InMemoryResearchQueryRepository()
-        self.result_repository = result_repository or InMemoryResearchResultRepository()
+        self.query_repository = self.container.query_repository
+        self.result_repository = self.container.result_repository
 
         # Application use cases
-        self.create_query_use_case = CreateResearchQueryUseCase(
-            query_repository=self.query_repository
-        )
-        self.execute_research_use_case = ExecuteResearchUseCase(
-            query_repository=self.query_repository,
-            result_repository=self.result_repository,
-        )
-        self.orchestration_service = ResearchOrchestrationService(
-            create_query_use_case=self.create_query_use_case,
-            execute_research_use_case=self.execute_research_use_case,
-        )
+        self.create_query_use_case = self.container.create_query_use_case
+        self.execute_research_use_case = self.container.execute_research_use_case
+        self.orchestration_service = self.container.orchestration_service
 
     async def create_query(
         self,
@@ -73,6 +84,8 @@ class ResearchCLI:
         Returns:
             Query ID for the created query
         """
+        from ..application.use_cases import CreateResearchQueryRequest
+
         request = CreateResearchQueryRequest(
             query_text=query_text, sources=sources or [], max_results=max_results
         )
@@ -80,15 +93,22 @@ class ResearchCLI:
         response = await self.create_query_use_case.execute(request)
         return response.query_id
 
-    async def execute_research(self, query_id: str) -> None:
+    async def execute_research(
+        self, query_id: str, timeout: Optional[float] = None
+    ) -> None:
         """
         Execute research for a given query ID.
 
         Args:
             query_id: The ID of the query to execute
+            timeout: Optional time limit in seconds (partial results are kept)
         """
+        from ..application.use_cases import ExecuteResearchRequest
+
         request = ExecuteResearchRequest(query_id=query_id)
-        response = await self.execute_research_use_case.execute(request)
+        response = await self.execute_research_use_case.execute(
+            request, cancel_token=CancellationToken(timeout=timeout)
+        )
 
         print(f"Research Results for Query {query_id}:")
         print("=" * 50)
@@ -111,6 +131,7 @@ class ResearchCLI:
         query_text: str,
         sources: Optional[List[str]] = None,
         max_results: int = 10,
+        timeout: Optional[float] = None,
     ) -> None:
         """
         Create and execute research in one step.
@@ -119,12 +140,16 @@ class ResearchCLI:
             query_text: The research question
             sources: Optional list of sources to search
             max_results: Maximum number of results
+            timeout: Optional time limit in seconds (partial results are kept)
         """
         print(f"Starting research for: {query_text}")
         print("=" * 50)
 
         response = await self.orchestration_service.create_and_execute_research(
-            query_text=query_text, sources=sources or [], max_results=max_results
+            query_text=query_text,
+            sources=sources or [],
+            max_results=max_results,
+            cancel_token=CancellationToken(timeout=timeout),
         )
 
         print(f"Query ID: {response.create_response.query_id}")
@@ -143,6 +168,65 @@ class ResearchCLI:
             if result.synthesis:
                 print(f"   Synthesis: {result.synthesis}")
 
+    async def run_batch(
+        self,
+        input_path: str = "-",
+        output_path: str = "-",
+        concurrency: int = DEFAULT_CONCURRENCY,
+        checkpoint_path: Optional[str] = None,
+        sources: Optional[List[str]] = None,
+        max_results: int = 10,
+        timeout: Optional[float] = None,
+    ) -> BatchSummary:
+        """
+        Research every query in a file, writing one JSON line per query.
+
+        Args:
+            input_path: Query file, one per line ("-" for stdin)
+            output_path: JSONL results file ("-" for stdout); appended to
+                when resuming from a checkpoint
+            concurrency: Queries researched at the same time
+            checkpoint_path: File of finished query IDs; a rerun with the
+                same file skips them
+            sources: Default sources for queries that do not name any
+            max_results: Default maximum results per query
+            timeout: Per-query time limit in seconds
+
+        Returns:
+            How many queries completed, failed or were skipped
+        """
+        checkpoint = BatchCheckpoint(checkpoint_path) if checkpoint_path else None
+        source = sys.stdin if input_path == "-" else open(input_path, encoding="utf-8")
+        if output_path == "-":
+            output = sys.stdout
+        else:
+            output = open(output_path, "a" if checkpoint else "w", encoding="utf-8")
+        try:
+            summary = await run_batch(
+                self.orchestration_service,
+                source,
+                output,
+                concurrency=concurrency,
+                checkpoint=checkpoint,
+                sources=sources,
+                max_results=max_results,
+                timeout=timeout,
+            )
+        finally:
+            for stream in (source, output):
+                if stream not in (sys.stdin, sys.stdout):
+                    stream.close()
+            if checkpoint is not None:
+                checkpoint.close()
+
+        # stdout may be carrying the results, so the summary goes to stderr
+        print(
+            f"Batch finished: {summary.completed} completed, "
+            f"{summary.failed} failed, {summary.skipped} skipped",
+            file=sys.stderr,
+        )
+        return summary
+
 
 def create_cli_parser() -> argparse.ArgumentParser:
     """Create and configure the CLI argument parser."""
@@ -155,6 +239,7 @@ Examples:
   %(prog)s research "Climate change impacts" --sources "academic" "news"
   %(prog)s create-query "AI ethics" --max-results 5
   %(prog)s execute-research <query-id>
+  %(prog)s batch queries.txt -o results.jsonl --concurrency 8 --checkpoint done.txt
         """,
     )
 
@@ -174,6 +259,11 @@ Examples:
         default=10,
         help="Maximum number of results (default: 10)",
     )
+    research_parser.add_argument(
+        "--timeout",
+        type=float,
+        help="Stop after this many seconds and show partial results",
+    )
 
     # Create query command
     create_parser = subparsers.add_parser(
@@ -195,6 +285,52 @@ Examples:
         "execute-research", help="Execute research for an existing query"
     )
     execute_parser.add_argument("query_id", help="ID of the query to execute")
+    execute_parser.add_argument(
+        "--timeout",
+        type=float,
+        help="Stop after this many seconds and show partial results",
+    )
+
+    # Batch command
+    batch_parser = subparsers.add_parser(
+        "batch", help="Research a file of queries concurrently, writing JSONL"
+    )
+    batch_parser.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="Query file: plain text or JSON objects, one per line " "(default: stdin)",
+    )
+    batch_parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="JSONL results file (default: stdout)",
+    )
+    batch_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Queries researched at the same time (default: {DEFAULT_CONCURRENCY})",
+    )
+    batch_parser.add_argument(
+        "--checkpoint",
+        help="File of finished query IDs; rerun with it to resume",
+    )
+    batch_parser.add_argument(
+        "--sources", nargs="*", help="Default sources for each query (optional)"
+    )
+    batch_parser.add_argument(
+        "--max-results",
+        type=int,
+        default=10,
+        help="Default maximum results per query (default: 10)",
+    )
+    batch_parser.add_argument(
+        "--timeout",
+        type=float,
+        help="Per-query time limit in seconds (partial results are kept)",
+    )
 
     return parser
 
@@ -208,7 +344,9 @@ async def main():
         parser.print_help()
         return
 
-    cli = ResearchCLI()
+    from ..application.container import get_application_container
+
+    cli = ResearchCLI(container=get_application_container())
 
     try:
         if args.command == "research":
@@ -216,6 +354,7 @@ async def main():
                 query_text=args.query,
                 sources=args.sources,
                 max_results=args.max_results,
+                timeout=args.timeout,
             )
 
         elif args.command == "create-query":
@@ -227,7 +366,20 @@ async def main():
             print(f"Query created successfully. ID: {query_id}")
 
         elif args.command == "execute-research":
-            await cli.execute_research(args.query_id)
+            await cli.execute_research(args.query_id, timeout=args.timeout)
+
+        elif args.command == "batch":
+            summary = await cli.run_batch(
+                input_path=args.input,
+                output_path=args.output,
+                concurrency=args.concurrency,
+                checkpoint_path=args.checkpoint,
+                sources=args.sources,
+                max_results=args.max_results,
+                timeout=args.timeout,
+            )
+            if summary.failed:
+                sys.exit(1)
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -0,0 +1,261 @@
+"""
+Response Compression
+
+CompressionMiddleware is an ASGI middleware that compresses response bodies
+with the best encoding the client accepts (``Accept-Encoding``): brotli
+(``br``) when the brotli package is installed, otherwise gzip.
+
+- Only text-like media types are compressed (JSON, NDJSON, SSE, citation
+  formats); bodies under ``minimum_size`` bytes are sent as they are,
+  since compressing them saves less than it costs.
+- Streamed bodies (citation downloads, research progress streams) are
+  compressed chunk by chunk with a sync flush, so every event still reaches
+  the client as soon as it is produced.
+- Responses that already carry a Content-Encoding pass through untouched.
+- ``Vary: Accept-Encoding`` is set on compressible responses so caches
+  (nginx, browsers) keep the compressed and plain variants apart, and a
+  compressed response's ETag is marked with its coding (see
+  http_caching.py).
+
+Research responses are mostly repeated English text and JSON keys, so they
+typically shrink to a fifth of their size or less.
+"""
+
+import importlib
+import zlib
+from types import ModuleType
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# brotli ships without type information, so it is loaded as a plain module
+brotli: Optional[ModuleType]
+try:
+    brotli = importlib.import_module("brotli")
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+from .http_caching import coded_etag
+
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+Headers = List[Tuple[bytes, bytes]]
+
+DEFAULT_MINIMUM_SIZE = 1024
+
+COMPRESSIBLE_TYPES = frozenset(
+    {
+        "application/json",
+        "application/x-ndjson",
+        "application/x-bibtex",
+        "application/x-research-info-systems",
+        "application/x-endnote-refer",
+        "application/xml",
+        "application/javascript",
+    }
+)
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """Encodings this process can produce, most preferred first."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def choose_encoding(
+    accept_encoding: Optional[str], available: Optional[Tuple[str, ...]] = None
+) -> Optional[str]:
+    """
+    Pick the encoding for a response from an ``Accept-Encoding`` header.
+
+    Honours q-values (``q=0`` refuses an encoding) and ``*``; ties go to
+    the earlier entry of ``available``. Returns None for no compression.
+    """
+    if not accept_encoding:
+        return None
+    available = available or available_encodings()
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in available:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    """Whether a response of this media type is worth compressing."""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in COMPRESSIBLE_TYPES
+        or media_type.endswith("+json")
+    )
+
+
+class _GzipStream:
+    def __init__(self, level: int):
+        # wbits=31: zlib deflate with a gzip header and trailer
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, flush: bool) -> bytes:
+        out = self._compressor.compress(data)
+        return out + self._compressor.flush(zlib.Z_SYNC_FLUSH) if flush else out
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliStream:
+    def __init__(self, module: ModuleType, quality: int):
+        self._compressor = module.Compressor(quality=quality)
+
+    def compress(self, data: bytes, flush: bool) -> bytes:
+        out: bytes = self._compressor.process(data)
+        if flush:
+            out += self._compressor.flush()
+        return out
+
+    def finish(self) -> bytes:
+        tail: bytes = self._compressor.finish()
+        return tail
+
+
+class CompressionMiddleware:
+    """
+    Compress HTTP responses the client can decode.
+
+    Args:
+        app: The ASGI application to wrap
+        minimum_size: Smallest complete body worth compressing
+        gzip_level: zlib level (6 balances speed and size for live responses)
+        brotli_quality: brotli quality (5 is fast enough for live responses)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = DEFAULT_MINIMUM_SIZE,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(_header(scope["headers"], b"accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def stream_for(self, encoding: str) -> Any:
+        if encoding == "br" and brotli is not None:
+            return _BrotliStream(brotli, self.brotli_quality)
+        return _GzipStream(self.gzip_level)
+
+
+class _CompressingResponder:
+    """Rewrites one response's messages on their way to the server."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Optional[Message] = None
+        self._stream: Any = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = message.get("headers", [])
+            self._passthrough = (
+                message["status"] < 200
+                or message["status"] in (204, 304)
+                or _header(headers, b"content-encoding") is not None
+                or not is_compressible(_header(headers, b"content-type") or "")
+            )
+            if self._passthrough:
+                await self._send(message)
+            else:
+                # Held back until the first body chunk shows the body's size
+                self._start = message
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._start is not None:
+            start, self._start = self._start, None
+            headers = _with_vary(start.get("headers", []))
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self._passthrough = True
+                await self._send({**start, "headers": headers})
+                await self._send(message)
+                return
+            self._stream = self.middleware.stream_for(self.encoding)
+            headers = [
+                (name, self._coded(value) if name.lower() == b"etag" else value)
+                for name, value in headers
+                if name.lower() != b"content-length"
+            ]
+            headers.append((b"content-encoding", self.encoding.encode("latin-1")))
+            if not more_body:
+                body = self._stream.compress(body, flush=False) + self._stream.finish()
+                headers.append((b"content-length", str(len(body)).encode("latin-1")))
+                await self._send({**start, "headers": headers})
+                await self._send({**message, "body": body})
+                return
+            await self._send({**start, "headers": headers})
+
+        if more_body:
+            chunk = self._stream.compress(body, flush=True)
+        else:
+            chunk = self._stream.compress(body, flush=False) + self._stream.finish()
+        await self._send({**message, "body": chunk})
+
+    def _coded(self, etag: bytes) -> bytes:
+        return coded_etag(etag.decode("latin-1"), self.encoding).encode("latin-1")
+
+
+def _header(headers: Headers, name: bytes) -> Optional[str]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _with_vary(headers: Headers) -> Headers:
+    """``headers`` with Accept-Encoding added to Vary."""
+    vary = _header(headers, b"vary")
+    if vary is None:
+        return [*headers, (b"vary", b"Accept-Encoding")]
+    if "accept-encoding" in vary.lower():
+        return list(headers)
+    return [
+        (
+            (key, f"{vary}, Accept-Encoding".encode("latin-1"))
+            if key.lower() == b"vary"
+            else (key, value)
+        )
+        for key, value in headers
+    ]
@@ -0,0 +1,92 @@
+"""
+HTTP Caching
+
+Validators and freshness for the web API's idempotent reads: stored query
+results, scholarly searches and the API description.
+
+- ``strong_etag`` derives an ETag from the response body, so it changes
+  exactly when the bytes do, on every worker process alike.
+- ``search_etag`` tags a scholarly search by its request and results,
+  leaving out per-run fields (``query_id``, ``search_time_ms``): running
+  the same search again for the same papers keeps the tag, so it is weak.
+- ``matching_etag`` evaluates ``If-None-Match`` with the weak comparison
+  the HTTP spec requires; a match means the client (or nginx) may reuse
+  its copy and gets a 304 with no body.
+- When a body is compressed its ETag gets the coding as a suffix
+  (``"abc-gzip"``), because the compressed bytes are a different
+  representation; ``If-None-Match`` matching ignores that suffix.
+- The ``*_CACHE_CONTROL`` values say how long shared caches may serve a
+  response without asking again; errors are ``no-store``.
+"""
+
+import hashlib
+from typing import Any, Dict, Optional
+
+from .serialization import dumps
+
+# Scholarly searches: the response cache already serves repeats for an hour
+SEARCH_CACHE_CONTROL = "public, max-age=300"
+# Stored results change only when their query is executed again
+RESULTS_CACHE_CONTROL = "public, max-age=60"
+API_DOCS_CACHE_CONTROL = "public, max-age=3600"
+NO_STORE = "no-store"
+
+CODING_SUFFIXES = ("-br", "-gzip")
+
+# Search response fields that differ on every run of the same search
+VOLATILE_FIELDS = frozenset({"query_id", "search_time_ms"})
+
+
+def strong_etag(body: bytes) -> str:
+    """A strong ETag for ``body``: a quoted 128-bit BLAKE2 digest."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def search_etag(request_key: str, response: Dict[str, Any]) -> str:
+    """A weak ETag for a search response: its request and stable data."""
+    data = response.get("data")
+    stable = (
+        {name: value for name, value in data.items() if name not in VOLATILE_FIELDS}
+        if isinstance(data, dict)
+        else data
+    )
+    digest = hashlib.blake2b(request_key.encode("utf-8"), digest_size=16)
+    digest.update(dumps(stable))
+    return f'W/"{digest.hexdigest()}"'
+
+
+def coded_etag(etag: str, encoding: str) -> str:
+    """The ETag of ``etag``'s representation compressed with ``encoding``."""
+    if not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def _opaque_tag(tag: str) -> str:
+    """``tag`` without its weak prefix and content-coding suffix."""
+    tag = tag.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    tag = tag.strip('"')
+    for suffix in CODING_SUFFIXES:
+        if tag.endswith(suffix):
+            return tag[: -len(suffix)]
+    return tag
+
+
+def matching_etag(if_none_match: Optional[str], etag: str) -> Optional[str]:
+    """
+    The entity tag in ``If-None-Match`` that matches ``etag``, if any.
+
+    The tag is returned as the client sent it, so a 304 echoes the
+    validator of the representation the client actually holds.
+    """
+    if not if_none_match:
+        return None
+    if if_none_match.strip() == "*":
+        return etag
+    current = _opaque_tag(etag)
+    for tag in if_none_match.split(","):
+        if tag.strip() and _opaque_tag(tag) == current:
+            return tag.strip()
+    return None
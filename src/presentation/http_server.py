@@ -0,0 +1,531 @@
+"""
+HTTP Server - ASGI application for the web interface
+
+Binds WebInterfaceHandler's async ``handle_*`` methods to HTTP routes with
+FastAPI and serves them with uvicorn. This is what nginx proxies to on port
+8000.
+
+- Routes accept and return the same JSON documents the handler methods do;
+  ``success: false`` responses get a 4xx/5xx status from their error type.
+- ``/api/research/enhanced/stream`` streams research progress and each
+  source's results as Server-Sent Events or NDJSON (see streaming.py).
+- ``/mcp`` is a WebSocket speaking MCP JSON-RPC, one message per text
+  frame, with concurrent tool calls (see mcp_transport.py).
+- Read-only scholarly searches are cached in a SQLiteResponseCache on disk,
+  so with several worker processes a result computed by one worker is
+  served by all of them. ``X-Cache: HIT|MISS`` reports which happened.
+  Each worker also keeps its hottest cached bodies in memory, so a repeat
+  is answered with the bytes already encoded.
+- Idempotent reads (``GET /api/results/{query_id}``, scholarly searches,
+  which ``GET /api/scholarly/search`` also serves from query parameters,
+  and the API description) carry an ETag and Cache-Control - weak for
+  searches, whose tag ignores per-run fields - and ``If-None-Match`` on a
+  GET gets a 304 (see http_caching.py); nginx
+  caches them at the edge. A search where a requested source failed lists
+  it in ``failed_sources`` and is neither cached nor cacheable
+  (``no-store``), so one upstream blip does not serve partial results for
+  the cache lifetime.
+- Responses are encoded by serialization.dumps (orjson when installed)
+  and compressed with brotli or gzip when the client accepts it (see
+  compression.py); ``compact: true`` in a request body trims duplicated
+  text fields from research and search results.
+- ``/health/live`` and ``/health/ready`` are the
+  liveness and readiness probes (see application/health.py). They read
+  counters only, never write or call upstream APIs, and are never cached;
+  readiness answers 503 while the event loop is lagging.
+- uvicorn keeps client connections alive between requests and, on
+  SIGTERM, stops accepting new connections, lets in-flight requests finish
+  (up to ``graceful_shutdown_seconds``) and then runs the app's shutdown,
+  which stops the research job workers and closes the cache.
+
+Each worker process has its own service graph. Research queries and jobs
+live in that worker's in-memory repositories, so multi-worker deployments
+should keep a client on one worker (or use persistent repositories) for
+the query/execute and job-status flows. Research collections are stored in
+SQLite at $RESEARCH_COLLECTIONS_PATH (data/collections.sqlite3 by default),
+so they survive restarts and every worker sees the same libraries.
+"""
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import Response, StreamingResponse
+
+from ..application.container import ApplicationContainer
+from ..infrastructure.collection_repositories import SQLiteResearchCollectionRepository
+from ..infrastructure.response_cache import MemoryResponseCache, SQLiteResponseCache
+from .compression import CompressionMiddleware
+from .http_caching import (
+    API_DOCS_CACHE_CONTROL,
+    NO_STORE,
+    RESULTS_CACHE_CONTROL,
+    SEARCH_CACHE_CONTROL,
+    matching_etag,
+    search_etag,
+    strong_etag,
+)
+from .mcp_server import McpServerHandler
+from .mcp_transport import McpSession, Outgoing, encode_message
+from .serialization import dumps, loads
+from .streaming import STREAM_HEADERS, encode_events, media_type_for
+from .web_interface import WebInterfaceHandler, create_web_interface
+
+logger = logging.getLogger(__name__)
+
+JSON_MEDIA_TYPE = "application/json"
+
+CACHE_PATH_ENV = "RESEARCH_CACHE_PATH"
+CACHE_TTL_ENV = "RESEARCH_CACHE_TTL"
+DEFAULT_CACHE_PATH = "data/response_cache.sqlite3"
+COLLECTIONS_PATH_ENV = "RESEARCH_COLLECTIONS_PATH"
+DEFAULT_COLLECTIONS_PATH = "data/collections.sqlite3"
+
+# POST routes taking a JSON body, and the handler method serving each
+JSON_ROUTES = {
+    "/api/research": "handle_research_request",
+    "/api/query": "handle_create_query_request",
+    "/api/execute": "handle_execute_research_request",
+    "/api/scholarly/search": "handle_scholarly_search_request",
+    "/api/scholarly/advanced": "handle_advanced_search_request",
+    "/api/research/enhanced": "handle_enhanced_research_request",
+    "/api/jobs": "handle_submit_research_job_request",
+    "/api/collections": "handle_research_collection_request",
+}
+
+# Routes whose responses depend only on the request body
+CACHED_ROUTES = frozenset({"/api/scholarly/search", "/api/scholarly/advanced"})
+
+# Cached routes also served over GET, their body given as query parameters
+GET_ROUTES = frozenset({"/api/scholarly/search"})
+LIST_PARAMS = ("sources", "fields_of_study", "fields")
+INT_PARAMS = ("max_results", "min_year", "max_year")
+BOOL_PARAMS = ("include_abstracts", "compact", "full_text")
+
+ERROR_STATUS = {
+    "ValidationError": 400,
+    "InvalidTimeoutError": 400,
+    "InvalidQueryException": 400,
+    "SourceValidationException": 400,
+    "NotFoundError": 404,
+    "QueryNotFoundError": 404,
+    "CollectionNotFoundError": 404,
+}
+
+
+def status_for(response: Dict[str, Any]) -> int:
+    """HTTP status for a handler response."""
+    if response.get("success", True):
+        return 200
+    return ERROR_STATUS.get(response.get("error", {}).get("type"), 500)
+
+
+def _json_response(
+    document: Any, status_code: int = 200, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    return Response(
+        dumps(document),
+        status_code=status_code,
+        media_type=JSON_MEDIA_TYPE,
+        headers=headers,
+    )
+
+
+def _bad_request(message: str) -> Response:
+    return _json_response(
+        {"success": False, "error": {"message": message, "type": "ValidationError"}},
+        status_code=400,
+    )
+
+
+def _conditional_response(
+    request: Request,
+    body: bytes,
+    cache_control: str,
+    headers: Optional[Dict[str, str]] = None,
+    etag: Optional[str] = None,
+) -> Response:
+    """
+    A cacheable 200 for ``body``, or a bodiless 304 when a GET's
+    If-None-Match already names it.
+
+    The ETag defaults to one derived from ``body``.
+    """
+    etag = etag or strong_etag(body)
+    headers = {**(headers or {}), "ETag": etag, "Cache-Control": cache_control}
+    if request.method == "GET":
+        matched = matching_etag(request.headers.get("if-none-match"), etag)
+        if matched is not None:
+            return Response(status_code=304, headers={**headers, "ETag": matched})
+    return Response(body, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+def _failed_sources(response: Dict[str, Any]) -> List[str]:
+    """The sources a search response reports as failed upstream."""
+    data = response.get("data")
+    return (data.get("failed_sources") or []) if isinstance(data, dict) else []
+
+
+def _query_payload(request: Request) -> Dict[str, Any]:
+    """
+    A GET request's query parameters as the JSON body the POST route takes.
+
+    Lists are repeated or comma-separated parameters. Raises ValueError
+    for a malformed integer.
+    """
+    params = request.query_params
+    payload: Dict[str, Any] = {}
+    if "query" in params:
+        payload["query"] = params["query"]
+    for name in LIST_PARAMS:
+        values = [
+            value
+            for param in params.getlist(name)
+            for value in param.split(",")
+            if value
+        ]
+        if values:
+            payload[name] = values
+    for name in INT_PARAMS:
+        if name in params:
+            try:
+                payload[name] = int(params[name])
+            except ValueError:
+                raise ValueError(f"{name} must be an integer")
+    for name in BOOL_PARAMS:
+        if name in params:
+            payload[name] = params[name].lower() in ("1", "true", "yes", "on")
+    return payload
+
+
+async def _read_json(request: Request) -> Optional[Dict[str, Any]]:
+    """The request body as a JSON object, or None if it is not one."""
+    body = await request.body()
+    if not body:
+        return {}
+    try:
+        payload = loads(body)
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def create_http_app(
+    handler: Optional[WebInterfaceHandler] = None,
+    cache: Optional[SQLiteResponseCache] = None,
+) -> FastAPI:
+    """
+    Build the ASGI application.
+
+    Args:
+        handler: Web interface to route to (the process-wide one by default)
+        cache: Shared response cache for read-only routes; None disables it
+    """
+    handler = handler or create_web_interface()
+
+    health = handler.container.health
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        health.loop_monitor.start()
+        yield
+        await health.loop_monitor.stop()
+        await handler.job_queue.shutdown()
+        if cache is not None:
+            cache.close()
+
+    # The handler publishes its own API description, so FastAPI's is off
+    app = FastAPI(
+        title="AI Deep Research MCP API",
+        docs_url=None,
+        redoc_url=None,
+        openapi_url=None,
+        lifespan=lifespan,
+    )
+    app.state.handler = handler
+    app.state.cache = cache
+    app.add_middleware(CompressionMiddleware)
+
+    # The hot tier answers repeats from memory before the shared database
+    tiers = (
+        (cache, MemoryResponseCache(cache.ttl_seconds)) if cache is not None else None
+    )
+    for path, method_name in JSON_ROUTES.items():
+        app.add_api_route(
+            path,
+            _json_endpoint(handler, path, method_name, tiers),
+            methods=["POST"],
+            name=method_name,
+        )
+        if path in GET_ROUTES:
+            app.add_api_route(
+                path,
+                _json_endpoint(handler, path, method_name, tiers),
+                methods=["GET"],
+                name=f"{method_name}_get",
+            )
+
+    @app.get("/api/results/{query_id}")
+    async def research_results(query_id: str, request: Request) -> Response:
+        response = await handler.handle_get_results_request({"query_id": query_id})
+        if not response["success"]:
+            return _json_response(
+                response, status_for(response), {"Cache-Control": NO_STORE}
+            )
+        return _conditional_response(request, dumps(response), RESULTS_CACHE_CONTROL)
+
+    @app.get("/api/jobs/{job_id}")
+    async def job_status(job_id: str, wait: Optional[float] = None) -> Response:
+        response = await handler.handle_job_status_request(
+            {"job_id": job_id, "wait": wait}
+        )
+        return _json_response(response, status_for(response))
+
+    @app.delete("/api/jobs/{job_id}")
+    async def cancel_job(job_id: str) -> Response:
+        response = await handler.handle_cancel_job_request({"job_id": job_id})
+        return _json_response(response, status_for(response))
+
+    @app.post("/api/citations/export")
+    async def export_citations(request: Request) -> Response:
+        payload = await _read_json(request)
+        if payload is None:
+            return _bad_request("Request body must be a JSON object")
+        response = await handler.handle_citation_export_stream(payload)
+        if not response["success"]:
+            return _json_response(response, status_for(response))
+        data = response["data"]
+        return StreamingResponse(
+            data["body"],
+            media_type=data["content_type"],
+            headers={
+                "Content-Disposition": f'attachment; filename="{data["filename"]}"'
+            },
+        )
+
+    @app.post("/api/research/enhanced/stream")
+    async def stream_enhanced_research(request: Request) -> Response:
+        payload = await _read_json(request)
+        if payload is None:
+            return _bad_request("Request body must be a JSON object")
+        response = await handler.handle_enhanced_research_stream(payload)
+        if not response["success"]:
+            return _json_response(response, status_for(response))
+        media_type = media_type_for(request.headers.get("accept"))
+        return StreamingResponse(
+            encode_events(response["data"]["events"], media_type),
+            media_type=media_type,
+            headers=STREAM_HEADERS,
+        )
+
+    mcp_handler = McpServerHandler(container=handler.container)
+
+    @app.websocket("/mcp")
+    async def mcp_websocket(websocket: WebSocket) -> None:
+        subprotocol = (
+            "mcp" if "mcp" in websocket.scope.get("subprotocols", []) else None
+        )
+        await websocket.accept(subprotocol=subprotocol)
+
+        async def send(message: Outgoing) -> None:
+            await websocket.send_text(encode_message(message))
+
+        session = McpSession(mcp_handler, send)
+        try:
+            while True:
+                await session.receive(await websocket.receive_text())
+        except WebSocketDisconnect:
+            pass
+        finally:
+            await session.close()
+
+    @app.get("/api/docs")
+    @app.get("/openapi.json")
+    async def api_documentation(request: Request) -> Response:
+        return _conditional_response(
+            request, dumps(handler.get_api_documentation()), API_DOCS_CACHE_CONTROL
+        )
+
+    probe_caches = (
+        {"responses": tiers[0].stats, "hot_responses": tiers[1].stats}
+        if tiers is not None
+        else {}
+    )
+
+    @app.get("/health")
+    async def health_status() -> Response:
+        return _json_response(
+            {"status": "healthy"}, headers={"Cache-Control": NO_STORE}
+        )
+
+    @app.get("/health/live")
+    async def liveness() -> Response:
+        return _json_response(health.liveness(), headers={"Cache-Control": NO_STORE})
+
+    @app.get("/health/ready")
+    async def readiness() -> Response:
+        report = health.readiness(probe_caches)
+        return _json_response(
+            report,
+            200 if report["status"] == "ready" else 503,
+            {"Cache-Control": NO_STORE},
+        )
+
+    return app
+
+
+def _json_endpoint(
+    handler: WebInterfaceHandler,
+    path: str,
+    method_name: str,
+    tiers: Optional[Tuple[SQLiteResponseCache, MemoryResponseCache]],
+) -> Callable[[Request], Awaitable[Response]]:
+    handle = getattr(handler, method_name)
+    conditional = path in CACHED_ROUTES
+    cached = tiers if conditional else None
+
+    async def endpoint(request: Request) -> Response:
+        payload: Optional[Dict[str, Any]]
+        if request.method == "GET":
+            try:
+                payload = _query_payload(request)
+            except ValueError as e:
+                return _bad_request(str(e))
+        else:
+            payload = await _read_json(request)
+            if payload is None:
+                return _bad_request("Request body must be a JSON object")
+
+        key = SQLiteResponseCache.key_for(path, payload) if conditional else ""
+        if cached is not None:
+            cache, hot = cached
+            # Hot bodies are the bytes already sent: no disk read, no encoding
+            body = hot.get(key)
+            if body is None:
+                entry = await asyncio.to_thread(cache.get_entry, key)
+                if entry is not None:
+                    body = entry[0]
+                    hot.set(key, body, ttl_seconds=entry[1])
+            if body is not None:
+                return _conditional_response(
+                    request,
+                    body,
+                    SEARCH_CACHE_CONTROL,
+                    {"X-Cache": "HIT"},
+                    search_etag(key, loads(body)),
+                )
+
+        response = await handle(payload)
+        status_code = status_for(response)
+        body = dumps(response)
+        headers = {"X-Cache": "MISS"} if cached is not None else {}
+        # A source that failed would leave its papers out of every cached copy
+        complete = status_code == 200 and not _failed_sources(response)
+        if cached is not None and complete:
+            cache, hot = cached
+            hot.set(key, body)
+            await asyncio.to_thread(cache.set, key, body)
+        if conditional:
+            if complete:
+                return _conditional_response(
+                    request,
+                    body,
+                    SEARCH_CACHE_CONTROL,
+                    headers,
+                    search_etag(key, response),
+                )
+            headers["Cache-Control"] = NO_STORE
+        return Response(
+            body,
+            status_code=status_code,
+            media_type=JSON_MEDIA_TYPE,
+            headers=headers or None,
+        )
+
+    return endpoint
+
+
+def response_cache_from_env() -> Optional[SQLiteResponseCache]:
+    """
+    Open the shared response cache at $RESEARCH_CACHE_PATH (TTL from
+    $RESEARCH_CACHE_TTL seconds); an empty path disables caching.
+    """
+    cache_path = os.environ.get(CACHE_PATH_ENV, DEFAULT_CACHE_PATH)
+    if not cache_path:
+        return None
+    if cache_path != ":memory:":
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+    return SQLiteResponseCache(
+        cache_path, ttl_seconds=float(os.environ.get(CACHE_TTL_ENV, 3600))
+    )
+
+
+def collection_repository_from_env() -> Optional[SQLiteResearchCollectionRepository]:
+    """
+    Open the collection store at $RESEARCH_COLLECTIONS_PATH, shared by every
+    worker; an empty path keeps collections in memory (None).
+    """
+    path = os.environ.get(COLLECTIONS_PATH_ENV, DEFAULT_COLLECTIONS_PATH)
+    if not path:
+        return None
+    if path != ":memory:":
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    return SQLiteResearchCollectionRepository(path)
+
+
+def create_app_from_env() -> FastAPI:
+    """uvicorn factory used by every worker process."""
+    container = ApplicationContainer(
+        collection_repository=collection_repository_from_env()
+    )
+    return create_http_app(
+        create_web_interface(container), cache=response_cache_from_env()
+    )
+
+
+def run_server(
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    workers: int = 1,
+    cache_path: Optional[str] = None,
+    collections_path: Optional[str] = None,
+    keep_alive_seconds: int = 5,
+    graceful_shutdown_seconds: int = 30,
+) -> None:
+    """
+    Serve the API with uvicorn (blocks until shut down).
+
+    Args:
+        workers: Worker processes; they share the on-disk response cache
+        cache_path: Response cache file (default $RESEARCH_CACHE_PATH or
+            data/response_cache.sqlite3)
+        collections_path: Research collection database (default
+            $RESEARCH_COLLECTIONS_PATH or data/collections.sqlite3; ''
+            keeps collections in each worker's memory)
+        keep_alive_seconds: How long idle client connections stay open
+        graceful_shutdown_seconds: How long in-flight requests may take to
+            finish after SIGTERM
+    """
+    import uvicorn
+
+    if cache_path is not None:
+        # Worker processes read their configuration from the environment
+        os.environ[CACHE_PATH_ENV] = cache_path
+    if collections_path is not None:
+        os.environ[COLLECTIONS_PATH_ENV] = collections_path
+
+    logger.info(f"Serving HTTP on {host}:{port} with {workers} worker(s)")
+    uvicorn.run(
+        "src.presentation.http_server:create_app_from_env",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        timeout_keep_alive=keep_alive_seconds,
+        timeout_graceful_shutdown=graceful_shutdown_seconds,
+        proxy_headers=True,
+    )
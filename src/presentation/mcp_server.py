@@ -8,13 +8,10 @@ Adapts between MCP protocol and our Clean Architecture application layer.
 import logging
 from typing import Any, Dict, List, Optional
 
-from ..application.use_cases import (
-    CreateResearchQueryRequest,
-    CreateResearchQueryUseCase,
-    ExecuteResearchRequest,
-    ExecuteResearchUseCase,
-    ResearchOrchestrationService,
-)
+from ..application.container import ApplicationContainer, get_application_container
+from ..application.research_pipeline import ProgressCallback
+from ..application.use_cases import CreateResearchQueryRequest, ExecuteResearchRequest
+from ..core.cancellation import CancellationToken, InvalidTimeoutError, parse_timeout
 from ..infrastructure.repositories import (
     InMemoryResearchQueryRepository,
     InMemoryResearchResultRepository,
@@ -35,27 +32,36 @@ class McpServerHandler:
         self,
         query_repository: Optional["InMemoryResearchQueryRepository"] = None,
         result_repository: Optional["InMemoryResearchResultRepository"] = None,
+        container: Optional[ApplicationContainer] = None,
     ):
-        """Initialize the MCP server with dependency injection."""
+        """
+        Initialize the MCP server with dependency injection.
+
+        Args:
+            query_repository: Query storage for a new container
+            result_repository: Result storage for a new container
+            container: Shared service graph; when given, the repositories
+                are taken from it
+        """
+        self.container = container or ApplicationContainer(
+            query_repository=query_repository, result_repository=result_repository
+        )
+
         # Infrastructure dependencies
-        self.query_repository = query_repository or InMemoryResearchQueryRepository()
-        self.result_repository = result_repository or InMemoryResearchResultRepository()
+        self.query_repository = self.container.query_repository
+        self.result_repository = self.container.result_repository
 
         # Application use cases
-        self.create_query_use_case = CreateResearchQueryUseCase(
-            query_repository=self.query_repository
-        )
-        self.execute_research_use_case = ExecuteResearchUseCase(
-            query_repository=self.query_repository,
-            result_repository=self.result_repository,
-        )
-        self.orchestration_service = ResearchOrchestrationService(
-            create_query_use_case=self.create_query_use_case,
-            execute_research_use_case=self.execute_research_use_case,
-        )
+        self.create_query_use_case = self.container.create_query_use_case
+        self.execute_research_use_case = self.container.execute_research_use_case
+        self.orchestration_service = self.container.orchestration_service
 
     async def handle_tool_call(
-        self, tool_name: str, arguments: Dict[str, Any]
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        cancel_token: Optional[CancellationToken] = None,
+        progress: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
         """
         Handle MCP tool calls by routing to appropriate use cases.
@@ -63,6 +69,11 @@ class McpServerHandler:
         Args:
             tool_name: Name of the tool being called
             arguments: Tool arguments from MCP protocol
+            cancel_token: Cancelled by the transport when the client sends
+                ``notifications/cancelled``; research stops early and keeps
+                its partial results
+            progress: Called as each research step finishes; the transport
+                turns these into ``notifications/progress``
 
         Returns:
             Tool response following MCP protocol format
@@ -71,16 +82,41 @@ class McpServerHandler:
             if tool_name == "create_research_query":
                 return await self._handle_create_research_query(arguments)
             elif tool_name == "execute_research":
-                return await self._handle_execute_research(arguments)
+                return await self._handle_execute_research(
+                    arguments, self._token_for(arguments, cancel_token), progress
+                )
             elif tool_name == "orchestrate_research":
-                return await self._handle_orchestrate_research(arguments)
+                return await self._handle_orchestrate_research(
+                    arguments, self._token_for(arguments, cancel_token), progress
+                )
             else:
                 raise ValueError(f"Unknown tool: {tool_name}")
 
+        except InvalidTimeoutError as e:
+            # Bad arguments are a protocol error, not a tool failure
+            return {"error": {"code": "INVALID_PARAMS", "message": str(e)}}
         except Exception as e:
             logger.error(f"Error handling tool call {tool_name}: {e}")
             return {"error": {"code": "TOOL_ERROR", "message": str(e)}}
 
+    @staticmethod
+    def _token_for(
+        arguments: Dict[str, Any], cancel_token: Optional[CancellationToken]
+    ) -> CancellationToken:
+        """
+        A token with the call's ``timeout_seconds`` that also follows
+        ``cancel_token``.
+
+        Raises:
+            InvalidTimeoutError: If ``timeout_seconds`` is not a positive number
+        """
+        token = CancellationToken(
+            timeout=parse_timeout(arguments.get("timeout_seconds"))
+        )
+        if cancel_token is not None:
+            cancel_token.add_callback(token.cancel)
+        return token
+
     async def _handle_create_research_query(
         self, arguments: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -106,13 +142,18 @@ class McpServerHandler:
         }
 
     async def _handle_execute_research(
-        self, arguments: Dict[str, Any]
+        self,
+        arguments: Dict[str, Any],
+        cancel_token: CancellationToken,
+        progress: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
         """Handle execute_research tool call."""
         query_id = arguments.get("query_id", "")
 
         request = ExecuteResearchRequest(query_id=query_id)
-        response = await self.execute_research_use_case.execute(request)
+        response = await self.execute_research_use_case.execute(
+            request, cancel_token=cancel_token, progress=progress
+        )
 
         # Format results for MCP response
         results_text = []
@@ -139,7 +180,10 @@ class McpServerHandler:
         }
 
     async def _handle_orchestrate_research(
-        self, arguments: Dict[str, Any]
+        self,
+        arguments: Dict[str, Any],
+        cancel_token: CancellationToken,
+        progress: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
         """Handle orchestrate_research tool call - full research workflow."""
         query_text = arguments.get("query", "")
@@ -148,7 +192,11 @@ class McpServerHandler:
 
         # Execute full research orchestration
         query_response = await self.orchestration_service.create_and_execute_research(
-            query_text=query_text, sources=sources, max_results=max_results
+            query_text=query_text,
+            sources=sources,
+            max_results=max_results,
+            cancel_token=cancel_token,
+            progress=progress,
         )
 
         # Format comprehensive response
@@ -215,7 +263,12 @@ class McpServerHandler:
                         "query_id": {
                             "type": "string",
                             "description": "The ID of the research query to execute",
-                        }
+                        },
+                        "timeout_seconds": {
+                            "type": "number",
+                            "description": "Stop after this many seconds and "
+                            "return partial results (optional)",
+                        },
                     },
                     "required": ["query_id"],
                 },
@@ -241,6 +294,11 @@ class McpServerHandler:
                             "description": "Maximum number of results to return",
                             "default": 10,
                         },
+                        "timeout_seconds": {
+                            "type": "number",
+                            "description": "Stop after this many seconds and "
+                            "return partial results (optional)",
+                        },
                     },
                     "required": ["query"],
                 },
@@ -252,6 +310,7 @@ class McpServerHandler:
 def create_mcp_server(
     query_repository: Optional["InMemoryResearchQueryRepository"] = None,
     result_repository: Optional["InMemoryResearchResultRepository"] = None,
+    container: Optional[ApplicationContainer] = None,
 ) -> McpServerHandler:
     """
     Factory function to create and configure the MCP server.
@@ -262,7 +321,13 @@ def create_mcp_server(
     Args:
         query_repository: Optional shared query repository instance
         result_repository: Optional shared result repository instance
+        container: Optional shared service graph; without it (or
+            repositories) the process-wide container is used
     """
+    if container is None and query_repository is None and result_repository is None:
+        container = get_application_container()
     return McpServerHandler(
-        query_repository=query_repository, result_repository=result_repository
+        query_repository=query_repository,
+        result_repository=result_repository,
+        container=container,
     )
@@ -0,0 +1,466 @@
+"""
+MCP Transport - JSON-RPC 2.0 sessions over stdio and WebSocket
+
+Speaks the Model Context Protocol wire format for McpServerHandler:
+
+- stdio: one JSON-RPC message per line on stdin/stdout (logs go to stderr),
+  started with ``python -m src --transport stdio``
+- WebSocket: one JSON-RPC message per text frame, at ``/mcp`` on the HTTP
+  server (see http_server.py)
+
+Every ``tools/call`` runs as its own task, so a slow research call never
+holds up the calls behind it (no head-of-line blocking). Responses are
+written as calls finish and are matched to requests by their JSON-RPC id.
+
+- At most ``max_in_flight`` tool calls run at once and up to ``max_queued``
+  more wait for a slot. When both are full the session stops reading, so
+  the pipe or socket buffer fills and the client is slowed down
+  (backpressure) instead of the server queueing unbounded work.
+- ``notifications/cancelled`` cancels the named call: a queued call is
+  dropped and a running one has its CancellationToken cancelled, so the
+  research stops at its next checkpoint. As the protocol requires, no
+  response is sent for a cancelled call.
+- A batch (a JSON array of messages) is answered with one array holding
+  the responses to its requests, written once every call in it has
+  finished; a batch of notifications only gets no response at all.
+- A call whose request carries ``_meta.progressToken`` gets a
+  ``notifications/progress`` message as each research step finishes (the
+  analysis, every source's search and scoring, the final ranking), so
+  clients see the run advance and do not time out during long searches.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from ..application.research_pipeline import PipelineProgress, ProgressCallback
+from ..core.cancellation import CancellationToken
+from .mcp_server import McpServerHandler, create_mcp_server
+from .serialization import dumps, dumps_text, loads
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = "2024-11-05"
+SERVER_INFO = {"name": "ai-deep-research-mcp", "version": "1.0.0"}
+
+DEFAULT_MAX_IN_FLIGHT = 8
+DEFAULT_MAX_QUEUED = 32
+
+# Largest stdio message accepted (tool results can carry many sources)
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+Message = Dict[str, Any]
+# One message, or the array of responses to a batch
+Outgoing = Union[Message, List[Message]]
+Send = Callable[[Outgoing], Awaitable[None]]
+# Where a single response goes: the transport, or a batch being collected
+Respond = Callable[[Message], Awaitable[None]]
+
+
+def valid_id(request_id: Any) -> bool:
+    """Whether ``request_id`` is a usable JSON-RPC id: a string, integer or null."""
+    return request_id is None or (
+        isinstance(request_id, (str, int)) and not isinstance(request_id, bool)
+    )
+
+
+def encode_message(message: Outgoing) -> str:
+    """Compact single-line JSON, as both transports frame it."""
+    return dumps_text(message)
+
+
+class McpSession:
+    """
+    One client connection: dispatches JSON-RPC messages to the handler.
+
+    Args:
+        handler: MCP tool implementation
+        send: Writes one message to the client
+        max_in_flight: Tool calls allowed to run at the same time
+        max_queued: Further tool calls allowed to wait for a slot before
+            the session stops reading
+    """
+
+    def __init__(
+        self,
+        handler: McpServerHandler,
+        send: Send,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+    ):
+        self.handler = handler
+        self._send = send
+        self._send_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._admission = asyncio.Semaphore(max_in_flight + max_queued)
+        self._calls: Dict[Any, Tuple[asyncio.Task, CancellationToken]] = {}
+        self._running: Set[Any] = set()
+        self._batches: Set[asyncio.Task] = set()
+
+    @property
+    def in_flight(self) -> int:
+        """Tool calls running or waiting for a slot."""
+        return len(self._calls)
+
+    async def receive(self, raw: Union[str, bytes]) -> None:
+        """
+        Handle one framed message (or batch).
+
+        Returns once the message is dispatched; for ``tools/call`` that is
+        when the call has been admitted, not when it finishes.
+        """
+        try:
+            message = loads(raw)
+        except ValueError:
+            await self._error(None, PARSE_ERROR, "Parse error")
+            return
+        if not isinstance(message, list):
+            await self.dispatch(message)
+            return
+        if not message:
+            await self._error(None, INVALID_REQUEST, "Invalid Request")
+            return
+
+        responses: List[Message] = []
+
+        async def collect(response: Message) -> None:
+            responses.append(response)
+
+        calls = [
+            call
+            for call in [await self.dispatch(item, collect) for item in message]
+            if call is not None
+        ]
+        if not calls:
+            if responses:
+                await self._write(responses)
+            return
+        batch = asyncio.create_task(self._send_batch(responses, calls))
+        self._batches.add(batch)
+        batch.add_done_callback(self._batches.discard)
+
+    async def dispatch(
+        self, message: Any, respond: Optional[Respond] = None
+    ) -> Optional[asyncio.Task]:
+        """
+        Handle one decoded JSON-RPC message.
+
+        Args:
+            respond: Receives the response (by default it is written to the
+                client); a batch collects its responses this way
+
+        Returns:
+            The task answering a ``tools/call``, None for other messages
+        """
+        if not isinstance(message, dict):
+            await self._error(None, INVALID_REQUEST, "Invalid Request", respond)
+            return None
+        if "method" not in message and ("result" in message or "error" in message):
+            # A reply to a server request; this server sends none
+            return None
+        request_id = message.get("id")
+        if not valid_id(request_id):
+            await self._error(None, INVALID_REQUEST, "Invalid Request", respond)
+            return None
+        method = message.get("method")
+        params = message.get("params")
+        if message.get("jsonrpc") != "2.0" or not isinstance(method, str):
+            await self._error(request_id, INVALID_REQUEST, "Invalid Request", respond)
+            return None
+        if params is None:
+            params = {}
+        elif not isinstance(params, dict):
+            # Every MCP method takes named params
+            if "id" in message:
+                await self._error(request_id, INVALID_PARAMS, "Invalid params", respond)
+            return None
+
+        if "id" not in message:
+            self._notification(method, params)
+        elif method == "tools/call":
+            return await self._start_call(request_id, params, respond)
+        elif method == "initialize":
+            await self._result(
+                request_id,
+                {
+                    "protocolVersion": PROTOCOL_VERSION,
+                    "capabilities": {"tools": {}},
+                    "serverInfo": SERVER_INFO,
+                },
+                respond,
+            )
+        elif method == "ping":
+            await self._result(request_id, {}, respond)
+        elif method == "tools/list":
+            await self._result(
+                request_id, {"tools": self.handler.get_tool_definitions()}, respond
+            )
+        else:
+            await self._error(
+                request_id, METHOD_NOT_FOUND, f"Method not found: {method}", respond
+            )
+        return None
+
+    def cancel(self, request_id: Any, reason: str = "cancelled") -> bool:
+        """
+        Cancel a tool call by request id.
+
+        Returns:
+            False if no such call is queued or running
+        """
+        call = self._calls.get(request_id) if valid_id(request_id) else None
+        if call is None:
+            return False
+        task, token = call
+        token.cancel(reason)
+        if request_id not in self._running:
+            task.cancel()
+        return True
+
+    async def join(self) -> None:
+        """Wait for every admitted tool call (and batch response) to finish."""
+        while self._calls or self._batches:
+            await asyncio.gather(
+                *(task for task, _ in list(self._calls.values())),
+                *list(self._batches),
+                return_exceptions=True,
+            )
+
+    async def close(self) -> None:
+        """Cancel outstanding calls (the client has gone) and wait for them."""
+        for request_id in list(self._calls):
+            self.cancel(request_id, "session closed")
+        await self.join()
+
+    def _notification(self, method: str, params: Dict[str, Any]) -> None:
+        if method == "notifications/cancelled":
+            self.cancel(
+                params.get("requestId"), params.get("reason") or "cancelled by client"
+            )
+        # notifications/initialized and unknown notifications need no reply
+
+    async def _start_call(
+        self, request_id: Any, params: Dict[str, Any], respond: Optional[Respond]
+    ) -> Optional[asyncio.Task]:
+        if request_id in self._calls:
+            await self._error(
+                request_id,
+                INVALID_REQUEST,
+                f"Request id already in use: {request_id}",
+                respond,
+            )
+            return None
+        # Blocks the reader once max_in_flight + max_queued calls are admitted
+        await self._admission.acquire()
+        token = CancellationToken()
+        task = asyncio.create_task(self._run_call(request_id, params, token, respond))
+        # A done callback (not ``finally``) also covers calls cancelled
+        # before they ever started running
+        task.add_done_callback(lambda _: self._finished(request_id))
+        self._calls[request_id] = (task, token)
+        return task
+
+    def _finished(self, request_id: Any) -> None:
+        self._calls.pop(request_id, None)
+        self._running.discard(request_id)
+        self._admission.release()
+
+    async def _run_call(
+        self,
+        request_id: Any,
+        params: Dict[str, Any],
+        token: CancellationToken,
+        respond: Optional[Respond] = None,
+    ) -> None:
+        try:
+            async with self._slots:
+                self._running.add(request_id)
+                outcome = await self._call_tool(params, token)
+            if token.is_cancelled:
+                return
+            if isinstance(outcome, tuple):
+                await self._error(request_id, *outcome, respond)
+            else:
+                await self._result(request_id, outcome, respond)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"MCP tool call {request_id} failed: {e}")
+            await self._error(request_id, INTERNAL_ERROR, str(e), respond)
+
+    async def _call_tool(
+        self, params: Dict[str, Any], token: CancellationToken
+    ) -> Union[Message, Tuple[int, str]]:
+        """Return the call's result, or the code and message of a protocol error."""
+        name = params.get("name")
+        arguments = params.get("arguments") or {}
+        tools = {tool["name"] for tool in self.handler.get_tool_definitions()}
+        if (
+            not isinstance(name, str)
+            or name not in tools
+            or not isinstance(arguments, dict)
+        ):
+            return INVALID_PARAMS, f"Unknown tool or bad arguments: {name}"
+
+        sent: List[asyncio.Task] = []
+        progress: Optional[ProgressCallback] = None
+        meta = params.get("_meta")
+        progress_token = meta.get("progressToken") if isinstance(meta, dict) else None
+        if progress_token is not None:
+
+            def report(update: PipelineProgress) -> None:
+                notification = {
+                    "jsonrpc": "2.0",
+                    "method": "notifications/progress",
+                    "params": {
+                        "progressToken": progress_token,
+                        "progress": update.completed,
+                        "total": update.total,
+                        "message": update.message,
+                    },
+                }
+                sent.append(asyncio.create_task(self._write(notification)))
+
+            progress = report
+
+        response = await self.handler.handle_tool_call(
+            name, arguments, cancel_token=token, progress=progress
+        )
+        # Every notification goes out before the response that ends the call
+        await asyncio.gather(*sent)
+        error = response.get("error")
+        if error is not None and error.get("code") == "INVALID_PARAMS":
+            return INVALID_PARAMS, error.get("message", "Invalid params")
+        if error is not None:
+            # Tool failures are results the model can read, not protocol errors
+            text = error.get("message", "Tool call failed")
+            return {"content": [{"type": "text", "text": text}], "isError": True}
+        return response
+
+    async def _send_batch(
+        self, responses: List[Message], calls: List[asyncio.Task]
+    ) -> None:
+        # Cancelled calls add no response; the rest are sent as one array
+        await asyncio.gather(*calls, return_exceptions=True)
+        if responses:
+            await self._write(responses)
+
+    async def _result(
+        self, request_id: Any, result: Message, respond: Optional[Respond] = None
+    ) -> None:
+        await (respond or self._write)(
+            {"jsonrpc": "2.0", "id": request_id, "result": result}
+        )
+
+    async def _error(
+        self,
+        request_id: Any,
+        code: int,
+        message: str,
+        respond: Optional[Respond] = None,
+    ) -> None:
+        await (respond or self._write)(
+            {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {"code": code, "message": message},
+            }
+        )
+
+    async def _write(self, message: Outgoing) -> None:
+        # One writer at a time so concurrent calls never interleave frames
+        async with self._send_lock:
+            await self._send(message)
+
+
+async def serve_lines(
+    handler: McpServerHandler,
+    reader: asyncio.StreamReader,
+    write: Callable[[bytes], Awaitable[None]],
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    max_queued: int = DEFAULT_MAX_QUEUED,
+) -> None:
+    """
+    Run a newline-delimited JSON-RPC session until ``reader`` reaches EOF
+    and every admitted call has answered.
+
+    Args:
+        write: Writes (and drains) one encoded line
+    """
+
+    async def send(message: Outgoing) -> None:
+        await write(dumps(message) + b"\n")
+
+    session = McpSession(handler, send, max_in_flight, max_queued)
+    try:
+        while line := await reader.readline():
+            if line.strip():
+                await session.receive(line)
+    except BaseException:
+        await session.close()
+        raise
+    # EOF: the client sent its last request; answer what is still running
+    await session.join()
+
+
+async def serve_stdio(
+    handler: Optional[McpServerHandler] = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    max_queued: int = DEFAULT_MAX_QUEUED,
+) -> None:
+    """Serve MCP on stdin/stdout until the client closes stdin."""
+    reader, write = await _stdio_streams()
+    logger.info("Serving MCP over stdio")
+    await serve_lines(
+        handler or create_mcp_server(), reader, write, max_in_flight, max_queued
+    )
+
+
+async def _stdio_streams() -> (
+    Tuple[asyncio.StreamReader, Callable[[bytes], Awaitable[None]]]
+):
+    """Non-blocking stdin/stdout; regular files fall back to blocking I/O."""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=MAX_MESSAGE_BYTES)
+    try:
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+        )
+    except ValueError:
+
+        def pump() -> None:
+            for line in sys.stdin.buffer:
+                loop.call_soon_threadsafe(reader.feed_data, line)
+            loop.call_soon_threadsafe(reader.feed_eof)
+
+        threading.Thread(target=pump, name="mcp-stdin", daemon=True).start()
+
+    try:
+        transport, protocol = await loop.connect_write_pipe(
+            asyncio.streams.FlowControlMixin, sys.stdout
+        )
+    except ValueError:
+
+        async def write(data: bytes) -> None:
+            sys.stdout.buffer.write(data)
+            sys.stdout.buffer.flush()
+
+        return reader, write
+
+    writer = asyncio.StreamWriter(transport, protocol, None, loop)
+
+    async def drain_write(data: bytes) -> None:
+        # drain() waits while the client is not reading (backpressure)
+        writer.write(data)
+        await writer.drain()
+
+    return reader, drain_write
@@ -0,0 +1,120 @@
+"""
+JSON Serialization
+
+One path from handler responses to response bytes, shared by the HTTP
+server, the SSE/NDJSON streams and the MCP transport.
+
+- ``dumps`` uses orjson when it is installed (several times faster than the
+  standard library on responses carrying many abstracts) and falls back to
+  ``json``; both produce the same compact UTF-8 JSON.
+- Values JSON has no type for (datetimes, enums, UUIDs, sets, dataclass
+  entities) are converted by an encoder chosen once per type and then
+  remembered, instead of a chain of isinstance checks per value.
+- ``source_summary`` and ``result_summary`` are the per-entity encoders for
+  research results, shared by every handler that lists sources.
+
+Educational Note:
+Serializing is like packing a suitcase. The first time you pack a new
+kind of item you work out how it folds; after that you just fold it the
+same way. And if you are sending the same suitcase again, you don't
+repack it - the response caches keep the packed bytes.
+"""
+
+import json
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+from datetime import time as time_of_day
+from enum import Enum
+from functools import lru_cache
+from operator import attrgetter, methodcaller
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional, Union
+
+from ..domain.entities import ResearchResult, ResearchSource
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+Encoder = Callable[[Any], Any]
+
+
+def _dataclass_encoder(cls: type) -> Encoder:
+    # Private fields (indexes, running totals) are skipped, as orjson does
+    names = tuple(field.name for field in fields(cls) if not field.name.startswith("_"))
+    return lambda obj: {name: getattr(obj, name) for name in names}
+
+
+@lru_cache(maxsize=None)
+def encoder_for(cls: type) -> Encoder:
+    """How to turn an instance of ``cls`` into something JSON can hold."""
+    if issubclass(cls, Enum):
+        return attrgetter("value")
+    if issubclass(cls, (datetime, date, time_of_day)):
+        return methodcaller("isoformat")
+    if issubclass(cls, (set, frozenset, tuple)):
+        return list
+    if is_dataclass(cls):
+        return _dataclass_encoder(cls)
+    # UUIDs, paths, decimals and anything else: their string form
+    return str
+
+
+def _default(obj: Any) -> Any:
+    cls: type = type(obj)
+    return encoder_for(cls)(obj)
+
+
+_json_encoder = json.JSONEncoder(
+    default=_default, ensure_ascii=False, separators=(",", ":")
+)
+
+
+def dumps(document: Any) -> bytes:
+    """Encode ``document`` as compact UTF-8 JSON."""
+    if orjson is not None:
+        body: bytes = orjson.dumps(
+            document, default=_default, option=orjson.OPT_NON_STR_KEYS
+        )
+        return body
+    return _json_encoder.encode(document).encode("utf-8")
+
+
+def dumps_text(document: Any) -> str:
+    """``dumps`` as a str, for text frames (SSE lines, WebSocket messages)."""
+    return dumps(document).decode("utf-8")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON; malformed input raises ValueError."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Per-entity encoders
+
+
+def source_summary(source: ResearchSource) -> Dict[str, Any]:
+    """A source as listed in research results."""
+    return {
+        "title": source.title,
+        "url": source.url,
+        "source_type": source.source_type.value,
+        "relevance_score": source.relevance_score,
+    }
+
+
+def result_summary(result: ResearchResult) -> Dict[str, Any]:
+    """A research result with its sources, as the web API returns it."""
+    return {
+        "query": result.query.text,
+        "status": result.status.value,
+        "sources": list(map(source_summary, result.sources)),
+        "synthesis": result.synthesis,
+        "created_at": result.created_at.isoformat(),
+    }
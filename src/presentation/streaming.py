@@ -0,0 +1,58 @@
+"""
+Streaming Response Framing
+
+Turns an async iterator of event dicts into the bytes of a streamed HTTP
+body, either as Server-Sent Events (``text/event-stream``, for browsers'
+EventSource and most HTTP clients) or as newline-delimited JSON
+(``application/x-ndjson``, one event per line, for scripts and pipelines).
+
+Each event is flushed as soon as it is produced, so a client sees the first
+source's results while slower sources are still being searched.
+"""
+
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Optional
+
+from .serialization import dumps, dumps_text
+
+SSE_MEDIA_TYPE = "text/event-stream"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Headers that stop proxies (nginx) and caches from buffering the stream
+STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def sse_frame(event: Dict[str, Any], event_id: Optional[int] = None) -> bytes:
+    """One Server-Sent Events frame; the ``event`` field names the SSE event."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if "event" in event:
+        lines.append(f"event: {event['event']}")
+    lines.append(f"data: {dumps_text(event)}")
+    return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+
+def ndjson_line(event: Dict[str, Any]) -> bytes:
+    """One NDJSON line."""
+    return dumps(event) + b"\n"
+
+
+def media_type_for(accept: Optional[str]) -> str:
+    """SSE if the client asks for it, NDJSON otherwise."""
+    return SSE_MEDIA_TYPE if accept and SSE_MEDIA_TYPE in accept else NDJSON_MEDIA_TYPE
+
+
+async def encode_events(
+    events: AsyncGenerator[Dict[str, Any], None], media_type: str
+) -> AsyncIterator[bytes]:
+    """Frame each event for ``media_type`` as it arrives."""
+    sse = media_type == SSE_MEDIA_TYPE
+    event_id = 0
+    try:
+        async for event in events:
+            event_id += 1
+            yield sse_frame(event, event_id) if sse else ndjson_line(event)
+    finally:
+        # A client disconnect closes this generator; pass that on so the
+        # research run is cancelled instead of finishing for nobody
+        await events.aclose()
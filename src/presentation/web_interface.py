@@ -31,30 +31,34 @@ This would integrate with frameworks like FastAPI, Flask, or similar.
 Enhanced with scholarly sources integration for academic research capabilities.
 """
 
+import asyncio
 import json
 import logging
-import uuid
 from dataclasses import asdict
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
-from ..application.scholarly_use_cases import (
-    EnhancedResearchOrchestrationService,
-    ScholarlyResearchUseCase,
-    ScholarlySearchRequest,
-)
+from ..application.citation_formats import default_citation_formats
+from ..application.container import ApplicationContainer, get_application_container
+from ..application.research_jobs import JobPriority
+from ..application.scholarly_use_cases import RESPONSE_FIELDS, ScholarlySearchRequest
 from ..application.use_cases import (
     CreateResearchQueryRequest,
-    CreateResearchQueryUseCase,
     ExecuteResearchRequest,
-    ExecuteResearchUseCase,
-    ResearchOrchestrationService,
+    GetResearchResultsRequest,
 )
-from ..infrastructure.repositories import (
-    InMemoryResearchQueryRepository,
-    InMemoryResearchResultRepository,
+from ..core.cancellation import CancellationToken, parse_timeout
+from ..domain.entities import (
+    InvalidQueryException,
+    ResearchCollection,
+    ResearchCollectionRepository,
+    ResearchStatus,
 )
 from ..infrastructure.scholarly_sources import UnifiedScholarlySearcher
+from .serialization import result_summary
+
+# Longest a job status request may long-poll, so a client cannot hold a
+# server connection open indefinitely
+MAX_JOB_WAIT_SECONDS = 30.0
 
 
 class WebInterfaceHandler:
@@ -84,32 +88,44 @@ class WebInterfaceHandler:
     This is the web presentation layer adapter.
     """
 
-    def __init__(self):
-        """Initialize web interface with dependency injection."""
+    def __init__(
+        self,
+        collection_repository: Optional[ResearchCollectionRepository] = None,
+        container: Optional[ApplicationContainer] = None,
+    ):
+        """
+        Initialize web interface with dependency injection.
+
+        Args:
+            collection_repository: Storage for research collections, e.g. a
+                SQLiteResearchCollectionRepository for an on-disk library
+                (in-memory by default); used when building a new container
+            container: Shared service graph (repositories, searchers,
+                caches and use cases); a private one is built if omitted
+        """
+        self.container = container or ApplicationContainer(
+            collection_repository=collection_repository
+        )
+
         # Infrastructure dependencies
-        self.query_repository = InMemoryResearchQueryRepository()
-        self.result_repository = InMemoryResearchResultRepository()
+        self.query_repository = self.container.query_repository
+        self.result_repository = self.container.result_repository
 
         # Application use cases
-        self.create_query_use_case = CreateResearchQueryUseCase(
-            query_repository=self.query_repository
-        )
-        self.execute_research_use_case = ExecuteResearchUseCase(
-            query_repository=self.query_repository,
-            result_repository=self.result_repository,
-        )
-        self.orchestration_service = ResearchOrchestrationService(
-            create_query_use_case=self.create_query_use_case,
-            execute_research_use_case=self.execute_research_use_case,
-        )
+        self.create_query_use_case = self.container.create_query_use_case
+        self.execute_research_use_case = self.container.execute_research_use_case
+        self.get_results_use_case = self.container.get_results_use_case
+        self.orchestration_service = self.container.orchestration_service
 
         # Scholarly research capabilities
-        self.scholarly_use_case = ScholarlyResearchUseCase(
-            self.query_repository, self.result_repository
-        )
-        self.enhanced_orchestration = EnhancedResearchOrchestrationService(
-            self.query_repository, self.result_repository, self.scholarly_use_case
-        )
+        self.scholarly_use_case = self.container.scholarly_use_case
+        self.enhanced_orchestration = self.container.enhanced_orchestration
+
+        # Persistent paper libraries
+        self.collection_service = self.container.collection_service
+
+        # Background execution for long research runs
+        self.job_queue = self.container.job_queue
 
         self.logger = logging.getLogger(__name__)
 
@@ -141,24 +157,9 @@ class WebInterfaceHandler:
                     "query_id": response.create_response.query_id,
                     "query_text": query_text,
                     "results_count": len(response.execute_response.results),
-                    "results": [
-                        {
-                            "query": result.query.text,
-                            "status": result.status.value,
-                            "sources": [
-                                {
-                                    "title": source.title,
-                                    "url": source.url,
-                                    "source_type": source.source_type.value,
-                                    "relevance_score": source.relevance_score,
-                                }
-                                for source in result.sources
-                            ],
-                            "synthesis": result.synthesis,
-                            "created_at": result.created_at.isoformat(),
-                        }
-                        for result in response.execute_response.results
-                    ],
+                    "results": list(
+                        map(result_summary, response.execute_response.results)
+                    ),
                 },
             }
 
@@ -203,33 +204,42 @@ class WebInterfaceHandler:
         """Handle execute research web request."""
         try:
             query_id = request_data.get("query_id", "")
+            cancel_token = self._cancel_token_from(request_data)
 
-            request = ExecuteResearchRequest(query_id=query_id)
-            response = await self.execute_research_use_case.execute(request)
+            response = await self.execute_research_use_case.execute(
+                ExecuteResearchRequest(query_id=query_id), cancel_token=cancel_token
+            )
 
             return {
                 "success": True,
                 "data": {
                     "query_id": query_id,
                     "results_count": len(response.results),
-                    "results": [
-                        {
-                            "query": result.query.text,
-                            "status": result.status.value,
-                            "sources": [
-                                {
-                                    "title": source.title,
-                                    "url": source.url,
-                                    "source_type": source.source_type.value,
-                                    "relevance_score": source.relevance_score,
-                                }
-                                for source in result.sources
-                            ],
-                            "synthesis": result.synthesis,
-                            "created_at": result.created_at.isoformat(),
-                        }
-                        for result in response.results
-                    ],
+                    "results": list(map(result_summary, response.results)),
+                },
+            }
+
+        except Exception as e:
+            return {
+                "success": False,
+                "error": {"message": str(e), "type": type(e).__name__},
+            }
+
+    async def handle_get_results_request(
+        self, request_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Handle a lookup of a query's stored results (read-only)."""
+        try:
+            response = await self.get_results_use_case.execute(
+                GetResearchResultsRequest(query_id=request_data.get("query_id", ""))
+            )
+
+            return {
+                "success": True,
+                "data": {
+                    "query_id": response.query_id,
+                    "results_count": len(response.results),
+                    "results": list(map(result_summary, response.results)),
                 },
             }
 
@@ -251,6 +261,7 @@ class WebInterfaceHandler:
             min_year = request_data.get("min_year")
             max_year = request_data.get("max_year")
             fields_of_study = request_data.get("fields_of_study", [])
+            fields = request_data.get("fields")
 
             request = ScholarlySearchRequest(
                 query_text=query_text,
@@ -260,6 +271,8 @@ class WebInterfaceHandler:
                 min_year=min_year,
                 max_year=max_year,
                 fields_of_study=fields_of_study,
+                fields=fields,
+                **self._text_options(request_data),
             )
 
             response = await self.scholarly_use_case.execute_scholarly_search(request)
@@ -271,6 +284,7 @@ class WebInterfaceHandler:
                     "papers": response.papers,
                     "total_found": response.total_found,
                     "sources_used": response.sources_used,
+                    "failed_sources": response.failed_sources,
                     "search_time_ms": response.search_time_ms,
                     "message": f"Found {response.total_found} academic papers",
                 },
@@ -292,6 +306,7 @@ class WebInterfaceHandler:
             sources = request_data.get("sources", [])
             max_results = request_data.get("max_results", 10)
             include_scholarly = request_data.get("include_scholarly", True)
+            cancel_token = self._cancel_token_from(request_data)
 
             # Create query first
             create_request = CreateResearchQueryRequest(
@@ -299,63 +314,391 @@ class WebInterfaceHandler:
             )
             create_response = await self.create_query_use_case.execute(create_request)
 
-            # Execute enhanced research
+            # Execute enhanced research (a timeout returns the partial result)
+            options: Dict[str, Any] = {"include_scholarly": include_scholarly}
+            if cancel_token is not None:
+                options["cancel_token"] = cancel_token
             result = await self.enhanced_orchestration.execute_enhanced_research(
-                create_response.query_id, include_scholarly=include_scholarly
+                create_response.query_id, **options
             )
 
-            # Format results for web display
-            formatted_sources = []
-            for source in result.sources:
-                source_data = {
-                    "title": source.title,
-                    "url": source.url,
-                    "source_type": source.source_type.value,
-                    "relevance_score": source.relevance_score,
-                    "content": (
-                        source.content[:500] + "..."
-                        if len(source.content) > 500
-                        else source.content
+            return {
+                "success": True,
+                "data": self._format_enhanced_result(
+                    result,
+                    create_response.query_id,
+                    include_scholarly,
+                    **self._text_options(request_data),
+                ),
+            }
+
+        except Exception as e:
+            self.logger.error(f"Enhanced research failed: {str(e)}")
+            return {
+                "success": False,
+                "error": {"message": str(e), "type": type(e).__name__},
+            }
+
+    async def handle_enhanced_research_stream(
+        self, request_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Start enhanced research and stream its progress.
+
+        Takes the same fields as ``handle_enhanced_research_request``. Instead
+        of one result, ``data["events"]`` is an async iterator of event dicts
+        an HTTP server can send as Server-Sent Events or NDJSON:
+
+        - ``started``: query ID and how many sources will be searched
+        - ``source``: one source finished; carries its new formatted sources
+        - ``completed``: the final summary (status, counts, message)
+        - ``error``: the run failed; no further events follow
+        """
+        try:
+            query_text = request_data.get("query", "")
+            sources = request_data.get("sources", [])
+            max_results = request_data.get("max_results", 10)
+            include_scholarly = request_data.get("include_scholarly", True)
+            cancel_token = self._cancel_token_from(request_data)
+
+            create_request = CreateResearchQueryRequest(
+                query_text=query_text, sources=sources, max_results=max_results
+            )
+            create_response = await self.create_query_use_case.execute(create_request)
+            query_id = create_response.query_id
+
+            return {
+                "success": True,
+                "data": {
+                    "query_id": query_id,
+                    "events": self._enhanced_research_events(
+                        query_id,
+                        include_scholarly,
+                        cancel_token,
+                        self._text_options(request_data),
                     ),
-                    "full_content": source.content,
+                },
+            }
+
+        except Exception as e:
+            self.logger.error(f"Enhanced research stream failed: {str(e)}")
+            return {
+                "success": False,
+                "error": {"message": str(e), "type": type(e).__name__},
+            }
+
+    async def _enhanced_research_events(
+        self,
+        query_id: str,
+        include_scholarly: bool,
+        cancel_token: Optional[CancellationToken],
+        text_options: Dict[str, bool],
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Format the orchestration service's progress events for the web."""
+        events = self.enhanced_orchestration.stream_enhanced_research(
+            query_id, include_scholarly=include_scholarly, cancel_token=cancel_token
+        )
+        try:
+            async for event in events:
+                if event.kind == "started":
+                    yield {
+                        "event": "started",
+                        "query_id": query_id,
+                        "sources_total": event.total,
+                    }
+                elif event.kind == "source":
+                    yield {
+                        "event": "source",
+                        "source": event.source,
+                        "completed": event.completed,
+                        "total": event.total,
+                        "error": event.error,
+                        "sources": [
+                            self._format_source(s, **text_options)
+                            for s in event.sources
+                        ],
+                    }
+                else:
+                    yield {
+                        "event": "completed",
+                        **self._format_summary(
+                            event.result, query_id, include_scholarly
+                        ),
+                    }
+        except Exception as e:
+            self.logger.error(f"Enhanced research stream failed: {str(e)}")
+            yield {
+                "event": "error",
+                "error": {"message": str(e), "type": type(e).__name__},
+            }
+        finally:
+            await events.aclose()
+
+    def _format_enhanced_result(
+        self,
+        result: Any,
+        query_id: str,
+        include_scholarly: bool,
+        compact: bool = False,
+        full_text: bool = False,
+    ) -> Dict[str, Any]:
+        """Format an enhanced research result for web display."""
+        formatted_sources = [
+            self._format_source(source, compact, full_text) for source in result.sources
+        ]
+        return {
+            **self._format_summary(result, query_id, include_scholarly),
+            "sources": formatted_sources,
+        }
+
+    def _format_source(
+        self, source: Any, compact: bool = False, full_text: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Format one research source for web display.
+
+        ``content`` is a 500-character preview unless ``full_text`` is set.
+        ``compact`` drops ``full_content`` (the preview's duplicate) and
+        metadata fields that have no value.
+        """
+        content = source.content
+        source_data = {
+            "title": source.title,
+            "url": source.url,
+            "source_type": source.source_type.value,
+            "relevance_score": source.relevance_score,
+            "content": (
+                content[:500] + "..."
+                if len(content) > 500 and not full_text
+                else content
+            ),
+        }
+        if not compact:
+            source_data["full_content"] = content
+
+        # Add scholarly metadata if available; the citation is only
+        # formatted here, when a client actually asks for this view
+        metadata = source.metadata
+        if metadata:
+            source_data.update(
+                {
+                    "authors": metadata.get("authors", source.authors),
+                    "year": metadata.get("year"),
+                    "citation_count": metadata.get(
+                        "citation_count", source.citation_count
+                    ),
+                    "venue": metadata.get("venue"),
+                    "pdf_url": metadata.get("pdf_url"),
+                    "doi": metadata.get("doi"),
+                    "formatted_citation": metadata.get("formatted_citation")
+                    or self.scholarly_use_case.format_source_citation(source),
+                }
+            )
+        if compact:
+            return {
+                name: value for name, value in source_data.items() if value is not None
+            }
+        return source_data
+
+    @staticmethod
+    def _format_summary(
+        result: Any, query_id: str, include_scholarly: bool
+    ) -> Dict[str, Any]:
+        """Everything about an enhanced result except its sources."""
+        sources_count = len(result.sources)
+        return {
+            "query_id": query_id,
+            "query": result.query.text,
+            "status": result.status.value,
+            "sources_count": sources_count,
+            "scholarly_sources_included": include_scholarly,
+            "completed_at": (
+                result.completed_at.isoformat() if result.completed_at else None
+            ),
+            "message": (
+                f"Research cancelled ({result.error_message}) with "
+                f"{sources_count} partial sources"
+                if result.status == ResearchStatus.CANCELLED
+                else f"Research completed with {sources_count} sources"
+            ),
+        }
+
+    @staticmethod
+    def _text_options(request_data: Dict[str, Any]) -> Dict[str, bool]:
+        """The opt-in ``compact`` and ``full_text`` response options."""
+        return {
+            "compact": bool(request_data.get("compact", False)),
+            "full_text": bool(request_data.get("full_text", False)),
+        }
+
+    @staticmethod
+    def _cancel_token_from(request_data: Dict[str, Any]) -> Optional[CancellationToken]:
+        """
+        Build a deadline token from an optional ``timeout_seconds`` field.
+
+        Raises:
+            InvalidTimeoutError: If ``timeout_seconds`` is not a positive
+                number (answered with HTTP 400)
+        """
+        timeout = parse_timeout(request_data.get("timeout_seconds"))
+        return None if timeout is None else CancellationToken(timeout=timeout)
+
+    async def handle_submit_research_job_request(
+        self, request_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Queue an enhanced research run and return its job ID immediately.
+
+        The caller polls ``handle_job_status_request`` (or subscribes to the
+        job queue) instead of holding the connection for the whole run. An
+        optional ``timeout_seconds`` bounds the job from submission onwards.
+        """
+        try:
+            query_text = request_data.get("query", "")
+            sources = request_data.get("sources", [])
+            max_results = request_data.get("max_results", 10)
+            include_scholarly = request_data.get("include_scholarly", True)
+            requester_id = request_data.get("requester_id") or "anonymous"
+            priority_name = str(request_data.get("priority", "normal")).upper()
+
+            if priority_name not in JobPriority.__members__:
+                return {
+                    "success": False,
+                    "error": {
+                        "message": f"Unknown priority: {priority_name.lower()}",
+                        "type": "ValidationError",
+                    },
                 }
 
-                # Add scholarly metadata if available
-                if source.metadata:
-                    source_data.update(
-                        {
-                            "authors": source.metadata.get("authors", []),
-                            "year": source.metadata.get("year"),
-                            "citation_count": source.metadata.get("citation_count", 0),
-                            "venue": source.metadata.get("venue"),
-                            "pdf_url": source.metadata.get("pdf_url"),
-                            "doi": source.metadata.get("doi"),
-                            "formatted_citation": source.metadata.get(
-                                "formatted_citation"
-                            ),
-                        }
-                    )
-
-                formatted_sources.append(source_data)
+            cancel_token = self._cancel_token_from(request_data) or CancellationToken()
+
+            create_request = CreateResearchQueryRequest(
+                query_text=query_text, sources=sources, max_results=max_results
+            )
+            create_response = await self.create_query_use_case.execute(create_request)
+            query_id = create_response.query_id
+
+            async def run_research() -> Dict[str, Any]:
+                result = await self.enhanced_orchestration.execute_enhanced_research(
+                    query_id,
+                    include_scholarly=include_scholarly,
+                    cancel_token=cancel_token,
+                )
+                return self._format_enhanced_result(result, query_id, include_scholarly)
+
+            job_id = self.job_queue.submit(
+                run_research,
+                requester_id=requester_id,
+                priority=JobPriority[priority_name],
+                description=query_text,
+                cancel_token=cancel_token,
+            )
 
             return {
                 "success": True,
                 "data": {
-                    "query_id": create_response.query_id,
-                    "query": result.query.text,
-                    "status": result.status.value,
-                    "sources": formatted_sources,
-                    "sources_count": len(formatted_sources),
-                    "scholarly_sources_included": include_scholarly,
-                    "completed_at": (
-                        result.completed_at.isoformat() if result.completed_at else None
-                    ),
-                    "message": f"Research completed with {len(formatted_sources)} sources",
+                    "job_id": job_id,
+                    "query_id": query_id,
+                    "status": ResearchStatus.PENDING.value,
+                    "status_url": f"/api/jobs/{job_id}",
                 },
+                "message": "Research job queued",
             }
 
         except Exception as e:
-            self.logger.error(f"Enhanced research failed: {str(e)}")
+            self.logger.error(f"Research job submission failed: {str(e)}")
+            return {
+                "success": False,
+                "error": {"message": str(e), "type": type(e).__name__},
+            }
+
+    async def handle_job_status_request(
+        self, request_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Report a research job's status, including its result once finished.
+
+        An optional ``wait`` (seconds, at most MAX_JOB_WAIT_SECONDS)
+        long-polls until the job finishes.
+        """
+        try:
+            try:
+                wait = float(request_data.get("wait") or 0)
+            except (TypeError, ValueError):
+                wait = -1.0
+            if not wait >= 0:  # Also rejects NaN
+                return {
+                    "success": False,
+                    "error": {
+                        "message": "wait must be a non-negative number of seconds",
+                        "type": "ValidationError",
+                    },
+                }
+            wait = min(wait, MAX_JOB_WAIT_SECONDS)
+
+            job_id = request_data.get("job_id", "")
+            job = self.job_queue.get(job_id)
+            if job is None:
+                return {
+                    "success": False,
+                    "error": {
+                        "message": f"Job not found: {job_id}",
+                        "type": "NotFoundError",
+                    },
+                }
+
+            if wait and not job.is_finished():
+                try:
+                    await self.job_queue.wait(job_id, timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+
+            data = job.to_dict()
+            if job.is_finished():
+                data["result"] = job.result
+
+            return {"success": True, "data": data}
+
+        except Exception as e:
+            self.logger.error(f"Job status lookup failed: {str(e)}")
+            return {
+                "success": False,
+                "error": {"message": str(e), "type": type(e).__name__},
+            }
+
+    async def handle_cancel_job_request(
+        self, request_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Cancel a research job.
+
+        Pending jobs never run; running jobs stop at their next checkpoint
+        and keep the partial result gathered so far.
+        """
+        try:
+            job_id = request_data.get("job_id", "")
+            job = self.job_queue.get(job_id)
+            if job is None:
+                return {
+                    "success": False,
+                    "error": {
+                        "message": f"Job not found: {job_id}",
+                        "type": "NotFoundError",
+                    },
+                }
+
+            cancelled = self.job_queue.cancel(job_id)
+
+            return {
+                "success": True,
+                "data": {**job.to_dict(), "cancel_requested": cancelled},
+                "message": (
+                    "Cancellation requested" if cancelled else "Job already finished"
+                ),
+            }
+
+        except Exception as e:
+            self.logger.error(f"Job cancellation failed: {str(e)}")
             return {
                 "success": False,
                 "error": {"message": str(e), "type": type(e).__name__},
@@ -386,20 +729,12 @@ class WebInterfaceHandler:
             # Use the scholarly research use case for citation export
             citations = self.scholarly_use_case.export_citations(papers, format_type)
 
-            # Set appropriate content type for download
-            content_types = {
-                "bibtex": "application/x-bibtex",
-                "ris": "application/x-research-info-systems",
-                "endnote": "application/x-endnote-refer",
-                "apa": "text/plain",
-            }
-
             return {
                 "success": True,
                 "data": {
                     "citations": citations,
                     "format": format_type,
-                    "content_type": content_types.get(format_type, "text/plain"),
+                    "content_type": default_citation_formats.content_type(format_type),
                     "filename": f"research_citations.{format_type}",
                     "count": len(papers),
                 },
@@ -413,6 +748,52 @@ class WebInterfaceHandler:
                 "error": {"message": str(e), "type": type(e).__name__},
             }
 
+    async def handle_citation_export_stream(
+        self, request_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Export citations as a stream for very large bibliographies.
+
+        Instead of one JSON string, ``data["body"]`` is an iterator of UTF-8
+        byte chunks that an HTTP server can send as a chunked download, so
+        memory stays flat no matter how many papers are exported. ``papers``
+        may be any iterable, including a generator over a collection.
+        """
+        try:
+            papers = request_data.get("papers")
+            format_type = request_data.get("format", "bibtex").lower()
+            chunk_size = int(request_data.get("chunk_size", 64 * 1024))
+
+            if papers is None:
+                return {
+                    "success": False,
+                    "error": {
+                        "message": "No papers provided for export",
+                        "type": "ValidationError",
+                    },
+                }
+
+            chunks = self.scholarly_use_case.iter_citation_chunks(
+                papers, format_type, chunk_size=chunk_size
+            )
+
+            return {
+                "success": True,
+                "data": {
+                    "body": (chunk.encode("utf-8") for chunk in chunks),
+                    "format": format_type,
+                    "content_type": default_citation_formats.content_type(format_type),
+                    "filename": f"research_citations.{format_type}",
+                },
+            }
+
+        except Exception as e:
+            self.logger.error(f"Citation export stream failed: {str(e)}")
+            return {
+                "success": False,
+                "error": {"message": str(e), "type": type(e).__name__},
+            }
+
     async def handle_advanced_search_request(
         self, request_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -442,6 +823,8 @@ class WebInterfaceHandler:
                 min_year=request_data.get("min_year"),
                 max_year=request_data.get("max_year"),
                 fields_of_study=request_data.get("fields_of_study", []),
+                fields=request_data.get("fields"),
+                **self._text_options(request_data),
             )
 
             # Execute advanced search
@@ -456,6 +839,7 @@ class WebInterfaceHandler:
                     "papers": response.papers,
                     "total_found": response.total_found,
                     "sources_used": response.sources_used,
+                    "failed_sources": response.failed_sources,
                     "search_time_ms": response.search_time_ms,
                     "filters_applied": {
                         "min_year": scholarly_request.min_year,
@@ -482,13 +866,20 @@ class WebInterfaceHandler:
 
         Researchers organize papers into collections for different projects.
         This enables saving, organizing, and managing research libraries.
+
+        Actions: create, get, list, delete, add_paper, add_papers,
+        remove_papers, contains, papers (paged listing) and export.
         """
         try:
             action = request_data.get("action", "create")
+            collection_id = request_data.get("collection_id", "")
+            service = self.collection_service
+            if not isinstance(collection_id, str):
+                raise InvalidQueryException("collection_id must be a string")
 
             if action == "create":
                 collection_name = request_data.get("name", "")
-                if not collection_name.strip():
+                if not isinstance(collection_name, str) or not collection_name.strip():
                     return {
                         "success": False,
                         "error": {
@@ -497,28 +888,47 @@ class WebInterfaceHandler:
                         },
                     }
 
-                collection_id = str(uuid.uuid4())
-                # In a real implementation, this would be stored in a database
-                collection = {
-                    "id": collection_id,
-                    "name": collection_name,
-                    "description": request_data.get("description", ""),
-                    "papers": [],
-                    "created_at": datetime.now().isoformat(),
-                    "updated_at": datetime.now().isoformat(),
+                collection = await service.create(
+                    collection_name, request_data.get("description", "")
+                )
+
+                return {
+                    "success": True,
+                    "data": self._format_collection(collection),
+                    "message": f"Research collection '{collection.name}' created successfully",
+                }
+
+            elif action == "get":
+                collection = await service.get(collection_id)
+                return {"success": True, "data": self._format_collection(collection)}
+
+            elif action == "list":
+                collections = await service.list_collections(
+                    limit=request_data.get("limit", 50),
+                    offset=request_data.get("offset", 0),
+                )
+                return {
+                    "success": True,
+                    "data": {
+                        "collections": [self._format_collection(c) for c in collections]
+                    },
                 }
 
+            elif action == "delete":
+                await service.delete(collection_id)
                 return {
                     "success": True,
-                    "data": collection,
-                    "message": f"Research collection '{collection_name}' created successfully",
+                    "data": {"collection_id": collection_id, "deleted": True},
                 }
 
-            elif action == "add_paper":
-                collection_id = request_data.get("collection_id")
-                paper = request_data.get("paper")
+            elif action in ("add_paper", "add_papers"):
+                papers = (
+                    [request_data["paper"]]
+                    if request_data.get("paper")
+                    else self._list_option(request_data, "papers")
+                )
 
-                if not collection_id or not paper:
+                if not collection_id or not papers:
                     return {
                         "success": False,
                         "error": {
@@ -527,11 +937,83 @@ class WebInterfaceHandler:
                         },
                     }
 
-                # In a real implementation, this would update the database
+                added = await service.add_papers(collection_id, papers)
+                collection = await service.get(collection_id)
+
+                return {
+                    "success": True,
+                    "data": {
+                        "collection_id": collection_id,
+                        "paper_added": added > 0,
+                        "added": added,
+                        "duplicates": len(papers) - added,
+                        "paper_count": collection.paper_count,
+                    },
+                    "message": f"Added {added} of {len(papers)} papers to collection",
+                }
+
+            elif action == "remove_papers":
+                removed = await service.remove_papers(
+                    collection_id,
+                    self._list_option(request_data, "keys")
+                    or self._list_option(request_data, "papers"),
+                )
                 return {
                     "success": True,
-                    "data": {"collection_id": collection_id, "paper_added": True},
-                    "message": "Paper added to collection successfully",
+                    "data": {"collection_id": collection_id, "removed": removed},
+                }
+
+            elif action == "contains":
+                paper = request_data.get("paper") or {}
+                return {
+                    "success": True,
+                    "data": {
+                        "collection_id": collection_id,
+                        "contains": await service.contains(collection_id, paper),
+                        "collections": await service.collections_for(paper),
+                    },
+                }
+
+            elif action == "papers":
+                limit = request_data.get("limit", 50)
+                offset = request_data.get("offset", 0)
+                papers = await service.list_papers(
+                    collection_id, limit=limit, offset=offset
+                )
+                collection = await service.get(collection_id)
+                return {
+                    "success": True,
+                    "data": {
+                        "collection_id": collection_id,
+                        "papers": papers,
+                        "total": collection.paper_count,
+                        "offset": offset,
+                        "limit": limit,
+                    },
+                }
+
+            elif action == "export":
+                format_type = request_data.get("format", "bibtex")
+                if not isinstance(format_type, str):
+                    raise InvalidQueryException("format must be a string")
+                format_type = format_type.lower()
+                collection = await service.get(collection_id)
+                # Rendering (and, on SQLite, paging through) a large library
+                # would otherwise hold up every other request on this worker
+                citations = await asyncio.to_thread(
+                    service.export, collection_id, format_type
+                )
+                return {
+                    "success": True,
+                    "data": {
+                        "citations": citations,
+                        "format": format_type,
+                        "content_type": default_citation_formats.content_type(
+                            format_type
+                        ),
+                        "filename": f"{collection.name}.{format_type}",
+                        "count": collection.paper_count,
+                    },
                 }
 
             else:
@@ -550,6 +1032,25 @@ class WebInterfaceHandler:
                 "error": {"message": str(e), "type": type(e).__name__},
             }
 
+    @staticmethod
+    def _list_option(request_data: Dict[str, Any], name: str) -> List[Any]:
+        """An optional list field (empty when missing)."""
+        value = request_data.get(name) or []
+        if not isinstance(value, list):
+            raise InvalidQueryException(f"{name} must be a list")
+        return value
+
+    @staticmethod
+    def _format_collection(collection: ResearchCollection) -> Dict[str, Any]:
+        return {
+            "id": collection.id,
+            "name": collection.name,
+            "description": collection.description,
+            "paper_count": collection.paper_count,
+            "created_at": collection.created_at.isoformat(),
+            "updated_at": collection.updated_at.isoformat(),
+        }
+
     def get_api_documentation(self) -> Dict[str, Any]:
         """
         Get API documentation for web interface.
@@ -641,7 +1142,10 @@ class WebInterfaceHandler:
                                 "application/json": {
                                     "schema": {
                                         "type": "object",
-                                        "properties": {"query_id": {"type": "string"}},
+                                        "properties": {
+                                            "query_id": {"type": "string"},
+                                            "timeout_seconds": {"type": "number"},
+                                        },
                                         "required": ["query_id"],
                                     }
                                 }
@@ -681,6 +1185,25 @@ class WebInterfaceHandler:
                                                 "type": "array",
                                                 "items": {"type": "string"},
                                             },
+                                            "fields": {
+                                                "type": "array",
+                                                "items": {
+                                                    "type": "string",
+                                                    "enum": list(RESPONSE_FIELDS),
+                                                },
+                                            },
+                                            "compact": {
+                                                "type": "boolean",
+                                                "default": False,
+                                                "description": "Drop duplicated "
+                                                "full-text fields and empty values",
+                                            },
+                                            "full_text": {
+                                                "type": "boolean",
+                                                "default": False,
+                                                "description": "Send untruncated "
+                                                "text in the preview field",
+                                            },
                                         },
                                         "required": ["query"],
                                     }
@@ -741,6 +1264,19 @@ class WebInterfaceHandler:
                                                 "type": "boolean",
                                                 "default": True,
                                             },
+                                            "timeout_seconds": {"type": "number"},
+                                            "compact": {
+                                                "type": "boolean",
+                                                "default": False,
+                                                "description": "Drop duplicated "
+                                                "full-text fields and empty values",
+                                            },
+                                            "full_text": {
+                                                "type": "boolean",
+                                                "default": False,
+                                                "description": "Send untruncated "
+                                                "text in the preview field",
+                                            },
                                         },
                                         "required": ["query"],
                                     }
@@ -776,6 +1312,140 @@ class WebInterfaceHandler:
                         },
                     }
                 },
+                "/api/jobs": {
+                    "post": {
+                        "summary": "Queue enhanced research as a background job",
+                        "requestBody": {
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "object",
+                                        "properties": {
+                                            "query": {"type": "string"},
+                                            "max_results": {"type": "integer"},
+                                            "include_scholarly": {"type": "boolean"},
+                                            "requester_id": {"type": "string"},
+                                            "timeout_seconds": {"type": "number"},
+                                            "priority": {
+                                                "type": "string",
+                                                "enum": ["high", "normal", "low"],
+                                                "default": "normal",
+                                            },
+                                        },
+                                        "required": ["query"],
+                                    }
+                                }
+                            }
+                        },
+                    }
+                },
+                "/api/results/{query_id}": {
+                    "get": {
+                        "summary": "Get the stored results of a query",
+                        "description": (
+                            "Cacheable: responses carry a strong ETag and "
+                            "Cache-Control; send If-None-Match to get a 304 "
+                            "when the results have not changed"
+                        ),
+                        "parameters": [
+                            {"name": "query_id", "in": "path", "required": True},
+                        ],
+                    },
+                },
+                "/api/jobs/{job_id}": {
+                    "get": {
+                        "summary": "Get research job status and result",
+                        "parameters": [
+                            {"name": "job_id", "in": "path", "required": True},
+                            {"name": "wait", "in": "query", "required": False},
+                        ],
+                    },
+                    "delete": {
+                        "summary": "Cancel a research job",
+                        "parameters": [
+                            {"name": "job_id", "in": "path", "required": True},
+                        ],
+                    },
+                },
+                "/api/collections": {
+                    "post": {
+                        "summary": "Manage persistent research paper collections",
+                        "requestBody": {
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "object",
+                                        "properties": {
+                                            "action": {
+                                                "type": "string",
+                                                "enum": [
+                                                    "create",
+                                                    "get",
+                                                    "list",
+                                                    "delete",
+                                                    "add_paper",
+                                                    "add_papers",
+                                                    "remove_papers",
+                                                    "contains",
+                                                    "papers",
+                                                    "export",
+                                                ],
+                                            },
+                                            "collection_id": {"type": "string"},
+                                            "name": {"type": "string"},
+                                            "description": {"type": "string"},
+                                            "paper": {"type": "object"},
+                                            "papers": {"type": "array"},
+                                            "keys": {"type": "array"},
+                                            "limit": {"type": "integer"},
+                                            "offset": {"type": "integer"},
+                                            "format": {"type": "string"},
+                                        },
+                                    }
+                                }
+                            }
+                        },
+                    }
+                },
+                "/api/research/enhanced/stream": {
+                    "post": {
+                        "summary": "Enhanced research streamed as progress events",
+                        "description": (
+                            "Same body as /api/research/enhanced. Responds with "
+                            "Server-Sent Events when Accept includes "
+                            "text/event-stream, NDJSON otherwise: started, one "
+                            "source event per scholarly source, then completed."
+                        ),
+                    }
+                },
+                "/api/scholarly/advanced": {
+                    "post": {
+                        "summary": "Scholarly search with year, field and source filters",
+                        "description": (
+                            "Same body as /api/scholarly/search, including "
+                            "compact and full_text."
+                        ),
+                    }
+                },
+                "/api/citations/export": {
+                    "post": {
+                        "summary": "Download citations as a streamed file",
+                        "requestBody": {
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "object",
+                                        "properties": {
+                                            "papers": {"type": "array"},
+                                            "format": {"type": "string"},
+                                        },
+                                        "required": ["papers"],
+                                    }
+                                }
+                            }
+                        },
+                    }
+                },
             },
         }
 
@@ -1018,11 +1688,16 @@ class WebUIComponents:
 
 
 # Web Interface Factory
-def create_web_interface() -> WebInterfaceHandler:
+def create_web_interface(
+    container: Optional[ApplicationContainer] = None,
+) -> WebInterfaceHandler:
     """
     Factory function to create and configure web interface handler.
 
+    Args:
+        container: Shared service graph (the process-wide one by default)
+
     Returns:
         Configured web interface handler
     """
-    return WebInterfaceHandler()
+    return WebInterfaceHandler(container=container or get_application_container())
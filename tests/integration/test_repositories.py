@@ -16,6 +16,12 @@ from src.domain.entities import (
     ResearchResult,
     ResearchStatus,
 )
+from src.infrastructure.async_repositories import (
+    AsyncQueryRepositoryAdapter,
+    AsyncResultRepositoryAdapter,
+    as_async_query_repository,
+    as_async_result_repository,
+)
 from src.infrastructure.repositories import (
     InMemoryResearchQueryRepository,
     InMemoryResearchResultRepository,
@@ -385,3 +391,55 @@ class TestInMemoryResearchResultRepository:
         # Retrieve and verify
         found_results = repository.find_by_query_id(query_id)
         assert len(found_results) == 10
+
+
+class TestAsyncRepositoryAdapters:
+    """Test cases for the executor-backed async repository adapters."""
+
+    @pytest.fixture
+    def sample_query(self):
+        """Sample research query."""
+        return ResearchQuery(
+            id=QueryId(),
+            text="What is machine learning?",
+            query_type=ResearchQueryType.GENERAL,
+            created_at=datetime.now(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_query_adapter_round_trip(self, sample_query):
+        """Test that awaited saves are visible through the sync backend."""
+        backend = InMemoryResearchQueryRepository()
+        repository = as_async_query_repository(backend)
+
+        assert isinstance(repository, AsyncQueryRepositoryAdapter)
+        assert repository.backend is backend
+
+        await repository.save(sample_query)
+
+        assert backend.find_by_id(sample_query.id) == sample_query
+        assert await repository.find_by_id(sample_query.id) == sample_query
+
+    @pytest.mark.asyncio
+    async def test_result_adapter_concurrent_saves(self, sample_query):
+        """Test that concurrent awaited saves all land in the backend."""
+        import asyncio
+
+        backend = InMemoryResearchResultRepository()
+        repository = as_async_result_repository(backend)
+        results = [
+            ResearchResult(query=sample_query, status=ResearchStatus.COMPLETED)
+            for _ in range(20)
+        ]
+
+        await asyncio.gather(*(repository.save(result) for result in results))
+
+        assert isinstance(repository, AsyncResultRepositoryAdapter)
+        assert len(await repository.find_by_query_id(sample_query.id)) == 20
+        assert len(await repository.find_completed_results(limit=5)) == 5
+
+    def test_async_repository_is_not_wrapped_twice(self):
+        """Test that already-async repositories are returned unchanged."""
+        wrapped = as_async_query_repository(InMemoryResearchQueryRepository())
+
+        assert as_async_query_repository(wrapped) is wrapped
@@ -38,6 +38,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from src.core.cancellation import CancellationToken
 from src.infrastructure.scholarly_sources import (
     ArxivSearcher,
     GoogleScholarSearcher,
@@ -237,6 +238,27 @@ class TestUnifiedScholarlySearcher:
 
         assert isinstance(results, list)
 
+    def test_unified_search_stops_after_cancellation(self):
+        """Test that cancelled searches skip remaining sources but keep results"""
+        searcher = UnifiedScholarlySearcher()
+        token = CancellationToken()
+
+        def arxiv_search(query, max_results, cancel_token=None, failed_sources=None):
+            cancel_token.cancel("timed out")
+            return [{"title": "Partial arXiv Paper", "source_type": "arxiv"}]
+
+        searcher.arxiv_searcher.search = Mock(side_effect=arxiv_search)
+        searcher.semantic_scholar_searcher.search = Mock(return_value=[])
+
+        papers = searcher.search(
+            "neural networks",
+            sources=["arxiv", "semantic_scholar"],
+            cancel_token=token,
+        )
+
+        assert [paper["title"] for paper in papers] == ["Partial arXiv Paper"]
+        searcher.semantic_scholar_searcher.search.assert_not_called()
+
     def test_deduplicate_papers(self):
         """Test paper deduplication functionality"""
         searcher = UnifiedScholarlySearcher()
@@ -309,6 +331,29 @@ class TestPaperProcessor:
 
         assert content is None  # Should return None on error
 
+    @patch("requests.Session.get")
+    def test_download_pdf_stops_when_cancelled(self, mock_get):
+        """Test that a cancelled download closes the response between chunks"""
+        token = CancellationToken()
+
+        def chunks(chunk_size):
+            yield b"first chunk"
+            token.cancel()
+            yield b"second chunk"
+
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.iter_content.side_effect = chunks
+        mock_get.return_value = mock_response
+
+        processor = PaperProcessor()
+        content = processor.download_pdf(
+            "https://example.com/paper.pdf", cancel_token=token
+        )
+
+        assert content is None
+        mock_response.close.assert_called_once()
+
     def test_extract_text_from_pdf_placeholder(self):
         """Test PDF text extraction (placeholder implementation)"""
         processor = PaperProcessor()
@@ -2,7 +2,9 @@
 System Tests for Complete Application Workflows
 
 Tests the complete system integration from presentation layer
-through to infrastructure, verifying end-to-end functionality.
+through to infrastructure, verifying end-to-end functionality. The
+scholarly APIs are replaced by an offline searcher, so the research
+pipeline runs for real without network access.
 """
 
 import json
@@ -11,18 +13,41 @@ from unittest.mock import patch
 import pytest
 
 from src import create_app
+from src.application.container import ApplicationContainer
 from src.presentation.cli import ResearchCLI
 from src.presentation.mcp_server import create_mcp_server
 from src.presentation.web_interface import create_web_interface
 
 
+class OfflineSearcher:
+    """Scholarly searcher returning one canned paper per source."""
+
+    def search(self, query, max_results=10, sources=None, **kwargs):
+        return [
+            {
+                "title": f"{query} ({source})",
+                "abstract": f"A study of {query}.",
+                "authors": ["A. Author"],
+                "url": f"https://example.org/{source}/{abs(hash(query))}",
+                "source": source,
+            }
+            for source in sources or ["arxiv"]
+        ]
+
+
+@pytest.fixture
+def container():
+    """Service graph whose pipeline searches offline."""
+    return ApplicationContainer(scholarly_searcher=OfflineSearcher())
+
+
 class TestMCPServerIntegration:
     """Test complete MCP server integration."""
 
     @pytest.fixture
-    def mcp_server(self):
+    def mcp_server(self, container):
         """Create MCP server for testing."""
-        return create_mcp_server()
+        return create_mcp_server(container=container)
 
     @pytest.mark.asyncio
     async def test_create_research_query_tool(self, mcp_server):
@@ -60,6 +85,7 @@ class TestMCPServerIntegration:
         assert "Research Query: Machine learning applications" in content_text
         assert "Query ID:" in content_text
         assert "Results:" in content_text
+        assert "Sources: 2" in content_text
 
     @pytest.mark.asyncio
     async def test_execute_research_tool(self, mcp_server):
@@ -85,6 +111,7 @@ class TestMCPServerIntegration:
         assert "content" in execute_response
         execute_text = execute_response["content"][0]["text"]
         assert "Research executed successfully" in execute_text
+        assert "Sources found: 2" in execute_text
 
     @pytest.mark.asyncio
     async def test_unknown_tool_returns_error(self, mcp_server):
@@ -123,9 +150,9 @@ class TestCLIIntegration:
     """Test complete CLI integration."""
 
     @pytest.fixture
-    def cli(self):
+    def cli(self, container):
         """Create CLI for testing."""
-        return ResearchCLI()
+        return ResearchCLI(container=container)
 
     @pytest.mark.asyncio
     async def test_create_query_workflow(self, cli):
@@ -152,16 +179,17 @@ class TestCLIIntegration:
 
         assert "Starting research for: Climate change solutions" in captured.out
         assert "Query ID:" in captured.out
-        assert "Results Found:" in captured.out
+        assert "Results Found: 1" in captured.out
+        assert "Sources: 2" in captured.out
 
 
 class TestWebInterfaceIntegration:
     """Test complete web interface integration."""
 
     @pytest.fixture
-    def web_interface(self):
+    def web_interface(self, container):
         """Create web interface for testing."""
-        return create_web_interface()
+        return create_web_interface(container=container)
 
     @pytest.mark.asyncio
     async def test_handle_research_request(self, web_interface):
@@ -186,6 +214,7 @@ class TestWebInterfaceIntegration:
 
         assert data["query_text"] == "Renewable energy technologies"
         assert isinstance(data["results"], list)
+        assert len(data["results"][0]["sources"]) == 2
 
     @pytest.mark.asyncio
     async def test_handle_create_query_request(self, web_interface):
@@ -225,6 +254,7 @@ class TestWebInterfaceIntegration:
         assert "data" in execute_response
         assert "results" in execute_response["data"]
         assert "results_count" in execute_response["data"]
+        assert len(execute_response["data"]["results"][0]["sources"]) == 2
 
     @pytest.mark.asyncio
     async def test_invalid_request_returns_error(self, web_interface):
@@ -258,9 +288,9 @@ class TestApplicationFactoryIntegration:
     """Test main application factory and integration."""
 
     @pytest.mark.asyncio
-    async def test_create_app_factory(self):
+    async def test_create_app_factory(self, container):
         """Test that create_app factory works correctly."""
-        app = create_app()
+        app = create_app(container)
 
         # Verify app has all required components
         assert app.get_mcp_server() is not None
@@ -268,18 +298,18 @@ class TestApplicationFactoryIntegration:
         assert app.get_web_interface() is not None
 
     @pytest.mark.asyncio
-    async def test_application_health_check(self):
+    async def test_application_health_check(self, container):
         """Test application health check."""
-        app = create_app()
+        app = create_app(container)
 
         is_healthy = await app.health_check()
 
         assert is_healthy is True
 
     @pytest.mark.asyncio
-    async def test_cross_interface_consistency(self):
+    async def test_cross_interface_consistency(self, container):
         """Test that all interfaces work with the same underlying system."""
-        app = create_app()
+        app = create_app(container)
 
         # Create query through CLI
         cli = app.get_cli()
@@ -294,11 +324,12 @@ class TestApplicationFactoryIntegration:
         # Verify response
         assert "content" in response
         assert "Research executed successfully" in response["content"][0]["text"]
+        assert "Sources found: 2" in response["content"][0]["text"]
 
     @pytest.mark.asyncio
-    async def test_error_handling_consistency(self):
+    async def test_error_handling_consistency(self, container):
         """Test that error handling is consistent across interfaces."""
-        app = create_app()
+        app = create_app(container)
 
         # Test invalid query through different interfaces
         cli = app.get_cli()
@@ -0,0 +1,109 @@
+"""
+Unit Tests for the Application Container
+
+Tests that one container wires a single searcher, pipeline and cache set
+into every use case, and that adapters built from the same container (as
+AIDeepResearchMCP does) share them and the stored research.
+"""
+
+import pytest
+
+from src import AIDeepResearchMCP
+from src.application.container import (
+    ApplicationContainer,
+    get_application_container,
+)
+from src.application.research_pipeline import ResearchPipeline
+from src.infrastructure.collection_repositories import (
+    InMemoryResearchCollectionRepository,
+)
+from src.infrastructure.repositories import (
+    InMemoryResearchQueryRepository,
+    InMemoryResearchResultRepository,
+)
+from src.presentation.cli import ResearchCLI
+from src.presentation.mcp_server import McpServerHandler, create_mcp_server
+from src.presentation.web_interface import WebInterfaceHandler, create_web_interface
+
+
+class TestApplicationContainer:
+    """Test the shared service graph."""
+
+    def test_one_searcher_feeds_pipeline_and_scholarly_use_case(self):
+        """Test the searcher and its HTTP sessions are built once."""
+        container = ApplicationContainer()
+
+        assert all(
+            branch.searcher is container.scholarly_searcher
+            for branch in container.pipeline.searchers.values()
+        )
+        assert (
+            container.scholarly_use_case.scholarly_searcher
+            is container.scholarly_searcher
+        )
+        assert (
+            container.enhanced_orchestration.scholarly_use_case
+            is container.scholarly_use_case
+        )
+        assert container.collection_service.scholarly_use_case is (
+            container.scholarly_use_case
+        )
+
+    def test_process_wide_container_is_reused(self):
+        """Test the factories share the process-wide container."""
+        assert get_application_container() is get_application_container()
+        assert create_web_interface().container is get_application_container()
+        assert create_mcp_server().container is get_application_container()
+
+    @pytest.mark.asyncio
+    async def test_adapters_on_one_container_share_state(self):
+        """Test a query created through the CLI is executable over MCP."""
+        container = ApplicationContainer(pipeline=ResearchPipeline(searchers={}))
+        cli = ResearchCLI(container=container)
+        mcp = McpServerHandler(container=container)
+        web = WebInterfaceHandler(container=container)
+
+        query_id = await cli.create_query("Shared container query")
+        response = await mcp.handle_tool_call(
+            "execute_research", {"query_id": query_id}
+        )
+
+        assert "Research executed successfully" in response["content"][0]["text"]
+        assert web.execute_research_use_case is mcp.execute_research_use_case
+        assert web.scholarly_use_case is container.scholarly_use_case
+
+    def test_main_app_shares_one_container_across_adapters(self):
+        """Test the MCP server, CLI and web interface share one service graph."""
+        container = ApplicationContainer()
+        app = AIDeepResearchMCP(container)
+
+        assert app.get_mcp_server().container is container
+        assert app.get_cli().container is container
+        assert app.get_web_interface().container is container
+        assert app.get_web_interface().query_repository is app.query_repository
+
+    def test_private_containers_stay_isolated(self):
+        """Test handlers built without a container do not share state."""
+        first, second = WebInterfaceHandler(), WebInterfaceHandler()
+
+        assert first.container is not second.container
+        assert first.query_repository is not second.query_repository
+
+    def test_empty_injected_repositories_are_used(self):
+        """Test empty repositories passed in are kept, not replaced."""
+        queries = InMemoryResearchQueryRepository()
+        results = InMemoryResearchResultRepository()
+        collections = InMemoryResearchCollectionRepository()
+
+        container = ApplicationContainer(
+            query_repository=queries,
+            result_repository=results,
+            collection_repository=collections,
+        )
+        handler = McpServerHandler(query_repository=queries, result_repository=results)
+
+        assert container.query_repository is queries
+        assert container.result_repository is results
+        assert container.collection_service.repository is collections
+        assert handler.query_repository is queries
+        assert handler.result_repository is results
@@ -37,6 +37,7 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+from src.application.research_pipeline import ResearchPipeline
 from src.application.use_cases import (
     CreateResearchQueryRequest,
     CreateResearchQueryResponse,
@@ -44,9 +45,12 @@ from src.application.use_cases import (
     ExecuteResearchRequest,
     ExecuteResearchResponse,
     ExecuteResearchUseCase,
+    GetResearchResultsRequest,
+    GetResearchResultsUseCase,
     OrchestrationResponse,
     ResearchOrchestrationService,
 )
+from src.core.cancellation import CancellationToken
 from src.domain.entities import (
     DomainException,
     InvalidQueryException,
@@ -59,6 +63,10 @@ from src.domain.entities import (
     ResearchStatus,
     SourceType,
 )
+from src.infrastructure.repositories import (
+    InMemoryResearchQueryRepository,
+    InMemoryResearchResultRepository,
+)
 
 
 class TestCreateResearchQueryUseCase:
@@ -190,11 +198,28 @@ class TestExecuteResearchUseCase:
         return Mock()
 
     @pytest.fixture
-    def use_case(self, mock_query_repository, mock_result_repository):
+    def pipeline(self):
+        """Pipeline with an offline arXiv branch returning one paper."""
+        searcher = Mock()
+        searcher.search = AsyncMock(
+            return_value=[
+                {
+                    "title": "What is AI? A survey",
+                    "abstract": "An overview of artificial intelligence.",
+                    "url": "https://arxiv.org/abs/0000.00001",
+                    "source": "arxiv",
+                }
+            ]
+        )
+        return ResearchPipeline(searchers={SourceType.ARXIV: searcher})
+
+    @pytest.fixture
+    def use_case(self, mock_query_repository, mock_result_repository, pipeline):
         """Create use case with mock repositories."""
         return ExecuteResearchUseCase(
             query_repository=mock_query_repository,
             result_repository=mock_result_repository,
+            pipeline=pipeline,
         )
 
     @pytest.fixture
@@ -276,6 +301,70 @@ class TestExecuteResearchUseCase:
         # Verify repositories were called
         mock_query_repository.find_by_id.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_execute_research_cancelled_is_recorded(
+        self, use_case, mock_query_repository, mock_result_repository, sample_query
+    ):
+        """Test that a cancelled run is saved with status CANCELLED."""
+        # Arrange
+        request = ExecuteResearchRequest(query_id=str(sample_query.id.value))
+        mock_query_repository.find_by_id.return_value = sample_query
+        token = CancellationToken()
+        token.cancel("client disconnected")
+
+        # Act
+        response = await use_case.execute(request, cancel_token=token)
+
+        # Assert
+        result = response.results[0]
+        assert result.status == ResearchStatus.CANCELLED
+        assert result.error_message == "client disconnected"
+        mock_result_repository.save.assert_called_once_with(result)
+
+
+class TestGetResearchResultsUseCase:
+    """Test cases for GetResearchResultsUseCase."""
+
+    @pytest.fixture
+    def query_repository(self):
+        return InMemoryResearchQueryRepository()
+
+    @pytest.fixture
+    def result_repository(self):
+        return InMemoryResearchResultRepository()
+
+    @pytest.fixture
+    def use_case(self, query_repository, result_repository):
+        return GetResearchResultsUseCase(query_repository, result_repository)
+
+    @pytest.mark.asyncio
+    async def test_returns_stored_results(
+        self, use_case, query_repository, result_repository
+    ):
+        """Test a query's saved results are returned without re-running it."""
+        query = ResearchQuery(
+            id=QueryId(),
+            text="Graph neural networks",
+            query_type=ResearchQueryType.ACADEMIC,
+            created_at=datetime.now(),
+        )
+        query_repository.save(query)
+        result = ResearchResult(query=query, status=ResearchStatus.COMPLETED)
+        result_repository.save(result)
+
+        response = await use_case.execute(GetResearchResultsRequest(str(query.id)))
+
+        assert response.query_id == str(query.id)
+        assert response.results == [result]
+
+    @pytest.mark.asyncio
+    async def test_unknown_and_malformed_ids(self, use_case):
+        """Test missing queries and non-UUID IDs raise domain errors."""
+        with pytest.raises(QueryNotFoundError):
+            await use_case.execute(GetResearchResultsRequest(str(uuid.uuid4())))
+        with pytest.raises(InvalidQueryException):
+            await use_case.execute(GetResearchResultsRequest("not-a-uuid"))
+
 
 class TestResearchOrchestrationService:
     """Test cases for ResearchOrchestrationService."""
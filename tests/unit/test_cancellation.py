@@ -0,0 +1,261 @@
+"""
+Unit Tests for Cooperative Cancellation
+
+Tests the CancellationToken itself and how cancellation flows through the
+enhanced research use case and the background job queue: work stops at the
+next checkpoint, partial results are kept, and the status becomes CANCELLED.
+"""
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.research_jobs import ResearchJobQueue
+from src.application.scholarly_use_cases import (
+    EnhancedResearchOrchestrationService,
+    ScholarlyResearchUseCase,
+)
+from src.application.use_cases import (
+    CreateResearchQueryRequest,
+    CreateResearchQueryUseCase,
+)
+from src.core.cancellation import (
+    CancellationToken,
+    InvalidTimeoutError,
+    OperationCancelled,
+    parse_timeout,
+)
+from src.domain.entities import ResearchStatus
+from src.infrastructure.repositories import (
+    InMemoryResearchQueryRepository,
+    InMemoryResearchResultRepository,
+)
+from src.presentation.web_interface import WebInterfaceHandler
+
+
+class TestCancellationToken:
+    """Test cases for CancellationToken."""
+
+    def test_cancel_sets_reason_and_raises_at_checkpoint(self):
+        """Test that the first cancel wins and checkpoints raise."""
+        token = CancellationToken()
+        assert token.is_cancelled is False
+        token.raise_if_cancelled()  # no-op while active
+
+        token.cancel("client disconnected")
+        token.cancel("ignored")
+
+        assert token.is_cancelled is True
+        assert token.reason == "client disconnected"
+        with pytest.raises(OperationCancelled, match="client disconnected"):
+            token.raise_if_cancelled()
+
+    def test_callbacks_run_once_on_cancel(self):
+        """Test that callbacks fire on cancel and immediately when late."""
+        token = CancellationToken()
+        calls = []
+        unregister = token.add_callback(calls.append)
+        token.add_callback(lambda reason: 1 / 0)  # failing hooks are isolated
+
+        token.cancel("stop")
+        token.add_callback(calls.append)
+        unregister()
+
+        assert calls == ["stop", "stop"]
+
+    def test_deadline_times_out_and_caps_request_timeouts(self):
+        """Test that a timeout cancels the token and bounds HTTP timeouts."""
+        token = CancellationToken(timeout=0.05)
+        assert token.timeout_for(30) <= 0.05
+
+        time.sleep(0.06)
+
+        assert token.is_cancelled is True
+        assert token.reason == "timed out"
+        with pytest.raises(OperationCancelled):
+            token.timeout_for(30)
+
+    @pytest.mark.parametrize(
+        "value", ["5", True, 0, -1, float("nan"), float("inf"), [1]]
+    )
+    def test_parse_timeout_rejects_bad_values(self, value):
+        """Test timeouts must be positive, finite numbers."""
+        with pytest.raises(InvalidTimeoutError):
+            parse_timeout(value)
+
+    def test_parse_timeout(self):
+        """Test valid timeouts become floats and a missing one stays None."""
+        assert parse_timeout(None) is None
+        assert parse_timeout(2) == 2.0
+
+    def test_sleep_wakes_early_on_cancel(self):
+        """Test that polite waits end as soon as the token is cancelled."""
+        token = CancellationToken()
+        token.cancel()
+
+        started = time.monotonic()
+        assert token.sleep(5) is True
+        assert time.monotonic() - started < 1
+
+
+class TestEnhancedResearchCancellation:
+    """Test cancellation of execute_enhanced_research."""
+
+    @pytest.fixture
+    def repositories(self):
+        """Real in-memory repositories."""
+        return InMemoryResearchQueryRepository(), InMemoryResearchResultRepository()
+
+    async def _create_query(self, query_repository):
+        response = await CreateResearchQueryUseCase(query_repository).execute(
+            CreateResearchQueryRequest(
+                query_text="graph neural networks", max_results=5
+            )
+        )
+        return response.query_id
+
+    @pytest.mark.asyncio
+    async def test_partial_results_are_saved_as_cancelled(self, repositories):
+        """Test that papers found before cancellation are kept and saved."""
+        query_repository, result_repository = repositories
+        token = CancellationToken()
+
+        def search(**kwargs):
+            kwargs["cancel_token"].cancel("timed out")
+            return [
+                {
+                    "title": "Partial Paper",
+                    "authors": ["A. Author"],
+                    "abstract": "Found before the deadline",
+                    "source_url": "https://arxiv.org/abs/1",
+                    "source_type": "arxiv",
+                }
+            ]
+
+        searcher = Mock()
+        searcher.search = Mock(side_effect=search)
+        service = EnhancedResearchOrchestrationService(
+            query_repository,
+            result_repository,
+            ScholarlyResearchUseCase(query_repository, result_repository, searcher),
+        )
+        query_id = await self._create_query(query_repository)
+
+        result = await service.execute_enhanced_research(query_id, cancel_token=token)
+
+        assert result.status == ResearchStatus.CANCELLED
+        assert result.error_message == "timed out"
+        assert [source.title for source in result.sources] == ["Partial Paper"]
+        assert result_repository.find_by_query_id(result.query.id) == [result]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_before_start_skips_search(self, repositories):
+        """Test that an already-cancelled token never reaches upstream."""
+        query_repository, result_repository = repositories
+        searcher = Mock()
+        service = EnhancedResearchOrchestrationService(
+            query_repository,
+            result_repository,
+            ScholarlyResearchUseCase(query_repository, result_repository, searcher),
+        )
+        query_id = await self._create_query(query_repository)
+        token = CancellationToken()
+        token.cancel()
+
+        result = await service.execute_enhanced_research(query_id, cancel_token=token)
+
+        assert result.status == ResearchStatus.CANCELLED
+        searcher.search.assert_not_called()
+
+
+class TestJobCancellation:
+    """Test cancelling queued and running research jobs."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_pending_job_never_runs(self):
+        """Test that a pending job is cancelled without running."""
+        queue = ResearchJobQueue(max_workers=1)
+        gate = asyncio.Event()
+        ran = []
+
+        async def blocker():
+            await gate.wait()
+
+        async def work():
+            ran.append(True)
+
+        blocker_id = queue.submit(blocker)
+        await asyncio.sleep(0)
+        job_id = queue.submit(work)
+
+        assert queue.cancel(job_id) is True
+        gate.set()
+        await queue.wait(blocker_id, timeout=1)
+
+        job = queue.get(job_id)
+        assert job.status == ResearchStatus.CANCELLED
+        assert ran == []
+        assert queue.cancel(job_id) is False
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_job_keeps_partial_result(self):
+        """Test that a running job observes its token and ends CANCELLED."""
+        queue = ResearchJobQueue(max_workers=1)
+        started = asyncio.Event()
+        token = CancellationToken()
+
+        async def work():
+            gathered = []
+            started.set()
+            while not token.is_cancelled:
+                gathered.append(len(gathered))
+                await asyncio.sleep(0.001)
+            return gathered
+
+        job_id = queue.submit(work, cancel_token=token)
+        await started.wait()
+        await asyncio.sleep(0.01)
+        queue.cancel(job_id)
+
+        job = await queue.wait(job_id, timeout=1)
+        assert job.status == ResearchStatus.CANCELLED
+        assert job.error_message == "cancelled by requester"
+        assert job.result  # partial work is retained
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_web_cancel_endpoint(self):
+        """Test the web handler's cancel endpoint for unknown and known jobs."""
+        handler = WebInterfaceHandler()
+        gate = asyncio.Event()
+
+        async def work():
+            await gate.wait()
+
+        job_id = handler.job_queue.submit(work)
+        missing = await handler.handle_cancel_job_request({"job_id": "nope"})
+        cancelled = await handler.handle_cancel_job_request({"job_id": job_id})
+        gate.set()
+
+        assert missing["error"]["type"] == "NotFoundError"
+        assert cancelled["success"] is True
+        assert cancelled["data"]["cancel_requested"] is True
+        assert handler.job_queue.get(job_id).cancel_token.is_cancelled
+        await handler.job_queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_web_rejects_bad_timeouts(self):
+        """Test web handlers refuse a non-numeric or non-positive timeout."""
+        handler = WebInterfaceHandler()
+
+        for timeout in ["soon", 0, -5]:
+            response = await handler.handle_submit_research_job_request(
+                {"query": "graphs", "timeout_seconds": timeout}
+            )
+            assert response["success"] is False
+            assert response["error"]["type"] == "InvalidTimeoutError"
+        assert handler.job_queue.stats()["queued"] == 0
+        await handler.job_queue.shutdown()
@@ -0,0 +1,235 @@
+"""
+Unit Tests for the Citation Format Registry
+
+Tests template compilation, the built-in MLA/IEEE/Chicago styles, the export
+cache and how the scholarly use case and web export endpoint resolve formats
+via the registry.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.citation_formats import (
+    Always,
+    CitationExportCache,
+    CitationFormatRegistry,
+    Computed,
+    Each,
+    Field,
+    Text,
+    default_citation_formats,
+)
+from src.application.scholarly_use_cases import ScholarlyResearchUseCase
+from src.domain.entities import InvalidQueryException
+from src.presentation.web_interface import WebInterfaceHandler
+
+PAPERS = [
+    {
+        "title": "Attention Is All You Need",
+        "authors": ["Ashish Vaswani", "Noam Shazeer", "Niki Parmar"],
+        "year": 2017,
+        "venue": "NeurIPS",
+        "doi": "10.5555/3295222",
+    },
+    {
+        "title": "BERT",
+        "authors": ["Jacob Devlin"],
+        "year": 2019,
+        "source_url": "https://arxiv.org/abs/1810.04805",
+    },
+]
+
+
+class TestTemplateCompilation:
+    """Test compiling and rendering custom templates."""
+
+    def test_segments_render_in_order(self):
+        """Test literal, optional, defaulted and repeated segments."""
+        registry = CitationFormatRegistry()
+        compact = registry.register(
+            "Compact",
+            [
+                Text("<"),
+                Text("entry>"),
+                Always("title", " {}", default="?"),
+                Each("authors", " [{}]"),
+                Field("year", " ({})"),
+            ],
+            separator="\n",
+        )
+
+        assert registry.get("compact") is compact
+        assert len(compact.steps) == 4  # adjacent literals are merged
+        assert list(compact.render_many([{"authors": ["A", "B"]}, {"year": 1999}])) == [
+            "<entry> ? [A] [B]",
+            "\n<entry> ? (1999)",
+        ]
+
+    def test_unknown_format_has_plain_text_content_type(self):
+        """Test content type lookup for registered and unknown styles."""
+        assert default_citation_formats.content_type("BibTeX") == (
+            "application/x-bibtex"
+        )
+        assert default_citation_formats.content_type("harvard") == "text/plain"
+
+
+class TestBuiltInStyles:
+    """Test the MLA, IEEE and Chicago styles."""
+
+    def test_mla(self):
+        """Test MLA shortens three or more authors to 'et al'."""
+        assert list(default_citation_formats.get("mla").render_many(PAPERS)) == [
+            'Ashish Vaswani, et al. "Attention Is All You Need." '
+            "NeurIPS, 2017, https://doi.org/10.5555/3295222.",
+            '\n\nJacob Devlin. "BERT." 2019, https://arxiv.org/abs/1810.04805.',
+        ]
+
+    def test_ieee_numbers_entries(self):
+        """Test IEEE entries carry their bibliography position."""
+        assert list(default_citation_formats.get("ieee").render_many(PAPERS)) == [
+            "[1] Ashish Vaswani, Noam Shazeer, and Niki Parmar, "
+            '"Attention Is All You Need," NeurIPS, 2017, doi: 10.5555/3295222.',
+            '\n\n[2] Jacob Devlin, "BERT," 2019.',
+        ]
+
+    def test_chicago_author_date(self):
+        """Test Chicago author-date ordering and missing metadata defaults."""
+        chicago = default_citation_formats.get("chicago")
+
+        assert chicago.render(PAPERS[1]) == (
+            'Jacob Devlin. 2019. "BERT." https://arxiv.org/abs/1810.04805.'
+        )
+        assert chicago.render({}) == 'Unknown Author. n.d. "Untitled."'
+
+
+class TestCitationExportCache:
+    """Test whole-export and per-paper caching."""
+
+    @pytest.fixture
+    def counting_format(self):
+        """A style that records which papers it renders."""
+        rendered = []
+
+        def render(paper, number):
+            rendered.append(paper["title"])
+            return f"{number}. {paper['title']}"
+
+        registry = CitationFormatRegistry()
+        citation_format = registry.register(
+            "counting", [Computed(render)], separator="\n", positional=True
+        )
+        return citation_format, rendered
+
+    def test_repeat_export_is_a_single_lookup(self, counting_format):
+        """Test that an unchanged paper list is not re-rendered."""
+        citation_format, rendered = counting_format
+        cache = CitationExportCache()
+        papers = [{"title": f"Paper {i}"} for i in range(3)]
+
+        first = cache.export(papers, citation_format)
+        second = cache.export([dict(paper) for paper in papers], citation_format)
+
+        assert first == second == "1. Paper 0\n2. Paper 1\n3. Paper 2"
+        assert rendered == ["Paper 0", "Paper 1", "Paper 2"]
+        assert cache.export_hits == 1
+
+    def test_appending_a_paper_renders_only_that_paper(self, counting_format):
+        """Test that per-paper fragments are reused across exports."""
+        citation_format, rendered = counting_format
+        cache = CitationExportCache()
+        papers = [{"title": f"Paper {i}"} for i in range(3)]
+        cache.export(papers, citation_format)
+        rendered.clear()
+
+        text = cache.export(papers + [{"title": "Paper 3"}], citation_format)
+
+        assert text.endswith("\n4. Paper 3")
+        assert rendered == ["Paper 3"]
+
+    def test_positional_entries_rerender_when_moved(self, counting_format):
+        """Test that position-dependent styles never reuse a misnumbered entry."""
+        citation_format, rendered = counting_format
+        cache = CitationExportCache()
+        cache.export([{"title": "A"}, {"title": "B"}], citation_format)
+
+        text = cache.export([{"title": "B"}, {"title": "A"}], citation_format)
+
+        assert text == "1. B\n2. A"
+
+    def test_edited_paper_and_other_format_miss(self):
+        """Test that the fingerprint covers paper content and format."""
+        cache = CitationExportCache()
+        bibtex = default_citation_formats.get("bibtex")
+        ris = default_citation_formats.get("ris")
+
+        original = cache.export(PAPERS, bibtex)
+        edited = cache.export([{**PAPERS[0], "year": 2018}, PAPERS[1]], bibtex)
+        as_ris = cache.export(PAPERS, ris)
+
+        assert "year = {2018}" in edited and edited != original
+        assert as_ris.startswith("TY  - JOUR")
+        assert cache.export_hits == 0
+
+    def test_caches_are_bounded(self):
+        """Test that both LRU levels evict the oldest entries."""
+        cache = CitationExportCache(max_exports=1, max_fragments=2)
+        apa = default_citation_formats.get("apa")
+
+        cache.export(PAPERS, apa)
+        cache.export([{"title": "Third"}], apa)
+
+        assert len(cache._exports) == 1
+        assert len(cache._fragments) == 2
+
+
+class TestRegistryIntegration:
+    """Test export paths resolving styles through the registry."""
+
+    def test_use_case_exports_every_registered_style(self):
+        """Test export_citations accepts each default style."""
+        use_case = ScholarlyResearchUseCase(Mock(), Mock(), Mock())
+
+        for name in default_citation_formats.names():
+            assert use_case.export_citations(PAPERS, name.upper())
+
+        with pytest.raises(InvalidQueryException, match="harvard"):
+            use_case.export_citations(PAPERS, "harvard")
+
+    def test_custom_registry_is_used_by_the_use_case(self):
+        """Test that a use case can be given its own registry."""
+        registry = CitationFormatRegistry()
+        registry.register("titles", [Always("title", "{}\n")])
+        use_case = ScholarlyResearchUseCase(
+            Mock(), Mock(), Mock(), citation_formats=registry
+        )
+
+        assert use_case.export_citations(PAPERS, "titles") == (
+            "Attention Is All You Need\nBERT\n"
+        )
+
+    def test_use_case_export_matches_streaming_output(self):
+        """Test cached exports equal the uncached streaming path."""
+        use_case = ScholarlyResearchUseCase(Mock(), Mock(), Mock())
+
+        for name in default_citation_formats.names():
+            streamed = "".join(use_case.iter_citations(PAPERS, name))
+            assert use_case.export_citations(PAPERS, name) == streamed
+            assert use_case.export_citations(PAPERS, name) == streamed
+
+        assert use_case.export_cache.export_hits == len(
+            default_citation_formats.names()
+        )
+
+    @pytest.mark.asyncio
+    async def test_web_export_supports_new_styles(self):
+        """Test the export endpoint serves MLA as plain text."""
+        handler = WebInterfaceHandler()
+
+        response = await handler.handle_citation_export_request(
+            {"papers": PAPERS, "format": "MLA"}
+        )
+
+        assert response["success"] is True
+        assert response["data"]["content_type"] == "text/plain"
+        assert response["data"]["citations"].startswith("Ashish Vaswani, et al.")
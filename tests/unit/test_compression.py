@@ -0,0 +1,207 @@
+"""
+Unit Tests for Response Compression
+
+Tests Accept-Encoding negotiation and the ASGI middleware on small, large,
+streamed and already-encoded responses, plus the opt-in compact mode that
+trims duplicated text from research and search results.
+"""
+
+import json
+import zlib
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.container import ApplicationContainer
+from src.application.scholarly_use_cases import ScholarlyResearchUseCase
+from src.domain.entities import (
+    QueryId,
+    ResearchQuery,
+    ResearchQueryType,
+    ResearchResult,
+    ResearchSource,
+    ResearchStatus,
+    SourceType,
+)
+from src.presentation import compression
+from src.presentation.compression import CompressionMiddleware, choose_encoding
+from src.presentation.web_interface import WebInterfaceHandler
+
+LARGE = json.dumps([{"abstract": "Graph neural networks " * 20}] * 20).encode()
+
+
+def app_sending(*chunks, content_type=b"application/json", extra_headers=()):
+    """ASGI app answering with ``chunks`` as its body messages."""
+
+    async def app(scope, receive, send):
+        headers = [(b"content-type", content_type), *extra_headers]
+        if len(chunks) == 1:
+            headers.append((b"content-length", str(len(chunks[0])).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        for index, chunk in enumerate(chunks):
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": index < len(chunks) - 1,
+                }
+            )
+
+    return app
+
+
+async def call(app, accept_encoding="gzip, deflate"):
+    """Run one request; returns (headers dict, list of body chunks)."""
+    scope = {"type": "http", "headers": []}
+    if accept_encoding is not None:
+        scope["headers"].append((b"accept-encoding", accept_encoding.encode()))
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    await CompressionMiddleware(app)(scope, receive, send)
+    headers = {k.decode(): v.decode() for k, v in messages[0]["headers"]}
+    return headers, [m["body"] for m in messages[1:]]
+
+
+class TestNegotiation:
+    """Test choosing an encoding from Accept-Encoding."""
+
+    def test_quality_values_and_wildcards(self):
+        """Test q-values, q=0 refusals, wildcards and preference order."""
+        both = ("br", "gzip")
+
+        assert choose_encoding("gzip, deflate, br", both) == "br"
+        assert choose_encoding("gzip;q=1.0, br;q=0.5", both) == "gzip"
+        assert choose_encoding("br;q=0, *", both) == "gzip"
+        assert choose_encoding("identity", both) is None
+        assert choose_encoding(None, both) is None
+        assert choose_encoding("br", ("gzip",)) is None
+
+
+class TestCompressionMiddleware:
+    """Test the ASGI middleware."""
+
+    @pytest.mark.asyncio
+    async def test_large_body_is_gzipped(self, monkeypatch):
+        """Test a complete body is compressed with a correct length."""
+        monkeypatch.setattr(compression, "brotli", None)
+
+        headers, (body,) = await call(app_sending(LARGE))
+
+        assert headers["content-encoding"] == "gzip"
+        assert headers["vary"] == "Accept-Encoding"
+        assert int(headers["content-length"]) == len(body)
+        assert zlib.decompress(body, 31) == LARGE
+        assert len(body) < len(LARGE) / 5
+
+    @pytest.mark.asyncio
+    async def test_small_and_unaccepted_bodies_are_untouched(self):
+        """Test tiny bodies and clients without gzip get the plain body."""
+        small_headers, (small,) = await call(app_sending(b'{"ok":true}'))
+        plain_headers, (plain,) = await call(app_sending(LARGE), accept_encoding=None)
+
+        assert small == b'{"ok":true}' and "content-encoding" not in small_headers
+        assert plain == LARGE and "content-encoding" not in plain_headers
+
+    @pytest.mark.asyncio
+    async def test_binary_and_encoded_bodies_pass_through(self):
+        """Test non-text media types and pre-encoded bodies are left alone."""
+        _, (image,) = await call(app_sending(LARGE, content_type=b"image/png"))
+        headers, (encoded,) = await call(
+            app_sending(LARGE, extra_headers=[(b"content-encoding", b"identity")])
+        )
+
+        assert image == LARGE
+        assert encoded == LARGE and headers["content-encoding"] == "identity"
+
+    @pytest.mark.asyncio
+    async def test_streamed_chunks_are_flushed_as_they_arrive(self, monkeypatch):
+        """Test each streamed event can be decoded before the stream ends."""
+        monkeypatch.setattr(compression, "brotli", None)
+        events = [b'{"event":"started"}\n', b'{"event":"source"}\n', b""]
+
+        headers, chunks = await call(
+            app_sending(*events, content_type=b"application/x-ndjson")
+        )
+
+        assert "content-length" not in headers
+        decoder = zlib.decompressobj(31)
+        assert decoder.decompress(chunks[0]) == events[0]
+        assert decoder.decompress(chunks[1]) == events[1]
+        assert decoder.decompress(chunks[2]) == b"" and decoder.eof
+
+    @pytest.mark.asyncio
+    async def test_compressed_etag_names_its_coding(self, monkeypatch):
+        """Test the compressed representation gets its own strong ETag."""
+        monkeypatch.setattr(compression, "brotli", None)
+
+        headers, _ = await call(app_sending(LARGE, extra_headers=[(b"etag", b'"abc"')]))
+
+        assert headers["etag"] == '"abc-gzip"'
+
+    @pytest.mark.asyncio
+    async def test_brotli_when_installed(self):
+        """Test brotli is preferred when the package is available."""
+        brotli = pytest.importorskip("brotli")
+
+        headers, (body,) = await call(app_sending(LARGE), "gzip, br")
+
+        assert headers["content-encoding"] == "br"
+        assert brotli.decompress(body) == LARGE
+
+
+class TestCompactResponses:
+    """Test the opt-in compact mode."""
+
+    def test_enhanced_sources_drop_duplicated_text(self):
+        """Test compact sources carry the text once, full only on request."""
+        handler = WebInterfaceHandler(
+            container=ApplicationContainer(scholarly_searcher=Mock(), pipeline=Mock())
+        )
+        query = ResearchQuery(
+            id=QueryId(),
+            text="graphs",
+            query_type=ResearchQueryType.ACADEMIC,
+            created_at=datetime.now(),
+        )
+        result = ResearchResult(query=query, status=ResearchStatus.COMPLETED)
+        result.add_source(
+            ResearchSource(
+                url="https://arxiv.org/abs/1",
+                title="GNNs",
+                source_type=SourceType.ARXIV,
+                content="x" * 800,
+                metadata={"year": 2020, "venue": None},
+            )
+        )
+
+        (default,) = handler._format_enhanced_result(result, "q", True)["sources"]
+        (compact,) = handler._format_enhanced_result(result, "q", True, compact=True)[
+            "sources"
+        ]
+        (full,) = handler._format_enhanced_result(
+            result, "q", True, compact=True, full_text=True
+        )["sources"]
+
+        assert len(default["full_content"]) == 800
+        assert "full_content" not in compact and "venue" not in compact
+        assert len(compact["content"]) == 503 and compact["year"] == 2020
+        assert full["content"] == "x" * 800
+        assert len(json.dumps(compact)) < len(json.dumps(default)) / 2
+
+    def test_scholarly_papers_drop_full_abstract(self):
+        """Test compact papers keep one abstract field and no empty values."""
+        use_case = ScholarlyResearchUseCase(Mock(), Mock(), Mock())
+        paper = {"title": "GNNs", "abstract": "y" * 800, "doi": None}
+
+        compact = use_case._format_paper_for_response(paper, compact=True)
+        full = use_case._format_paper_for_response(paper, full_text=True)
+
+        assert "doi" not in compact and len(compact["abstract"]) == 503
+        assert full["abstract"] == "y" * 800
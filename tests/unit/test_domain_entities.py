@@ -298,6 +298,148 @@ class TestResearchResult:
         with pytest.raises(ValueError):
             result.add_source(source2)
 
+    def test_research_result_add_source_ignores_duplicate_urls(self):
+        """Test that sources with equivalent URLs are only added once."""
+        query = ResearchQuery(
+            id=QueryId(),
+            text="AI research",
+            query_type=ResearchQueryType.ACADEMIC,
+            created_at=datetime.now(),
+            max_sources=5,
+        )
+        result = ResearchResult(query=query)
+
+        result.add_source(ResearchSource(url="https://example.com/paper"))
+        result.add_source(ResearchSource(url="HTTPS://Example.com/paper/"))
+        result.add_source(ResearchSource(url="https://example.com/paper#abstract"))
+
+        assert len(result.sources) == 1
+        assert result.has_source_url("https://EXAMPLE.com/paper")
+
+    def test_research_result_add_sources_bulk(self):
+        """Test bulk adding dedupes against existing sources and the batch."""
+        query = ResearchQuery(
+            id=QueryId(),
+            text="AI research",
+            query_type=ResearchQueryType.ACADEMIC,
+            created_at=datetime.now(),
+            max_sources=4,
+        )
+        result = ResearchResult(query=query)
+        result.add_source(ResearchSource(url="https://example.com/1"))
+
+        added = result.add_sources(
+            [
+                ResearchSource(url="https://example.com/1"),
+                ResearchSource(url="https://example.com/2"),
+                ResearchSource(url="https://example.com/2/"),
+                ResearchSource(url="https://example.com/3"),
+            ]
+        )
+
+        assert added == 2
+        assert [s.url for s in result.sources] == [
+            "https://example.com/1",
+            "https://example.com/2",
+            "https://example.com/3",
+        ]
+
+    def test_research_result_add_sources_rejects_oversized_batch(self):
+        """Test that a batch exceeding max_sources is rejected as a whole."""
+        query = ResearchQuery(
+            id=QueryId(),
+            text="AI research",
+            query_type=ResearchQueryType.ACADEMIC,
+            created_at=datetime.now(),
+            max_sources=2,
+        )
+        result = ResearchResult(query=query)
+
+        with pytest.raises(ValueError):
+            result.add_sources(
+                [ResearchSource(url=f"https://example.com/{i}") for i in range(3)]
+            )
+
+        assert result.sources == []
+        assert not result.has_source_url("https://example.com/0")
+
+    def test_research_result_running_aggregates(self):
+        """Test that accessors reflect sources added one-by-one and in bulk."""
+        query = ResearchQuery(
+            id=QueryId(),
+            text="AI research",
+            query_type=ResearchQueryType.ACADEMIC,
+            created_at=datetime.now(),
+            max_sources=10,
+        )
+        result = ResearchResult(query=query)
+
+        result.add_source(
+            ResearchSource(
+                url="https://arxiv.org/abs/1",
+                source_type=SourceType.ARXIV,
+                relevance_score=0.9,
+                abstract="a" * 50,
+            )
+        )
+        result.add_sources(
+            [
+                ResearchSource(
+                    url="https://example.com/a",
+                    source_type=SourceType.WEB,
+                    relevance_score=0.5,
+                    content="a" * 100,
+                ),
+                ResearchSource(
+                    url="https://example.com/b",
+                    source_type=SourceType.WEB,
+                    relevance_score=0.1,
+                ),
+            ]
+        )
+
+        assert [s.url for s in result.get_academic_sources()] == [
+            "https://arxiv.org/abs/1"
+        ]
+        assert len(result.get_web_sources()) == 2
+        assert result.count_sources_by_type(SourceType.WEB) == 2
+        assert result.count_sources_by_type(SourceType.WIKIPEDIA) == 0
+        assert result.get_average_relevance_score() == pytest.approx(0.5)
+        assert result.has_sufficient_sources() is False
+
+        result.add_source(
+            ResearchSource(url="https://example.com/c", content="a" * 100)
+        )
+        assert result.has_sufficient_sources() is True
+
+    def test_research_result_aggregates_include_initial_sources(self):
+        """Test that sources passed to the constructor are aggregated too."""
+        query = ResearchQuery(
+            id=QueryId(),
+            text="AI research",
+            query_type=ResearchQueryType.ACADEMIC,
+            created_at=datetime.now(),
+        )
+        result = ResearchResult(
+            query=query,
+            sources=[
+                ResearchSource(
+                    url="https://arxiv.org/abs/2",
+                    source_type=SourceType.ARXIV,
+                    relevance_score=0.8,
+                )
+            ],
+        )
+
+        assert len(result.get_academic_sources()) == 1
+        assert result.get_average_relevance_score() == pytest.approx(0.8)
+        assert result.has_source_url("https://arxiv.org/abs/2")
+
+        result.get_academic_sources().clear()
+        result.get_web_sources().append(result.sources[0])
+        assert len(result.get_academic_sources()) == 1
+        assert result.get_web_sources() == []
+
     def test_research_result_mark_completed(self):
         """Test marking result as completed."""
         query = ResearchQuery(
@@ -354,6 +496,17 @@ class TestResearchSource:
         assert source.relevance_score == 0.95
         assert isinstance(source.id, UUID)
 
+    def test_research_source_is_slotted(self):
+        """Test sources keep no per-instance __dict__ and still work."""
+        source = ResearchSource(url="https://example.com", citation_count=3)
+
+        assert not hasattr(source, "__dict__")
+        assert source == ResearchSource(
+            id=source.id, url="https://example.com", citation_count=3
+        )
+        with pytest.raises(AttributeError):
+            source.unknown_field = 1
+
     def test_research_source_default_values(self):
         """Test research source with default values."""
         source = ResearchSource()
@@ -0,0 +1,132 @@
+"""
+Unit Tests for the Health Probes
+
+Tests that liveness and readiness report repository, cache, upstream and
+event loop state without storing anything, answer quickly, and that a
+lagging event loop makes the process unready.
+"""
+
+import asyncio
+import time
+from uuid import UUID
+
+import pytest
+
+from src.__main__ import create_app
+from src.application.container import ApplicationContainer
+from src.application.health import EventLoopLagMonitor, HealthService
+from src.application.use_cases import CreateResearchQueryRequest
+from src.domain.entities import QueryId, ResearchResult
+from src.infrastructure.response_cache import MemoryResponseCache
+from src.infrastructure.scholarly_sources import UpstreamStatus
+
+
+@pytest.fixture
+def container():
+    return ApplicationContainer()
+
+
+class TestHealthService:
+    """Test cases for HealthService."""
+
+    def test_liveness(self, container):
+        """Test liveness reports the process is up."""
+        report = container.health.liveness()
+
+        assert report["status"] == "alive"
+        assert report["uptime_seconds"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_probes_do_not_store_anything(self, container):
+        """Test repeated probes leave every repository the same size."""
+        app = create_app(container)
+        created = await container.create_query_use_case.execute(
+            CreateResearchQueryRequest(query_text="graph neural networks")
+        )
+        query = container.query_repository.find_by_id(QueryId(UUID(created.query_id)))
+        container.result_repository.save(ResearchResult(query=query))
+        before = container.health.readiness()["checks"]["repositories"]
+
+        for _ in range(100):
+            container.health.liveness()
+            container.health.readiness()
+            assert await app.health_check() is True
+
+        after = container.health.readiness()["checks"]["repositories"]
+        assert before == after == {"queries": 1, "results": 1, "collections": 0}
+
+    def test_readiness_reports(self, container):
+        """Test readiness reports caches, upstreams, jobs and the pipeline."""
+        hot = MemoryResponseCache()
+        hot.set("key", b"body")
+        report = container.health.readiness({"hot_responses": hot.stats})
+
+        checks = report["checks"]
+        assert report["status"] == "ready"
+        assert checks["caches"]["hot_responses"]["entries"] == 1
+        assert checks["caches"]["citations"]["exports"]["exports"] == 0
+        assert set(checks["upstreams"]) == {"arxiv", "semantic_scholar"}
+        assert checks["upstreams"]["arxiv"]["state"] == "healthy"
+        assert checks["jobs"]["queued"] == 0
+        assert isinstance(checks["pipeline"], dict)
+
+    def test_readiness_is_fast(self, container):
+        """Test a readiness report takes well under a millisecond."""
+        container.health.readiness()
+        started = time.perf_counter()
+        for _ in range(100):
+            container.health.readiness()
+
+        assert (time.perf_counter() - started) / 100 < 0.001
+
+    def test_upstream_failures_are_reported(self, container):
+        """Test a failing upstream shows up without making the process unready."""
+        upstream = container.scholarly_searcher.arxiv_searcher.upstream
+        for _ in range(upstream.down_after):
+            upstream.record_failure(ConnectionError("refused"))
+
+        report = container.health.readiness()
+
+        arxiv = report["checks"]["upstreams"]["arxiv"]
+        assert report["status"] == "ready"
+        assert arxiv["state"] == "down"
+        assert arxiv["last_error"] == "ConnectionError: refused"
+
+    @pytest.mark.asyncio
+    async def test_lagging_event_loop_is_not_ready(self, container):
+        """Test blocking the event loop makes readiness fail."""
+        health = HealthService(
+            container,
+            EventLoopLagMonitor(interval=0.05),
+            max_loop_lag_seconds=0.05,
+        )
+        health.loop_monitor.start()
+        await asyncio.sleep(0.01)
+        time.sleep(0.2)  # Block the loop
+        await asyncio.sleep(0.01)  # The monitor wakes late, then sleeps again
+
+        report = health.readiness()
+        await health.loop_monitor.stop()
+
+        assert report["status"] == "not_ready"
+        assert report["checks"]["event_loop"]["max_lag_ms"] >= 50
+        assert health.loop_monitor.running is False
+
+
+class TestUpstreamStatus:
+    """Test cases for UpstreamStatus."""
+
+    def test_state_transitions(self):
+        """Test healthy -> degraded -> down, and recovery on success."""
+        status = UpstreamStatus("arxiv", down_after=2)
+        assert status.state == "healthy"
+
+        status.record_failure(TimeoutError("slow"))
+        assert status.state == "degraded"
+        status.record_failure(TimeoutError("slow"))
+        assert status.state == "down"
+
+        status.record_success()
+        assert status.state == "healthy"
+        assert status.to_dict()["failures"] == 2
+        assert status.to_dict()["requests"] == 3
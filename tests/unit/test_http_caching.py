@@ -0,0 +1,54 @@
+"""
+Unit Tests for HTTP Caching
+
+Tests content-derived ETags, search tags that ignore per-run fields,
+If-None-Match matching (weak comparison, coding suffixes and wildcards)
+and the coding suffix compressed responses get.
+"""
+
+from src.presentation.http_caching import (
+    coded_etag,
+    matching_etag,
+    search_etag,
+    strong_etag,
+)
+
+
+class TestEtags:
+    """Test ETag derivation and matching."""
+
+    def test_strong_etag_follows_the_bytes(self):
+        """Test equal bodies share an ETag and different bodies do not."""
+        etag = strong_etag(b'{"success":true}')
+
+        assert etag == strong_etag(b'{"success":true}')
+        assert etag != strong_etag(b'{"success":false}')
+        assert etag.startswith('"') and not etag.startswith("W/")
+
+    def test_search_etag_ignores_per_run_fields(self):
+        """Test a search tag follows its request and papers, not its run."""
+        papers = [{"title": "Attention Is All You Need"}]
+        first = {"success": True, "data": {"query_id": "a", "papers": papers}}
+        rerun = {
+            "success": True,
+            "data": {"query_id": "b", "papers": papers, "search_time_ms": 12},
+        }
+        etag = search_etag("key", first)
+
+        assert etag == search_etag("key", rerun)
+        assert etag != search_etag("other", first)
+        assert etag != search_etag("key", {"success": True, "data": {"papers": []}})
+        assert etag.startswith('W/"')
+
+    def test_matching_uses_weak_comparison(self):
+        """Test weak, coded, listed and wildcard tags match."""
+        etag = strong_etag(b"body")
+        gzip_tag = coded_etag(etag, "gzip")
+
+        assert gzip_tag == etag[:-1] + '-gzip"'
+        assert matching_etag(etag, etag) == etag
+        assert matching_etag(f"W/{etag}", etag) == f"W/{etag}"
+        assert matching_etag(f'"other", {gzip_tag}', etag) == gzip_tag
+        assert matching_etag("*", etag) == etag
+        assert matching_etag('"other"', etag) is None
+        assert matching_etag(None, etag) is None
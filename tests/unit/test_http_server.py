@@ -0,0 +1,252 @@
+"""
+Unit Tests for the ASGI HTTP Server
+
+Tests routing to WebInterfaceHandler, status codes for handler errors, the
+shared response cache, conditional requests, streamed downloads and MCP
+over WebSocket. Skipped
+when the web server stack (fastapi and its test client) is not installed.
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.application.container import ApplicationContainer  # noqa: E402
+from src.infrastructure.response_cache import SQLiteResponseCache  # noqa: E402
+from src.presentation.http_server import (  # noqa: E402
+    create_app_from_env,
+    create_http_app,
+)
+from src.presentation.web_interface import WebInterfaceHandler  # noqa: E402
+
+
+class StubSearcher:
+    """Offline scholarly searcher that counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def search(self, query, max_results=10, **kwargs):
+        self.calls += 1
+        return [{"title": f"Paper about {query}", "authors": ["A. Author"]}]
+
+
+@pytest.fixture
+def searcher():
+    return StubSearcher()
+
+
+@pytest.fixture
+def client(searcher, tmp_path):
+    handler = WebInterfaceHandler(
+        container=ApplicationContainer(scholarly_searcher=searcher)
+    )
+    cache = SQLiteResponseCache(str(tmp_path / "cache.sqlite3"))
+    with TestClient(create_http_app(handler, cache)) as client:
+        yield client
+
+
+class TestHttpServer:
+    """Test the HTTP routes."""
+
+    def test_health_and_docs(self, client):
+        """Test the health probe and the handler's API description."""
+        assert client.get("/health").json() == {"status": "healthy"}
+        assert "/api/research" in client.get("/api/docs").json()["paths"]
+
+    def test_liveness_and_readiness_probes(self, client):
+        """Test the probes report state without storing anything."""
+        live = client.get("/health/live")
+        ready = client.get("/health/ready")
+        again = client.get("/health/ready").json()
+
+        assert live.json()["status"] == "alive"
+        assert live.headers["cache-control"] == "no-store"
+        assert ready.status_code == 200
+        checks = ready.json()["checks"]
+        assert checks["repositories"]["queries"] == 0
+        assert again["checks"]["repositories"]["queries"] == 0
+        assert checks["caches"]["responses"]["backend"] == "sqlite"
+        assert checks["event_loop"]["running"] is True
+
+    def test_create_query_then_missing_execute(self, client):
+        """Test JSON routes and 4xx statuses for handler errors."""
+        created = client.post("/api/query", json={"query": "Graph neural networks"})
+        empty = client.post("/api/query", json={"query": ""})
+        missing_job = client.get("/api/jobs/unknown")
+
+        assert created.status_code == 200
+        assert "query_id" in created.json()["data"]
+        assert empty.status_code == 400
+        assert missing_job.status_code == 404
+
+    def test_job_long_poll_rejects_negative_wait(self, client):
+        """Test a negative long-poll wait gets a 400."""
+        response = client.get("/api/jobs/unknown", params={"wait": -1})
+
+        assert response.status_code == 400
+
+    def test_bad_timeout_is_rejected(self, client):
+        """Test a non-numeric timeout gets a 400."""
+        response = client.post(
+            "/api/jobs", json={"query": "graphs", "timeout_seconds": "soon"}
+        )
+
+        assert response.status_code == 400
+
+    def test_malformed_body_is_rejected(self, client):
+        """Test non-object JSON bodies get a 400."""
+        response = client.post("/api/query", content=b"[1, 2]")
+
+        assert response.status_code == 400
+
+    def test_scholarly_search_uses_shared_cache(self, client, searcher):
+        """Test repeated searches are served from the response cache."""
+        body = {"query": "attention", "sources": ["arxiv"], "max_results": 1}
+
+        first = client.post("/api/scholarly/search", json=body)
+        second = client.post("/api/scholarly/search", json=body)
+
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.content == first.content
+        assert searcher.calls == 1
+
+    def test_search_with_failed_source_is_not_cached(self, client, searcher):
+        """Test a search missing a failed source is neither cached nor cacheable."""
+        body = {"query": "attention", "sources": ["arxiv"], "max_results": 1}
+
+        def failing_search(query, max_results=10, failed_sources=None, **kwargs):
+            searcher.calls += 1
+            failed_sources.append("arxiv")
+            return []
+
+        searcher.search = failing_search
+        first = client.post("/api/scholarly/search", json=body)
+        second = client.post("/api/scholarly/search", json=body)
+
+        assert first.json()["data"]["failed_sources"] == ["arxiv"]
+        assert second.headers["X-Cache"] == "MISS"
+        assert second.headers["Cache-Control"] == "no-store"
+        assert searcher.calls == 2
+
+    def test_scholarly_search_over_get_is_conditional(self, client, searcher):
+        """Test GET searches share the cache and revalidate with a 304."""
+        body = {"query": "attention", "sources": ["arxiv"], "max_results": 1}
+
+        posted = client.post("/api/scholarly/search", json=body)
+        fetched = client.get(
+            "/api/scholarly/search",
+            params={"query": "attention", "sources": "arxiv", "max_results": 1},
+        )
+        revalidated = client.get(
+            "/api/scholarly/search",
+            params={"query": "attention", "sources": "arxiv", "max_results": 1},
+            headers={"If-None-Match": fetched.headers["ETag"]},
+        )
+
+        assert fetched.headers["X-Cache"] == "HIT"
+        assert fetched.headers["ETag"] == posted.headers["ETag"]
+        assert fetched.headers["Cache-Control"].startswith("public")
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert searcher.calls == 1
+
+    def test_search_etag_survives_a_rerun(self, searcher):
+        """Test re-running a search for the same papers keeps its ETag."""
+        handler = WebInterfaceHandler(
+            container=ApplicationContainer(scholarly_searcher=searcher)
+        )
+        params = {"query": "attention", "sources": "arxiv", "max_results": 1}
+
+        with TestClient(create_http_app(handler, None)) as uncached:
+            first = uncached.get("/api/scholarly/search", params=params)
+            revalidated = uncached.get(
+                "/api/scholarly/search",
+                params=params,
+                headers={"If-None-Match": first.headers["ETag"]},
+            )
+
+        assert first.headers["ETag"].startswith("W/")
+        assert revalidated.status_code == 304
+        assert searcher.calls == 2
+
+    def test_results_lookup_by_query_id(self, client):
+        """Test stored results are cacheable and unknown queries are not."""
+        query_id = client.post("/api/research", json={"query": "attention"}).json()[
+            "data"
+        ]["query_id"]
+
+        results = client.get(f"/api/results/{query_id}")
+        revalidated = client.get(
+            f"/api/results/{query_id}",
+            headers={"If-None-Match": results.headers["ETag"]},
+        )
+        missing = client.get("/api/results/00000000-0000-0000-0000-000000000000")
+
+        assert results.status_code == 200
+        assert results.json()["data"]["results_count"] == 1
+        assert revalidated.status_code == 304
+        assert missing.status_code == 404
+        assert missing.headers["Cache-Control"] == "no-store"
+
+    def test_citation_export_streams_a_download(self, client):
+        """Test citations download with the format's content type."""
+        response = client.post(
+            "/api/citations/export",
+            json={"papers": [{"title": "A", "year": 2020}], "format": "ris"},
+        )
+
+        assert response.status_code == 200
+        assert "TY  - JOUR" in response.text
+        assert "research_citations.ris" in response.headers["Content-Disposition"]
+
+    def test_enhanced_research_streams_events(self, client):
+        """Test the stream route speaks SSE or NDJSON per the Accept header."""
+        body = {"query": "attention", "max_results": 2}
+
+        ndjson = client.post("/api/research/enhanced/stream", json=body)
+        sse = client.post(
+            "/api/research/enhanced/stream",
+            json=body,
+            headers={"Accept": "text/event-stream"},
+        )
+
+        assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in ndjson.text.splitlines()]
+        assert lines[0]["event"] == "started"
+        assert lines[-1]["event"] == "completed"
+        assert sse.headers["content-type"].startswith("text/event-stream")
+        assert sse.text.startswith("id: 1\nevent: started\n")
+
+    def test_mcp_over_websocket(self, client):
+        """Test MCP JSON-RPC requests are answered over the /mcp WebSocket."""
+        with client.websocket_connect("/mcp", subprotocols=["mcp"]) as websocket:
+            websocket.send_text(
+                json.dumps({"jsonrpc": "2.0", "id": 1, "method": "tools/list"})
+            )
+            response = json.loads(websocket.receive_text())
+
+        assert response["id"] == 1
+        assert "execute_research" in [t["name"] for t in response["result"]["tools"]]
+
+    def test_collections_persist_across_workers(self, monkeypatch, tmp_path):
+        """Test served apps keep collections on disk, shared by every worker."""
+        monkeypatch.setenv("RESEARCH_CACHE_PATH", "")
+        monkeypatch.setenv(
+            "RESEARCH_COLLECTIONS_PATH", str(tmp_path / "collections.sqlite3")
+        )
+
+        with TestClient(create_app_from_env()) as first:
+            created = first.post(
+                "/api/collections", json={"action": "create", "name": "Reading"}
+            ).json()["data"]
+        with TestClient(create_app_from_env()) as second:
+            listed = second.post("/api/collections", json={"action": "list"}).json()
+
+        assert [c["id"] for c in listed["data"]["collections"]] == [created["id"]]
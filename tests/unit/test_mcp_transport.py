@@ -0,0 +1,360 @@
+"""
+Unit Tests for the MCP JSON-RPC Transport
+
+Tests protocol requests, concurrent tool calls without head-of-line
+blocking, the in-flight cap and backpressure, cancellation notifications
+for queued and running calls, progress notifications, batches answered
+with one array, and newline framing for stdio.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from src.application.container import ApplicationContainer
+from src.application.research_pipeline import ResearchPipeline
+from src.domain.entities import ResearchStatus, SourceType
+from src.presentation.mcp_server import McpServerHandler
+from src.presentation.mcp_transport import (
+    INVALID_PARAMS,
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    McpSession,
+    serve_lines,
+)
+
+
+class SleepyHandler:
+    """Tool handler whose one tool sleeps for ``arguments["delay"]``."""
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.started = []
+
+    def get_tool_definitions(self):
+        return [{"name": "sleep", "inputSchema": {"type": "object"}}]
+
+    async def handle_tool_call(
+        self, tool_name, arguments, cancel_token=None, progress=None
+    ):
+        self.started.append(arguments["label"])
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(arguments.get("delay", 0))
+        finally:
+            self.running -= 1
+        return {"content": [{"type": "text", "text": arguments["label"]}]}
+
+
+class WaitForCancelSearch:
+    """Search stage that runs until its cancellation token fires."""
+
+    async def search(self, plan, cancel_token):
+        while not cancel_token.is_cancelled:
+            await asyncio.sleep(0.01)
+        return []
+
+
+class StaticSearch:
+    """Search stage returning one paper after an optional delay."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+
+    async def search(self, plan, cancel_token):
+        await asyncio.sleep(self.delay)
+        return [{"title": "Graph networks", "url": "https://example.org/graphs"}]
+
+
+def request(request_id, method, params=None):
+    return json.dumps(
+        {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}
+    )
+
+
+def call(request_id, label, delay=0.0):
+    return request(
+        request_id,
+        "tools/call",
+        {"name": "sleep", "arguments": {"label": label, "delay": delay}},
+    )
+
+
+def cancelled(request_id):
+    return json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "method": "notifications/cancelled",
+            "params": {"requestId": request_id, "reason": "user stopped"},
+        }
+    )
+
+
+def session_for(handler, **limits):
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    return McpSession(handler, send, **limits), sent
+
+
+class TestMcpSession:
+    """Test JSON-RPC dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_protocol_requests(self):
+        """Test initialize, tools/list, ping and JSON-RPC errors."""
+        session, sent = session_for(McpServerHandler())
+
+        await session.receive(request(1, "initialize"))
+        await session.receive(request(2, "tools/list"))
+        await session.receive(request(3, "ping"))
+        await session.receive(request(4, "resources/list"))
+        await session.receive("{not json")
+        await session.receive(request(5, "tools/call", {"name": "missing"}))
+        await session.join()
+
+        by_id = {message["id"]: message for message in sent}
+        assert by_id[1]["result"]["capabilities"] == {"tools": {}}
+        assert "orchestrate_research" in [
+            tool["name"] for tool in by_id[2]["result"]["tools"]
+        ]
+        assert by_id[3]["result"] == {}
+        assert by_id[4]["error"]["code"] == METHOD_NOT_FOUND
+        assert by_id[None]["error"]["code"] == PARSE_ERROR
+        assert by_id[5]["error"]["code"] == INVALID_PARAMS
+
+    @pytest.mark.asyncio
+    async def test_calls_run_concurrently_without_head_of_line_blocking(self):
+        """Test a fast call answers before a slow one sent ahead of it."""
+        handler = SleepyHandler()
+        session, sent = session_for(handler)
+
+        started = time.perf_counter()
+        await session.receive(call(1, "slow", delay=0.3))
+        await session.receive(call(2, "fast", delay=0.01))
+        await session.receive(call(3, "slow too", delay=0.3))
+        await session.join()
+
+        assert [message["id"] for message in sent] == [2, 1, 3]
+        assert time.perf_counter() - started < 0.55
+        assert handler.max_running == 3
+
+    @pytest.mark.asyncio
+    async def test_in_flight_cap_and_backpressure(self):
+        """Test calls beyond the cap wait, and a full queue stops reading."""
+        handler = SleepyHandler()
+        session, sent = session_for(handler, max_in_flight=2, max_queued=1)
+
+        for request_id in range(3):
+            await session.receive(call(request_id, str(request_id), delay=0.1))
+        blocked = asyncio.create_task(session.receive(call(3, "3", delay=0.1)))
+        await asyncio.sleep(0.05)
+
+        assert not blocked.done()
+        assert session.in_flight == 3
+        await blocked
+        await session.join()
+        assert handler.max_running == 2
+        assert sorted(message["id"] for message in sent) == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_cancelling_a_queued_call_drops_it(self):
+        """Test a call cancelled before it started never runs or answers."""
+        handler = SleepyHandler()
+        session, sent = session_for(handler, max_in_flight=1)
+
+        await session.receive(call(1, "running", delay=0.05))
+        await session.receive(call(2, "queued"))
+        await session.receive(cancelled(2))
+        await session.join()
+
+        assert handler.started == ["running"]
+        assert [message["id"] for message in sent] == [1]
+        assert session.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelling_a_running_call_stops_research(self):
+        """Test cancellation reaches the pipeline and saves a partial result."""
+        container = ApplicationContainer(
+            pipeline=ResearchPipeline(
+                searchers={SourceType.ARXIV: WaitForCancelSearch()}
+            )
+        )
+        handler = McpServerHandler(container=container)
+        session, sent = session_for(handler)
+
+        await session.receive(
+            request(
+                7,
+                "tools/call",
+                {"name": "orchestrate_research", "arguments": {"query": "graphs"}},
+            )
+        )
+        await asyncio.sleep(0.05)
+        await session.receive(cancelled(7))
+        await asyncio.wait_for(session.join(), timeout=2)
+
+        assert sent == []
+        (result,) = container.result_repository.find_all()
+        assert result.status == ResearchStatus.CANCELLED
+
+    @pytest.mark.asyncio
+    async def test_progress_notifications_precede_the_result(self):
+        """Test a progress token gets one notification per research step."""
+        container = ApplicationContainer(
+            pipeline=ResearchPipeline(
+                searchers={
+                    SourceType.ARXIV: StaticSearch(delay=0.05),
+                    SourceType.SEMANTIC_SCHOLAR: StaticSearch(),
+                }
+            )
+        )
+        session, sent = session_for(McpServerHandler(container=container))
+        arguments = {"name": "orchestrate_research", "arguments": {"query": "graphs"}}
+
+        await session.receive(
+            request(1, "tools/call", {**arguments, "_meta": {"progressToken": "t"}})
+        )
+        await session.receive(request(2, "tools/call", arguments))
+        await session.join()
+
+        first = [m for m in sent if m.get("id") != 2]
+        progress = [m["params"] for m in first[:-1]]
+        assert {m["method"] for m in first[:-1]} == {"notifications/progress"}
+        assert [p["progress"] for p in progress] == [1, 2, 3, 4, 5, 6]
+        assert {(p["progressToken"], p["total"]) for p in progress} == {("t", 6)}
+        assert "arxiv" in progress[3]["message"]
+        assert first[-1]["id"] == 1
+        assert [m.get("method") for m in sent if m not in first] == [None]
+
+    @pytest.mark.asyncio
+    async def test_unhashable_ids_are_invalid_requests(self):
+        """Test array or object ids are rejected without breaking the session."""
+        session, sent = session_for(SleepyHandler())
+        message = json.loads(call(1, "x"))
+
+        await session.receive(json.dumps({**message, "id": [1]}))
+        await session.receive(json.dumps({**message, "id": True}))
+        cancel = json.loads(cancelled(1))
+        cancel["params"]["requestId"] = {}
+        await session.receive(json.dumps(cancel))
+        await session.receive(call(2, "still serving"))
+        await session.join()
+
+        assert [m["error"]["code"] for m in sent[:2]] == [INVALID_REQUEST] * 2
+        assert [m["id"] for m in sent[:2]] == [None, None]
+        assert sent[2]["result"]["content"][0]["text"] == "still serving"
+        assert len(sent) == 3
+
+    @pytest.mark.asyncio
+    async def test_non_object_params_are_invalid_params(self):
+        """Test params that are not an object get -32602."""
+        session, sent = session_for(SleepyHandler())
+
+        for request_id, method in [(1, "tools/call"), (2, "ping")]:
+            await session.receive(
+                json.dumps(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": request_id,
+                        "method": method,
+                        "params": "x",
+                    }
+                )
+            )
+        await session.receive(
+            json.dumps(
+                {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": [1]}
+            )
+        )
+        await session.join()
+
+        assert [(m["id"], m["error"]["code"]) for m in sent] == [
+            (1, INVALID_PARAMS),
+            (2, INVALID_PARAMS),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bad_timeout_is_invalid_params(self):
+        """Test a non-numeric or non-positive timeout is a JSON-RPC error."""
+        session, sent = session_for(McpServerHandler())
+
+        for request_id, timeout in enumerate(["soon", 0, -1]):
+            await session.receive(
+                request(
+                    request_id,
+                    "tools/call",
+                    {
+                        "name": "orchestrate_research",
+                        "arguments": {"query": "graphs", "timeout_seconds": timeout},
+                    },
+                )
+            )
+        await session.join()
+
+        assert len(sent) == 3
+        assert {message["error"]["code"] for message in sent} == {INVALID_PARAMS}
+        assert "timeout_seconds" in sent[0]["error"]["message"]
+
+    @pytest.mark.asyncio
+    async def test_batch_is_answered_with_one_array(self):
+        """Test a batch gets its responses, tool calls included, in one array."""
+        session, sent = session_for(SleepyHandler())
+        batch = [
+            json.loads(call(1, "slow", delay=0.05)),
+            json.loads(request(2, "ping")),
+            json.loads(cancelled(99)),
+            json.loads(request(3, "resources/list")),
+        ]
+
+        await session.receive(json.dumps(batch))
+        assert sent == []  # The call is still running
+        await session.join()
+
+        (responses,) = sent
+        by_id = {message["id"]: message for message in responses}
+        assert sorted(by_id) == [1, 2, 3]
+        assert by_id[1]["result"]["content"][0]["text"] == "slow"
+        assert by_id[2]["result"] == {}
+        assert by_id[3]["error"]["code"] == METHOD_NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_notification_batch_gets_no_response(self):
+        """Test a batch of notifications only is not answered, an empty one is."""
+        session, sent = session_for(SleepyHandler())
+
+        await session.receive(json.dumps([json.loads(cancelled(1))] * 2))
+        await session.join()
+        assert sent == []
+
+        await session.receive("[]")
+        assert sent[0]["error"]["code"] == INVALID_REQUEST
+
+
+class TestLineFraming:
+    """Test the newline-delimited (stdio) framing."""
+
+    @pytest.mark.asyncio
+    async def test_one_message_per_line(self):
+        """Test each request line gets one response line until EOF."""
+        reader = asyncio.StreamReader()
+        reader.feed_data(
+            (request(1, "ping") + "\n\n" + call(2, "x") + "\n").encode("utf-8")
+        )
+        reader.feed_eof()
+        written = []
+
+        async def write(data):
+            written.append(data)
+
+        await serve_lines(SleepyHandler(), reader, write)
+
+        assert all(line.endswith(b"\n") and line.count(b"\n") == 1 for line in written)
+        assert [json.loads(line)["id"] for line in written] == [1, 2]
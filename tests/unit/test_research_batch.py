@@ -0,0 +1,193 @@
+"""
+Unit Tests for Batch Research
+
+Tests input parsing, bounded concurrency, JSONL output as queries finish,
+per-query failures and resuming from a checkpoint file.
+"""
+
+import asyncio
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from src.application.use_cases import (
+    CreateResearchQueryResponse,
+    ExecuteResearchResponse,
+    OrchestrationResponse,
+)
+from src.domain.entities import (
+    QueryId,
+    ResearchQuery,
+    ResearchQueryType,
+    ResearchResult,
+    ResearchStatus,
+)
+from src.presentation.batch import BatchCheckpoint, parse_batch_line, run_batch
+
+INPUT = """# offline sweep
+graph neural networks
+{"id": "t1", "query": "transformers", "max_results": 3}
+
+{"query": "fail please"}
+"""
+
+
+class FakeOrchestration:
+    """Answers each query after a short delay, tracking concurrency."""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+        self.queries = []
+
+    async def create_and_execute_research(
+        self, query_text, sources, max_results, cancel_token=None
+    ):
+        self.queries.append((query_text, max_results))
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(0.01)
+            if query_text.startswith("fail"):
+                raise RuntimeError("upstream unavailable")
+        finally:
+            self.running -= 1
+        query = ResearchQuery(
+            id=QueryId(),
+            text=query_text,
+            query_type=ResearchQueryType.GENERAL,
+            created_at=datetime.now(),
+        )
+        return OrchestrationResponse(
+            create_response=CreateResearchQueryResponse(query_id=str(query.id)),
+            execute_response=ExecuteResearchResponse(
+                results=[ResearchResult(query=query, status=ResearchStatus.COMPLETED)]
+            ),
+        )
+
+
+class TestParseBatchLine:
+    """Test reading queries from input lines."""
+
+    def test_plain_json_and_skipped_lines(self):
+        """Test both line forms, defaults and stable IDs."""
+        plain = parse_batch_line("attention\n", sources=["arxiv"], max_results=5)
+        item = parse_batch_line('{"id": "a", "query": "bert", "sources": []}')
+
+        assert parse_batch_line("  \n") is None
+        assert parse_batch_line("# note") is None
+        assert (plain.query, plain.sources, plain.max_results) == (
+            "attention",
+            ["arxiv"],
+            5,
+        )
+        assert plain.id == parse_batch_line("attention", ["arxiv"], 5).id
+        assert (item.id, item.sources) == ("a", [])
+        with pytest.raises(ValueError):
+            parse_batch_line('{"sources": ["arxiv"]}')
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            '{"query": "bert", "max_results": null}',
+            '{"query": "bert", "max_results": [5]}',
+            '{"query": "bert", "max_results": 0}',
+            '{"query": "bert", "sources": "arxiv"}',
+            '{"query": ["bert"]}',
+            '{"query": "bert", "id": {"a": 1}}',
+        ],
+    )
+    def test_malformed_fields_raise_value_error(self, line):
+        """Test wrongly typed fields are rejected as bad lines."""
+        with pytest.raises(ValueError):
+            parse_batch_line(line)
+
+
+class TestRunBatch:
+    """Test running a batch."""
+
+    @pytest.mark.asyncio
+    async def test_writes_a_line_per_query(self):
+        """Test results and failures are written as JSONL."""
+        service = FakeOrchestration()
+        output = io.StringIO()
+
+        summary = await run_batch(service, io.StringIO(INPUT), output, concurrency=2)
+
+        lines = [json.loads(line) for line in output.getvalue().splitlines()]
+        by_query = {line["query"]: line for line in lines}
+        assert (summary.completed, summary.failed, summary.skipped) == (2, 1, 0)
+        assert by_query["transformers"]["id"] == "t1"
+        assert by_query["transformers"]["results_count"] == 1
+        assert by_query["graph neural networks"]["success"] is True
+        assert by_query["fail please"]["error"]["type"] == "RuntimeError"
+        assert ("transformers", 3) in service.queries
+
+    @pytest.mark.asyncio
+    async def test_malformed_line_does_not_abort_batch(self):
+        """Test a line with bad field types gets its own error record."""
+        service = FakeOrchestration()
+        queries = io.StringIO('{"query": "bad", "max_results": null}\ngood query\n')
+        output = io.StringIO()
+
+        summary = await run_batch(service, queries, output, concurrency=1)
+
+        lines = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert (summary.completed, summary.failed) == (1, 1)
+        assert lines[0] == {
+            "line": 1,
+            "success": False,
+            "error": {
+                "message": lines[0]["error"]["message"],
+                "type": "ValidationError",
+            },
+        }
+        assert lines[1]["query"] == "good query"
+
+    @pytest.mark.asyncio
+    async def test_worker_failure_stops_the_batch(self):
+        """Test a dead worker pool raises instead of hanging on a full queue."""
+
+        class BrokenOutput(io.StringIO):
+            def write(self, text):
+                raise OSError("disk full")
+
+        queries = io.StringIO("".join(f"query {i}\n" for i in range(20)))
+
+        with pytest.raises(OSError, match="disk full"):
+            await asyncio.wait_for(
+                run_batch(FakeOrchestration(), queries, BrokenOutput(), concurrency=2),
+                timeout=5,
+            )
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """Test no more than ``concurrency`` queries run at once."""
+        service = FakeOrchestration()
+        queries = io.StringIO("".join(f"query {i}\n" for i in range(12)))
+
+        summary = await run_batch(service, queries, io.StringIO(), concurrency=3)
+
+        assert summary.completed == 12
+        assert service.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_checkpoint(self, tmp_path):
+        """Test finished queries are skipped and failures retried."""
+        path = str(tmp_path / "done.txt")
+        first = BatchCheckpoint(path)
+        await run_batch(
+            FakeOrchestration(), io.StringIO(INPUT), io.StringIO(), 2, first
+        )
+        first.close()
+
+        service = FakeOrchestration()
+        second = BatchCheckpoint(path)
+        summary = await run_batch(service, io.StringIO(INPUT), io.StringIO(), 2, second)
+        second.close()
+
+        assert "t1" in second
+        assert (summary.completed, summary.failed, summary.skipped) == (0, 1, 2)
+        assert service.queries == [("fail please", 10)]
@@ -0,0 +1,266 @@
+"""
+Unit Tests for Research Collections
+
+Tests both collection repositories against the same behaviour (dedupe,
+bidirectional indexes, bulk edits, paging), SQLite persistence across
+connections, and the web interface's collection actions.
+"""
+
+import pytest
+
+from src.application.research_collections import ResearchCollectionService
+from src.domain.entities import (
+    CollectionNotFoundError,
+    InvalidQueryException,
+    ResearchCollection,
+    SourceValidationException,
+    paper_identity,
+)
+from src.infrastructure.collection_repositories import (
+    InMemoryResearchCollectionRepository,
+    SQLiteResearchCollectionRepository,
+)
+from src.presentation.web_interface import WebInterfaceHandler
+
+PAPERS = [
+    {"title": "Attention Is All You Need", "doi": "10.5555/3295222", "year": 2017},
+    {"title": "BERT: Pre-training of Deep Bidirectional Transformers", "year": 2019},
+    {"title": "Deep Residual Learning", "source_url": "https://arxiv.org/abs/1512"},
+]
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repository(request, tmp_path):
+    """Each collection repository implementation."""
+    if request.param == "memory":
+        yield InMemoryResearchCollectionRepository()
+    else:
+        repository = SQLiteResearchCollectionRepository(
+            str(tmp_path / "collections.db"), export_batch_size=2
+        )
+        yield repository
+        repository.close()
+
+
+class TestCollectionPaperKey:
+    """Test the collection dedupe key."""
+
+    def test_doi_then_normalized_title_then_url(self):
+        """Test the key fallback chain."""
+        assert paper_identity({"doi": " 10.1/ABC ", "title": "X"}) == ("doi:10.1/abc")
+        assert paper_identity({"title": "BERT: Pre-Training!"}) == (
+            "title:bertpretraining"
+        )
+        assert paper_identity({"url": "HTTPS://A.org/p/"}) == ("url:https://a.org/p")
+        assert paper_identity({"authors": ["Nobody"]}) is None
+
+
+class TestCollectionRepositories:
+    """Behaviour shared by the in-memory and SQLite repositories."""
+
+    def test_add_dedupes_and_indexes_both_directions(self, repository):
+        """Test duplicate detection, counts and reverse lookups."""
+        first, second = ResearchCollection(name="NLP"), ResearchCollection(name="ML")
+        repository.save(first)
+        repository.save(second)
+
+        added = repository.add_papers(
+            first.id, PAPERS + [{"title": "attention is all you need", "doi": None}]
+        )
+        repository.add_papers(second.id, PAPERS[:1])
+        duplicate = repository.add_papers(
+            first.id, [{"title": "Other title", "doi": "10.5555/3295222"}]
+        )
+
+        assert (added, duplicate) == (4, 0)
+        assert repository.find_by_id(first.id).paper_count == 4
+        assert repository.contains(first.id, "doi:10.5555/3295222")
+        assert not repository.contains(second.id, paper_identity(PAPERS[1]))
+        assert repository.collections_for("doi:10.5555/3295222") == sorted(
+            [first.id, second.id]
+        )
+
+    def test_bulk_remove_and_paging(self, repository):
+        """Test removal by key and insertion-ordered pages."""
+        collection = ResearchCollection(name="Library")
+        repository.save(collection)
+        repository.add_papers(collection.id, PAPERS)
+
+        removed = repository.remove_papers(
+            collection.id, [paper_identity(PAPERS[0]), "title:missing"]
+        )
+
+        assert removed == 1
+        assert repository.find_by_id(collection.id).paper_count == 2
+        assert repository.collections_for(paper_identity(PAPERS[0])) == []
+        assert repository.list_papers(collection.id, limit=1, offset=1) == [PAPERS[2]]
+        assert list(repository.iter_papers(collection.id)) == PAPERS[1:]
+
+    def test_unknown_collection_and_unidentifiable_paper(self, repository):
+        """Test error handling for missing collections and keyless papers."""
+        collection = ResearchCollection(name="Library")
+        repository.save(collection)
+
+        with pytest.raises(CollectionNotFoundError):
+            repository.add_papers("missing", PAPERS)
+        with pytest.raises(CollectionNotFoundError):
+            repository.iter_papers("missing")
+        with pytest.raises(SourceValidationException):
+            repository.add_papers(collection.id, [PAPERS[0], {"year": 2020}])
+        assert repository.find_by_id(collection.id).paper_count == 0
+
+    def test_delete_drops_memberships(self, repository):
+        """Test that deleting a collection clears its reverse index entries."""
+        collection = ResearchCollection(name="Scratch")
+        repository.save(collection)
+        repository.add_papers(collection.id, PAPERS)
+
+        assert repository.delete(collection.id) is True
+        assert repository.delete(collection.id) is False
+        assert repository.find_by_id(collection.id) is None
+        assert repository.collections_for(paper_identity(PAPERS[0])) == []
+
+    def test_list_collections_pages(self, repository):
+        """Test oldest-first collection paging."""
+        names = [f"Collection {i}" for i in range(5)]
+        for name in names:
+            repository.save(ResearchCollection(name=name))
+
+        page = repository.list_collections(limit=2, offset=2)
+
+        assert [collection.name for collection in page] == names[2:4]
+
+
+class TestSQLitePersistence:
+    """Test that the SQLite backend survives reconnects."""
+
+    def test_collections_persist_on_disk(self, tmp_path):
+        """Test collections and papers are readable from a new connection."""
+        path = str(tmp_path / "library.db")
+        repository = SQLiteResearchCollectionRepository(path)
+        collection = ResearchCollection(name="Thesis", description="Chapter 2")
+        repository.save(collection)
+        repository.add_papers(collection.id, PAPERS)
+        repository.close()
+
+        reopened = SQLiteResearchCollectionRepository(path)
+        stored = reopened.find_by_id(collection.id)
+
+        assert (stored.name, stored.description, stored.paper_count) == (
+            "Thesis",
+            "Chapter 2",
+            3,
+        )
+        assert reopened.list_papers(collection.id) == PAPERS
+        reopened.close()
+
+
+class TestResearchCollectionService:
+    """Test the application service's validation."""
+
+    @pytest.mark.asyncio
+    async def test_validation_errors(self):
+        """Test invalid names and page sizes are rejected."""
+        service = ResearchCollectionService()
+
+        with pytest.raises(InvalidQueryException, match="cannot be empty"):
+            await service.create("   ")
+        with pytest.raises(InvalidQueryException, match="limit"):
+            await service.list_collections(limit=0)
+
+    @pytest.mark.asyncio
+    async def test_remove_by_paper_or_key(self):
+        """Test papers can be removed by dict or by dedupe key."""
+        service = ResearchCollectionService()
+        collection = await service.create("Library")
+        await service.add_papers(collection.id, PAPERS)
+
+        removed = await service.remove_papers(
+            collection.id, [PAPERS[0], paper_identity(PAPERS[1])]
+        )
+
+        assert removed == 2
+        assert await service.contains(collection.id, PAPERS[2]) is True
+        assert await service.contains(collection.id, PAPERS[0]) is False
+
+
+class TestWebCollectionActions:
+    """Test the web interface's collection actions end to end."""
+
+    @pytest.mark.asyncio
+    async def test_collection_lifecycle(self, tmp_path):
+        """Test create, bulk add, page, membership and export on disk."""
+        repository = SQLiteResearchCollectionRepository(str(tmp_path / "web.db"))
+        handler = WebInterfaceHandler(collection_repository=repository)
+        request = handler.handle_research_collection_request
+
+        created = await request({"action": "create", "name": "Transformers"})
+        collection_id = created["data"]["id"]
+        added = await request(
+            {
+                "action": "add_papers",
+                "collection_id": collection_id,
+                "papers": PAPERS + PAPERS[:1],
+            }
+        )
+        page = await request(
+            {"action": "papers", "collection_id": collection_id, "limit": 2}
+        )
+        contains = await request(
+            {"action": "contains", "collection_id": collection_id, "paper": PAPERS[1]}
+        )
+        exported = await request(
+            {"action": "export", "collection_id": collection_id, "format": "ris"}
+        )
+        listed = await request({"action": "list"})
+
+        assert added["data"]["added"] == 3
+        assert added["data"]["duplicates"] == 1
+        assert page["data"]["total"] == 3
+        assert page["data"]["papers"] == PAPERS[:2]
+        assert contains["data"]["contains"] is True
+        assert contains["data"]["collections"] == [collection_id]
+        assert exported["data"]["citations"].count("TY  - JOUR") == 3
+        assert exported["data"]["filename"] == "Transformers.ris"
+        assert [c["id"] for c in listed["data"]["collections"]] == [collection_id]
+        repository.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {"action": "list", "limit": "abc"},
+            {"action": "papers", "collection_id": "c", "offset": 1.5},
+            {"action": "add_papers", "collection_id": "c", "papers": ["x"]},
+            {"action": "add_papers", "collection_id": "c", "papers": 5},
+            {"action": "add_paper", "collection_id": "c", "paper": "str"},
+            {"action": "remove_papers", "collection_id": "c", "keys": [3]},
+            {"action": "contains", "collection_id": "c", "paper": ["x"]},
+            {"action": "create", "name": 5},
+            {"action": "get", "collection_id": ["c"]},
+            {"action": "export", "collection_id": "c", "format": 1},
+        ],
+    )
+    async def test_malformed_input_is_a_client_error(self, body):
+        """Test wrong field types are validation errors, not server errors."""
+        handler = WebInterfaceHandler()
+
+        response = await handler.handle_research_collection_request(body)
+
+        assert response["success"] is False
+        assert response["error"]["type"] in ("InvalidQueryException", "ValidationError")
+
+    @pytest.mark.asyncio
+    async def test_delete_then_get_reports_not_found(self):
+        """Test deleted collections are gone."""
+        handler = WebInterfaceHandler()
+        request = handler.handle_research_collection_request
+        created = await request({"action": "create", "name": "Scratch"})
+        collection_id = created["data"]["id"]
+
+        deleted = await request({"action": "delete", "collection_id": collection_id})
+        fetched = await request({"action": "get", "collection_id": collection_id})
+
+        assert deleted["data"]["deleted"] is True
+        assert fetched["success"] is False
+        assert fetched["error"]["type"] == "CollectionNotFoundError"
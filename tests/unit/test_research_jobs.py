@@ -0,0 +1,331 @@
+"""
+Unit Tests for the Background Research Job Queue
+
+Tests that jobs are accepted immediately, run on a bounded worker pool,
+respect priorities and per-requester fairness, and report their lifecycle
+through ResearchStatus.
+"""
+
+import asyncio
+
+import pytest
+
+from src.application.research_jobs import (
+    JobPriority,
+    JobQueueFullError,
+    ResearchJobQueue,
+)
+from src.domain.entities import ResearchStatus
+from src.presentation.web_interface import MAX_JOB_WAIT_SECONDS, WebInterfaceHandler
+
+
+class TestResearchJobQueue:
+    """Test cases for ResearchJobQueue."""
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_immediately_and_completes(self):
+        """Test that submit returns a job ID before the work has run."""
+        queue = ResearchJobQueue(max_workers=1)
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "done"
+
+        job_id = queue.submit(work)
+        job = queue.get(job_id)
+        assert job.status == ResearchStatus.PENDING
+
+        release.set()
+        finished = await queue.wait(job_id, timeout=1)
+
+        assert finished.status == ResearchStatus.COMPLETED
+        assert finished.result == "done"
+        assert finished.completed_at is not None
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_failed_job_records_error(self):
+        """Test that exceptions mark the job FAILED instead of killing workers."""
+        queue = ResearchJobQueue(max_workers=1)
+
+        async def broken():
+            raise RuntimeError("upstream exploded")
+
+        async def healthy():
+            return 42
+
+        failed_id = queue.submit(broken)
+        healthy_id = queue.submit(healthy)
+
+        failed = await queue.wait(failed_id, timeout=1)
+        healthy_job = await queue.wait(healthy_id, timeout=1)
+
+        assert failed.status == ResearchStatus.FAILED
+        assert "upstream exploded" in failed.error_message
+        assert healthy_job.result == 42
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_worker_pool_is_bounded(self):
+        """Test that no more than max_workers jobs run at once."""
+        queue = ResearchJobQueue(max_workers=2)
+        running = 0
+        peak = 0
+
+        async def work():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        job_ids = [queue.submit(work) for _ in range(6)]
+        for job_id in job_ids:
+            await queue.wait(job_id, timeout=1)
+
+        assert peak == 2
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_priority_and_requester_fairness(self):
+        """Test that HIGH runs first and requesters are interleaved."""
+        queue = ResearchJobQueue(max_workers=1)
+        order = []
+        gate = asyncio.Event()
+
+        def make_work(label):
+            async def work():
+                await gate.wait()
+                order.append(label)
+
+            return work
+
+        # Occupy the single worker so everything else queues up
+        blocker = queue.submit(make_work("blocker"))
+        await asyncio.sleep(0)
+
+        ids = [
+            queue.submit(make_work(f"bulk-{i}"), requester_id="bulk") for i in range(3)
+        ]
+        ids.append(queue.submit(make_work("other"), requester_id="other"))
+        ids.append(
+            queue.submit(
+                make_work("urgent"), requester_id="bulk", priority=JobPriority.HIGH
+            )
+        )
+
+        gate.set()
+        for job_id in [blocker, *ids]:
+            await queue.wait(job_id, timeout=1)
+
+        assert order[0] == "blocker"
+        assert order[1] == "urgent"
+        assert order.index("other") < order.index("bulk-1")
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_queue_full_raises(self):
+        """Test that submissions beyond max_pending are rejected."""
+        queue = ResearchJobQueue(max_workers=1, max_pending=1)
+        gate = asyncio.Event()
+
+        async def work():
+            await gate.wait()
+
+        queue.submit(work)
+        await asyncio.sleep(0)  # first job is picked up by the worker
+        queue.submit(work)
+
+        with pytest.raises(JobQueueFullError):
+            queue.submit(work)
+
+        gate.set()
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_pending_jobs_free_capacity(self):
+        """Test cancelled jobs neither block submissions nor pile up queued."""
+        queue = ResearchJobQueue(max_workers=1, max_pending=2)
+        gate = asyncio.Event()
+
+        async def work():
+            await gate.wait()
+            return "done"
+
+        queue.submit(work)
+        await asyncio.sleep(0)  # The only worker is now busy
+        for _ in range(10):
+            job_ids = [queue.submit(work), queue.submit(work)]
+            for job_id in job_ids:
+                assert queue.cancel(job_id)
+
+        last = queue.submit(work)
+        assert queue.stats()["queued"] == 1
+        assert queue._queue.qsize() <= 2 * queue.max_pending
+        gate.set()
+        job = await queue.wait(last, timeout=1)
+
+        assert job.status == ResearchStatus.COMPLETED
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_oldest_finished_jobs_are_evicted(self):
+        """Test retention drops finished jobs first, oldest first."""
+        queue = ResearchJobQueue(max_workers=1, max_retained=2)
+        gate = asyncio.Event()
+
+        async def work():
+            await gate.wait()
+
+        first, second = queue.submit(work), queue.submit(work)
+        queue.cancel(second)
+        queue.cancel(first)
+        third = queue.submit(work)
+        fourth = queue.submit(work)
+
+        assert queue.get(second) is None  # Finished first
+        assert queue.get(first) is None
+        assert queue.get(third) is not None and queue.get(fourth) is not None
+        gate.set()
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_subscribers_receive_status_changes(self):
+        """Test that listeners are pushed every lifecycle transition."""
+        queue = ResearchJobQueue(max_workers=1)
+        seen = []
+        unsubscribe = queue.subscribe(lambda job: seen.append(job.status))
+
+        async def work():
+            return None
+
+        job_id = queue.submit(work)
+        await queue.wait(job_id, timeout=1)
+        unsubscribe()
+
+        assert seen == [
+            ResearchStatus.PENDING,
+            ResearchStatus.IN_PROGRESS,
+            ResearchStatus.COMPLETED,
+        ]
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_running_job(self):
+        """Test a job interrupted by shutdown is marked CANCELLED."""
+        queue = ResearchJobQueue(max_workers=1)
+
+        job_id = queue.submit(lambda: asyncio.sleep(10))
+        await asyncio.sleep(0.01)
+        await queue.shutdown()
+
+        job = queue.get(job_id)
+        assert job.status == ResearchStatus.CANCELLED
+        assert job.completed_at is not None
+
+    @pytest.mark.asyncio
+    async def test_requester_rounds_are_pruned(self):
+        """Test requesters without unfinished jobs are forgotten."""
+        queue = ResearchJobQueue(max_workers=2)
+
+        async def work():
+            return None
+
+        job_ids = [
+            queue.submit(work, requester_id=f"user-{index}") for index in range(5)
+        ]
+        for job_id in job_ids:
+            await queue.wait(job_id, timeout=1)
+
+        assert queue._requester_rounds == {}
+        assert queue._requester_active == {}
+        await queue.shutdown()
+
+    def test_new_event_loop_fails_stranded_jobs(self):
+        """Test jobs queued on a finished event loop are failed, not lost."""
+        queue = ResearchJobQueue(max_workers=1)
+
+        async def first_loop():
+            queue.submit(lambda: asyncio.sleep(10))
+            return queue.submit(lambda: asyncio.sleep(10))
+
+        async def second_loop():
+            job_id = queue.submit(lambda: asyncio.sleep(0, result="done"))
+            job = await queue.wait(job_id, timeout=1)
+            await queue.shutdown()
+            return job
+
+        stranded_id = asyncio.run(first_loop())
+        job = asyncio.run(second_loop())
+
+        stranded = queue.get(stranded_id)
+        assert stranded.status == ResearchStatus.FAILED
+        assert "Event loop changed" in stranded.error_message
+        assert job.result == "done"
+        assert queue.stats()["workers"] == 0
+
+
+class TestWebJobEndpoints:
+    """Test the web handler's job submission and status endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_submit_and_poll_research_job(self):
+        """Test that a queued research job can be polled to completion."""
+        handler = WebInterfaceHandler()
+        handler.scholarly_use_case.scholarly_searcher.search = lambda **kwargs: []
+
+        submitted = await handler.handle_submit_research_job_request(
+            {"query": "graph neural networks", "priority": "high"}
+        )
+        assert submitted["success"] is True
+        job_id = submitted["data"]["job_id"]
+        assert submitted["data"]["status"] == "pending"
+
+        status = await handler.handle_job_status_request({"job_id": job_id, "wait": 1})
+
+        assert status["success"] is True
+        assert status["data"]["status"] == "completed"
+        assert status["data"]["result"]["query"] == "graph neural networks"
+        await handler.job_queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_unknown_job_and_priority_are_rejected(self):
+        """Test validation errors for unknown jobs and priorities."""
+        handler = WebInterfaceHandler()
+
+        missing = await handler.handle_job_status_request({"job_id": "nope"})
+        bad_priority = await handler.handle_submit_research_job_request(
+            {"query": "test", "priority": "urgent"}
+        )
+
+        assert missing["success"] is False
+        assert missing["error"]["type"] == "NotFoundError"
+        assert bad_priority["success"] is False
+        assert bad_priority["error"]["type"] == "ValidationError"
+
+    @pytest.mark.asyncio
+    async def test_job_wait_is_validated_and_capped(self, monkeypatch):
+        """Test negative or malformed waits are rejected and long waits capped."""
+        handler = WebInterfaceHandler()
+        job_id = handler.job_queue.submit(lambda: asyncio.sleep(10))
+        waits = []
+
+        async def record_wait(job_id, timeout=None):
+            waits.append(timeout)
+
+        monkeypatch.setattr(handler.job_queue, "wait", record_wait)
+
+        for bad in (-1, "soon", float("nan")):
+            response = await handler.handle_job_status_request(
+                {"job_id": job_id, "wait": bad}
+            )
+            assert response["error"]["type"] == "ValidationError"
+
+        capped = await handler.handle_job_status_request(
+            {"job_id": job_id, "wait": 3600}
+        )
+
+        assert capped["success"] is True
+        assert waits == [MAX_JOB_WAIT_SECONDS]
+        await handler.job_queue.shutdown()
@@ -0,0 +1,268 @@
+"""
+Unit Tests for the Research Pipeline
+
+Tests the analyze/search/fetch/parse/score stages: concurrent branches per
+source type, per-stage concurrency limits and statistics, isolation of a
+failing branch, cancellation, ranking, progress reporting, and the default
+wiring to UnifiedScholarlySearcher.
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.research_pipeline import (
+    KeywordQueryAnalyzer,
+    ResearchPipeline,
+    ScholarlySourceSearch,
+    create_default_research_pipeline,
+)
+from src.core.cancellation import CancellationToken
+from src.domain.entities import (
+    QueryId,
+    ResearchQuery,
+    ResearchQueryType,
+    ResearchStatus,
+    SourceType,
+)
+
+
+def make_query(text="transformer attention models", max_sources=10, **flags):
+    return ResearchQuery(
+        id=QueryId(),
+        text=text,
+        query_type=ResearchQueryType.ACADEMIC,
+        created_at=datetime.now(),
+        max_sources=max_sources,
+        **flags,
+    )
+
+
+def paper(title, source="arxiv", **extra):
+    return {
+        "title": title,
+        "abstract": extra.pop("abstract", ""),
+        "url": f"https://example.org/{abs(hash(title))}",
+        "source": source,
+        **extra,
+    }
+
+
+class StaticSearch:
+    """Search stage returning fixed papers after an optional delay."""
+
+    def __init__(self, papers, delay=0.0, error=None):
+        self.papers = papers
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def search(self, plan, cancel_token):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return list(self.papers)
+
+
+class TestKeywordQueryAnalyzer:
+    """Test query analysis."""
+
+    @pytest.mark.asyncio
+    async def test_terms_and_source_types(self):
+        """Test stopwords are dropped and source types follow the query flags."""
+        plan = await KeywordQueryAnalyzer().analyze(
+            make_query("What is the role of attention in Transformers?")
+        )
+        academic_only = await KeywordQueryAnalyzer().analyze(
+            make_query(include_web_search=False)
+        )
+
+        assert plan.terms == ["role", "attention", "transformers"]
+        assert plan.source_types == [
+            SourceType.ARXIV,
+            SourceType.SEMANTIC_SCHOLAR,
+            SourceType.WEB,
+        ]
+        assert SourceType.WEB not in academic_only.source_types
+
+
+class TestResearchPipeline:
+    """Test the staged pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_branches_run_concurrently_and_rank(self):
+        """Test source types are searched in parallel and ranked by score."""
+        arxiv = StaticSearch([paper("Transformer attention models")], delay=0.2)
+        scholar = StaticSearch(
+            [paper("Unrelated biology", source="semantic_scholar")], delay=0.2
+        )
+        pipeline = ResearchPipeline(
+            searchers={SourceType.ARXIV: arxiv, SourceType.SEMANTIC_SCHOLAR: scholar}
+        )
+
+        started = asyncio.get_running_loop().time()
+        result = await pipeline.run(make_query())
+        elapsed = asyncio.get_running_loop().time() - started
+
+        assert elapsed < 0.35
+        assert result.status == ResearchStatus.COMPLETED
+        assert result.search_strategies_used == ["arxiv", "semantic_scholar"]
+        assert [s.title for s in result.sources] == [
+            "Transformer attention models",
+            "Unrelated biology",
+        ]
+        assert result.sources[0].relevance_score > result.sources[1].relevance_score
+
+    @pytest.mark.asyncio
+    async def test_stage_concurrency_limit_and_stats(self):
+        """Test a stage never exceeds its limit and records timings."""
+        in_flight, peak = 0, 0
+
+        class SlowFetch:
+            async def fetch(self, candidate, cancel_token):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return candidate
+
+        pipeline = ResearchPipeline(
+            searchers={
+                SourceType.ARXIV: StaticSearch([paper(f"P{i}") for i in range(10)])
+            },
+            fetcher=SlowFetch(),
+            concurrency={"fetch": 3},
+        )
+
+        await pipeline.run(make_query())
+        stats = pipeline.stats()
+
+        assert peak == 3
+        assert stats["fetch"]["calls"] == 10
+        assert stats["search"]["calls"] == 1
+        assert stats["score"]["calls"] == 10
+        assert stats["fetch"]["max_seconds"] >= 0.01
+
+    @pytest.mark.asyncio
+    async def test_failing_branch_is_isolated(self):
+        """Test one failing source type does not fail the run."""
+        pipeline = ResearchPipeline(
+            searchers={
+                SourceType.ARXIV: StaticSearch([paper("Attention models")]),
+                SourceType.SEMANTIC_SCHOLAR: StaticSearch(
+                    [], error=ConnectionError("down")
+                ),
+            }
+        )
+
+        result = await pipeline.run(make_query())
+
+        assert result.status == ResearchStatus.COMPLETED
+        assert [s.title for s in result.sources] == ["Attention models"]
+        assert pipeline.stats()["search"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unparseable_candidates_dropped_and_max_sources(self):
+        """Test candidates without titles are dropped and results are capped."""
+        papers = [paper(f"Attention {i}") for i in range(5)] + [{"abstract": "x"}]
+        pipeline = ResearchPipeline(searchers={SourceType.ARXIV: StaticSearch(papers)})
+
+        result = await pipeline.run(make_query(max_sources=3))
+
+        assert len(result.sources) == 3
+        assert all(s.title.startswith("Attention") for s in result.sources)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_run_is_marked_cancelled(self):
+        """Test a pre-cancelled token searches nothing and marks the result."""
+        arxiv = StaticSearch([paper("Attention")])
+        pipeline = ResearchPipeline(searchers={SourceType.ARXIV: arxiv})
+        token = CancellationToken()
+        token.cancel("stop")
+
+        result = await pipeline.run(make_query(), token)
+
+        assert arxiv.calls == 0
+        assert result.status == ResearchStatus.CANCELLED
+        assert result.error_message == "stop"
+
+    @pytest.mark.asyncio
+    async def test_unregistered_source_types_are_skipped(self):
+        """Test planned source types without a search stage are ignored."""
+        pipeline = ResearchPipeline(
+            searchers={SourceType.ARXIV: StaticSearch([paper("Attention")])}
+        )
+
+        result = await pipeline.run(make_query())
+
+        assert result.search_strategies_used == ["arxiv"]
+
+    @pytest.mark.asyncio
+    async def test_progress_reports_each_step_as_it_finishes(self):
+        """Test progress covers analysis, every source's steps and ranking."""
+        updates = []
+        pipeline = ResearchPipeline(
+            searchers={
+                SourceType.ARXIV: StaticSearch([paper("Attention")], delay=0.1),
+                SourceType.SEMANTIC_SCHOLAR: StaticSearch(
+                    [paper("Attention 2", source="semantic_scholar")] * 2
+                ),
+            }
+        )
+
+        await pipeline.run(make_query(), progress=updates.append)
+
+        assert [u.completed for u in updates] == [1, 2, 3, 4, 5, 6]
+        assert {u.total for u in updates} == {6}
+        assert [(u.stage, u.source_type) for u in updates] == [
+            ("analyze", None),
+            ("search", SourceType.SEMANTIC_SCHOLAR),
+            ("score", SourceType.SEMANTIC_SCHOLAR),
+            ("search", SourceType.ARXIV),
+            ("score", SourceType.ARXIV),
+            ("rank", None),
+        ]
+        assert updates[1].sources_found == 2
+
+    @pytest.mark.asyncio
+    async def test_failing_progress_callback_does_not_fail_the_run(self):
+        """Test a broken listener is logged and ignored."""
+        pipeline = ResearchPipeline(
+            searchers={SourceType.ARXIV: StaticSearch([paper("Attention")])}
+        )
+
+        def broken(update):
+            raise RuntimeError("listener gone")
+
+        result = await pipeline.run(make_query(), progress=broken)
+
+        assert result.status == ResearchStatus.COMPLETED
+
+
+class TestDefaultPipeline:
+    """Test the default wiring to UnifiedScholarlySearcher."""
+
+    @pytest.mark.asyncio
+    async def test_scholarly_branches_use_unified_searcher(self):
+        """Test each academic branch searches its own scholarly source."""
+        searcher = Mock()
+        searcher.search.side_effect = lambda **kwargs: [
+            paper(f"Attention via {kwargs['sources'][0]}", kwargs["sources"][0])
+        ]
+        pipeline = create_default_research_pipeline(searcher)
+
+        result = await pipeline.run(make_query(max_sources=4))
+
+        assert isinstance(pipeline.searchers[SourceType.ARXIV], ScholarlySourceSearch)
+        assert sorted(
+            call.kwargs["sources"][0] for call in searcher.search.call_args_list
+        ) == ["arxiv", "semantic_scholar"]
+        assert searcher.search.call_args.kwargs["results_per_source"] == 4
+        assert {s.title for s in result.sources} == {
+            "Attention via arxiv",
+            "Attention via semantic_scholar",
+        }
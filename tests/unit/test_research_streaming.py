@@ -0,0 +1,167 @@
+"""
+Unit Tests for Streamed Research Progress
+
+Tests that enhanced research yields one event per scholarly source as soon
+as that source answers (fastest first), that closing the stream early
+cancels and saves the partial result, and the SSE/NDJSON framing.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+
+import pytest
+
+from src.application.container import ApplicationContainer
+from src.application.research_pipeline import ResearchPipeline
+from src.domain.entities import QueryId, ResearchStatus
+from src.presentation.streaming import (
+    NDJSON_MEDIA_TYPE,
+    SSE_MEDIA_TYPE,
+    encode_events,
+    media_type_for,
+)
+from src.presentation.web_interface import WebInterfaceHandler
+
+
+class SlowSourceSearcher:
+    """Scholarly searcher whose sources answer after different delays."""
+
+    delays = {"arxiv": 0.3, "semantic_scholar": 0.05}
+
+    def search(self, query, max_results=10, sources=(), **kwargs):
+        (source,) = sources
+        time.sleep(self.delays[source])
+        return [
+            {
+                "title": f"{source} paper {i}",
+                "source_url": f"https://{source}.example/{i}",
+                "source": source,
+            }
+            for i in range(max_results)
+        ]
+
+
+@pytest.fixture
+def handler():
+    container = ApplicationContainer(
+        scholarly_searcher=SlowSourceSearcher(),
+        pipeline=ResearchPipeline(searchers={}),
+    )
+    return WebInterfaceHandler(container=container)
+
+
+async def collect(events):
+    return [event async for event in events]
+
+
+class TestEnhancedResearchStream:
+    """Test the streamed enhanced research run."""
+
+    @pytest.mark.asyncio
+    async def test_sources_arrive_fastest_first(self, handler):
+        """Test the first source event arrives after the fastest source."""
+        response = await handler.handle_enhanced_research_stream(
+            {"query": "graph neural networks", "max_results": 4}
+        )
+        events = response["data"]["events"]
+
+        started = time.perf_counter()
+        first = await events.__anext__()
+        fastest = await events.__anext__()
+        first_source_latency = time.perf_counter() - started
+        rest = await collect(events)
+
+        assert first == {
+            "event": "started",
+            "query_id": response["data"]["query_id"],
+            "sources_total": 2,
+        }
+        assert fastest["source"] == "semantic_scholar"
+        assert first_source_latency < 0.25
+        assert [len(fastest["sources"]), len(rest[0]["sources"])] == [2, 2]
+        assert rest[-1]["event"] == "completed"
+        assert rest[-1]["status"] == "completed"
+        assert rest[-1]["sources_count"] == 4
+
+    @pytest.mark.asyncio
+    async def test_closing_early_saves_cancelled_partial_result(self, handler):
+        """Test a disconnect cancels the run and keeps the partial sources."""
+        response = await handler.handle_enhanced_research_stream(
+            {"query": "graph neural networks", "max_results": 4}
+        )
+        events = response["data"]["events"]
+        await events.__anext__()
+        await events.__anext__()
+
+        await events.aclose()
+
+        (stored,) = handler.result_repository.find_by_query_id(
+            QueryId(uuid.UUID(response["data"]["query_id"]))
+        )
+        assert stored.status == ResearchStatus.CANCELLED
+        assert len(stored.sources) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_request_fails_before_streaming(self, handler):
+        """Test validation errors are returned as a normal error response."""
+        response = await handler.handle_enhanced_research_stream({"query": ""})
+
+        assert response["success"] is False
+
+
+class TestStreamFraming:
+    """Test SSE and NDJSON encoding."""
+
+    @staticmethod
+    async def events():
+        yield {"event": "started", "sources_total": 1}
+        yield {"event": "completed", "message": "done"}
+
+    @pytest.mark.asyncio
+    async def test_sse_frames(self):
+        """Test events become id/event/data frames separated by blank lines."""
+        body = b"".join(await collect(encode_events(self.events(), SSE_MEDIA_TYPE)))
+
+        frames = body.decode().split("\n\n")
+        assert frames[0].splitlines() == [
+            "id: 1",
+            "event: started",
+            'data: {"event":"started","sources_total":1}',
+        ]
+        assert frames[1].startswith("id: 2\nevent: completed")
+
+    @pytest.mark.asyncio
+    async def test_ndjson_lines(self):
+        """Test one JSON document per line."""
+        chunks = await collect(encode_events(self.events(), NDJSON_MEDIA_TYPE))
+
+        assert [json.loads(chunk)["event"] for chunk in chunks] == [
+            "started",
+            "completed",
+        ]
+
+    def test_media_type_negotiation(self):
+        """Test SSE is chosen only when the client accepts it."""
+        assert media_type_for("text/event-stream") == SSE_MEDIA_TYPE
+        assert media_type_for("application/json") == NDJSON_MEDIA_TYPE
+        assert media_type_for(None) == NDJSON_MEDIA_TYPE
+
+    @pytest.mark.asyncio
+    async def test_closing_the_body_closes_the_events(self):
+        """Test a disconnect propagates to the event source."""
+        closed = asyncio.Event()
+
+        async def events():
+            try:
+                yield {"event": "started"}
+                yield {"event": "completed"}
+            finally:
+                closed.set()
+
+        body = encode_events(events(), NDJSON_MEDIA_TYPE)
+        await body.__anext__()
+        await body.aclose()
+
+        assert closed.is_set()
@@ -16,6 +16,7 @@ Why this matters:
 - Reference managers need exact format compliance
 """
 
+import io
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock
 
@@ -126,6 +127,44 @@ class TestCitationExport:
         result = self.use_case.export_citations([], "bibtex")
         assert result == ""
 
+    def test_iter_citations_streams_from_a_generator(self):
+        """Test that entries are yielded lazily, one per paper."""
+        consumed = []
+
+        def papers():
+            for paper in self.sample_papers:
+                consumed.append(paper["title"])
+                yield paper
+
+        entries = self.use_case.iter_citations(papers(), "ris")
+        first = next(entries)
+
+        assert first.startswith("TY  - JOUR") and first.endswith("ER  - \n\n")
+        assert len(consumed) == 1
+        assert "".join([first, *entries]) == self.use_case.export_citations(
+            self.sample_papers, "ris"
+        )
+
+    def test_iter_citations_validates_format_eagerly(self):
+        """Test that unsupported formats fail before any entry is produced."""
+        with pytest.raises(Exception, match="Unsupported citation format"):
+            self.use_case.iter_citation_chunks(iter(self.sample_papers), "nope")
+
+    def test_chunks_and_file_sink_match_joined_export(self):
+        """Test that chunked and file-sink exports equal the joined export."""
+        expected = self.use_case.export_citations(self.sample_papers, "apa")
+        sink = io.StringIO()
+
+        chunks = list(
+            self.use_case.iter_citation_chunks(self.sample_papers, "apa", chunk_size=1)
+        )
+        written = self.use_case.write_citations(self.sample_papers, sink, "apa")
+
+        assert len(chunks) == 2
+        assert "".join(chunks) == expected
+        assert written == 2
+        assert sink.getvalue() == expected
+
 
 class TestAdvancedSearchInterface:
     """Test advanced search functionality for researchers."""
@@ -201,9 +240,12 @@ class TestResearchCollections:
     @pytest.mark.asyncio
     async def test_add_paper_to_collection(self):
         """Test adding a paper to an existing collection."""
+        created = await self.handler.handle_research_collection_request(
+            {"action": "create", "name": "My AI Research"}
+        )
         request_data = {
             "action": "add_paper",
-            "collection_id": "test-collection-id",
+            "collection_id": created["data"]["id"],
             "paper": {"title": "Test Paper", "authors": ["Test Author"], "year": 2024},
         }
 
@@ -212,6 +254,20 @@ class TestResearchCollections:
         assert response["success"] is True
         assert response["data"]["paper_added"] is True
 
+    @pytest.mark.asyncio
+    async def test_add_paper_to_unknown_collection_fails(self):
+        """Test that papers cannot be added to a collection that does not exist."""
+        request_data = {
+            "action": "add_paper",
+            "collection_id": "test-collection-id",
+            "paper": {"title": "Test Paper"},
+        }
+
+        response = await self.handler.handle_research_collection_request(request_data)
+
+        assert response["success"] is False
+        assert response["error"]["type"] == "CollectionNotFoundError"
+
     @pytest.mark.asyncio
     async def test_empty_collection_name_validation(self):
         """Test that empty collection names are rejected."""
@@ -252,6 +308,22 @@ class TestWebInterfaceCitationExport:
         assert response["data"]["content_type"] == "application/x-bibtex"
         assert response["data"]["filename"] == "research_citations.bibtex"
 
+    @pytest.mark.asyncio
+    async def test_citation_export_stream(self):
+        """Test that the streaming export returns UTF-8 byte chunks."""
+        handler = WebInterfaceHandler()
+        papers = ({"title": f"Paper {i}", "authors": ["Ünal Author"]} for i in range(3))
+
+        response = await handler.handle_citation_export_stream(
+            {"papers": papers, "format": "endnote", "chunk_size": 1}
+        )
+
+        assert response["success"] is True
+        assert response["data"]["content_type"] == "application/x-endnote-refer"
+        body = list(response["data"]["body"])
+        assert len(body) == 3
+        assert "%A Ünal Author" in b"".join(body).decode("utf-8")
+
     @pytest.mark.asyncio
     async def test_export_with_no_papers(self):
         """Test export request with no papers provided."""
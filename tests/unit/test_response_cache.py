@@ -0,0 +1,97 @@
+"""
+Unit Tests for the Shared Response Cache
+
+Tests keying, expiry, eviction and that two connections to the same file
+(as two HTTP worker processes would have) see each other's entries, and
+the in-memory tier of hot bodies.
+"""
+
+import time
+
+from src.infrastructure.response_cache import MemoryResponseCache, SQLiteResponseCache
+
+
+class TestSQLiteResponseCache:
+    """Test the on-disk response cache."""
+
+    def test_key_ignores_payload_key_order(self):
+        """Test equal payloads map to one key and routes are kept apart."""
+        key = SQLiteResponseCache.key_for("/a", {"query": "x", "max_results": 5})
+
+        assert key == SQLiteResponseCache.key_for(
+            "/a", {"max_results": 5, "query": "x"}
+        )
+        assert key != SQLiteResponseCache.key_for(
+            "/b", {"query": "x", "max_results": 5}
+        )
+
+    def test_entries_are_shared_between_connections(self, tmp_path):
+        """Test a body stored by one worker is a hit for another."""
+        path = str(tmp_path / "cache.sqlite3")
+        first, second = SQLiteResponseCache(path), SQLiteResponseCache(path)
+
+        first.set("key", b'{"success":true}')
+
+        assert second.get("key") == b'{"success":true}'
+        assert second.get("missing") is None
+        assert (second.hits, second.misses) == (1, 1)
+        first.close()
+        second.close()
+
+    def test_expired_entries_are_misses(self):
+        """Test entries stop being served after their TTL."""
+        cache = SQLiteResponseCache(ttl_seconds=0.05)
+        cache.set("key", b"body")
+
+        time.sleep(0.1)
+
+        assert cache.get("key") is None
+
+    def test_oldest_entries_are_evicted(self):
+        """Test the cache keeps at most max_entries bodies."""
+        cache = SQLiteResponseCache(max_entries=3)
+        for index in range(5):
+            cache.set(f"key-{index}", b"body")
+            time.sleep(0.001)
+
+        assert len(cache) == 3
+        assert cache.get("key-0") is None
+        assert cache.get("key-4") == b"body"
+
+
+class TestMemoryResponseCache:
+    """Test the in-process tier of hot bodies."""
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """Test reads keep an entry alive and the oldest unread one goes."""
+        cache = MemoryResponseCache(max_entries=2)
+        cache.set("a", b"A")
+        cache.set("b", b"B")
+
+        assert cache.get("a") == b"A"
+        cache.set("c", b"C")
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (b"A", b"C")
+        assert len(cache) == 2
+
+    def test_entries_expire(self):
+        """Test the per-entry TTL (e.g. what is left of a disk entry's)."""
+        cache = MemoryResponseCache(ttl_seconds=60)
+        cache.set("short", b"body", ttl_seconds=0.05)
+        cache.set("long", b"body")
+
+        time.sleep(0.1)
+
+        assert cache.get("short") is None
+        assert cache.get("long") == b"body"
+
+    def test_disk_entries_report_their_remaining_ttl(self):
+        """Test get_entry returns the body and the seconds it has left."""
+        disk = SQLiteResponseCache(ttl_seconds=30)
+        disk.set("key", b"body")
+
+        body, remaining = disk.get_entry("key")
+
+        assert body == b"body"
+        assert 29 < remaining <= 30
@@ -0,0 +1,310 @@
+"""
+Unit Tests for Scholarly Research Use Cases
+
+Tests how raw searcher papers become domain ResearchSource objects, how
+display formatting is deferred to the presentation layer, and that failed
+upstreams are reported per search.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.scholarly_use_cases import (
+    RESPONSE_FIELDS,
+    EnhancedResearchOrchestrationService,
+    ScholarlyResearchUseCase,
+    ScholarlySearchRequest,
+    _paper_to_source,
+)
+from src.application.use_cases import (
+    CreateResearchQueryRequest,
+    CreateResearchQueryUseCase,
+)
+from src.domain.entities import (
+    DomainException,
+    QueryNotFoundError,
+    ResearchStatus,
+    SourceType,
+    paper_identity,
+)
+from src.infrastructure.repositories import (
+    InMemoryResearchQueryRepository,
+    InMemoryResearchResultRepository,
+)
+from src.infrastructure.scholarly_sources import UnifiedScholarlySearcher
+from src.presentation.web_interface import WebInterfaceHandler
+
+RAW_PAPERS = [
+    {
+        "title": "Attention Is All You Need",
+        "authors": ["Ashish Vaswani", "Noam Shazeer"],
+        "abstract": "The dominant sequence transduction models...",
+        "pdf_url": "https://arxiv.org/pdf/1706.03762",
+        "source_url": "https://arxiv.org/abs/1706.03762",
+        "venue": "arXiv",
+        "source_type": "arxiv",
+        "citation_count": None,
+        "year": 2017,
+    },
+    {
+        "title": "BERT",
+        "authors": ["Jacob Devlin"],
+        "abstract": "We introduce a new language representation model...",
+        "source_url": "https://www.semanticscholar.org/paper/bert",
+        "venue": "NAACL",
+        "source_type": "semantic_scholar",
+        "citation_count": 50000,
+        "year": 2019,
+    },
+    {
+        # Same paper as the first one, reported with a trailing slash
+        "title": "Attention Is All You Need",
+        "authors": ["Ashish Vaswani"],
+        "abstract": "Duplicate",
+        "source_url": "https://arxiv.org/abs/1706.03762/",
+        "source_type": "arxiv",
+    },
+]
+
+
+class TestPaperToSource:
+    """Test the single-pass raw paper -> ResearchSource conversion."""
+
+    def test_maps_raw_searcher_fields(self):
+        """Test that searcher keys map directly onto ResearchSource fields."""
+        source = _paper_to_source(RAW_PAPERS[0])
+
+        assert source.title == "Attention Is All You Need"
+        assert source.url == "https://arxiv.org/abs/1706.03762"
+        assert source.source_type == SourceType.ARXIV
+        assert source.authors == ["Ashish Vaswani", "Noam Shazeer"]
+        assert source.content == source.abstract
+        assert source.citation_count == 0  # arXiv reports None
+        assert source.metadata["year"] == 2017
+        assert "formatted_citation" not in source.metadata
+
+    def test_unknown_source_type_defaults_to_custom(self):
+        """Test that unknown searcher types fall back to CUSTOM."""
+        source = _paper_to_source({"title": "X", "source_type": "dblp"})
+
+        assert source.source_type == SourceType.CUSTOM
+
+
+class TestEnhancedResearchConversion:
+    """Test execute_enhanced_research with raw papers."""
+
+    @pytest.mark.asyncio
+    async def test_sources_are_deduplicated_and_formatted_lazily(self):
+        """Test one source per URL and citations only built for display."""
+        query_repository = InMemoryResearchQueryRepository()
+        result_repository = InMemoryResearchResultRepository()
+        searcher = Mock()
+        searcher.search = Mock(return_value=RAW_PAPERS)
+        scholarly_use_case = ScholarlyResearchUseCase(
+            query_repository, result_repository, searcher
+        )
+        scholarly_use_case._format_citation = Mock(
+            wraps=scholarly_use_case._format_citation
+        )
+        service = EnhancedResearchOrchestrationService(
+            query_repository, result_repository, scholarly_use_case
+        )
+        created = await CreateResearchQueryUseCase(query_repository).execute(
+            CreateResearchQueryRequest(query_text="transformers", max_results=5)
+        )
+
+        result = await service.execute_enhanced_research(created.query_id)
+
+        assert result.status == ResearchStatus.COMPLETED
+        assert [source.source_type for source in result.sources] == [
+            SourceType.ARXIV,
+            SourceType.SEMANTIC_SCHOLAR,
+        ]
+        scholarly_use_case._format_citation.assert_not_called()
+
+        handler = WebInterfaceHandler()
+        handler.scholarly_use_case = scholarly_use_case
+        data = handler._format_enhanced_result(result, created.query_id, True)
+
+        assert data["sources"][0]["formatted_citation"] == (
+            "Ashish Vaswani, Noam Shazeer (2017). Attention Is All You Need. arXiv."
+        )
+        assert data["sources"][1]["citation_count"] == 50000
+        assert scholarly_use_case._format_citation.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_malformed_query_id_is_not_found(self):
+        """Test a query ID that is not a UUID is reported as not found."""
+        service = EnhancedResearchOrchestrationService(
+            InMemoryResearchQueryRepository(), InMemoryResearchResultRepository()
+        )
+
+        with pytest.raises(QueryNotFoundError):
+            async for _ in service.stream_enhanced_research("not-a-uuid"):
+                pass
+
+    def test_response_formatting_reads_searcher_keys(self):
+        """Test that API responses carry the searcher's source_url/source_type."""
+        use_case = ScholarlyResearchUseCase(
+            InMemoryResearchQueryRepository(),
+            InMemoryResearchResultRepository(),
+            Mock(),
+        )
+
+        formatted = use_case._format_paper_for_response(RAW_PAPERS[1])
+
+        assert formatted["source_url"] == RAW_PAPERS[1]["source_url"]
+        assert formatted["source_type"] == "semantic_scholar"
+
+
+class TestFailedSources:
+    """Test searches report the sources whose upstream failed."""
+
+    @pytest.mark.asyncio
+    async def test_failed_upstream_is_reported(self):
+        """Test a failing arXiv shows up in failed_sources, not as no papers."""
+        searcher = UnifiedScholarlySearcher()
+        searcher.arxiv_searcher.session = Mock()
+        searcher.arxiv_searcher.session.get.side_effect = ConnectionError("down")
+        searcher.semantic_scholar_searcher.session = Mock()
+        searcher.semantic_scholar_searcher.session.get.return_value.json.return_value = {
+            "data": [{"title": "BERT", "year": 2019}]
+        }
+        use_case = ScholarlyResearchUseCase(
+            InMemoryResearchQueryRepository(),
+            InMemoryResearchResultRepository(),
+            searcher,
+        )
+
+        response = await use_case.execute_scholarly_search(
+            ScholarlySearchRequest(query_text="language models")
+        )
+        handler = WebInterfaceHandler()
+        handler.scholarly_use_case = use_case
+        web = await handler.handle_scholarly_search_request({"query": "bert"})
+
+        assert response.failed_sources == ["arxiv"]
+        assert [paper["title"] for paper in response.papers] == ["BERT"]
+        assert web["data"]["failed_sources"] == ["arxiv"]
+        assert searcher.upstream_status()["arxiv"]["failures"] == 2
+
+
+class TestFieldProjection:
+    """Test ScholarlySearchRequest.fields projection."""
+
+    @pytest.fixture
+    def use_case(self):
+        """Use case backed by a mock searcher returning RAW_PAPERS."""
+        searcher = Mock()
+        searcher.search = Mock(return_value=RAW_PAPERS[:2])
+        return ScholarlyResearchUseCase(
+            InMemoryResearchQueryRepository(),
+            InMemoryResearchResultRepository(),
+            searcher,
+        )
+
+    @pytest.mark.asyncio
+    async def test_only_requested_fields_are_built(self, use_case):
+        """Test that an ID/title projection skips citation formatting."""
+        use_case._format_citation = Mock(wraps=use_case._format_citation)
+        request = ScholarlySearchRequest(
+            query_text="transformers", fields=["title", "doi"]
+        )
+
+        response = await use_case.execute_scholarly_search(request)
+
+        assert response.papers == [
+            {"title": "Attention Is All You Need", "doi": None},
+            {"title": "BERT", "doi": None},
+        ]
+        use_case._format_citation.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_default_returns_every_field(self, use_case):
+        """Test that omitting fields keeps the full response shape."""
+        response = await use_case.execute_scholarly_search(
+            ScholarlySearchRequest(query_text="transformers")
+        )
+
+        assert list(response.papers[0]) == list(RESPONSE_FIELDS)
+
+    @pytest.mark.asyncio
+    async def test_include_abstracts_false_drops_abstracts(self, use_case):
+        """Test that include_abstracts=False omits both abstract fields."""
+        response = await use_case.execute_scholarly_search(
+            ScholarlySearchRequest(query_text="transformers", include_abstracts=False)
+        )
+
+        assert "abstract" not in response.papers[0]
+        assert "full_abstract" not in response.papers[0]
+
+    @pytest.mark.asyncio
+    async def test_unknown_field_is_rejected(self, use_case):
+        """Test that unknown field names fail validation."""
+        with pytest.raises(DomainException, match="Unknown response fields: isbn"):
+            await use_case.execute_scholarly_search(
+                ScholarlySearchRequest(query_text="transformers", fields=["isbn"])
+            )
+
+
+class TestCitationMemoization:
+    """Test memoized citation formatting keyed by paper identity."""
+
+    def test_paper_identity_prefers_doi_then_title_then_url(self):
+        """Test the identity fallback chain."""
+        assert paper_identity({"doi": "10.1/ABC", "source_url": "x"}) == "doi:10.1/abc"
+        assert paper_identity({"title": "Deep  Learning", "url": "x"}) == (
+            "title:deeplearning"
+        )
+        assert (
+            paper_identity({"source_url": "HTTPS://A.org/p/"}) == "url:https://a.org/p"
+        )
+        assert paper_identity({}) is None
+
+    def test_citation_is_rendered_once_per_paper(self):
+        """Test that repeat formatting of the same paper hits the cache."""
+        use_case = ScholarlyResearchUseCase(
+            InMemoryResearchQueryRepository(),
+            InMemoryResearchResultRepository(),
+            Mock(),
+        )
+        use_case._render_citation = Mock(wraps=use_case._render_citation)
+
+        first = use_case._format_citation(RAW_PAPERS[0])
+        second = use_case._format_citation(dict(RAW_PAPERS[0]))
+
+        assert first == second
+        assert use_case._render_citation.call_count == 1
+
+    def test_cache_is_bounded(self):
+        """Test that the least recently used citation is evicted."""
+        use_case = ScholarlyResearchUseCase(
+            InMemoryResearchQueryRepository(),
+            InMemoryResearchResultRepository(),
+            Mock(),
+            citation_cache_size=2,
+        )
+
+        for index in range(3):
+            use_case._format_citation({"title": f"Paper {index}"})
+
+        assert [key[0] for key in use_case._citation_cache] == [
+            "title:paper1",
+            "title:paper2",
+        ]
+
+    def test_changed_paper_is_formatted_again(self):
+        """Test a paper edited under the same DOI does not get a stale citation."""
+        use_case = ScholarlyResearchUseCase(
+            InMemoryResearchQueryRepository(),
+            InMemoryResearchResultRepository(),
+            Mock(),
+        )
+        paper = {"doi": "10.1/abc", "title": "Draft title", "authors": ["A. Author"]}
+
+        first = use_case._format_citation(paper)
+        second = use_case._format_citation({**paper, "title": "Final title"})
+
+        assert "Draft title" in first
+        assert "Final title" in second
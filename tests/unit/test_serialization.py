@@ -0,0 +1,155 @@
+"""
+Unit Tests for JSON Serialization
+
+Tests that both backends (orjson and the standard library) produce the same
+compact JSON, the per-type encoders for values JSON has no type for, and
+the per-entity research result encoders.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+
+from src.domain.entities import (
+    QueryId,
+    ResearchQuery,
+    ResearchQueryType,
+    ResearchResult,
+    ResearchSource,
+    ResearchStatus,
+    SourceType,
+)
+from src.presentation import serialization
+from src.presentation.serialization import (
+    dumps,
+    dumps_text,
+    loads,
+    result_summary,
+    source_summary,
+)
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+DOCUMENT = {
+    "text": "Résumé — naïve “quotes”\nnext line",
+    "when": datetime(2024, 5, 1, 12, 30, 15),
+    "status": ResearchStatus.COMPLETED,
+    "id": UUID("12345678-1234-5678-1234-567812345678"),
+    "tags": {"only"},
+    "point": Point(1, 2),
+    "nested": [1, 2.5, None, True],
+}
+
+EXPECTED = {
+    "text": "Résumé — naïve “quotes”\nnext line",
+    "when": "2024-05-01T12:30:15",
+    "status": "completed",
+    "id": "12345678-1234-5678-1234-567812345678",
+    "tags": ["only"],
+    "point": {"x": 1, "y": 2},
+    "nested": [1, 2.5, None, True],
+}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+class TestDumps:
+    """Test encoding with each backend."""
+
+    def test_compact_utf8_with_converted_values(self, backend):
+        """Test special values are converted and the output is compact."""
+        body = dumps(DOCUMENT)
+
+        assert isinstance(body, bytes)
+        assert b", " not in body and b": " not in body
+        assert "Résumé".encode("utf-8") in body
+        assert json.loads(body) == EXPECTED
+        assert loads(body) == EXPECTED
+        assert dumps_text(DOCUMENT) == body.decode("utf-8")
+
+    def test_backends_agree(self, monkeypatch):
+        """Test switching backends does not change the document."""
+        fast = dumps(DOCUMENT)
+        monkeypatch.setattr(serialization, "orjson", None)
+
+        assert json.loads(dumps(DOCUMENT)) == json.loads(fast)
+
+    def test_backends_agree_on_entities(self, monkeypatch):
+        """Test a populated result encodes the same way on both backends."""
+        query = ResearchQuery(
+            id=QueryId(),
+            text="graph neural networks",
+            query_type=ResearchQueryType.ACADEMIC,
+            created_at=datetime(2024, 1, 2, 3, 4, 5),
+        )
+        result = ResearchResult(query=query, status=ResearchStatus.IN_PROGRESS)
+        result.add_source(
+            ResearchSource(
+                url="https://arxiv.org/abs/1",
+                title="GNNs",
+                source_type=SourceType.ARXIV,
+                relevance_score=0.75,
+            )
+        )
+        result.mark_completed()
+
+        fast = dumps(result)
+        monkeypatch.setattr(serialization, "orjson", None)
+        fallback = dumps(result)
+
+        assert json.loads(fallback) == json.loads(fast)
+        assert not any(name.startswith("_") for name in json.loads(fallback))
+
+    def test_malformed_input_raises_value_error(self, backend):
+        """Test callers can keep catching ValueError."""
+        with pytest.raises(ValueError):
+            loads(b"{not json")
+
+
+class TestEntityEncoders:
+    """Test the research result encoders."""
+
+    def test_result_summary(self):
+        """Test a result and its sources become plain JSON values."""
+        query = ResearchQuery(
+            id=QueryId(),
+            text="graph neural networks",
+            query_type=ResearchQueryType.ACADEMIC,
+            created_at=datetime(2024, 1, 2, 3, 4, 5),
+        )
+        source = ResearchSource(
+            url="https://arxiv.org/abs/1",
+            title="GNNs",
+            source_type=SourceType.ARXIV,
+            relevance_score=0.75,
+        )
+        result = ResearchResult(query=query, status=ResearchStatus.COMPLETED)
+        result.add_source(source)
+
+        summary = result_summary(result)
+
+        assert summary["query"] == "graph neural networks"
+        assert summary["status"] == "completed"
+        assert summary["sources"] == [source_summary(source)]
+        assert summary["sources"][0] == {
+            "title": "GNNs",
+            "url": "https://arxiv.org/abs/1",
+            "source_type": "arxiv",
+            "relevance_score": 0.75,
+        }
+        assert json.loads(dumps(summary)) == summary
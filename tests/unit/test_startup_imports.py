@@ -0,0 +1,43 @@
+"""
+Startup Import Regression Tests
+
+Imports each entry point in a fresh interpreter (``python -X importtime``)
+and checks it stays lazy: the HTTP client and web server stacks are not
+loaded, and cumulative import time stays within the budgets of
+benchmarks/import_time_benchmark.py.
+"""
+
+import pytest
+
+from benchmarks.import_time_benchmark import (
+    BUDGETS_MS,
+    DEFERRED_MODULES,
+    import_profile,
+)
+
+
+@pytest.mark.parametrize("entry_point", sorted(BUDGETS_MS))
+def test_entry_point_imports_stay_lazy(entry_point):
+    """Test an entry point loads no deferred stack and stays in budget."""
+    # Best of three, so one slow interpreter start does not fail the test
+    profiles = [import_profile(entry_point) for _ in range(3)]
+    fastest = min(total for total, _ in profiles)
+    loaded = profiles[0][1]
+
+    assert [name for name in DEFERRED_MODULES if name in loaded] == []
+    assert fastest <= BUDGETS_MS[entry_point]
+
+
+def test_lazy_package_exports_resolve():
+    """Test names re-exported lazily by the packages still import."""
+    import src
+    import src.infrastructure
+
+    assert src.ResearchCLI.__name__ == "ResearchCLI"
+    assert src.create_app.__module__ == "src.__main__"
+    assert src.infrastructure.UnifiedScholarlySearcher.__name__ == (
+        "UnifiedScholarlySearcher"
+    )
+    assert set(src.__all__) <= set(dir(src))
+    with pytest.raises(AttributeError):
+        src.not_a_public_name